@@ -0,0 +1,164 @@
+"""Benchmark the RPLidar path processor: per-point Python loop vs vectorized engine."""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from providers.lidar_path_engine import LidarPathEngine  # noqa: E402
+
+PATH_ANGLES = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
+HALF_WIDTH_ROBOT = 0.20
+RELEVANT_DISTANCE_MAX = 1.1
+RELEVANT_DISTANCE_MIN = 0.08
+SENSOR_MOUNTING_ANGLE = 180.0
+
+
+def make_paths() -> List[np.ndarray]:
+    """Create the straight line paths used by the RPLidar providers.
+
+    Returns
+    -------
+    List[np.ndarray]
+        One (2, 30) array of x and y coordinates per path angle.
+    """
+    paths = []
+    for angle in PATH_ANGLES:
+        rad = math.radians(angle)
+        paths.append(
+            np.array(
+                [
+                    np.linspace(0.0, math.sin(rad), 30),
+                    np.linspace(0.0, math.cos(rad), 30),
+                ]
+            )
+        )
+    return paths
+
+
+def make_scan(num_points: int, rng: np.random.Generator) -> np.ndarray:
+    """Create a synthetic express scan of a robot in a cluttered room.
+
+    Parameters
+    ----------
+    num_points : int
+        Number of measurements in the scan.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        An (N, 2) array of [angle_deg, distance_m].
+    """
+    angles = np.sort(rng.uniform(0.0, 360.0, num_points))
+    distances = rng.uniform(0.3, 3.0, num_points)
+    return np.column_stack((angles, distances))
+
+
+def legacy_path_processor(data: np.ndarray, paths: List[np.ndarray]) -> List[int]:
+    """Reference per-point implementation the providers used before the engine.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        An (N, 2) array of [angle_deg, distance_m].
+    paths : List[np.ndarray]
+        The candidate paths.
+
+    Returns
+    -------
+    List[int]
+        The valid paths.
+    """
+    complexes = []
+    for angle, d_m in data:
+        angle = angle + SENSOR_MOUNTING_ANGLE
+        if angle >= 360.0:
+            angle = angle - 360.0
+        elif angle < 0.0:
+            angle = 360.0 + angle
+        if d_m > RELEVANT_DISTANCE_MAX or d_m < RELEVANT_DISTANCE_MIN:
+            continue
+        angle = angle - 180.0
+        a_rad = math.radians(angle + 180.0)
+        complexes.append([-d_m * math.sin(a_rad), -d_m * math.cos(a_rad), angle, d_m])
+
+    possible_paths = np.arange(len(paths))
+    array = np.array(complexes)
+    if array.ndim > 1:
+        array = array[array[:, 2].argsort()]
+        for x, y in zip(array[:, 0], array[:, 1]):
+            for apath in possible_paths:
+                if apath == 9 and y >= 0:
+                    continue
+                x1, y1 = paths[apath][0][0], paths[apath][1][0]
+                x2, y2 = paths[apath][0][-1], paths[apath][1][-1]
+                dx = x2 - x1
+                dy = y2 - y1
+                t = ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+                t = max(0, min(1, t))
+                dist = math.sqrt((x - x1 - t * dx) ** 2 + (y - y1 - t * dy) ** 2)
+                if dist < HALF_WIDTH_ROBOT:
+                    possible_paths = np.setdiff1d(possible_paths, np.array([apath]))
+                    break
+    return possible_paths.tolist()
+
+
+def scans_per_second(fn: Callable[[np.ndarray], object], scans: List[np.ndarray]):
+    """Measure throughput of a path processor.
+
+    Parameters
+    ----------
+    fn : Callable[[np.ndarray], object]
+        The path processor.
+    scans : List[np.ndarray]
+        The scans to process.
+
+    Returns
+    -------
+    float
+        Processed scans per second.
+    """
+    start = time.perf_counter()
+    for scan in scans:
+        fn(scan)
+    return len(scans) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print scans per second before and after."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=1500, help="points per scan")
+    parser.add_argument("--scans", type=int, default=200, help="number of scans")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scans = [make_scan(args.points, rng) for _ in range(args.scans)]
+
+    paths = make_paths()
+    engine = LidarPathEngine(
+        paths,
+        half_width_robot=HALF_WIDTH_ROBOT,
+        relevant_distance_max=RELEVANT_DISTANCE_MAX,
+        relevant_distance_min=RELEVANT_DISTANCE_MIN,
+        sensor_mounting_angle=SENSOR_MOUNTING_ANGLE,
+    )
+
+    before = scans_per_second(lambda s: legacy_path_processor(s, paths), scans)
+    after = scans_per_second(engine.process, scans)
+
+    print(f"{args.points} points per scan, {args.scans} scans")
+    print(f"per-point loop : {before:10.1f} scans/s")
+    print(f"vectorized     : {after:10.1f} scans/s")
+    print(f"speedup        : {after / before:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark decoding and encoding bulky Zenoh messages: pycdr2 vs NumPy fast path."""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from zenoh_msgs import (  # noqa: E402
+    Point32,
+    deserialize_numpy,
+    sensor_msgs,
+    serialize_numpy,
+    std_msgs,
+)
+
+HEADER = std_msgs.Header(stamp=std_msgs.Time(sec=0, nanosec=0), frame_id="camera")
+
+
+def make_image(width: int, height: int, rng: np.random.Generator):
+    """Create an rgb8 image message.
+
+    Parameters
+    ----------
+    width : int
+        Image width in pixels.
+    height : int
+        Image height in pixels.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    sensor_msgs.Image
+        The image, with its data as a list as pycdr2 expects.
+    """
+    data = rng.integers(0, 256, width * height * 3, dtype=np.uint8)
+    return sensor_msgs.Image(
+        header=HEADER,
+        height=height,
+        width=width,
+        encoding="rgb8",
+        is_bigendian=0,
+        step=width * 3,
+        data=data.tolist(),
+    )
+
+
+def make_point_cloud(num_points: int, rng: np.random.Generator):
+    """Create a point cloud message like the D435 obstacle cloud.
+
+    Parameters
+    ----------
+    num_points : int
+        Number of points.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    sensor_msgs.PointCloud
+        The point cloud, with its points as Point32 objects.
+    """
+    xyz = rng.uniform(-2.0, 2.0, (num_points, 3)).astype(np.float32)
+    return sensor_msgs.PointCloud(
+        header=HEADER,
+        points=[Point32(x=x, y=y, z=z) for x, y, z in xyz.tolist()],
+        channels=[],
+    )
+
+
+def per_second(fn: Callable[[], object], repeat: int) -> float:
+    """Measure calls per second of a function.
+
+    Parameters
+    ----------
+    fn : Callable[[], object]
+        The function to call.
+    repeat : int
+        Number of calls.
+
+    Returns
+    -------
+    float
+        Calls per second.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - start)
+
+
+def compare(name: str, message, repeat: int) -> List[Tuple[str, float, float]]:
+    """Compare both codecs on one message.
+
+    Parameters
+    ----------
+    name : str
+        Name of the message in the report.
+    message : IdlStruct
+        The message to decode and encode.
+    repeat : int
+        Number of calls per measurement.
+
+    Returns
+    -------
+    List[Tuple[str, float, float]]
+        (operation, pycdr2 calls/s, NumPy calls/s) per operation.
+    """
+    message_type = type(message)
+    payload = message.serialize()
+    decoded = deserialize_numpy(message_type, payload)
+    return [
+        (
+            f"{name} decode",
+            per_second(lambda: message_type.deserialize(payload), repeat),
+            per_second(lambda: deserialize_numpy(message_type, payload), repeat),
+        ),
+        (
+            f"{name} encode",
+            per_second(message.serialize, repeat),
+            per_second(lambda: serialize_numpy(decoded), repeat),
+        ),
+    ]
+
+
+def main():
+    """Run the benchmark and print messages per second of both codecs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=640, help="image width")
+    parser.add_argument("--height", type=int, default=480, help="image height")
+    parser.add_argument("--points", type=int, default=10000, help="cloud points")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per codec")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = compare(
+        f"{args.width}x{args.height} image",
+        make_image(args.width, args.height, rng),
+        args.repeat,
+    )
+    rows += compare(
+        f"{args.points}-point cloud",
+        make_point_cloud(args.points, rng),
+        args.repeat,
+    )
+
+    print(f"{'':24} {'pycdr2 msg/s':>14} {'numpy msg/s':>14} {'speedup':>9}")
+    for operation, before, after in rows:
+        print(f"{operation:24} {before:14.1f} {after:14.1f} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 import threading
-import time
 import typing as T
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from pydantic import BaseModel, ConfigDict
 
+from providers.clock import get_clock
+
 IT = T.TypeVar("IT")
 OT = T.TypeVar("OT")
 CT = T.TypeVar("CT", bound="ActionConfig")
@@ -68,8 +69,15 @@ class Interface(T.Generic[IT, OT]):
 class ActionConnector(ABC, T.Generic[CT, OT]):
     """
     A connector for an action.
+
+    Connectors whose ``connect`` calls blocking code set ``blocking = True``
+    so the runtime runs it on a worker thread; None runs it on the event loop
+    and warns once it stalls it. The ``blocking`` config option overrides
+    the class attribute.
     """
 
+    blocking: T.Optional[bool] = None
+
     def __init__(self, config: CT):
         """
         Initialize the ActionConnector.
@@ -108,6 +116,8 @@ class ActionConnector(ABC, T.Generic[CT, OT]):
         """
         Sleep for the specified duration, but wake immediately if stop signal is received.
 
+        The duration is measured by the runtime clock, see providers.clock.
+
         Parameters
         ----------
         duration : float
@@ -118,11 +128,12 @@ class ActionConnector(ABC, T.Generic[CT, OT]):
         bool
             True if sleep completed normally, False if interrupted by stop signal
         """
+        clock = get_clock()
         if self._stop_event is None:
-            time.sleep(duration)
+            clock.sleep(duration)
             return True
 
-        was_stopped = self._stop_event.wait(timeout=duration)
+        was_stopped = clock.wait(self._stop_event, duration)
 
         return not was_stopped
 
@@ -7,7 +7,9 @@ from concurrent.futures import ThreadPoolExecutor
 
 from actions.base import AgentAction
 from llm.output_model import Action
+from providers.trace_provider import TraceProvider
 from runtime.config import RuntimeConfig
+from runtime.plugin_executor import OffloadPolicy
 
 
 class ActionOrchestrator:
@@ -20,6 +22,8 @@ class ActionOrchestrator:
     - dependencies: Actions wait for their dependencies to complete before executing
 
     Note: It is very important that the actions do not block the event loop.
+    Connectors that do are run on a worker thread of their own, see
+    OffloadPolicy.
     """
 
     promise_queue: T.List[asyncio.Task[T.Any]]
@@ -31,6 +35,7 @@ class ActionOrchestrator:
     _execution_mode: str
     _action_dependencies: T.Dict[str, T.List[str]]
     _completed_actions: T.Dict[str, asyncio.Event]
+    _offload_policies: T.Dict[str, OffloadPolicy]
 
     def __init__(self, config: RuntimeConfig):
         """
@@ -56,6 +61,8 @@ class ActionOrchestrator:
         self._execution_mode = config.action_execution_mode or "concurrent"
         self._action_dependencies = config.action_dependencies or {}
         self._completed_actions = {}
+        self._trace_provider = TraceProvider()
+        self._offload_policies = {}
 
     def start(self) -> asyncio.Future:
         """
@@ -138,9 +145,24 @@ class ActionOrchestrator:
         actions : list[Action]
             List of actions to promise to connectors.
         """
-        self._completed_actions = {
-            action.type.lower(): asyncio.Event() for action in actions
-        }
+        self._completed_actions = {}
+        await self.extend_promise(actions)
+
+    async def extend_promise(self, actions: list[Action]) -> None:
+        """
+        Promises more actions as part of the batch of the last ``promise``.
+
+        Unlike ``promise``, the completion state of the actions promised
+        before is kept, so actions of a streamed LLM response can be
+        promised one by one.
+
+        Parameters
+        ----------
+        actions : list[Action]
+            List of actions to promise to connectors.
+        """
+        for action in actions:
+            self._completed_actions.setdefault(action.type.lower(), asyncio.Event())
 
         if self._execution_mode == "sequential":
             await self._promise_sequential(actions)
@@ -375,7 +397,20 @@ class ActionOrchestrator:
 
         input_interface = input_type(**converted_params)
 
-        await agent_action.connector.connect(input_interface)
+        with self._trace_provider.span(
+            f"{type(agent_action.connector).__name__}.connect",
+            lane=f"action:{agent_action.llm_label}",
+        ):
+            policy = self._offload_policies.get(agent_action.llm_label)
+            if policy is None or policy.plugin is not agent_action.connector:
+                policy = OffloadPolicy(agent_action.connector, "action")
+                self._offload_policies[agent_action.llm_label] = policy
+            try:
+                await policy.run(agent_action.connector.connect(input_interface))
+            except asyncio.TimeoutError:
+                logging.error(
+                    f"Action {agent_action.llm_label} timed out after {policy.timeout}s"
+                )
 
         return input_interface
 
@@ -385,6 +420,9 @@ class ActionOrchestrator:
         """
         self._stop_event.set()
         self._connector_executor.shutdown(wait=True)
+        for policy in self._offload_policies.values():
+            policy.shutdown()
+        self._offload_policies.clear()
 
     def __del__(self):
         """
@@ -2,12 +2,12 @@ import asyncio
 import logging
 from typing import Any
 
-import aiohttp
 from pydantic import Field
 
 from actions.base import ActionConfig, ActionConnector
 from actions.remember_location.interface import RememberLocationInput
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client import get_http_client
 
 
 class UnitreeGo2RememberLocationConfig(ActionConfig):
@@ -84,22 +84,19 @@ class UnitreeGo2RememberLocationConnector(
         headers = {"Content-Type": "application/json"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url, json=payload, headers=headers, timeout=self.timeout
-                ) as resp:
-                    text = await resp.text()
-                    if resp.status >= 200 and resp.status < 300:
-                        logging.info(
-                            f"RememberLocationGo2: stored '{output_interface.action}' -> {resp.status} {text}"
-                        )
-                        self.elevenlabs_provider.add_pending_message(
-                            f"Location {output_interface.action} remembered for Go2. Woof! Woof!"
-                        )
-                    else:
-                        logging.error(
-                            f"RememberLocationGo2 API returned {resp.status}: {text}"
-                        )
+            resp = await get_http_client().post_async(
+                self.base_url, json=payload, headers=headers, timeout=self.timeout
+            )
+            text = resp.text
+            if resp.status >= 200 and resp.status < 300:
+                logging.info(
+                    f"RememberLocationGo2: stored '{output_interface.action}' -> {resp.status} {text}"
+                )
+                self.elevenlabs_provider.add_pending_message(
+                    f"Location {output_interface.action} remembered for Go2. Woof! Woof!"
+                )
+            else:
+                logging.error(f"RememberLocationGo2 API returned {resp.status}: {text}")
         except asyncio.TimeoutError:
             logging.error("RememberLocationGo2 API request timed out")
         except Exception as e:
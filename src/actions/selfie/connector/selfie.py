@@ -3,12 +3,12 @@ import logging
 import time
 from typing import Dict, Optional
 
-import requests
 from pydantic import Field
 
 from actions.base import ActionConfig, ActionConnector
 from actions.selfie.interface import SelfieInput
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client import get_http_client
 from providers.io_provider import IOProvider
 
 
@@ -110,7 +110,7 @@ class SelfieConnector(ActionConnector[SelfieConfig, SelfieInput]):
         """
         url = f"{self.base_url}{path}"
         try:
-            r = requests.post(url, json=body, timeout=self.http_timeout)
+            r = get_http_client().post(url, json=body, timeout=self.http_timeout)
             return r.json()
         except Exception as e:
             logging.warning("HTTP POST %s failed (%s) body=%s", url, e, body)
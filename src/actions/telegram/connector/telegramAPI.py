@@ -1,10 +1,10 @@
 import logging
 
-import aiohttp
 from pydantic import Field
 
 from actions.base import ActionConfig, ActionConnector
 from actions.telegram.interface import TelegramInput
+from providers.http_client import get_http_client
 
 
 class TelegramAPIConfig(ActionConfig):
@@ -63,19 +63,16 @@ class TelegramAPIConnector(ActionConnector[TelegramAPIConfig, TelegramInput]):
                 "parse_mode": "HTML",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        message_id = data.get("result", {}).get("message_id")
-                        logging.info(
-                            f"Telegram message sent successfully! Message ID: {message_id}"
-                        )
-                    else:
-                        error_text = await response.text()
-                        logging.error(
-                            f"Telegram API error: {response.status} - {error_text}"
-                        )
+            response = await get_http_client().post_async(url, json=payload)
+            if response.status == 200:
+                message_id = response.json().get("result", {}).get("message_id")
+                logging.info(
+                    f"Telegram message sent successfully! Message ID: {message_id}"
+                )
+            else:
+                logging.error(
+                    f"Telegram API error: {response.status} - {response.text}"
+                )
 
         except Exception as e:
             logging.error(f"Failed to send Telegram message: {str(e)}")
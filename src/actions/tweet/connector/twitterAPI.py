@@ -15,6 +15,9 @@ class TweetAPIConnector(ActionConnector[ActionConfig, TweetInput]):
     This connector integrates with Twitter API v2 to post tweets from the robot.
     """
 
+    # The tweepy client blocks, so tweets are sent from a thread of their own
+    blocking = True
+
     def __init__(self, config: ActionConfig):
         """
         Initialize the Twitter API connector.
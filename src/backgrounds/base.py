@@ -1,9 +1,10 @@
 import threading
-import time
 import typing as T
 
 from pydantic import BaseModel, ConfigDict
 
+from providers.clock import get_clock
+
 ConfigType = T.TypeVar("ConfigType", bound="BackgroundConfig")
 
 
@@ -61,6 +62,8 @@ class Background(T.Generic[ConfigType]):
         """
         Sleep for the specified duration, but wake immediately if stop signal is received.
 
+        The duration is measured by the runtime clock, see providers.clock.
+
         Parameters
         ----------
         duration : float
@@ -71,11 +74,12 @@ class Background(T.Generic[ConfigType]):
         bool
             True if sleep completed normally, False if interrupted by stop signal
         """
+        clock = get_clock()
         if self._stop_event is None:
-            time.sleep(duration)
+            clock.sleep(duration)
             return True
 
-        was_stopped = self._stop_event.wait(timeout=duration)
+        was_stopped = clock.wait(self._stop_event, duration)
 
         return not was_stopped
 
@@ -1,10 +1,28 @@
 import logging
 
+from pydantic import Field
+
 from backgrounds.base import Background, BackgroundConfig
 from providers.d435_provider import D435Provider
 
 
-class D435(Background[BackgroundConfig]):
+class D435Config(BackgroundConfig):
+    """
+    Configuration for D435 Background.
+
+    Parameters
+    ----------
+    voxel_size : float, default=0.0
+        Voxel edge length in meters for downsampling the obstacle cloud.
+    """
+
+    voxel_size: float = Field(
+        default=0.0,
+        description="Voxel edge length in meters for downsampling the obstacle cloud; 0 keeps all points",
+    )
+
+
+class D435(Background[D435Config]):
     """
     Background task for reading depth data from D435 camera.
 
@@ -16,18 +34,18 @@ class D435(Background[BackgroundConfig]):
     for obstacle detection and navigation assistance.
     """
 
-    def __init__(self, config: BackgroundConfig):
+    def __init__(self, config: D435Config):
         """
         Initialize D435 background task with configuration.
 
         Parameters
         ----------
-        config : BackgroundConfig
-            Configuration object for the background task. The base configuration
-            is used as D435 does not require additional parameters.
+        config : D435Config
+            Configuration object for the background task.
         """
         super().__init__(config)
 
         self.d435_provider = D435Provider()
+        self.d435_provider.set_voxel_size(self.config.voxel_size)
         self.d435_provider.start()
         logging.info("Initiated D435 Provider in background")
@@ -34,6 +34,8 @@ class RFmapperConfig(BackgroundConfig):
         Unique Robot ID.
     unitree_ethernet : Optional[str]
         Unitree Ethernet channel.
+    fabric_max_batch : int
+        Maximum number of payloads per FABRIC upload; batching is off at 1.
     """
 
     name: str = Field(default="RFmapper", description="Name of the RF mapper")
@@ -42,6 +44,9 @@ class RFmapperConfig(BackgroundConfig):
     unitree_ethernet: Optional[str] = Field(
         default=None, description="Unitree Ethernet channel"
     )
+    fabric_max_batch: int = Field(
+        default=1, description="Maximum number of payloads per FABRIC upload"
+    )
 
 
 class RFmapper(Background[RFmapperConfig]):
@@ -109,7 +114,11 @@ class RFmapper(Background[RFmapperConfig]):
         self.odom = UnitreeGo2OdomProvider()
         logging.info(f"Mapper Odom Provider: {self.odom}")
 
-        self.fds = FabricDataSubmitter(api_key=self.api_key, write_to_local_file=True)
+        self.fds = FabricDataSubmitter(
+            api_key=self.api_key,
+            write_to_local_file=True,
+            max_batch=self.config.fabric_max_batch,
+        )
 
         self.seen_devices: Dict[str, RFData] = {}
 
@@ -1,4 +1,3 @@
-import ast
 import json
 import logging
 import multiprocessing as mp
@@ -12,6 +11,7 @@ from jsonschema import ValidationError, validate
 
 from runtime.config import load_mode_config
 from runtime.converter import convert_to_multi_mode
+from runtime.plugin_index import get_plugin_index
 
 app = typer.Typer()
 
@@ -563,7 +563,9 @@ def _validate_mode_components(
 
 def _check_class_in_dir(directory: str, class_name: str) -> bool:
     """
-    Check if a class exists in any .py file in the given directory using AST.
+    Check if a class exists in any .py file in the given directory.
+
+    Uses the shared plugin index, so repeated checks do not re-parse files.
 
     Parameters
     ----------
@@ -580,18 +582,8 @@ def _check_class_in_dir(directory: str, class_name: str) -> bool:
     if not os.path.exists(directory):
         return False
 
-    for filename in os.listdir(directory):
-        if filename.endswith(".py") and filename != "__init__.py":
-            filepath = os.path.join(directory, filename)
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    tree = ast.parse(f.read())
-                    for node in tree.body:
-                        if isinstance(node, ast.ClassDef) and node.name == class_name:
-                            return True
-            except Exception:
-                continue
-    return False
+    index = get_plugin_index(directory)
+    return index.find_class(class_name, exclude=("__init__",)) is not None
 
 
 def _check_input_exists(input_type: str) -> bool:
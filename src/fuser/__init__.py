@@ -1,12 +1,39 @@
 import logging
 import time
 import typing as T
+from dataclasses import dataclass
 
 from actions import describe_action
 from inputs.base import Sensor
+from providers.clock import get_clock
 from providers.io_provider import IOProvider
 from runtime.config import RuntimeConfig
 
+QUESTION_PROMPT = "What will you do? Actions:"
+
+
+@dataclass
+class StaticSections:
+    """
+    Prompt sections that are fixed for a runtime configuration.
+
+    Parameters
+    ----------
+    key : tuple
+        The configuration values the sections were rendered from.
+    system_prompt : str
+        Basic context, laws and examples.
+    system_prompt_without_laws : str
+        Basic context and examples, used when the laws arrive as an input.
+    actions_fused : str
+        Descriptions of the available actions.
+    """
+
+    key: tuple
+    system_prompt: str
+    system_prompt_without_laws: str
+    actions_fused: str
+
 
 class Fuser:
     """
@@ -35,12 +62,70 @@ class Fuser:
         self.config = config
         self.io_provider = IOProvider()
 
-    def fuse(self, inputs: list[Sensor], finished_promises: list[T.Any]) -> str:
+        self.section_timings: T.Dict[str, float] = {}
+        self._static: T.Optional[StaticSections] = None
+        self._last_inputs: T.Optional[T.Tuple[tuple, str, str, str]] = None
+
+    def invalidate(self):
+        """
+        Drop the cached static prompt sections.
+
+        The cache is keyed on the runtime configuration and rebuilt
+        automatically when it changes; this forces a rebuild on the next tick.
+        """
+        self._static = None
+        self._last_inputs = None
+
+    def _static_key(self) -> tuple:
+        return (
+            id(self.config),
+            self.config.system_prompt_base,
+            self.config.system_governance,
+            self.config.system_prompt_examples,
+            tuple(
+                (action.name, action.llm_label, action.exclude_from_prompt)
+                for action in self.config.agent_actions
+            ),
+        )
+
+    def _build_static(self, key: tuple) -> StaticSections:
+        base = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
+        laws = "\nLAWS:\n" + self.config.system_governance
+        examples = ""
+        if self.config.system_prompt_examples:
+            examples = "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
+
+        # descriptions of possible actions
+        actions_fused = ""
+
+        for action in self.config.agent_actions:
+            desc = describe_action(
+                action.name, action.llm_label, action.exclude_from_prompt
+            )
+            if desc:
+                actions_fused += desc + "\n\n"
+
+        return StaticSections(
+            key=key,
+            system_prompt=base + laws + examples,
+            system_prompt_without_laws=base + examples,
+            actions_fused=actions_fused,
+        )
+
+    def fuse(
+        self,
+        inputs: list[Sensor],
+        finished_promises: list[T.Any],
+        keep_previous_inputs: bool = False,
+    ) -> str:
         """
         Combine all inputs into a single formatted prompt string.
 
         Integrates system prompts, input buffers, action descriptions, and
-        command prompts into a structured format for LLM processing.
+        command prompts into a structured format for LLM processing. The
+        system prompt and action descriptions are fixed for a runtime
+        configuration and are rendered once; the timings of each section are
+        kept in ``section_timings``.
 
         Parameters
         ----------
@@ -48,6 +133,10 @@ class Fuser:
             List of agent input objects containing latest input buffers.
         finished_promises : list[Any]
             List of completed promises from previous actions.
+        keep_previous_inputs : bool
+            Reuse the previous reading of inputs that have no new data, as if
+            the previous fuse had not drained them. Used when the previous
+            prompt was fused ahead of time for a speculative LLM call.
 
         Returns
         -------
@@ -55,43 +144,56 @@ class Fuser:
             Fused prompt string combining all inputs and context.
         """
         # Record the timestamp of the input
-        self.io_provider.fuser_start_time = time.time()
-
-        input_strings = [input.formatted_latest_buffer() for input in inputs]
+        self.io_provider.fuser_start_time = get_clock().time()
+        started = time.perf_counter()
+
+        # Input buffers are drained by formatted_latest_buffer, so every
+        # input is read on every tick
+        input_strings = tuple(input.formatted_latest_buffer() for input in inputs)
+        if (
+            keep_previous_inputs
+            and self._last_inputs is not None
+            and len(self._last_inputs[0]) == len(input_strings)
+        ):
+            input_strings = tuple(
+                new if new is not None else previous
+                for new, previous in zip(input_strings, self._last_inputs[0])
+            )
         logging.debug(f"InputMessageArray: {input_strings}")
-
-        # Combine all inputs, memories, and configurations into a single prompt
-        system_prompt = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
-
-        inputs_fused = " ".join([s for s in input_strings if s is not None])
-
-        # if we provide laws from blockchain, these override the locally stored rules
-        # the rules are not provided in the system prompt, but as a separate INPUT,
-        # since they are flowing from the outside world
-        if "Universal Laws" not in inputs_fused:
-            system_prompt += "\nLAWS:\n" + self.config.system_governance
-
-        if self.config.system_prompt_examples:
-            system_prompt += "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
-
-        # descriptions of possible actions
-        actions_fused = ""
-
-        for action in self.config.agent_actions:
-            desc = describe_action(
-                action.name, action.llm_label, action.exclude_from_prompt
+        inputs_done = time.perf_counter()
+
+        key = self._static_key()
+        if self._static is None or self._static.key != key:
+            self._static = self._build_static(key)
+            self._last_inputs = None
+        static = self._static
+        static_done = time.perf_counter()
+
+        if self._last_inputs is not None and self._last_inputs[0] == input_strings:
+            _, system_prompt, inputs_fused, fused_prompt = self._last_inputs
+        else:
+            inputs_fused = " ".join([s for s in input_strings if s is not None])
+
+            # if we provide laws from blockchain, these override the locally stored rules
+            # the rules are not provided in the system prompt, but as a separate INPUT,
+            # since they are flowing from the outside world
+            if "Universal Laws" not in inputs_fused:
+                system_prompt = static.system_prompt
+            else:
+                system_prompt = static.system_prompt_without_laws
+
+            # this is the final prompt:
+            # (1) a (typically) fixed overall system prompt with the agents, name, rules, and examples
+            # (2) all the inputs (vision, sound, etc.)
+            # (3) a (typically) fixed list of available actions
+            # (4) a (typically) fixed system prompt requesting commands to be generated
+            fused_prompt = f"{system_prompt}\n\nAVAILABLE INPUTS:\n{inputs_fused}\nAVAILABLE ACTIONS:\n\n{static.actions_fused}\n\n{QUESTION_PROMPT}"
+            self._last_inputs = (
+                input_strings,
+                system_prompt,
+                inputs_fused,
+                fused_prompt,
             )
-            if desc:
-                actions_fused += desc + "\n\n"
-
-        question_prompt = "What will you do? Actions:"
-
-        # this is the final prompt:
-        # (1) a (typically) fixed overall system prompt with the agents, name, rules, and examples
-        # (2) all the inputs (vision, sound, etc.)
-        # (3) a (typically) fixed list of available actions
-        # (4) a (typically) fixed system prompt requesting commands to be generated
-        fused_prompt = f"{system_prompt}\n\nAVAILABLE INPUTS:\n{inputs_fused}\nAVAILABLE ACTIONS:\n\n{actions_fused}\n\n{question_prompt}"
 
         logging.debug(f"FINAL PROMPT: {fused_prompt}")
 
@@ -99,10 +201,19 @@ class Fuser:
         self.io_provider.set_fuser_system_prompt(f"{system_prompt}")
         self.io_provider.set_fuser_inputs(inputs_fused)
         self.io_provider.set_fuser_available_actions(
-            f"AVAILABLE ACTIONS:\n{actions_fused}\n\n{question_prompt}"
+            f"AVAILABLE ACTIONS:\n{static.actions_fused}\n\n{QUESTION_PROMPT}"
         )
 
+        finished = time.perf_counter()
+        self.section_timings = {
+            "inputs": inputs_done - started,
+            "static": static_done - inputs_done,
+            "assemble": finished - static_done,
+            "total": finished - started,
+        }
+        logging.debug(f"Fuser section timings: {self.section_timings}")
+
         # Record the timestamp of the output
-        self.io_provider.fuser_end_time = time.time()
+        self.io_provider.fuser_end_time = get_clock().time()
 
         return fused_prompt
@@ -4,6 +4,7 @@ from typing import Any, Dict
 import aiohttp
 
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from providers.http_client import get_http_client
 
 
 async def start_nav2_hook(context: Dict[str, Any]):
@@ -22,38 +23,37 @@ async def start_nav2_hook(context: Dict[str, Any]):
     elevenlabs_provider: ElevenLabsTTSProvider = ElevenLabsTTSProvider()
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                nav2_url,
-                json={"map_name": map_name},
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
+        response = await get_http_client().post_async(
+            nav2_url,
+            json={"map_name": map_name},
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
 
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"Nav2 started successfully: {result.get('message', 'Success')}"
-                    )
-                    elevenlabs_provider.add_pending_message(
-                        "Navigation system has started successfully."
-                    )
-                    return {
-                        "status": "success",
-                        "message": "Nav2 process initiated",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
+        if response.status == 200:
+            result = response.json()
+            logging.info(
+                f"Nav2 started successfully: {result.get('message', 'Success')}"
+            )
+            elevenlabs_provider.add_pending_message(
+                "Navigation system has started successfully."
+            )
+            return {
+                "status": "success",
+                "message": "Nav2 process initiated",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to start Nav2: {error_info.get('message', 'Unknown error')}"
+            )
 
     except aiohttp.ClientError as e:
         logging.error(f"Error calling Nav2 API: {str(e)}")
@@ -73,34 +73,33 @@ async def stop_nav2_hook(context: Dict[str, Any]):
     nav2_url = f"{base_url}/stop/nav2"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                nav2_url,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
+        response = await get_http_client().post_async(
+            nav2_url,
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
 
-                if response.status == 200:
-                    result = await response.json()
-                    logging.info(
-                        f"Nav2 stopped successfully: {result.get('message', 'Success')}"
-                    )
-                    return {
-                        "status": "success",
-                        "message": "Nav2 process stopped",
-                        "response": result,
-                    }
-                else:
-                    try:
-                        error_info = await response.json()
-                    except Exception as _:
-                        error_info = {"message": "Unknown error"}
-                    logging.error(
-                        f"Failed to stop Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
-                    raise Exception(
-                        f"Failed to stop Nav2: {error_info.get('message', 'Unknown error')}"
-                    )
+        if response.status == 200:
+            result = response.json()
+            logging.info(
+                f"Nav2 stopped successfully: {result.get('message', 'Success')}"
+            )
+            return {
+                "status": "success",
+                "message": "Nav2 process stopped",
+                "response": result,
+            }
+        else:
+            try:
+                error_info = response.json()
+            except Exception as _:
+                error_info = {"message": "Unknown error"}
+            logging.error(
+                f"Failed to stop Nav2: {error_info.get('message', 'Unknown error')}"
+            )
+            raise Exception(
+                f"Failed to stop Nav2: {error_info.get('message', 'Unknown error')}"
+            )
 
     except aiohttp.ClientError as e:
         logging.error(f"Error calling Nav2 stop API: {str(e)}")
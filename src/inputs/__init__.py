@@ -2,10 +2,10 @@ import importlib
 import inspect
 import logging
 import os
-import re
 import typing as T
 
 from inputs.base import Sensor, SensorConfig
+from runtime.plugin_index import find_plugin_module
 
 
 def find_module_with_class(class_name: str) -> T.Optional[str]:
@@ -24,30 +24,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
 
-    if not os.path.exists(plugins_dir):
-        return None
-
-    plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
-
-    for plugin_file in plugin_files:
-        file_path = os.path.join(plugins_dir, plugin_file)
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            pattern = (
-                rf"^class\s+{re.escape(class_name)}\s*\([^)]*FuserInput[^)]*\)\s*:"
-            )
-
-            if re.search(pattern, content, re.MULTILINE):
-                return plugin_file[:-3]
-
-        except Exception as e:
-            logging.warning(f"Could not read {plugin_file}: {e}")
-            continue
-
-    return None
+    return find_plugin_module(plugins_dir, class_name, base="FuserInput")
 
 
 def load_input(input_config: T.Dict[str, T.Any]) -> Sensor:
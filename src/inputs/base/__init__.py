@@ -42,8 +42,15 @@ class Sensor(T.Generic[ConfigType, R]):
     --------------
     R
         The raw input type that this agent handles
+
+    Sensors whose ``_poll`` calls blocking code set ``blocking = True`` so the
+    runtime polls them on a worker thread; None polls them on the event loop
+    and warns once they stall it. The ``blocking`` config option overrides
+    the class attribute.
     """
 
+    blocking: T.Optional[bool] = None
+
     def __init__(self, config: ConfigType):
         """
         Initialize an Sensor instance.
@@ -108,6 +115,16 @@ class Sensor(T.Generic[ConfigType, R]):
         """
         raise NotImplementedError
 
+    def stop_listening(self) -> None:
+        """
+        Release what the sensor registered with shared providers.
+
+        Called by the input orchestrator once it stops listening to the
+        sensor, e.g. on a mode transition, after which the sensor is not
+        used again. Sensors that register callbacks with singleton
+        providers unregister them here.
+        """
+
     async def listen(self) -> T.AsyncIterator[R]:
         """
         Create an asynchronous iterator that yields raw input events.
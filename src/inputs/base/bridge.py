@@ -0,0 +1,259 @@
+import asyncio
+import threading
+import typing as T
+from collections import deque
+
+V = T.TypeVar("V")
+
+
+class _Waiters:
+    """
+    Futures of coroutines waiting for a value, possibly on several loops.
+    """
+
+    def __init__(self):
+        self._waiters: T.List[T.Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def add(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        waiter = loop.create_future()
+        self._waiters.append((loop, waiter))
+        return waiter
+
+    def remove(self, waiter: asyncio.Future):
+        self._waiters = [(lp, w) for lp, w in self._waiters if w is not waiter]
+
+    def wake_all(self):
+        waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The loop of the waiter was closed
+                pass
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _wait(waiter: asyncio.Future, deadline: T.Optional[float]) -> bool:
+    """
+    Wait for a waiter until the deadline. Returns False on timeout.
+    """
+    if deadline is None:
+        await waiter
+        return True
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining <= 0:
+        return False
+    try:
+        await asyncio.wait_for(waiter, remaining)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+class ThreadBridge(T.Generic[V]):
+    """
+    FIFO queue fed from any thread and awaited from asyncio.
+
+    Provider callbacks run on Zenoh, websocket or serial threads. They
+    ``put_nowait`` into the bridge, which wakes waiting coroutines with
+    ``loop.call_soon_threadsafe``, so inputs can ``await get()`` instead of
+    polling a ``queue.Queue`` with short sleeps. The consumer loop is picked
+    up when it first waits, so the bridge can be created before the event
+    loop runs.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize the bridge.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of queued items; when full, the oldest item is
+            dropped. 0 means unbounded.
+        """
+        self._items: T.Deque[V] = deque(maxlen=maxsize or None)
+        self._lock = threading.Lock()
+        self._waiters = _Waiters()
+
+    def put_nowait(self, item: V) -> None:
+        """
+        Queue an item and wake the waiting consumers. Safe from any thread.
+
+        Parameters
+        ----------
+        item : V
+            The item to queue.
+        """
+        with self._lock:
+            self._items.append(item)
+            self._waiters.wake_all()
+
+    def get_nowait(self) -> V:
+        """
+        Take the oldest item without waiting.
+
+        Returns
+        -------
+        V
+            The oldest queued item.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            If no item is queued.
+        """
+        with self._lock:
+            if not self._items:
+                raise asyncio.QueueEmpty
+            return self._items.popleft()
+
+    async def get(self, timeout: T.Optional[float] = None) -> T.Optional[V]:
+        """
+        Wait for the oldest item.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait before giving up. Waits forever by default.
+
+        Returns
+        -------
+        V or None
+            The oldest queued item, or None if the timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._items:
+                    return self._items.popleft()
+                waiter = self._waiters.add(loop)
+            try:
+                if not await _wait(waiter, deadline):
+                    return None
+            finally:
+                with self._lock:
+                    self._waiters.remove(waiter)
+
+    def qsize(self) -> int:
+        """
+        Get the number of queued items.
+
+        Returns
+        -------
+        int
+            The queue length.
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """
+        Check whether no item is queued.
+
+        Returns
+        -------
+        bool
+            True if the queue is empty.
+        """
+        return not self._items
+
+
+class LatestValue(T.Generic[V]):
+    """
+    Latest-value slot written from any thread and awaited from asyncio.
+
+    Unlike ThreadBridge, only the newest value is kept, which suits sensors
+    whose readings supersede each other, e.g. lidar scans. Every write bumps
+    a version, so each consumer can wait for a value newer than the last
+    one it saw.
+    """
+
+    def __init__(self, value: T.Optional[V] = None):
+        """
+        Initialize the slot.
+
+        Parameters
+        ----------
+        value : V, optional
+            The initial value, at version 0.
+        """
+        self._value = value
+        self._version = 0
+        self._lock = threading.Lock()
+        self._waiters = _Waiters()
+
+    @property
+    def value(self) -> T.Optional[V]:
+        """
+        Get the latest value.
+
+        Returns
+        -------
+        V or None
+            The value of the latest write.
+        """
+        return self._value
+
+    @property
+    def version(self) -> int:
+        """
+        Get the number of writes so far.
+
+        Returns
+        -------
+        int
+            The version of the latest value.
+        """
+        return self._version
+
+    def set(self, value: V) -> None:
+        """
+        Replace the value and wake the waiting consumers. Safe from any thread.
+
+        Parameters
+        ----------
+        value : V
+            The new value.
+        """
+        with self._lock:
+            self._value = value
+            self._version += 1
+            self._waiters.wake_all()
+
+    async def wait_newer(
+        self, version: int, timeout: T.Optional[float] = None
+    ) -> T.Tuple[T.Optional[V], int]:
+        """
+        Wait for a value newer than the given version.
+
+        Parameters
+        ----------
+        version : int
+            The version the consumer saw last.
+        timeout : float, optional
+            Seconds to wait before giving up. Waits forever by default.
+
+        Returns
+        -------
+        Tuple[V or None, int]
+            The latest value and its version. The version equals the given
+            one if the timeout expired first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._version != version:
+                    return self._value, self._version
+                waiter = self._waiters.add(loop)
+            try:
+                if not await _wait(waiter, deadline):
+                    return self._value, self._version
+            finally:
+                with self._lock:
+                    self._waiters.remove(waiter)
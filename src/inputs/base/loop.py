@@ -1,6 +1,7 @@
 import typing as T
 
 from inputs.base import Sensor, SensorConfig
+from providers.trace_provider import TraceProvider
 
 R = T.TypeVar("R")
 ConfigType = T.TypeVar("ConfigType", bound="SensorConfig")
@@ -34,8 +35,12 @@ class FuserInput(Sensor[ConfigType, R]):
         R
             Raw input events from polling
         """
+        trace_provider = TraceProvider()
+        lane = f"input:{type(self).__name__}"
         while True:
-            yield await self._poll()
+            with trace_provider.span("poll", lane=lane):
+                event = await self._poll()
+            yield event
 
     async def _poll(self) -> R:
         """
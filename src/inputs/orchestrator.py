@@ -1,8 +1,20 @@
 import asyncio
 import logging
+import typing as T
 from collections.abc import Sequence
 
 from inputs.base import Sensor
+from inputs.base.loop import FuserInput
+from providers.sleep_ticker_provider import SleepTickerProvider
+from providers.trace_provider import TraceProvider
+from runtime.plugin_executor import OffloadPolicy
+from runtime.replay import (
+    ReplayInput,
+    SessionRecorder,
+    SessionReplay,
+    input_channel,
+    text_channel,
+)
 
 
 class InputOrchestrator:
@@ -10,12 +22,21 @@ class InputOrchestrator:
     Manages and coordinates multiple input sources.
 
     Handles concurrent processing of multiple Sensor instances,
-    orchestrating their data flows.
+    orchestrating their data flows. Polling inputs that block the event
+    loop are polled on a worker thread of their own, see OffloadPolicy.
+    The raw events of the inputs and the text they hand to the fuser can be
+    recorded, or replaced with the events of a recorded session, see
+    runtime.replay.
     """
 
     inputs: Sequence[Sensor]
 
-    def __init__(self, inputs: Sequence[Sensor]):
+    def __init__(
+        self,
+        inputs: Sequence[Sensor],
+        recorder: T.Optional[SessionRecorder] = None,
+        replay: T.Optional[SessionReplay] = None,
+    ):
         """
         Initialize InputOrchestrator instance with input sources.
 
@@ -23,8 +44,79 @@ class InputOrchestrator:
         ----------
         inputs : Sequence[Sensor]
             Sequence of input sources to manage.
+        recorder : SessionRecorder, optional
+            Records the raw events of the inputs.
+        replay : SessionReplay, optional
+            Provides recorded raw events in place of the inputs' own.
         """
         self.inputs = inputs
+        self.recorder = recorder
+        self.replay = replay
+        self.names = self._input_names(inputs)
+        self.sleep_ticker_provider = SleepTickerProvider()
+        self.trace_provider = TraceProvider()
+        self.offload_policies: T.Dict[int, OffloadPolicy] = {}
+        if recorder:
+            for input in inputs:
+                self._record_text(input, recorder)
+
+    def _record_text(self, input: Sensor, recorder: SessionRecorder) -> None:
+        """
+        Record the text an input hands to the fuser, for ReplayInput.
+
+        Parameters
+        ----------
+        input : Sensor
+            The input source.
+        recorder : SessionRecorder
+            The recorder of the session.
+        """
+        name = self.names[id(input)]
+        read = input.formatted_latest_buffer
+
+        def formatted_latest_buffer() -> T.Optional[str]:
+            text = read()
+            if text is not None:
+                recorder.record_text(name, text)
+            return text
+
+        input.formatted_latest_buffer = formatted_latest_buffer  # type: ignore
+
+    @staticmethod
+    def _input_names(inputs: Sequence[Sensor]) -> T.Dict[int, str]:
+        """
+        Name the inputs by plugin class, numbering repeated classes.
+
+        Substitutes of a plugin, e.g. the mock inputs of the integration
+        tests, get the name of the plugin they subclass, and a ReplayInput
+        the name of the plugin it replaces.
+
+        Parameters
+        ----------
+        inputs : Sequence[Sensor]
+            The input sources.
+
+        Returns
+        -------
+        Dict[int, str]
+            The names, keyed by input id. Stable for the same configuration,
+            so recorded events can be matched to their inputs.
+        """
+        names: T.Dict[int, str] = {}
+        counts: T.Dict[str, int] = {}
+        for input in inputs:
+            plugin = next(
+                (
+                    cls
+                    for cls in type(input).__mro__
+                    if cls.__module__.startswith("inputs.plugins.")
+                ),
+                type(input),
+            )
+            name = input.name if isinstance(input, ReplayInput) else plugin.__name__
+            counts[name] = counts.get(name, 0) + 1
+            names[id(input)] = name if counts[name] == 1 else f"{name}#{counts[name]}"
+        return names
 
     async def listen(self) -> None:
         """
@@ -39,7 +131,22 @@ class InputOrchestrator:
             )
             for input in self.inputs
         ]
-        results = await asyncio.gather(*input_tasks, return_exceptions=True)
+        channels = [
+            (
+                text_channel(self.names[id(input)])
+                if isinstance(input, ReplayInput)
+                else input_channel(self.names[id(input)])
+            )
+            for input in self.inputs
+        ]
+        if self.replay:
+            self.replay.attach(channels)
+        try:
+            results = await asyncio.gather(*input_tasks, return_exceptions=True)
+        finally:
+            if self.replay:
+                self.replay.detach(channels)
+            self.shutdown()
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -56,14 +163,97 @@ class InputOrchestrator:
             Input source to listen to
         """
         input_name = type(input).__name__
+        # Inputs wake event-driven ticks unless configured with trigger_tick: false
+        trigger_tick = getattr(getattr(input, "config", None), "trigger_tick", True)
         try:
-            async for event in input.listen():
+            async for event in self._events(input):
+                if self.recorder:
+                    self.recorder.record_event(self.names[id(input)], event)
                 try:
-                    await input.raw_to_text(event)
+                    with self.trace_provider.span(
+                        "raw_to_text", lane=f"input:{input_name}"
+                    ):
+                        await input.raw_to_text(event)
                 except Exception as e:
                     logging.error(
                         f"Error processing event in {input_name}: {e}", exc_info=True
                     )
+                    continue
+                if event is not None and trigger_tick:
+                    self.sleep_ticker_provider.notify()
         except Exception as e:
             logging.error(f"Input {input_name} listener failed: {e}", exc_info=True)
             raise
+
+    def _events(self, input: Sensor) -> T.AsyncIterator[T.Any]:
+        """
+        Get the raw events of an input source.
+
+        Parameters
+        ----------
+        input : Sensor
+            Input source to listen to
+
+        Returns
+        -------
+        AsyncIterator
+            The events of the input. Polling inputs with the default loop are
+            polled here, so their ``_poll`` can be offloaded. During a replay,
+            the recorded events of the input.
+        """
+        if self.replay:
+            return self.replay.events(
+                self.names[id(input)], text=isinstance(input, ReplayInput)
+            )
+        if (
+            isinstance(input, FuserInput)
+            and type(input)._listen_loop is FuserInput._listen_loop
+        ):
+            policy = OffloadPolicy(input, "input")
+            self.offload_policies[id(input)] = policy
+            return self._poll_loop(input, policy)
+        return input.listen()
+
+    async def _poll_loop(
+        self, input: FuserInput, policy: OffloadPolicy
+    ) -> T.AsyncIterator[T.Any]:
+        """
+        Poll an input source, on its worker thread if it blocks.
+
+        Parameters
+        ----------
+        input : FuserInput
+            Input source to poll
+        policy : OffloadPolicy
+            Decides where each poll runs
+
+        Yields
+        ------
+        Any
+            Raw input events from polling
+        """
+        input_name = type(input).__name__
+        lane = f"input:{input_name}"
+        while True:
+            with self.trace_provider.span("poll", lane=lane):
+                try:
+                    event = await policy.run(input._poll())
+                except asyncio.TimeoutError:
+                    logging.error(
+                        f"Polling {input_name} timed out after {policy.timeout}s"
+                    )
+                    continue
+            yield event
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads of offloaded inputs and release the inputs.
+        """
+        for policy in self.offload_policies.values():
+            policy.shutdown()
+        self.offload_policies.clear()
+        for input in self.inputs:
+            try:
+                input.stop_listening()
+            except Exception as e:
+                logging.error(f"Error stopping input {type(input).__name__}: {e}")
@@ -1,4 +1,3 @@
-import asyncio
 import json
 import logging
 import time
@@ -8,6 +7,7 @@ from uuid import uuid4
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.asr_rtsp_provider import ASRRTSPProvider
 from providers.io_provider import IOProvider
@@ -29,6 +29,9 @@ LANGUAGE_CODE_MAP: dict = {
     "arabic": "ar-SA",
 }
 
+# Seconds _poll waits for speech before it returns None
+POLL_TIMEOUT = 0.5
+
 
 class GoogleASRRTSPSensorConfig(SensorConfig):
     """
@@ -90,7 +93,7 @@ class GoogleASRRTSPInput(FuserInput[GoogleASRRTSPSensorConfig, Optional[str]]):
         self.io_provider = IOProvider()
 
         # Message buffer for incoming ASR messages
-        self.message_buffer: asyncio.Queue[str] = asyncio.Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize ASR provider
         api_key = self.config.api_key
@@ -165,19 +168,15 @@ class GoogleASRRTSPInput(FuserInput[GoogleASRRTSPSensorConfig, Optional[str]]):
 
     async def _poll(self) -> Optional[str]:
         """
-        Poll for new messages in the buffer.
+        Wait for the next message from the ASR service.
 
         Returns
         -------
         Optional[str]
-            Message from the buffer if available, None otherwise
+            Message from the buffer, or None if none arrived within the
+            poll timeout
         """
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except asyncio.QueueEmpty:
-            await asyncio.sleep(0.01)
-            return None
+        return await self.message_buffer.get(timeout=POLL_TIMEOUT)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
@@ -217,6 +216,8 @@ class GoogleASRRTSPInput(FuserInput[GoogleASRRTSPSensorConfig, Optional[str]]):
                 self.messages.append(pending_message.message)
             else:
                 self.messages[-1] = f"{self.messages[-1]} {pending_message.message}"
+            # Wake the cortex right away instead of on the next idle poll
+            self.global_sleep_ticker_provider.skip_sleep = True
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -11,6 +11,7 @@ from pydantic import Field
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
+from providers.http_client import NO_RETRY, get_http_client
 from providers.io_provider import IOProvider
 
 
@@ -107,40 +108,36 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
         await asyncio.sleep(self.poll_interval)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # First, get current status
-                async with session.get(
-                    self.status_url,
-                    timeout=aiohttp.ClientTimeout(total=2),
-                ) as response:
-                    if response.status != 200:
-                        return None
-
-                    data = await response.json()
-                    is_tracked = data.get("is_tracked", False)
-                    status = data.get("status", "UNKNOWN")
-                    target_track_id = data.get("target_track_id")
-
-                    # If tracking, remember we've successfully tracked
-                    if is_tracked:
-                        self._has_ever_tracked = True
-
-                    # Only retry enrollment if INACTIVE (no one enrolled yet)
-                    # Do NOT re-enroll if SEARCHING (person enrolled but temporarily out of frame)
-                    if status == "INACTIVE" and target_track_id is None:
-                        current_time = time.time()
-                        time_since_last_enroll = (
-                            current_time - self._last_enroll_attempt
-                        )
-
-                        if time_since_last_enroll >= self.enroll_retry_interval:
-                            self._last_enroll_attempt = current_time
-                            logging.info(
-                                "PersonFollowingStatus: Status INACTIVE, attempting enrollment"
-                            )
-                            await self._try_enroll(session)
-
-                    return self._format_status(data)
+            # The next poll is the retry
+            response = await get_http_client().get_async(
+                self.status_url, timeout=2, retry=NO_RETRY
+            )
+            if response.status != 200:
+                return None
+
+            data = response.json()
+            is_tracked = data.get("is_tracked", False)
+            status = data.get("status", "UNKNOWN")
+            target_track_id = data.get("target_track_id")
+
+            # If tracking, remember we've successfully tracked
+            if is_tracked:
+                self._has_ever_tracked = True
+
+            # Only retry enrollment if INACTIVE (no one enrolled yet)
+            # Do NOT re-enroll if SEARCHING (person enrolled but temporarily out of frame)
+            if status == "INACTIVE" and target_track_id is None:
+                current_time = time.time()
+                time_since_last_enroll = current_time - self._last_enroll_attempt
+
+                if time_since_last_enroll >= self.enroll_retry_interval:
+                    self._last_enroll_attempt = current_time
+                    logging.info(
+                        "PersonFollowingStatus: Status INACTIVE, attempting enrollment"
+                    )
+                    await self._try_enroll()
+
+            return self._format_status(data)
 
         except aiohttp.ClientError as e:
             logging.debug(f"PersonFollowingStatus: Poll failed: {e}")
@@ -149,26 +146,18 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
             logging.warning(f"PersonFollowingStatus: Unexpected error: {e}")
             return None
 
-    async def _try_enroll(self, session: aiohttp.ClientSession) -> None:
+    async def _try_enroll(self) -> None:
         """
         Attempt to enroll a person for tracking.
-
-        Parameters
-        ----------
-        session : aiohttp.ClientSession
-            The HTTP session to use for the request.
         """
         try:
-            async with session.post(
-                self.enroll_url,
-                timeout=aiohttp.ClientTimeout(total=3),
-            ) as response:
-                if response.status == 200:
-                    logging.info("PersonFollowingStatus: Re-enrollment request sent")
-                else:
-                    logging.debug(
-                        f"PersonFollowingStatus: Enroll returned status {response.status}"
-                    )
+            response = await get_http_client().post_async(self.enroll_url, timeout=3)
+            if response.status == 200:
+                logging.info("PersonFollowingStatus: Re-enrollment request sent")
+            else:
+                logging.debug(
+                    f"PersonFollowingStatus: Enroll returned status {response.status}"
+                )
         except Exception as e:
             logging.debug(f"PersonFollowingStatus: Enroll request failed: {e}")
             return None
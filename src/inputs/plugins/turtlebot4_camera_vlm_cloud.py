@@ -1,16 +1,17 @@
-import asyncio
 import json
 import logging
 import time
-from queue import Empty, Queue
 from typing import Dict, List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.scene_gate import SceneChangeGate
 from providers.turtlebot4_camera_vlm_provider import TurtleBot4CameraVLMProvider
+from providers.turtlebot4_odom_provider import TurtleBot4OdomProvider
 
 
 class TurtleBot4CameraVLMCloudConfig(SensorConfig):
@@ -27,6 +28,11 @@ class TurtleBot4CameraVLMCloudConfig(SensorConfig):
         Stream Base URL.
     URID : str
         URID (Unitree ID).
+    scene_change_threshold : float
+        Mean grayscale difference from which a frame shows a new scene; 0
+        sends every frame to the VLM.
+    max_staleness : float
+        Seconds after which a frame is sent even if the scene is unchanged.
     """
 
     api_key: Optional[str] = Field(default=None, description="API Key")
@@ -36,6 +42,13 @@ class TurtleBot4CameraVLMCloudConfig(SensorConfig):
     )
     stream_base_url: Optional[str] = Field(default=None, description="Stream Base URL")
     URID: str = Field(default="default", description="URID (Unitree ID)")
+    scene_change_threshold: float = Field(
+        default=5.0,
+        description="Mean grayscale difference from which a frame shows a new scene",
+    )
+    max_staleness: float = Field(
+        default=5.0, description="Seconds after which an unchanged scene is resent"
+    )
 
 
 class TurtleBot4CameraVLMCloud(
@@ -66,7 +79,7 @@ class TurtleBot4CameraVLMCloud(
         self.messages: List[Message] = []
 
         # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize VLM provider
         api_key = self.config.api_key
@@ -77,9 +90,19 @@ class TurtleBot4CameraVLMCloud(
             or f"wss://api.openmind.org/api/core/teleops/stream/video?api_key={api_key}"
         )
         URID = self.config.URID
+        # Every frame is new while the robot drives
+        self.odom = TurtleBot4OdomProvider(URID)
 
+        scene_gate = SceneChangeGate(
+            threshold=self.config.scene_change_threshold,
+            max_staleness=self.config.max_staleness,
+            motion_hint=lambda: self.odom.moving,
+        )
         self.vlm: TurtleBot4CameraVLMProvider = TurtleBot4CameraVLMProvider(
-            ws_url=base_url, URID=URID, stream_url=stream_base_url
+            ws_url=base_url,
+            URID=URID,
+            stream_url=stream_base_url,
+            scene_gate=scene_gate,
         )
         self.vlm.start()
         self.vlm.register_message_callback(self._handle_vlm_message)
@@ -103,7 +126,7 @@ class TurtleBot4CameraVLMCloud(
             json_message: Dict = json.loads(raw_message)
             if "vlm_reply" in json_message:
                 vlm_reply = json_message["vlm_reply"]
-                self.message_buffer.put(vlm_reply)
+                self.message_buffer.put_nowait(vlm_reply)
                 logging.info("Detected VLM message: %s", vlm_reply)
         except json.JSONDecodeError:
             pass
@@ -112,20 +135,16 @@ class TurtleBot4CameraVLMCloud(
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits on the message buffer, which the provider thread fills, so
+        a reply is returned as soon as it arrives.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer, or None if none arrived
+            within half a second
         """
-        await asyncio.sleep(0.5)
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except Empty:
-            return None
+        return await self.message_buffer.get(timeout=0.5)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
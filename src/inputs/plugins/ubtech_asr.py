@@ -1,12 +1,11 @@
-import asyncio
 import logging
 import time
-from queue import Empty, Queue
 from typing import List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
@@ -63,7 +62,7 @@ class UbtechASRInput(FuserInput[UbtechASRSensorConfig, Optional[str]]):
         self.messages: List[str] = []
         self.descriptor_for_LLM = "Voice"
         self.io_provider = IOProvider()
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
         self.global_sleep_ticker_provider = SleepTickerProvider()
         # MODIFIED: Tracks the last time ASR resume was triggered
         self.last_asr_resume_trigger_time = time.time()
@@ -94,7 +93,7 @@ class UbtechASRInput(FuserInput[UbtechASRSensorConfig, Optional[str]]):
         """
         if message and len(message.split()) >= 1:
             logging.info("Detected ASR message: %s", message)
-            self.message_buffer.put(message)
+            self.message_buffer.put_nowait(message)
         else:
             logging.debug("Ignored empty or malformed ASR message: %s", message)
 
@@ -107,10 +106,9 @@ class UbtechASRInput(FuserInput[UbtechASRSensorConfig, Optional[str]]):
         Optional[str]
             The next message from the buffer if available, None otherwise
         """
-        await asyncio.sleep(0.1)
-        try:
-            # Attempt to get a message from the buffer that the provider has left.
-            message = self.message_buffer.get_nowait()
+        # Wait for a message from the provider, waking up to resume ASR
+        message = await self.message_buffer.get(timeout=0.1)
+        if message is not None:
             # If a message is successfully polled, we can allow the ASR resume cooldown to effectively reset
             # by setting last_asr_resume_trigger_time to a value that would allow immediate resume if buffer becomes empty.
             # This makes the system more responsive after successful speech.
@@ -119,7 +117,7 @@ class UbtechASRInput(FuserInput[UbtechASRSensorConfig, Optional[str]]):
                     time.time() - self.asr_resume_cooldown - 1
                 )
             return message
-        except Empty:
+        else:
             # The buffer is empty.
             # Only resume ASR if it's paused AND the cooldown period has elapsed since the last resume trigger.
             if self.asr.paused:
@@ -180,6 +178,8 @@ class UbtechASRInput(FuserInput[UbtechASRSensorConfig, Optional[str]]):
                 self.messages.append(pending_message.message)
             else:
                 self.messages[-1] = f"{self.messages[-1]} {pending_message.message}"
+            # Wake the cortex right away instead of on the next idle poll
+            self.global_sleep_ticker_provider.skip_sleep = True
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -1,13 +1,12 @@
-import asyncio
 import json
 import logging
 import time
-from queue import Empty, Queue
 from typing import Dict, List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.ubtech_vlm_provider import UbtechVLMProvider
@@ -58,7 +57,7 @@ class UbtechCameraVLMInput(FuserInput[UbtechCameraVLMSensorConfig, Optional[str]
         self.messages: List[Message] = []
 
         # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize VLM provider
         base_url = self.config.base_url
@@ -84,7 +83,7 @@ class UbtechCameraVLMInput(FuserInput[UbtechCameraVLMSensorConfig, Optional[str]
             json_message: Dict = json.loads(raw_message)
             if "vlm_reply" in json_message:
                 vlm_reply = json_message["vlm_reply"]
-                self.message_buffer.put(vlm_reply)
+                self.message_buffer.put_nowait(vlm_reply)
                 logging.info("Detected VLM message: %s", vlm_reply)
         except json.JSONDecodeError:
             pass
@@ -93,20 +92,16 @@ class UbtechCameraVLMInput(FuserInput[UbtechCameraVLMSensorConfig, Optional[str]
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits on the message buffer, which the provider thread fills, so
+        a reply is returned as soon as it arrives.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer, or None if none arrived
+            within half a second
         """
-        await asyncio.sleep(0.5)
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except Empty:
-            return None
+        return await self.message_buffer.get(timeout=0.5)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
@@ -1,16 +1,17 @@
-import asyncio
 import json
 import logging
 import time
-from queue import Empty, Queue
 from typing import Dict, List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.scene_gate import SceneChangeGate
 from providers.unitree_camera_vlm_provider import UnitreeCameraVLMProvider
+from providers.unitree_go2_odom_provider import UnitreeGo2OdomProvider
 
 
 class UnitreeGo2CameraVLMCloudConfig(SensorConfig):
@@ -25,6 +26,11 @@ class UnitreeGo2CameraVLMCloudConfig(SensorConfig):
         Base URL for the VLM service.
     stream_base_url : Optional[str]
         Stream Base URL.
+    scene_change_threshold : float
+        Mean grayscale difference from which a frame shows a new scene; 0
+        sends every frame to the VLM.
+    max_staleness : float
+        Seconds after which a frame is sent even if the scene is unchanged.
     """
 
     api_key: Optional[str] = Field(default=None, description="API Key")
@@ -33,6 +39,13 @@ class UnitreeGo2CameraVLMCloudConfig(SensorConfig):
         description="Base URL for the VLM service",
     )
     stream_base_url: Optional[str] = Field(default=None, description="Stream Base URL")
+    scene_change_threshold: float = Field(
+        default=5.0,
+        description="Mean grayscale difference from which a frame shows a new scene",
+    )
+    max_staleness: float = Field(
+        default=5.0, description="Seconds after which an unchanged scene is resent"
+    )
 
 
 class UnitreeGo2CameraVLMCloud(
@@ -63,7 +76,7 @@ class UnitreeGo2CameraVLMCloud(
         self.messages: List[Message] = []
 
         # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize VLM provider
         api_key = self.config.api_key
@@ -74,8 +87,15 @@ class UnitreeGo2CameraVLMCloud(
             or f"wss://api.openmind.org/api/core/teleops/stream?api_key={api_key}"
         )
 
+        # Every frame is new while the robot walks
+        self.odom = UnitreeGo2OdomProvider()
+        scene_gate = SceneChangeGate(
+            threshold=self.config.scene_change_threshold,
+            max_staleness=self.config.max_staleness,
+            motion_hint=lambda: self.odom.moving,
+        )
         self.vlm: UnitreeCameraVLMProvider = UnitreeCameraVLMProvider(
-            base_url=base_url, stream_url=stream_base_url
+            base_url=base_url, stream_url=stream_base_url, scene_gate=scene_gate
         )
         self.vlm.start()
         self.vlm.register_message_callback(self._handle_vlm_message)
@@ -96,7 +116,7 @@ class UnitreeGo2CameraVLMCloud(
             json_message: Dict = json.loads(raw_message)
             if "vlm_reply" in json_message:
                 vlm_reply = json_message["vlm_reply"]
-                self.message_buffer.put(vlm_reply)
+                self.message_buffer.put_nowait(vlm_reply)
                 logging.info("Detected VLM message: %s", vlm_reply)
         except json.JSONDecodeError:
             pass
@@ -105,20 +125,16 @@ class UnitreeGo2CameraVLMCloud(
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits on the message buffer, which the provider thread fills, so
+        a reply is returned as soon as it arrives.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer, or None if none arrived
+            within half a second
         """
-        await asyncio.sleep(0.5)
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except Empty:
-            return None
+        return await self.message_buffer.get(timeout=0.5)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
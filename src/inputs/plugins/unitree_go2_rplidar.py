@@ -1,11 +1,10 @@
-import asyncio
 import time
-from queue import Empty, Queue
 from typing import List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import LatestValue
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.unitree_go2_rplidar_provider import UnitreeGo2RPLidarProvider
@@ -74,8 +73,9 @@ class UnitreeGo2RPLidar(FuserInput[RPLidarConfig, Optional[str]]):
         # Buffer for storing the final output
         self.messages: List[Message] = []
 
-        # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        # Signals new lidar strings from the provider thread
+        self.lidar_updates: LatestValue[str] = LatestValue()
+        self._lidar_version = 0
 
         # Build lidar configuration from config
         lidar_config = self._extract_lidar_config(config)
@@ -84,28 +84,33 @@ class UnitreeGo2RPLidar(FuserInput[RPLidarConfig, Optional[str]]):
         self.lidar: UnitreeGo2RPLidarProvider = UnitreeGo2RPLidarProvider(
             **lidar_config
         )
+        self.lidar.register_lidar_callback(self.lidar_updates.set)
         self.lidar.start()
 
         self.descriptor_for_LLM = "Information about objects and walls around you, to plan your movements and avoid bumping into things."
 
+    def stop_listening(self):
+        """
+        Unregister from the provider, which outlives the input.
+        """
+        self.lidar.unregister_lidar_callback(self.lidar_updates.set)
+
     async def _poll(self) -> Optional[str]:
         """
-        Poll for new messages from the RPLidar Provider.
+        Wait for the next lidar string from the RPLidar Provider.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Returns as soon as the provider has processed a new scan, or after
+        half a second with the last known string.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The latest lidar string, or None if none is available yet
         """
-        await asyncio.sleep(0.2)
-
-        try:
-            return self.lidar.lidar_string
-        except Empty:
-            return None
+        _, self._lidar_version = await self.lidar_updates.wait_newer(
+            self._lidar_version, timeout=0.5
+        )
+        return self.lidar.lidar_string
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
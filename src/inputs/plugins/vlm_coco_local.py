@@ -1,17 +1,16 @@
 import asyncio
-import collections
 import logging
 import time
 from typing import Optional
 
 import cv2
 import numpy as np
-import torch
 from pydantic import Field
-from torchvision.models import detection as detection_model
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
+from providers.detection_worker import COCODetector, get_detection_worker
+from providers.frame_bus import open_webcam, release_webcam, webcam_is_open
 from providers.io_provider import IOProvider
 
 
@@ -28,8 +27,6 @@ class VLM_COCO_LocalConfig(SensorConfig):
     camera_index: int = Field(default=0, description="Index of the camera device")
 
 
-Detection = collections.namedtuple("Detection", "label, bbox, score")
-
 # if working on Mac, please disable continuity camera on your iphone
 # Settings > General > AirPlay & Continuity, and turn off Continuity
 
@@ -53,6 +50,7 @@ def check_webcam(index_to_check):
         logging.info(f"ERROR: COCO did not find cam: {index_to_check}")
         return False
     logging.info(f"COCO found cam: {index_to_check}")
+    cap.release()
     return True
 
 
@@ -69,7 +67,6 @@ class VLM_COCO_Local(FuserInput[VLM_COCO_LocalConfig, Optional[np.ndarray]]):
         """
         super().__init__(config)
 
-        self.device = "cpu"
         self.detection_threshold = 0.2
 
         self.camera_index = self.config.camera_index
@@ -83,33 +80,34 @@ class VLM_COCO_Local(FuserInput[VLM_COCO_LocalConfig, Optional[np.ndarray]]):
         # Simple description of sensor output to help LLM understand its importance and utility
         self.descriptor_for_LLM = "Object Detector"
 
-        # Low resolution Faster R-CNN model with a MobileNetV3-Large backbone tuned for mobile use cases.
-        self.model = detection_model.fasterrcnn_mobilenet_v3_large_320_fpn(
-            weights="FasterRCNN_MobileNet_V3_Large_320_FPN_Weights.COCO_V1",
-            progress=True,
-            weights_backbone="MobileNet_V3_Large_Weights.IMAGENET1K_V1",
-        ).to(self.device)
-        self.class_labels = (
-            detection_model.FasterRCNN_MobileNet_V3_Large_320_FPN_Weights.DEFAULT.meta[
-                "categories"
-            ]
-        )
-        self.model.eval()
+        # Low resolution Faster R-CNN model with a MobileNetV3-Large backbone tuned
+        # for mobile use cases, run in a worker process off the event loop
+        self.detector = get_detection_worker("coco:fasterrcnn_mobilenet", COCODetector)
         logging.info("COCO Object Detector Started")
 
-        self.have_cam = check_webcam(self.camera_index)
+        self.have_cam = webcam_is_open(self.camera_index) or check_webcam(
+            self.camera_index
+        )
 
-        # Start capturing video, if we have a webcam
-        self.cap = None
+        # Share the webcam capture with other inputs, if we have a webcam
+        self.webcam = None
         if self.have_cam:
-            self.cap = cv2.VideoCapture(self.camera_index)
-            self.width = int(self.cap.get(3))  # float `width`
-            self.height = int(self.cap.get(4))  # float `height`
+            self.webcam = open_webcam(self.camera_index)
+            self.width = self.webcam.width
+            self.height = self.webcam.height
             self.cam_third = int(self.width / 3)
             logging.info(
                 f"Webcam pixel dimensions for COCO: {self.width}, {self.height}"
             )
 
+    def stop_listening(self):
+        """
+        Hand back the shared webcam capture, stopping it if no input uses it.
+        """
+        if self.webcam is not None:
+            release_webcam(self.webcam)
+            self.webcam = None
+
     async def _poll(self) -> Optional[np.ndarray]:
         """
         Poll for new image input.
@@ -124,13 +122,10 @@ class VLM_COCO_Local(FuserInput[VLM_COCO_LocalConfig, Optional[np.ndarray]]):
         """
         await asyncio.sleep(0.5)
 
-        # Capture a frame every 500 ms
-        # logging.info(f"VLM_COCO_Local poll")
-
-        if self.have_cam and self.cap is not None:
-            ret, frame = self.cap.read()
-            # logging.info(f"VLM_COCO_Local frame: {frame}")
-            return frame
+        # Take the latest frame every 500 ms
+        if self.have_cam and self.webcam is not None:
+            frame = self.webcam.bus.latest
+            return frame.image if frame is not None else None
 
         return None
 
@@ -148,46 +143,30 @@ class VLM_COCO_Local(FuserInput[VLM_COCO_LocalConfig, Optional[np.ndarray]]):
         Message
             Timestamped message containing description
         """
-        filtered_detections = None
+        if raw_input is None:
+            return None
 
-        if raw_input is not None:
-            image = raw_input.copy().transpose((2, 0, 1))
+        try:
+            result = await self.detector.detect(self.camera_index, raw_input)
+        except RuntimeError as e:
+            logging.error(f"Error detecting COCO objects: {e}")
+            return None
 
-            batch_image = np.expand_dims(image, axis=0)
-            tensor_image = torch.tensor(
-                batch_image / 255.0, dtype=torch.float, device=self.device
-            )
-            mobilenet_detections = self.model(tensor_image)[
-                0
-            ]  # pylint: disable=E1102 disable not callable warning
-
-            # logging.info(f"VLM_COCO_Local detections: {mobilenet_detections}")
-            filtered_detections = [
-                Detection(label_id, box, score)
-                for label_id, box, score in zip(
-                    mobilenet_detections["labels"],
-                    mobilenet_detections["boxes"],
-                    mobilenet_detections["scores"],
-                )
-                if score >= self.detection_threshold
-            ]
-            logging.debug(f"COCO filtered_detections {filtered_detections}")
+        # Detections come sorted by descending score
+        keep = result.scores >= self.detection_threshold
+        pred_boxes = result.boxes[keep]
+        pred_labels = [
+            self.detector.names.get(label, str(label))
+            for label in result.classes[keep].tolist()
+        ]
+        logging.debug(
+            f"COCO labels {pred_labels} scores {result.scores[keep]} "
+            f"in {result.latency * 1000:.1f} ms"
+        )
 
         sentence = None
 
-        if filtered_detections and len(filtered_detections) > 0:
-
-            pred_boxes = torch.stack(
-                [detection.bbox for detection in filtered_detections]
-            )
-            pred_scores = torch.stack(
-                [detection.score for detection in filtered_detections]
-            )
-            pred_labels = [
-                self.class_labels[detection.label] for detection in filtered_detections
-            ]
-            logging.debug(f"COCO labels {pred_labels} scores {pred_scores}")
-
+        if pred_labels:
             # we have a least one detection, and that will have the highest score
             thing = pred_labels[0]
             x1 = pred_boxes[0, 0]
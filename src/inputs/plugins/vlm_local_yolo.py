@@ -1,19 +1,23 @@
 import asyncio
-import json
+import functools
 import logging
-import os
 import time
 from typing import List, Optional
 
 import cv2
+import numpy as np
 from pydantic import Field
-from ultralytics import YOLO  # type: ignore
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
+from providers.detection_worker import YOLODetector, get_detection_worker
+from providers.frame_bus import open_webcam, release_webcam, webcam_is_open
 from providers.io_provider import IOProvider
+from providers.sensor_recorder import SensorRecorder, get_sensor_recorder
 from providers.unitree_go2_odom_provider import UnitreeGo2OdomProvider
 
+YOLO_WEIGHTS = "yolov8n_aug.pt"
+
 
 class VLM_Local_YOLOConfig(SensorConfig):
     """
@@ -130,36 +134,36 @@ class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
         # Simple description of sensor output to help LLM understand its importance and utility
         self.descriptor_for_LLM = "Eyes"
 
-        # Load model
-        self.model = YOLO("yolov8n_aug.pt")
+        # Run the model in a worker process shared by all YOLO inputs
+        self.detector = get_detection_worker(
+            f"yolo:{YOLO_WEIGHTS}", functools.partial(YOLODetector, YOLO_WEIGHTS)
+        )
 
         self.write_to_local_file = False
         if self.config.log_file:
             self.write_to_local_file = self.config.log_file
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Detections are recorded by a writer thread, off the detection path
+        self.recorder: Optional[SensorRecorder] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"YOLO Logging to {self.filename_current}")
-
-        self.width, self.height = check_webcam(self.camera_index)
+            self.recorder = get_sensor_recorder()
+            logging.info(f"YOLO Logging to {self.recorder.directory}")
 
-        self.have_cam = False
+        # Probe the best resolution, unless another input captures the webcam
+        resolution = None
+        if not webcam_is_open(self.camera_index):
+            resolution = check_webcam(self.camera_index)
 
-        if self.width > 0:
-            self.have_cam = True
+        self.have_cam = resolution is None or resolution[0] > 0
 
         self.frame_index = 0
 
-        # Start capturing video, if we have a webcam
-        self.cap = None
+        # Share the webcam capture with other inputs, if we have a webcam
+        self.webcam = None
+        self.width, self.height = 0, 0
         if self.have_cam:
-            self.cap = cv2.VideoCapture(self.camera_index)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            self.webcam = open_webcam(self.camera_index, resolution)
+            self.width, self.height = self.webcam.width, self.webcam.height
             self.cam_third = int(self.width / 3)
             logging.info(
                 f"Webcam pixel dimensions for YOLO: {self.width}, {self.height}"
@@ -174,15 +178,13 @@ class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
         self.odom_yaw_0_360 = 0.0
         self.odom_yaw_m180_p180 = 0.0
 
-    def update_filename(self):
+    def stop_listening(self):
         """
-        Create a new filename with the current timestamp.
+        Hand back the shared webcam capture, stopping it if no input uses it.
         """
-        unix_ts = round(time.time(), 6)
-        logging.info(f"YOLO time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/yolo_{unix_ts}Z.jsonl"
-        return filename
+        if self.webcam is not None:
+            release_webcam(self.webcam)
+            self.webcam = None
 
     def get_top_detection(self, detections: List[dict]) -> tuple:
         """
@@ -216,9 +218,12 @@ class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
         """
         await asyncio.sleep(0.25)
 
-        if self.have_cam and self.cap is not None:
+        if self.have_cam and self.webcam is not None:
+            latest = self.webcam.bus.latest
+            if latest is None:
+                return None
 
-            ret, frame = self.cap.read()
+            frame = latest.image
             self.frame_index += 1
             timestamp = time.time()
 
@@ -235,78 +240,54 @@ class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
             except Exception as e:
                 logging.error(f"Error parsing Odom: {e}")
 
-            results = self.model.predict(
-                source=frame, save=False, stream=True, verbose=False
-            )
-
-            detections = []
-            for r in results:
-                if r.boxes is not None:
-                    for box in r.boxes:
-                        x1, y1, x2, y2 = map(float, box.xyxy[0])
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        label = self.model.names[cls]
-                        detections.append(
-                            {
-                                "class": label,
-                                "confidence": round(conf, 4),
-                                "bbox": [round(x1), round(y1), round(x2), round(y2)],
-                            }
-                        )
+            try:
+                result = await self.detector.detect(self.camera_index, frame)
+            except RuntimeError as e:
+                logging.error(f"Error detecting objects with YOLO: {e}")
+                return None
+
+            boxes = np.rint(result.boxes).astype(int).tolist()
+            detections = [
+                {
+                    "class": self.detector.names.get(cls, str(cls)),
+                    "confidence": round(conf, 4),
+                    "bbox": bbox,
+                }
+                for bbox, conf, cls in zip(
+                    boxes, result.scores.tolist(), result.classes.tolist()
+                )
+            ]
 
             logging.debug(
-                f"\nFrame {self.frame_index} @ {timestamp} — {len(detections)} objects:"
+                f"\nFrame {self.frame_index} @ {timestamp} — {len(detections)} objects "
+                f"in {result.latency * 1000:.1f} ms:"
             )
 
-            if self.write_to_local_file:
+            if self.recorder is not None:
                 try:
-                    json_line = json.dumps(
+                    self.recorder.record(
+                        "yolo",
                         {
                             "frame": self.frame_index,
                             "timestamp": timestamp,
-                            "detections": detections,
+                            "boxes": result.boxes,
+                            "scores": result.scores,
+                            "classes": result.classes,
+                            "labels": [d["class"] for d in detections],
+                            "latency": round(result.latency, 4),
                             "odom_rockchip_ts": self.odom_rockchip_ts,
                             "odom_subscriber_ts": self.odom_subscriber_ts,
                             "odom_x": self.odom_x,
                             "odom_y": self.odom_y,
                             "odom_yaw_0_360": self.odom_yaw_0_360,
                             "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-                        }
+                        },
                     )
-                    self.write_str_to_file(json_line)
-                    logging.info(f"YOLO wrote to {self.filename_current}")
                 except Exception as e:
                     logging.error(f"Error saving YOLO: {str(e)}")
 
             return detections
 
-    def write_str_to_file(self, json_line: str):
-        """
-        Writes a string to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
-
-        Parameters
-        ----------
-        json_line : str
-            JSON string to write to the file.
-        """
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New yolo file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
-
     async def _raw_to_text(self, raw_input: Optional[List]) -> Optional[Message]:
         """
         Process raw image input to generate text description.
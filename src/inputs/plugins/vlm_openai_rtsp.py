@@ -1,13 +1,12 @@
-import asyncio
 import logging
 import time
-from queue import Empty, Queue
 from typing import List, Optional
 
 from openai.types.chat import ChatCompletion
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 from providers.vlm_openai_rtsp_provider import VLMOpenAIRTSPProvider
@@ -80,7 +79,7 @@ class VLMOpenAIRTSP(FuserInput[VLMOpenAIRTSPConfig, Optional[str]]):
         self.messages: List[Message] = []
 
         # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize VLM provider
         api_key = self.config.api_key
@@ -120,26 +119,22 @@ class VLMOpenAIRTSP(FuserInput[VLMOpenAIRTSPConfig, Optional[str]]):
         logging.info(f"VLM OpenAI received message: {raw_message}")
         content = raw_message.choices[0].message.content
         if content is not None:
-            self.message_buffer.put(content)
+            self.message_buffer.put_nowait(content)
 
     async def _poll(self) -> Optional[str]:
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits on the message buffer, which the provider thread fills, so
+        a reply is returned as soon as it arrives.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer, or None if none arrived
+            within half a second
         """
-        await asyncio.sleep(0.5)
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except Empty:
-            return None
+        return await self.message_buffer.get(timeout=0.5)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
@@ -1,15 +1,15 @@
-import asyncio
 import json
 import logging
 import time
-from queue import Empty, Queue
 from typing import Dict, List, Optional
 
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
+from inputs.base.bridge import ThreadBridge
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.scene_gate import SceneChangeGate
 from providers.vlm_vila_provider import VLMVilaProvider
 
 
@@ -27,6 +27,11 @@ class VLMVilaConfig(SensorConfig):
         Stream Base URL.
     camera_index : int
         Index of the camera device.
+    scene_change_threshold : float
+        Mean grayscale difference from which a frame shows a new scene; 0
+        sends every frame to the VLM.
+    max_staleness : float
+        Seconds after which a frame is sent even if the scene is unchanged.
     """
 
     api_key: Optional[str] = Field(default=None, description="API Key")
@@ -36,6 +41,13 @@ class VLMVilaConfig(SensorConfig):
     )
     stream_base_url: Optional[str] = Field(default=None, description="Stream Base URL")
     camera_index: int = Field(default=0, description="Index of the camera device")
+    scene_change_threshold: float = Field(
+        default=5.0,
+        description="Mean grayscale difference from which a frame shows a new scene",
+    )
+    max_staleness: float = Field(
+        default=5.0, description="Seconds after which an unchanged scene is resent"
+    )
 
 
 class VLMVila(FuserInput[VLMVilaConfig, Optional[str]]):
@@ -66,7 +78,7 @@ class VLMVila(FuserInput[VLMVilaConfig, Optional[str]]):
         self.messages: List[Message] = []
 
         # Buffer for storing messages
-        self.message_buffer: Queue[str] = Queue()
+        self.message_buffer: ThreadBridge[str] = ThreadBridge()
 
         # Initialize VLM provider
         api_key = self.config.api_key
@@ -77,8 +89,15 @@ class VLMVila(FuserInput[VLMVilaConfig, Optional[str]]):
         )
         camera_index = self.config.camera_index
 
+        scene_gate = SceneChangeGate(
+            threshold=self.config.scene_change_threshold,
+            max_staleness=self.config.max_staleness,
+        )
         self.vlm: VLMVilaProvider = VLMVilaProvider(
-            ws_url=base_url, stream_url=stream_base_url, camera_index=camera_index
+            ws_url=base_url,
+            stream_url=stream_base_url,
+            camera_index=camera_index,
+            scene_gate=scene_gate,
         )
         self.vlm.start()
         self.vlm.register_message_callback(self._handle_vlm_message)
@@ -101,7 +120,7 @@ class VLMVila(FuserInput[VLMVilaConfig, Optional[str]]):
             json_message: Dict = json.loads(raw_message)
             if "vlm_reply" in json_message:
                 vlm_reply = json_message["vlm_reply"]
-                self.message_buffer.put(vlm_reply)
+                self.message_buffer.put_nowait(vlm_reply)
                 logging.info("Detected VLM message: %s", vlm_reply)
         except json.JSONDecodeError:
             pass
@@ -110,20 +129,16 @@ class VLMVila(FuserInput[VLMVilaConfig, Optional[str]]):
         """
         Poll for new messages from the VLM service.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits on the message buffer, which the provider thread fills, so
+        a reply is returned as soon as it arrives.
 
         Returns
         -------
         Optional[str]
-            The next message from the buffer if available, None otherwise
+            The next message from the buffer, or None if none arrived
+            within half a second
         """
-        await asyncio.sleep(0.5)
-        try:
-            message = self.message_buffer.get_nowait()
-            return message
-        except Empty:
-            return None
+        return await self.message_buffer.get(timeout=0.5)
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
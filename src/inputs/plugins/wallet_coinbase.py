@@ -4,12 +4,15 @@ import os
 import time
 from typing import List, Optional
 
-from cdp import Cdp, Wallet
 from pydantic import Field
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from runtime.lazy_import import lazy_attribute
+
+Cdp = lazy_attribute("cdp", "Cdp")
+Wallet = lazy_attribute("cdp", "Wallet")
 
 
 class WalletCoinbaseConfig(SensorConfig):
@@ -30,6 +33,9 @@ class WalletCoinbase(FuserInput[WalletCoinbaseConfig, List[float]]):
     Queries current balance of the configured asset and reports a balance increase.
     """
 
+    # The CDP SDK calls block, so the input is polled on its own thread
+    blocking = True
+
     def __init__(self, config: WalletCoinbaseConfig):
         """
         Initialize the WalletCoinbase input handler.
@@ -4,11 +4,12 @@ import os
 import time
 from typing import List, Optional
 
-from web3 import Web3
-
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from runtime.lazy_import import lazy_attribute
+
+Web3 = lazy_attribute("web3", "Web3")
 
 
 class WalletEthereum(FuserInput[SensorConfig, List[float]]):
@@ -24,6 +25,9 @@ class WalletEthereum(FuserInput[SensorConfig, List[float]]):
         If connection to Ethereum network fails
     """
 
+    # Web3 RPC calls block, so the input is polled on its own thread
+    blocking = True
+
     def __init__(self, config: SensorConfig):
         """
         Initialize WalletEthereum instance.
@@ -11,11 +11,14 @@ import time
 from typing import Optional
 
 import cv2
-from deepface import DeepFace
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
+from providers.frame_bus import open_webcam, release_webcam, webcam_is_open
 from providers.io_provider import IOProvider
+from runtime.lazy_import import lazy_attribute
+
+DeepFace = lazy_attribute("deepface", "DeepFace")
 
 
 def check_webcam():
@@ -27,6 +30,7 @@ def check_webcam():
         logging.info("No webcam found")
         return False
     logging.info("Found cam(0)")
+    cap.release()
     return True
 
 
@@ -60,12 +64,12 @@ class FaceEmotionCapture(FuserInput[SensorConfig, Optional[cv2.typing.MatLike]])
             cv2.data.haarcascades + "haarcascade_frontalface_default.xml"  # type: ignore
         )
 
-        self.have_cam = check_webcam()
+        self.have_cam = webcam_is_open(0) or check_webcam()
 
-        # Start capturing video, if we have a webcam
-        self.cap = None
+        # Share the webcam capture with other inputs, if we have a webcam
+        self.webcam = None
         if self.have_cam:
-            self.cap = cv2.VideoCapture(0)
+            self.webcam = open_webcam(0)
 
         # Initialize emotion label
         self.emotion = ""
@@ -73,6 +77,14 @@ class FaceEmotionCapture(FuserInput[SensorConfig, Optional[cv2.typing.MatLike]])
         # Messages buffer
         self.messages: list[Message] = []
 
+    def stop_listening(self):
+        """
+        Hand back the shared webcam capture, stopping it if no input uses it.
+        """
+        if self.webcam is not None:
+            release_webcam(self.webcam)
+            self.webcam = None
+
     async def _poll(self) -> Optional[cv2.typing.MatLike]:
         """
         Capture frame from webcam.
@@ -84,10 +96,10 @@ class FaceEmotionCapture(FuserInput[SensorConfig, Optional[cv2.typing.MatLike]])
         """
         await asyncio.sleep(0.5)
 
-        # Capture a frame every 500 ms
-        if self.have_cam and self.cap is not None:
-            ret, frame = self.cap.read()
-            return frame
+        # Take the latest frame every 500 ms
+        if self.have_cam and self.webcam is not None:
+            frame = self.webcam.bus.latest
+            return frame.image if frame is not None else None
 
     async def _raw_to_text(
         self, raw_input: Optional[cv2.typing.MatLike]
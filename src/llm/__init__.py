@@ -2,13 +2,14 @@ import importlib
 import inspect
 import logging
 import os
-import re
 import typing as T
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from llm.function_schemas import generate_function_schemas_from_actions
+from llm.output_model import Action
 from providers.io_provider import IOProvider
+from runtime.plugin_index import find_plugin_module
 
 R = T.TypeVar("R")
 
@@ -27,6 +28,12 @@ class LLMConfig(BaseModel):
         Name of the LLM model to use
     history_length : int, optional
         Number of interactions to store in the history buffer
+    response_cache : dict, optional
+        Response cache settings (ttl, max_entries). The cache is disabled
+        when not set.
+    stream : bool, optional
+        Stream the completion and dispatch each action as soon as its tool
+        call is complete, for plugins that support it
     extra_params : dict, optional
         Additional parameters for the LLM API request
     """
@@ -51,6 +58,13 @@ class LLMConfig(BaseModel):
     history_length: T.Optional[int] = Field(
         default=0, description="Number of past interactions to keep in context"
     )
+    response_cache: T.Optional[T.Dict[str, T.Any]] = Field(
+        default=None, description="Response cache settings; disabled when not set"
+    )
+    stream: T.Optional[bool] = Field(
+        default=False,
+        description="Stream the completion and dispatch actions as they complete",
+    )
     extra_params: T.Dict[str, T.Any] = Field(default_factory=dict)
 
     def __getitem__(self, item: str) -> T.Any:
@@ -133,6 +147,43 @@ class LLM(T.Generic[R]):
         # Enable state management by default
         self._skip_state_management: bool = False
 
+        # Receives actions of a streamed response before ask returns
+        self._action_callback: T.Optional[T.Callable[[Action], T.Awaitable[None]]] = (
+            None
+        )
+
+    def set_action_callback(
+        self, callback: T.Optional[T.Callable[[Action], T.Awaitable[None]]]
+    ):
+        """
+        Set the callback that receives actions while a response is streamed.
+
+        Plugins that stream call it once per completed tool call, before ask
+        returns. The returned output still contains every action.
+
+        Parameters
+        ----------
+        callback : Callable[[Action], Awaitable[None]], optional
+            The callback, or None to stop early dispatch.
+        """
+        self._action_callback = callback
+
+    async def _dispatch_action(self, action: Action):
+        """
+        Hand a streamed action to the action callback, if one is set.
+
+        Parameters
+        ----------
+        action : Action
+            The completed action.
+        """
+        if self._action_callback is None:
+            return
+        try:
+            await self._action_callback(action)
+        except Exception as e:
+            logging.error(f"Error dispatching streamed action {action.type}: {e}")
+
     async def ask(
         self, prompt: str, messages: T.List[T.Dict[str, str]] = []
     ) -> T.Optional[R]:
@@ -175,28 +226,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
 
-    if not os.path.exists(plugins_dir):
-        return None
-
-    plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
-
-    for plugin_file in plugin_files:
-        file_path = os.path.join(plugins_dir, plugin_file)
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            pattern = rf"^class\s+{re.escape(class_name)}\s*\([^)]*LLM[^)]*\)\s*:"
-
-            if re.search(pattern, content, re.MULTILINE):
-                return plugin_file[:-3]
-
-        except Exception as e:
-            logging.warning(f"Could not read {plugin_file}: {e}")
-            continue
-
-    return None
+    return find_plugin_module(plugins_dir, class_name, base="LLM")
 
 
 def get_llm_class(class_name: str) -> T.Type[LLM]:
@@ -294,7 +324,15 @@ def load_llm(
             config = LLMConfig(**(config_dict if isinstance(config_dict, dict) else {}))
 
         logging.debug(f"Loaded LLM {class_name} from {module_name}.py")
-        return llm_class(config=config, available_actions=available_actions)
+        llm = llm_class(config=config, available_actions=available_actions)
+
+        if config.response_cache is not None:
+            from llm.cache import CachedLLM, ResponseCacheConfig
+
+            logging.info(f"Enabling response cache for {class_name}")
+            return CachedLLM(llm, ResponseCacheConfig(**config.response_cache))
+
+        return llm
 
     except ImportError as e:
         raise ValueError(f"Could not import LLM module '{module_name}': {e}")
@@ -0,0 +1,348 @@
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import typing as T
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from pydantic import BaseModel, Field
+
+from llm import LLM
+
+R = T.TypeVar("R")
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Log the hit rate every this many calls
+STATS_LOG_INTERVAL = 100
+
+
+class ResponseCacheConfig(BaseModel):
+    """
+    Configuration of the LLM response cache.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a cached response stays valid.
+    max_entries : int
+        Maximum number of cached responses; the least recently used entry is
+        evicted first.
+
+    Notes
+    -----
+    The cache always answers; skipping the LLM call for a prompt that did
+    not change is owned by the cortex, see ``event_driven_ticks``, whose
+    heartbeat forces a call once ``max_tick_interval`` has passed.
+    """
+
+    ttl: float = Field(default=30.0, gt=0, description="Seconds a response is valid")
+    max_entries: int = Field(default=128, gt=0, description="Maximum cached responses")
+
+
+@dataclass
+class ResponseCacheStats:
+    """
+    Counters of the LLM response cache.
+
+    Parameters
+    ----------
+    hits : int
+        Calls answered from the cache.
+    misses : int
+        Calls forwarded to the LLM.
+    evictions : int
+        Entries dropped by the LRU policy or because they expired.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def total(self) -> int:
+        """
+        Get the number of calls seen by the cache.
+
+        Returns
+        -------
+        int
+            hits + misses.
+        """
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the share of calls that did not reach the LLM.
+
+        Returns
+        -------
+        float
+            hits / all calls, or 0.0 before the first call.
+        """
+        return self.hits / self.total if self.total else 0.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalize a prompt so formatting-only differences share a cache key.
+
+    Parameters
+    ----------
+    prompt : str
+        The fused prompt.
+
+    Returns
+    -------
+    str
+        The prompt with runs of whitespace collapsed and ends stripped.
+    """
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+def prompt_key(prompt: str, messages: T.Optional[T.List[T.Dict[str, str]]]) -> str:
+    """
+    Hash a prompt and its history window into a cache key.
+
+    Parameters
+    ----------
+    prompt : str
+        The fused prompt.
+    messages : List[Dict[str, str]], optional
+        The history messages sent along with the prompt.
+
+    Returns
+    -------
+    str
+        A hex digest identifying the request.
+    """
+    digest = hashlib.sha256(normalize_prompt(prompt).encode("utf-8"))
+    if messages:
+        history = [
+            {
+                "role": m.get("role", ""),
+                "content": normalize_prompt(m.get("content", "")),
+            }
+            for m in messages
+        ]
+        digest.update(json.dumps(history, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded map from request keys to LLM responses.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 128):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        ttl : float
+            Seconds a cached response stays valid.
+        max_entries : int
+            Maximum number of cached responses.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = ResponseCacheStats()
+
+        self._entries: "OrderedDict[str, T.Tuple[float, T.Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached responses, including expired ones.
+        """
+        return len(self._entries)
+
+    def get(self, key: str) -> T.Optional[T.Any]:
+        """
+        Get a cached response and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The request key.
+
+        Returns
+        -------
+        Any or None
+            The cached response, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.stats.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: T.Any):
+        """
+        Store a response, evicting the least recently used entries if full.
+
+        Parameters
+        ----------
+        key : str
+            The request key.
+        value : Any
+            The response to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self):
+        """
+        Drop all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedLLM(LLM[R]):
+    """
+    LLM wrapper that answers repeated prompts from a response cache.
+
+    Requests are keyed on the normalized prompt plus the history window of
+    the wrapped LLM. Any attribute not defined here is forwarded to the
+    wrapped LLM, so the wrapper can replace it in the runtime.
+    """
+
+    def __init__(self, llm: LLM[R], config: ResponseCacheConfig):
+        """
+        Wrap an LLM with a response cache.
+
+        Parameters
+        ----------
+        llm : LLM
+            The LLM to wrap.
+        config : ResponseCacheConfig
+            The cache configuration.
+        """
+        self._llm = llm
+        self._config = llm._config
+        self._available_actions = llm._available_actions
+        self.function_schemas = llm.function_schemas
+        self.io_provider = llm.io_provider
+        self._skip_state_management = llm._skip_state_management
+
+        self.cache_config = config
+        self.cache = ResponseCache(ttl=config.ttl, max_entries=config.max_entries)
+
+    @property
+    def llm(self) -> LLM[R]:
+        """
+        Get the wrapped LLM.
+
+        Returns
+        -------
+        LLM
+            The LLM that handles cache misses.
+        """
+        return self._llm
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        """
+        Get the cache counters.
+
+        Returns
+        -------
+        ResponseCacheStats
+            Hits, misses and evictions.
+        """
+        return self.cache.stats
+
+    def __getattr__(self, name: str) -> T.Any:
+        """
+        Forward attributes of the wrapped LLM, e.g. its history manager.
+        """
+        if name == "_llm":
+            raise AttributeError(name)
+        return getattr(self._llm, name)
+
+    def set_action_callback(
+        self, callback: T.Optional[T.Callable[[T.Any], T.Awaitable[None]]]
+    ):
+        """
+        Set the streamed action callback on the wrapped LLM.
+
+        Cache hits are not streamed; their actions are only in the output.
+
+        Parameters
+        ----------
+        callback : Callable[[Action], Awaitable[None]], optional
+            The callback, or None to stop early dispatch.
+        """
+        self._action_callback = callback
+        self._llm.set_action_callback(callback)
+
+    def _history_window(
+        self, messages: T.List[T.Dict[str, str]]
+    ) -> T.List[T.Dict[str, str]]:
+        history_manager = getattr(self._llm, "history_manager", None)
+        if history_manager is None or not self._config.history_length:
+            return list(messages)
+        return list(messages) + history_manager.get_messages()
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> T.Optional[R]:
+        """
+        Answer from the cache or forward the prompt to the wrapped LLM.
+
+        Parameters
+        ----------
+        prompt : str
+            Input text to send to the model
+        messages : List[Dict[str, str]]
+            List of message dictionaries to send to the model.
+
+        Returns
+        -------
+        R or None
+            The cached or fresh response.
+        """
+        response = await self._lookup_or_ask(prompt, messages)
+
+        if self.stats.total % STATS_LOG_INTERVAL == 0:
+            logging.info(
+                f"LLM response cache: {self.stats.hits} hits, {self.stats.misses} misses, "
+                f"hit rate {self.stats.hit_rate:.2f}"
+            )
+        return response
+
+    async def _lookup_or_ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]]
+    ) -> T.Optional[R]:
+        key = prompt_key(prompt, self._history_window(messages))
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            logging.debug(
+                f"LLM response cache hit (hit rate {self.stats.hit_rate:.2f})"
+            )
+            return copy.deepcopy(cached)
+
+        self.stats.misses += 1
+        response = await self._llm.ask(prompt, messages)
+        if response is not None:
+            self.cache.put(key, copy.deepcopy(response))
+        return response
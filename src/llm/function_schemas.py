@@ -4,12 +4,14 @@ Utility functions for generating OpenAI function schemas from AgentActions.
 This module is separate from both the actions and llm modules to avoid circular imports.
 """
 
+import functools
 import json
 import logging
 from enum import Enum
 from typing import get_type_hints
 
 from llm.output_model import Action
+from providers.trace_provider import TraceProvider
 
 
 def generate_function_schema_from_action(action) -> dict:
@@ -118,6 +120,20 @@ def generate_function_schemas_from_actions(actions: list) -> list[dict]:
     return schemas
 
 
+def _trace_parsing(convert):
+    """
+    Record each conversion of function calls as a trace span.
+    """
+
+    @functools.wraps(convert)
+    def wrapper(function_calls: list[dict]) -> list[Action]:
+        with TraceProvider().span("parse_function_calls", calls=len(function_calls)):
+            return convert(function_calls)
+
+    return wrapper
+
+
+@_trace_parsing
 def convert_function_calls_to_actions(function_calls: list[dict]) -> list[Action]:
     """
     Convert OpenAI function call responses to Action objects.
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from llm import LLM, LLMConfig
 from llm.function_schemas import convert_function_calls_to_actions
 from llm.output_model import CortexOutputModel
+from llm.streaming import ToolCallAccumulator
 from providers.avatar_llm_state_provider import AvatarLLMState
 from providers.llm_history_manager import LLMHistoryManager
 
@@ -146,7 +147,7 @@ class OllamaLLM(LLM[R]):
             payload = {
                 "model": self._config.model,
                 "messages": formatted_messages,
-                "stream": False,
+                "stream": bool(self._config.stream),
                 "options": {
                     "temperature": self._config.temperature,
                     "num_ctx": self._config.num_ctx,
@@ -159,6 +160,9 @@ class OllamaLLM(LLM[R]):
 
             logging.debug(f"Ollama request payload: {json.dumps(payload, indent=2)}")
 
+            if self._config.stream:
+                return await self._ask_streaming(payload)
+
             response = await self._client.post(
                 self._chat_url,
                 json=payload,
@@ -220,6 +224,67 @@ class OllamaLLM(LLM[R]):
             logging.error(f"Ollama API error: {e}")
             return None
 
+    async def _ask_streaming(self, payload: T.Dict[str, T.Any]) -> T.Optional[R]:
+        """
+        Stream the chat response and dispatch each tool call as it arrives.
+
+        Ollama streams newline-delimited JSON chunks and sends every tool call
+        complete in a single chunk.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+            The chat request, with streaming enabled.
+
+        Returns
+        -------
+        R or None
+            All actions of the response, or None if there were none.
+        """
+        accumulator = ToolCallAccumulator()
+        index = 0
+
+        async with self._client.stream(
+            "POST", self._chat_url, json=payload
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                logging.error(
+                    f"Ollama API error: {response.status_code} - {response.text}"
+                )
+                return None
+
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                for tc in chunk.get("message", {}).get("tool_calls") or []:
+                    func = tc.get("function", {})
+                    arguments = func.get("arguments", {})
+                    for action in accumulator.add(
+                        index,
+                        func.get("name", ""),
+                        (
+                            json.dumps(arguments)
+                            if isinstance(arguments, dict)
+                            else arguments or "{}"
+                        ),
+                    ):
+                        await self._dispatch_action(action)
+                    index += 1
+                if chunk.get("done"):
+                    break
+
+        for action in accumulator.finish():
+            await self._dispatch_action(action)
+        self.io_provider.llm_end_time = time.time()
+
+        if not accumulator.actions:
+            return None
+
+        logging.info(f"Received {len(accumulator.actions)} streamed function calls")
+        return T.cast(R, CortexOutputModel(actions=accumulator.actions))
+
     async def close(self):
         """Close the HTTP client."""
         await self._client.aclose()
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from llm import LLM, LLMConfig
 from llm.function_schemas import convert_function_calls_to_actions
 from llm.output_model import CortexOutputModel
+from llm.streaming import ToolCallAccumulator
 from providers.avatar_llm_state_provider import AvatarLLMState
 from providers.llm_history_manager import LLMHistoryManager
 
@@ -116,6 +117,9 @@ class OpenAILLM(LLM[R]):
             ]
             formatted_messages.append({"role": "user", "content": prompt})
 
+            if self._config.stream:
+                return await self._ask_streaming(formatted_messages)
+
             response = await self._client.chat.completions.create(
                 model=self._config.model or "gpt-5",
                 messages=T.cast(T.Any, formatted_messages),
@@ -155,3 +159,57 @@ class OpenAILLM(LLM[R]):
         except Exception as e:
             logging.error(f"OpenAI API error: {e}")
             return None
+
+    async def _ask_streaming(
+        self, formatted_messages: T.List[T.Dict[str, str]]
+    ) -> T.Optional[R]:
+        """
+        Stream the completion and dispatch each tool call once it is complete.
+
+        Parameters
+        ----------
+        formatted_messages : List[Dict[str, str]]
+            The chat messages, ending with the prompt.
+
+        Returns
+        -------
+        R or None
+            All actions of the response, or None if there were none.
+        """
+        started = time.time()
+        stream = await self._client.chat.completions.create(
+            model=self._config.model or "gpt-5",
+            messages=T.cast(T.Any, formatted_messages),
+            tools=T.cast(T.Any, self.function_schemas),
+            tool_choice="auto",
+            timeout=self._config.timeout,
+            stream=True,
+        )
+
+        accumulator = ToolCallAccumulator()
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            for tc in chunk.choices[0].delta.tool_calls or []:
+                function = tc.function
+                completed = accumulator.add(
+                    tc.index,
+                    function.name if function else None,
+                    function.arguments if function else None,
+                )
+                if completed and len(accumulator.actions) == len(completed):
+                    logging.info(
+                        f"OpenAI first action after {time.time() - started:.3f}s"
+                    )
+                for action in completed:
+                    await self._dispatch_action(action)
+
+        for action in accumulator.finish():
+            await self._dispatch_action(action)
+        self.io_provider.llm_end_time = time.time()
+
+        if not accumulator.actions:
+            return None
+
+        logging.info(f"Received {len(accumulator.actions)} streamed function calls")
+        return T.cast(R, CortexOutputModel(actions=accumulator.actions))
@@ -0,0 +1,109 @@
+import json
+import logging
+import typing as T
+from dataclasses import dataclass, field
+
+from llm.function_schemas import convert_function_calls_to_actions
+from llm.output_model import Action
+
+
+@dataclass
+class _PartialToolCall:
+    """
+    A tool call whose name and arguments are still being streamed.
+    """
+
+    name: str = ""
+    arguments: str = ""
+    done: bool = False
+
+
+@dataclass
+class ToolCallAccumulator:
+    """
+    Assembles streamed tool-call deltas into actions.
+
+    A tool call is complete as soon as its arguments parse as a JSON object
+    (an object cannot be extended after its closing brace), or when a delta
+    for a later call arrives, or when the stream ends. Each call is turned
+    into an action exactly once and in the order the model generated it.
+    """
+
+    _calls: T.Dict[int, _PartialToolCall] = field(default_factory=dict)
+    actions: T.List[Action] = field(default_factory=list)
+
+    def add(
+        self,
+        index: int,
+        name: T.Optional[str] = None,
+        arguments: T.Optional[str] = None,
+    ) -> T.List[Action]:
+        """
+        Add a streamed fragment of a tool call.
+
+        Parameters
+        ----------
+        index : int
+            Position of the tool call in the response.
+        name : str, optional
+            Fragment of the function name.
+        arguments : str, optional
+            Fragment of the JSON encoded function arguments.
+
+        Returns
+        -------
+        List[Action]
+            Actions of the tool calls completed by this fragment.
+        """
+        completed = [
+            i for i, call in self._calls.items() if i < index and not call.done
+        ]
+
+        call = self._calls.setdefault(index, _PartialToolCall())
+        if name:
+            call.name += name
+        if arguments:
+            call.arguments += arguments
+
+        if call.name and call.arguments.rstrip().endswith("}"):
+            try:
+                json.loads(call.arguments)
+                completed.append(index)
+            except json.JSONDecodeError:
+                pass
+
+        return self._complete(completed)
+
+    def finish(self) -> T.List[Action]:
+        """
+        Complete all tool calls that are still open at the end of the stream.
+
+        Returns
+        -------
+        List[Action]
+            Actions of the remaining tool calls.
+        """
+        return self._complete([i for i, call in self._calls.items() if not call.done])
+
+    def _complete(self, indices: T.List[int]) -> T.List[Action]:
+        actions = []
+        for index in sorted(set(indices)):
+            call = self._calls[index]
+            call.done = True
+            if not call.name:
+                logging.warning(f"Dropping streamed tool call {index} without a name")
+                continue
+            actions.extend(
+                convert_function_calls_to_actions(
+                    [
+                        {
+                            "function": {
+                                "name": call.name,
+                                "arguments": call.arguments or "{}",
+                            }
+                        }
+                    ]
+                )
+            )
+        self.actions.extend(actions)
+        return actions
@@ -1,11 +1,26 @@
-from .context_provider import ContextProvider
-from .io_provider import IOProvider
-from .teleops_status_provider import (
-    BatteryStatus,
-    CommandStatus,
-    TeleopsStatus,
-    TeleopsStatusProvider,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context_provider import ContextProvider
+    from .io_provider import IOProvider
+    from .teleops_status_provider import (
+        BatteryStatus,
+        CommandStatus,
+        TeleopsStatus,
+        TeleopsStatusProvider,
+    )
+
+# Exported names are resolved on first access, so importing one provider
+# module does not import every provider (and their HTTP/Zenoh stacks) with it.
+_EXPORTS = {
+    "ContextProvider": ".context_provider",
+    "IOProvider": ".io_provider",
+    "TeleopsStatusProvider": ".teleops_status_provider",
+    "CommandStatus": ".teleops_status_provider",
+    "BatteryStatus": ".teleops_status_provider",
+    "TeleopsStatus": ".teleops_status_provider",
+}
 
 __all__ = [
     "ContextProvider",
@@ -15,3 +30,15 @@ __all__ = [
     "BatteryStatus",
     "TeleopsStatus",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import an exported provider on first access.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
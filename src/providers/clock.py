@@ -0,0 +1,413 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class Clock:
+    """
+    Source of time and sleeps for the runtime.
+
+    The cortex loop, the sleep ticker, connectors, backgrounds and
+    simulators read the time and sleep through the clock returned by
+    ``get_clock`` instead of ``time`` and ``asyncio`` directly, so a
+    simulated clock can replace real time for a whole run.
+    """
+
+    def time(self) -> float:
+        """
+        Get the current Unix time.
+
+        Returns
+        -------
+        float
+            Seconds since the epoch.
+        """
+        raise NotImplementedError
+
+    def monotonic(self) -> float:
+        """
+        Get a monotonic time for measuring intervals.
+
+        Returns
+        -------
+        float
+            Seconds from an arbitrary origin.
+        """
+        raise NotImplementedError
+
+    def sleep(self, duration: float) -> None:
+        """
+        Block the calling thread.
+
+        Parameters
+        ----------
+        duration : float
+            Seconds to sleep.
+        """
+        raise NotImplementedError
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Block the calling thread until an event is set or a timeout expires.
+
+        Parameters
+        ----------
+        event : threading.Event
+            The event to wait for.
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if the event is set.
+        """
+        raise NotImplementedError
+
+    async def sleep_async(self, duration: float) -> None:
+        """
+        Suspend the calling coroutine.
+
+        Parameters
+        ----------
+        duration : float
+            Seconds to sleep.
+        """
+        raise NotImplementedError
+
+    async def wait_for(self, awaitable: Awaitable[R], timeout: float) -> R:
+        """
+        Await with a timeout measured by this clock.
+
+        Parameters
+        ----------
+        awaitable : Awaitable
+            The awaitable.
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        Any
+            The result of the awaitable.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the timeout expired first; the awaitable is cancelled.
+        """
+        task = asyncio.ensure_future(awaitable)
+        timer = asyncio.ensure_future(self.sleep_async(max(timeout, 0.0)))
+        try:
+            await asyncio.wait({task, timer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            timer.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        raise asyncio.TimeoutError()
+
+
+class RealClock(Clock):
+    """
+    Wall-clock time; the default clock.
+    """
+
+    def time(self) -> float:
+        """
+        Get the wall-clock Unix time.
+        """
+        return time.time()
+
+    def monotonic(self) -> float:
+        """
+        Get the monotonic time of the system.
+        """
+        return time.monotonic()
+
+    def sleep(self, duration: float) -> None:
+        """
+        Block the calling thread for real seconds.
+        """
+        time.sleep(max(duration, 0.0))
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Wait for an event for real seconds.
+        """
+        return event.wait(timeout=timeout)
+
+    async def sleep_async(self, duration: float) -> None:
+        """
+        Suspend the calling coroutine for real seconds.
+        """
+        await asyncio.sleep(duration)
+
+    async def wait_for(self, awaitable: Awaitable[R], timeout: float) -> R:
+        """
+        Await with a timeout in real seconds.
+        """
+        return await asyncio.wait_for(awaitable, timeout)
+
+
+class SimulatedClock(Clock):
+    """
+    Simulated time that only moves when it is advanced.
+
+    Sleeping threads and coroutines register a deadline and are woken, in
+    deadline order, when the clock passes it. Tests step the clock with
+    ``advance`` or ``run_for``, which gives timing-sensitive code a
+    deterministic order. With ``autojump`` set, a driver thread jumps to
+    the next deadline every ``autojump`` real seconds, so a run covers
+    hours of robot time in minutes.
+    """
+
+    # Real seconds between checks for a stop event while a thread sleeps
+    STOP_POLL_INTERVAL = 0.005
+
+    def __init__(self, start: Optional[float] = None, autojump: Optional[float] = None):
+        """
+        Initialize the clock.
+
+        Parameters
+        ----------
+        start : float, optional
+            Initial Unix time; defaults to now.
+        autojump : float, optional
+            Real seconds between jumps to the next deadline. The clock only
+            moves through ``advance`` and ``run_for`` when not set.
+        """
+        self._now = time.time() if start is None else start
+        self._lock = threading.Lock()
+        # Entries are [deadline, sequence, wake], wake is None once cancelled
+        self._waiters: List[List[Any]] = []
+        self._sequence = itertools.count()
+
+        self._stop = threading.Event()
+        self._driver: Optional[threading.Thread] = None
+        if autojump is not None:
+            self._driver = threading.Thread(
+                target=self._autojump,
+                args=(autojump,),
+                name="simulated-clock",
+                daemon=True,
+            )
+            self._driver.start()
+
+    def time(self) -> float:
+        """
+        Get the simulated Unix time.
+        """
+        with self._lock:
+            return self._now
+
+    def monotonic(self) -> float:
+        """
+        Get the simulated time; it never moves backwards.
+        """
+        return self.time()
+
+    @property
+    def pending(self) -> int:
+        """
+        Get the number of sleeps waiting for the clock.
+
+        Returns
+        -------
+        int
+            The number of registered deadlines.
+        """
+        with self._lock:
+            return sum(1 for entry in self._waiters if entry[2] is not None)
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the earliest deadline of a waiting sleep.
+
+        Returns
+        -------
+        float or None
+            The deadline, or None if nothing waits.
+        """
+        with self._lock:
+            self._drop_cancelled()
+            return self._waiters[0][0] if self._waiters else None
+
+    def _drop_cancelled(self):
+        while self._waiters and self._waiters[0][2] is None:
+            heapq.heappop(self._waiters)
+
+    def _schedule(self, duration: float, wake: Callable[[], None]) -> List[Any]:
+        with self._lock:
+            entry = [self._now + max(duration, 0.0), next(self._sequence), wake]
+            heapq.heappush(self._waiters, entry)
+        return entry
+
+    def _cancel(self, entry: List[Any]):
+        with self._lock:
+            entry[2] = None
+
+    def advance(self, duration: float) -> int:
+        """
+        Move the clock forward, waking every sleep that is due.
+
+        Sleeps are woken in deadline order, with the clock set to their
+        deadline, before it moves on to the end of the step.
+
+        Parameters
+        ----------
+        duration : float
+            Seconds to move forward.
+
+        Returns
+        -------
+        int
+            The number of sleeps woken.
+        """
+        with self._lock:
+            target = self._now + max(duration, 0.0)
+        return self._advance_to(target)
+
+    def _advance_to(self, target: float) -> int:
+        woken = 0
+        while True:
+            with self._lock:
+                self._drop_cancelled()
+                if not self._waiters or self._waiters[0][0] > target:
+                    self._now = max(self._now, target)
+                    return woken
+                deadline, _, wake = heapq.heappop(self._waiters)
+                self._now = max(self._now, deadline)
+            wake()
+            woken += 1
+
+    async def run_for(self, duration: float, settle: int = 5) -> None:
+        """
+        Advance the clock from a coroutine, one deadline at a time.
+
+        Before every deadline the event loop runs the ready coroutines, so
+        sleeps they start, including those of coroutines woken by the
+        previous deadline, are due within the same call.
+
+        Parameters
+        ----------
+        duration : float
+            Seconds to move forward.
+        settle : int
+            Event loop iterations to run after every deadline.
+        """
+        target = self.time() + max(duration, 0.0)
+        while True:
+            for _ in range(settle):
+                await asyncio.sleep(0)
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self._advance_to(deadline)
+        self._advance_to(target)
+        for _ in range(settle):
+            await asyncio.sleep(0)
+
+    def _autojump(self, interval: float):
+        while not self._stop.wait(interval):
+            deadline = self.next_deadline()
+            if deadline is not None:
+                self._advance_to(deadline)
+
+    def close(self):
+        """
+        Stop the autojump driver thread.
+        """
+        self._stop.set()
+        if self._driver is not None:
+            self._driver.join(timeout=1.0)
+
+    def sleep(self, duration: float) -> None:
+        """
+        Block the calling thread until the clock passes the deadline.
+        """
+        if duration <= 0:
+            return
+        woken = threading.Event()
+        self._schedule(duration, woken.set)
+        woken.wait()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Wait for an event until the clock passes the timeout.
+        """
+        if event.is_set():
+            return True
+        woken = threading.Event()
+        entry = self._schedule(timeout, woken.set)
+        while not woken.wait(self.STOP_POLL_INTERVAL):
+            if event.is_set():
+                self._cancel(entry)
+                return True
+        return event.is_set()
+
+    async def sleep_async(self, duration: float) -> None:
+        """
+        Suspend the calling coroutine until the clock passes the deadline.
+        """
+        if duration <= 0:
+            await asyncio.sleep(0)
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve():
+            if not future.done():
+                future.set_result(None)
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(resolve)
+            except RuntimeError:
+                # The event loop was closed while the coroutine slept
+                pass
+
+        entry = self._schedule(duration, wake)
+        try:
+            await future
+        finally:
+            self._cancel(entry)
+
+
+_clock: Clock = RealClock()
+
+
+def get_clock() -> Clock:
+    """
+    Get the clock of the runtime.
+
+    Returns
+    -------
+    Clock
+        The clock set with ``set_clock``, real time by default.
+    """
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replace the clock of the runtime.
+
+    Parameters
+    ----------
+    clock : Clock
+        The new clock, e.g. a ``SimulatedClock``.
+
+    Returns
+    -------
+    Clock
+        The previous clock.
+    """
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
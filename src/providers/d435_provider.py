@@ -1,12 +1,49 @@
 import logging
 import math
+import time
 
+import numpy as np
 import zenoh
+from numpy.typing import NDArray
 
-from zenoh_msgs import open_zenoh_session, sensor_msgs
+from zenoh_msgs import deserialize_numpy, open_zenoh_session, sensor_msgs
 
 from .singleton import singleton
 
+OBSTACLE_DTYPE = np.dtype(
+    [
+        ("x", np.float32),
+        ("y", np.float32),
+        ("z", np.float32),
+        ("angle", np.float32),
+        ("distance", np.float32),
+    ]
+)
+
+
+def _read_only(array: NDArray) -> NDArray:
+    array.flags.writeable = False
+    return array
+
+
+def path_obstacles(obstacle: NDArray) -> NDArray:
+    """
+    Convert D435 obstacles to the rows taken by ``LidarPathEngine.process``.
+
+    Parameters
+    ----------
+    obstacle : NDArray
+        Structured obstacle array with the fields of ``OBSTACLE_DTYPE``.
+
+    Returns
+    -------
+    NDArray
+        An (N, 4) array of [x, y, angle, distance].
+    """
+    return np.column_stack(
+        (obstacle["x"], obstacle["y"], obstacle["angle"], obstacle["distance"])
+    )
+
 
 @singleton
 class D435Provider:
@@ -20,7 +57,10 @@ class D435Provider:
 
         Sets up the Zenoh subscriber for obstacle point cloud data and starts the provider.
         """
-        self.obstacle: list[dict[str, float]] = []
+        # Edge length in meters of the downsampling voxels, see set_voxel_size
+        self.voxel_size = 0.0
+        self._obstacle: NDArray = _read_only(np.empty(0, dtype=OBSTACLE_DTYPE))
+        self.obstacle_timestamp: float = 0.0
         self.running: bool = False
         self.session = None
 
@@ -36,6 +76,22 @@ class D435Provider:
 
         self.start()
 
+    def set_voxel_size(self, voxel_size: float):
+        """
+        Set the voxel size the obstacle cloud is downsampled to.
+
+        The provider is shared by the lidar providers and the D435
+        background, so the size is set on the instance, whichever of them
+        created it first.
+
+        Parameters
+        ----------
+        voxel_size : float
+            Edge length in meters of the voxels, keeping one point per
+            voxel. 0 keeps all points.
+        """
+        self.voxel_size = max(voxel_size, 0.0)
+
     def calculate_angle_and_distance(self, world_x: float, world_y: float) -> tuple:
         """
         Calculate the angle and distance from the world coordinates.
@@ -69,21 +125,52 @@ class D435Provider:
             The sample containing the point cloud data.
         """
         try:
-            points = sensor_msgs.PointCloud.deserialize(sample.payload.to_bytes())
-
-            obstacles = []
-            for pt in points.points:  # type: ignore
-                x = pt.x
-                y = pt.y
-                z = pt.z
-                angle, distance = self.calculate_angle_and_distance(x, y)
-                obstacles.append(
-                    {"x": x, "y": y, "z": z, "angle": angle, "distance": distance}
-                )
-            self.obstacle = obstacles
+            points = deserialize_numpy(
+                sensor_msgs.PointCloud, sample.payload.to_bytes()
+            )
+            self._update_obstacle(points.points)  # type: ignore
         except Exception as e:
             logging.error(f"Error processing obstacle info: {e}")
 
+    def _update_obstacle(self, xyz: NDArray):
+        """
+        Replace the obstacles with a new point cloud.
+
+        Parameters
+        ----------
+        xyz : NDArray
+            An (N, 3) array of x, y and z in meters.
+        """
+        if self.voxel_size > 0 and len(xyz):
+            voxels = np.floor(xyz / self.voxel_size).astype(np.int64)
+            _, first = np.unique(voxels, axis=0, return_index=True)
+            xyz = xyz[np.sort(first)]
+
+        obstacle = np.empty(len(xyz), dtype=OBSTACLE_DTYPE)
+        obstacle["x"] = xyz[:, 0]
+        obstacle["y"] = xyz[:, 1]
+        obstacle["z"] = xyz[:, 2]
+        obstacle["angle"] = np.degrees(np.arctan2(xyz[:, 1], xyz[:, 0]))
+        obstacle["distance"] = np.hypot(xyz[:, 0], xyz[:, 1])
+
+        # Swapped in whole, so readers never see a partial frame
+        self._obstacle = _read_only(obstacle)
+        self.obstacle_timestamp = time.time()
+
+    @property
+    def obstacle(self) -> NDArray:
+        """
+        Get the obstacles of the latest point cloud.
+
+        Returns
+        -------
+        NDArray
+            Read-only structured array with the fields of ``OBSTACLE_DTYPE``.
+            Each frame replaces the array instead of modifying it, so it is a
+            consistent snapshot.
+        """
+        return self._obstacle
+
     def start(self):
         """
         Start the D435 provider.
@@ -0,0 +1,560 @@
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing as mp
+import os
+import queue
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from runtime.lazy_import import lazy_attribute, lazy_import
+
+YOLO = lazy_attribute("ultralytics", "YOLO")
+torch = lazy_import("torch")
+detection_model = lazy_import("torchvision.models.detection")
+
+# Raw output of a detector for one image: boxes (n, 4), scores (n,), classes (n,)
+RawDetections = Tuple[NDArray, NDArray, NDArray]
+
+_THREAD_VARIABLES = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+class Detections(NamedTuple):
+    """
+    Detections of one frame, as compact arrays.
+
+    Parameters
+    ----------
+    boxes : NDArray[np.float32]
+        (n, 4) boxes as x1, y1, x2, y2 in pixels.
+    scores : NDArray[np.float32]
+        (n,) confidences.
+    classes : NDArray[np.int32]
+        (n,) class ids; see ``DetectionWorker.names``.
+    inference : float
+        Seconds the model took for the batch of the frame.
+    latency : float
+        Seconds from submitting the frame to receiving its detections.
+    batch_size : int
+        Number of frames inferred together with this one.
+    """
+
+    boxes: NDArray[np.float32]
+    scores: NDArray[np.float32]
+    classes: NDArray[np.int32]
+    inference: float
+    latency: float
+    batch_size: int
+
+
+class YOLODetector:
+    """
+    Batched Ultralytics YOLO detector.
+    """
+
+    def __init__(self, weights: str):
+        """
+        Load the model.
+
+        Parameters
+        ----------
+        weights : str
+            Path or name of the YOLO weights, e.g. "yolov8n_aug.pt".
+        """
+        self.model = YOLO(weights)
+        self.names: Dict[int, str] = dict(self.model.names)
+
+    def __call__(self, images: List[NDArray]) -> List[RawDetections]:
+        """
+        Detect objects in a batch of BGR images.
+        """
+        results = self.model.predict(source=images, save=False, verbose=False)
+        return [
+            (
+                r.boxes.xyxy.cpu().numpy(),
+                r.boxes.conf.cpu().numpy(),
+                r.boxes.cls.cpu().numpy(),
+            )
+            for r in results
+        ]
+
+
+class COCODetector:
+    """
+    Batched torchvision Faster R-CNN MobileNetV3 detector for COCO classes.
+    """
+
+    def __init__(self):
+        """
+        Load the model.
+        """
+        self.model = detection_model.fasterrcnn_mobilenet_v3_large_320_fpn(
+            weights="FasterRCNN_MobileNet_V3_Large_320_FPN_Weights.COCO_V1",
+            progress=True,
+            weights_backbone="MobileNet_V3_Large_Weights.IMAGENET1K_V1",
+        )
+        self.model.eval()
+        categories = (
+            detection_model.FasterRCNN_MobileNet_V3_Large_320_FPN_Weights.DEFAULT.meta[
+                "categories"
+            ]
+        )
+        self.names: Dict[int, str] = dict(enumerate(categories))
+
+    def __call__(self, images: List[NDArray]) -> List[RawDetections]:
+        """
+        Detect objects in a batch of images, sorted by descending score.
+        """
+        tensors = [
+            torch.from_numpy(np.ascontiguousarray(image.transpose((2, 0, 1))))
+            .float()
+            .div_(255.0)
+            for image in images
+        ]
+        with torch.no_grad():
+            outputs = self.model(tensors)
+        return [
+            (o["boxes"].numpy(), o["scores"].numpy(), o["labels"].numpy())
+            for o in outputs
+        ]
+
+
+def _limit_threads(threads: int):
+    # Set before the loader imports torch, so its thread pools are sized once
+    for variable in _THREAD_VARIABLES:
+        os.environ[variable] = str(threads)
+    cv2.setNumThreads(threads)
+
+
+def _run_worker(
+    loader: Callable[[], Any],
+    requests: mp.Queue,
+    results: mp.Queue,
+    threads: int,
+    max_batch: int,
+    batch_window: float,
+):
+    """
+    Inference loop of the worker process.
+
+    Parameters
+    ----------
+    loader : Callable[[], Any]
+        Picklable factory of the detector, e.g. ``YOLODetector`` bound to
+        its weights with ``functools.partial``.
+    requests : mp.Queue
+        Frame requests from the parent; None stops the worker.
+    results : mp.Queue
+        Detections and errors for the parent.
+    threads : int
+        CPU threads for the model.
+    max_batch : int
+        Maximum frames per inference.
+    batch_window : float
+        Seconds to wait for more frames after the first one of a batch.
+    """
+    _limit_threads(threads)
+    try:
+        detector = loader()
+    except Exception as e:
+        results.put(("failed", f"Could not load detector: {e}"))
+        return
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(threads)
+    results.put(("ready", dict(getattr(detector, "names", {}))))
+
+    attached: Dict[int, shared_memory.SharedMemory] = {}
+    images: List[NDArray] = []
+    stopping = False
+    while not stopping:
+        request = requests.get()
+        if request is None:
+            break
+
+        batch = [request]
+        deadline = time.monotonic() + batch_window
+        while len(batch) < max_batch:
+            try:
+                timeout = deadline - time.monotonic()
+                request = (
+                    requests.get(timeout=timeout)
+                    if timeout > 0
+                    else requests.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                stopping = True
+                break
+            batch.append(request)
+
+        # Drop the views of the last batch before remapping any slot
+        images = []
+        for stream, _, name, shape, dtype in batch:
+            shm = attached.get(stream)
+            if shm is None or shm.name != name:
+                if shm is not None:
+                    shm.close()
+                shm = attached[stream] = shared_memory.SharedMemory(name=name)
+            images.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+        start = time.perf_counter()
+        try:
+            outputs = detector(images)
+        except Exception as e:
+            for stream, request_id, *_ in batch:
+                results.put(("error", stream, request_id, str(e)))
+            continue
+        inference = time.perf_counter() - start
+
+        for (stream, request_id, *_), (boxes, scores, classes) in zip(batch, outputs):
+            results.put(
+                (
+                    "result",
+                    stream,
+                    request_id,
+                    np.asarray(boxes, dtype=np.float32).reshape(-1, 4),
+                    np.asarray(scores, dtype=np.float32).reshape(-1),
+                    np.asarray(classes, dtype=np.int32).reshape(-1),
+                    inference,
+                    len(batch),
+                )
+            )
+
+    images = []
+    for shm in attached.values():
+        shm.close()
+
+
+class _Stream:
+    """
+    Shared frame slot and in-flight request of one camera stream.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self.request_id = 0
+        self.submitted = 0.0
+        self.future: Optional[concurrent.futures.Future] = None
+        # Until the worker answers, it may still read the slot, even if the
+        # future was cancelled, e.g. through asyncio.wrap_future
+        self.in_flight = False
+
+    def release(self):
+        if self.shm is not None:
+            self.shm.close()
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            self.shm = None
+
+
+class DetectionWorker:
+    """
+    Runs an object detector in its own process, fed through shared memory.
+
+    Each camera stream gets a shared-memory frame slot. A frame is copied
+    into it once and only its name and shape are queued, so the worker
+    reads it without pickling. The worker batches the frames of all streams
+    that are waiting into one inference and returns compact arrays, so
+    neither the convolutions nor their post-processing hold the GIL of the
+    cortex loop.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        threads: Optional[int] = None,
+        max_batch: int = 4,
+        batch_window: float = 0.0,
+        context: Optional[str] = None,
+    ):
+        """
+        Initialize the worker; ``start`` launches its process.
+
+        Parameters
+        ----------
+        loader : Callable[[], Any]
+            Picklable factory of the detector, run in the worker process. The
+            detector maps a list of BGR images to a list of (boxes, scores,
+            classes) and may have ``names`` mapping class ids to labels.
+        threads : int, optional
+            CPU threads for the model. Defaults to half of the cores, leaving
+            the rest to the cortex loop and the capture threads.
+        max_batch : int
+            Maximum frames per inference.
+        batch_window : float
+            Seconds the worker waits for frames of other streams before it
+            runs a batch.
+        context : str, optional
+            Start method of the worker process, e.g. "spawn". Defaults to the
+            multiprocessing default.
+        """
+        self.loader = loader
+        self.threads = threads or max(1, (os.cpu_count() or 2) // 2)
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.names: Dict[int, str] = {}
+
+        self._context = mp.get_context(context)
+        self._requests: Optional[mp.Queue] = None
+        self._results: Optional[mp.Queue] = None
+        self._process: Optional[Any] = None
+        self._collector: Optional[threading.Thread] = None
+        self._streams: Dict[Hashable, _Stream] = {}
+        self._slots: List[_Stream] = []
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self.running = False
+
+    def start(self):
+        """
+        Start the worker process and the thread collecting its results.
+        """
+        if self.running:
+            return
+        self.running = True
+        # Share one resource tracker with the worker; a tracker of its own
+        # would unlink the frame slots it attached to when it exits
+        resource_tracker.ensure_running()
+        self._requests = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self.loader,
+                self._requests,
+                self._results,
+                self.threads,
+                self.max_batch,
+                self.batch_window,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        self._collector = threading.Thread(
+            target=self._collect, name="detection-worker", daemon=True
+        )
+        self._collector.start()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the worker has loaded its detector.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait. Waits forever by default.
+
+        Returns
+        -------
+        bool
+            True once the detector is loaded.
+        """
+        return self._ready.wait(timeout)
+
+    def submit(
+        self, stream: Hashable, image: NDArray
+    ) -> "concurrent.futures.Future[Detections]":
+        """
+        Queue a frame for detection.
+
+        Parameters
+        ----------
+        stream : Hashable
+            The camera of the frame, e.g. its index. Each stream has one
+            frame in flight at a time.
+        image : NDArray
+            The BGR image; it is copied into the shared frame slot.
+
+        Returns
+        -------
+        concurrent.futures.Future[Detections]
+            Resolves with the detections of the frame.
+
+        Raises
+        ------
+        RuntimeError
+            If the worker is not running or the stream has a frame in flight.
+        """
+        if not self.running or self._requests is None:
+            raise RuntimeError("Detection worker is not running")
+
+        image = np.ascontiguousarray(image)
+        with self._lock:
+            slot = self._streams.get(stream)
+            if slot is None:
+                slot = self._streams[stream] = _Stream(len(self._slots))
+                self._slots.append(slot)
+            if slot.in_flight:
+                raise RuntimeError(f"Stream {stream} has a frame in flight")
+
+            if slot.shm is None or slot.shm.size < image.nbytes:
+                slot.release()
+                slot.shm = shared_memory.SharedMemory(
+                    create=True, size=max(image.nbytes, 1)
+                )
+            frame = np.ndarray(image.shape, dtype=image.dtype, buffer=slot.shm.buf)
+            frame[...] = image
+            del frame
+
+            slot.request_id += 1
+            slot.submitted = time.perf_counter()
+            slot.future = concurrent.futures.Future()
+            slot.in_flight = True
+            self._requests.put(
+                (
+                    slot.index,
+                    slot.request_id,
+                    slot.shm.name,
+                    image.shape,
+                    image.dtype.str,
+                )
+            )
+            return slot.future
+
+    async def detect(self, stream: Hashable, image: NDArray) -> Detections:
+        """
+        Detect objects in a frame without blocking the event loop.
+
+        Parameters
+        ----------
+        stream : Hashable
+            The camera of the frame, see ``submit``.
+        image : NDArray
+            The BGR image.
+
+        Returns
+        -------
+        Detections
+            The detections of the frame.
+        """
+        return await asyncio.wrap_future(self.submit(stream, image))
+
+    def _resolve(self, index: int, request_id: int, result: Any, error: bool):
+        with self._lock:
+            slot = self._slots[index] if index < len(self._slots) else None
+            if slot is None or slot.request_id != request_id or slot.future is None:
+                return
+            slot.in_flight = False
+            future, latency = slot.future, time.perf_counter() - slot.submitted
+        if future.done():
+            return
+        if error:
+            future.set_exception(RuntimeError(result))
+        else:
+            boxes, scores, classes, inference, batch_size = result
+            future.set_result(
+                Detections(boxes, scores, classes, inference, latency, batch_size)
+            )
+            logging.debug(
+                f"Detection latency {latency * 1000:.1f} ms, inference "
+                f"{inference * 1000:.1f} ms for a batch of {batch_size}"
+            )
+
+    def _fail_pending(self, reason: str):
+        with self._lock:
+            futures = [s.future for s in self._streams.values() if s.future]
+            for slot in self._streams.values():
+                slot.in_flight = False
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+
+    def _collect(self):
+        while self.running:
+            try:
+                message = self._results.get(timeout=0.5)  # type: ignore
+            except queue.Empty:
+                if self._process is not None and not self._process.is_alive():
+                    logging.error("Detection worker exited unexpectedly")
+                    self.running = False
+                    self._fail_pending("Detection worker exited")
+                continue
+            except (EOFError, OSError):
+                break
+
+            kind = message[0]
+            if kind == "ready":
+                self.names = message[1]
+                self._ready.set()
+            elif kind == "failed":
+                logging.error(message[1])
+                self.running = False
+                self._fail_pending(message[1])
+            elif kind == "error":
+                _, index, request_id, reason = message
+                logging.error(f"Error in detection worker: {reason}")
+                self._resolve(index, request_id, reason, error=True)
+            else:
+                _, index, request_id, *result = message
+                self._resolve(index, request_id, result, error=False)
+
+    def stop(self):
+        """
+        Stop the worker process and release the shared frame slots.
+        """
+        was_running, self.running = self.running, False
+        if was_running and self._requests is not None:
+            try:
+                self._requests.put(None)
+            except (ValueError, OSError):
+                pass
+        if self._process is not None:
+            self._process.join(timeout=5.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        if self._collector and self._collector is not threading.current_thread():
+            self._collector.join(timeout=1.0)
+
+        self._fail_pending("Detection worker stopped")
+        with self._lock:
+            for slot in self._slots:
+                slot.release()
+            self._streams.clear()
+            self._slots.clear()
+
+
+_workers: Dict[str, DetectionWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_detection_worker(
+    name: str, loader: Callable[[], Any], **kwargs: Any
+) -> DetectionWorker:
+    """
+    Get the process-wide, running detection worker of a model.
+
+    Inputs running the same model share one worker, so the frames of all
+    their cameras are batched together.
+
+    Parameters
+    ----------
+    name : str
+        Name of the model, e.g. "yolo:yolov8n_aug.pt".
+    loader : Callable[[], Any]
+        Factory of the detector, used if the worker is created.
+    **kwargs : Any
+        Further ``DetectionWorker`` arguments, used if it is created.
+
+    Returns
+    -------
+    DetectionWorker
+        The running worker.
+    """
+    with _workers_lock:
+        worker = _workers.get(name)
+        if worker is None or not worker.running:
+            worker = _workers[name] = DetectionWorker(loader, **kwargs)
+            worker.start()
+        return worker
@@ -0,0 +1,236 @@
+import json
+import logging
+import os
+import re
+import threading
+from typing import BinaryIO, List, Optional, Tuple
+
+# Position of the first unacknowledged record: (segment, byte offset)
+Cursor = Tuple[int, int]
+
+SEGMENT_PATTERN = re.compile(r"^(\d{12})\.jsonl$")
+
+
+class DiskSpool:
+    """
+    Append-only, disk-backed queue of JSON lines for store-and-forward uploads.
+
+    Records are appended to numbered segment files. A consumer reads
+    batches from the cursor and acknowledges them once delivered; the
+    cursor is persisted, so undelivered records survive a restart and are
+    read again. Fully acknowledged segments are deleted, and the oldest
+    segments are dropped once the spool exceeds ``max_bytes``, so a long
+    outage costs bounded disk space and no memory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Open the spool, resuming from the persisted cursor.
+
+        Parameters
+        ----------
+        directory : str
+            Directory of the segment files; created if missing.
+        max_segment_bytes : int
+            Size from which appends roll over to a new segment.
+        max_bytes : int
+            Size from which the oldest segments are dropped.
+        """
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_bytes = max_bytes
+        self.dropped_bytes = 0
+
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self._sizes = {
+            segment: os.path.getsize(self._path(segment))
+            for segment in self._list_segments()
+        }
+        cursor = self._load_cursor()
+        for segment in [s for s in self._sizes if s < cursor[0]]:
+            self._remove(segment)
+
+        # Never append behind a line a crash may have torn
+        self._write_segment = max([*self._sizes, cursor[0]]) + 1
+        if cursor[0] not in self._sizes:
+            # The segment of the cursor was dropped or fully read
+            cursor = (min(self._sizes, default=self._write_segment), 0)
+        self._cursor: Cursor = cursor
+        self._writer: Optional[BinaryIO] = None
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:012d}.jsonl")
+
+    @property
+    def _cursor_path(self) -> str:
+        return os.path.join(self.directory, "cursor.json")
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self.directory):
+            match = SEGMENT_PATTERN.match(name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _load_cursor(self) -> Cursor:
+        first = min(self._sizes, default=0)
+        try:
+            with open(self._cursor_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            cursor = (int(data["segment"]), int(data["offset"]))
+        except FileNotFoundError:
+            return (first, 0)
+        except (ValueError, KeyError, TypeError) as e:
+            logging.error(f"Error reading spool cursor, resending spool: {e}")
+            return (first, 0)
+
+        return cursor
+
+    def _save_cursor(self):
+        tmp_path = f"{self._cursor_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"segment": self._cursor[0], "offset": self._cursor[1]}, f)
+        os.replace(tmp_path, self._cursor_path)
+
+    def _remove(self, segment: int):
+        try:
+            os.remove(self._path(segment))
+        except FileNotFoundError:
+            pass
+        self._sizes.pop(segment, None)
+
+    @property
+    def pending_bytes(self) -> int:
+        """
+        Get the size of the records not acknowledged yet.
+
+        Returns
+        -------
+        int
+            Bytes on disk from the cursor on.
+        """
+        with self._lock:
+            return sum(self._sizes.values()) - self._cursor[1]
+
+    def append(self, record: bytes):
+        """
+        Append a record.
+
+        Parameters
+        ----------
+        record : bytes
+            One JSON document, without line breaks.
+        """
+        with self._lock:
+            if (
+                self._writer is not None
+                and self._sizes[self._write_segment] >= self.max_segment_bytes
+            ):
+                self._writer.close()
+                self._writer = None
+                self._write_segment += 1
+
+            if self._writer is None:
+                self._writer = open(self._path(self._write_segment), "ab")
+                self._sizes[self._write_segment] = 0
+
+            self._writer.write(record + b"\n")
+            self._writer.flush()
+            self._sizes[self._write_segment] += len(record) + 1
+            self._enforce_limit()
+
+    def _enforce_limit(self):
+        while sum(self._sizes.values()) > self.max_bytes and len(self._sizes) > 1:
+            oldest = min(self._sizes)
+            size = self._sizes[oldest]
+            self._remove(oldest)
+            self.dropped_bytes += size
+            if self._cursor[0] <= oldest:
+                self._cursor = (min(self._sizes), 0)
+                self._save_cursor()
+            logging.warning(
+                f"Spool {self.directory} full, dropped {size} bytes of records"
+            )
+
+    def read_batch(
+        self, max_records: int, max_bytes: int = 1024 * 1024
+    ) -> Tuple[List[bytes], Cursor]:
+        """
+        Read the next unacknowledged records.
+
+        Parameters
+        ----------
+        max_records : int
+            Maximum number of records.
+        max_bytes : int
+            Maximum total size of the records; at least one is read.
+
+        Returns
+        -------
+        Tuple[List[bytes], Cursor]
+            The records, and the cursor to acknowledge them with.
+        """
+        records: List[bytes] = []
+        size = 0
+        with self._lock:
+            segment, offset = self._cursor
+            while len(records) < max_records and segment in self._sizes:
+                line = b""
+                with open(self._path(segment), "rb") as f:
+                    f.seek(offset)
+                    while len(records) < max_records:
+                        line = f.readline()
+                        if not line.endswith(b"\n"):
+                            break
+                        if records and size + len(line) > max_bytes:
+                            return records, (segment, offset)
+                        offset += len(line)
+                        size += len(line)
+                        records.append(line[:-1])
+
+                if segment == self._write_segment or len(records) >= max_records:
+                    break
+                if line:
+                    logging.error(
+                        f"Skipping truncated record in spool segment {segment}"
+                    )
+                later = [s for s in self._sizes if s > segment]
+                if not later:
+                    break
+                segment, offset = min(later), 0
+
+        return records, (segment, offset)
+
+    def ack(self, cursor: Cursor):
+        """
+        Acknowledge the records before a cursor as delivered.
+
+        Parameters
+        ----------
+        cursor : Cursor
+            The cursor returned by ``read_batch``.
+        """
+        with self._lock:
+            if cursor < self._cursor:
+                return
+            self._cursor = cursor
+            for segment in [s for s in self._sizes if s < cursor[0]]:
+                self._remove(segment)
+            self._save_cursor()
+
+    def close(self):
+        """
+        Close the segment being written.
+        """
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
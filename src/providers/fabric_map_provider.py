@@ -1,15 +1,21 @@
+import gzip
 import json
 import logging
 import os
-import time
-from concurrent.futures import ThreadPoolExecutor
+import threading
 from dataclasses import dataclass
 from typing import List, Optional
 
-import requests
+from runtime.cache_dir import get_cache_dir
 
+from .disk_spool import DiskSpool
+from .http_client import get_http_client
+from .sensor_recorder import SensorRecorder, get_sensor_recorder
 from .singleton import singleton
 
+# Statuses of a payload FABRIC cannot accept, e.g. malformed or too large
+PAYLOAD_REJECTED_STATUSES = (400, 413, 415, 422)
+
 
 @dataclass
 class RFData:
@@ -175,6 +181,12 @@ class FabricData:
 class FabricDataSubmitter:
     """
     Allows a machine to locally log mapping data and submit data to FABRIC.
+
+    Payloads are appended to a disk spool and uploaded by a background
+    thread, so mapping continues through connectivity losses: nothing piles
+    up in memory while the link is down, and the spool is resumed after a
+    reconnect or restart. Payloads are sent one JSON object per request
+    unless ``max_batch`` opts in to gzip-compressed batches.
     """
 
     def __init__(
@@ -182,6 +194,9 @@ class FabricDataSubmitter:
         api_key: Optional[str] = None,
         base_url: str = "https://api.openmind.org/api/core/fabric/submit",
         write_to_local_file: bool = False,
+        spool_dir: Optional[str] = None,
+        max_batch: int = 1,
+        max_spool_bytes: int = 256 * 1024 * 1024,
     ):
         """
         Initialize the FabricDataSubmitter.
@@ -196,97 +211,151 @@ class FabricDataSubmitter:
         write_to_local_file : bool
             If True, enables local file logging of submitted data.
             Default is False.
+        spool_dir : Optional[str]
+            Directory of the upload spool. Defaults to fabric_spool in
+            $OM1_CACHE_DIR or ~/.cache/om1.
+        max_batch : int
+            Maximum number of payloads per request. With 1, payloads are
+            sent one by one as uncompressed JSON objects; with more, as a
+            gzip-compressed JSON array, falling back to single payloads if
+            FABRIC rejects the batch. Default is 1.
+        max_spool_bytes : int
+            Disk space of the spool, from which the oldest payloads are
+            dropped. Default is 256 MiB.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.write_to_local_file = write_to_local_file
-        self.filename_base = "dump/fabric"
-        self.filename_current = self.update_filename()
-        self.max_file_size_bytes = 1024 * 1024
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.recorder: Optional[SensorRecorder] = None
+        if write_to_local_file:
+            self.recorder = get_sensor_recorder()
+        self.max_batch = max(1, max_batch)
+
+        if spool_dir is None:
+            spool_dir = os.path.join(get_cache_dir(), "fabric_spool")
+        self.spool = DiskSpool(spool_dir, max_bytes=max_spool_bytes)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if self.api_key:
+            self.start()
 
-    def update_filename(self):
+    def start(self):
         """
-        Update the filename for local logging with a timestamp.
+        Start the background thread uploading the spool.
         """
-        unix_ts = time.time()
-        logging.info(f"fabric time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"{self.filename_base}_{unix_ts}Z.jsonl"
-        return filename
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._upload_loop, name="fabric-uploader", daemon=True
+            )
+            self._thread.start()
 
-    def write_dict_to_file(self, data: dict):
+    def stop(self, timeout: float = 5.0):
         """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
+        Stop the upload thread; the spool keeps what was not uploaded yet.
 
         Parameters
         ----------
-        data : dict
-            The dictionary to write to the file.
+        timeout : float
+            Seconds to wait for a running upload to finish.
+        """
+        self._stop_event.set()
+        self._wakeup.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self.spool.close()
+
+    def _upload_loop(self):
         """
-        if not isinstance(data, dict):
-            raise ValueError("Provided data must be a dictionary.")
-
-        if (
-            os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"new file name: {self.filename_current}")
-
-        with open(self.filename_current, "a", encoding="utf-8") as f:
-            json_line = json.dumps(data)
-            f.write(json_line + "\n")
-            f.flush()
-
-    def _share_data_worker(self, data: FabricData):
+        Upload spooled payloads in batches until stopped, backing off
+        exponentially while FABRIC is unreachable.
         """
-        Worker function to share data from the machine.
-        This function runs in a separate thread to avoid blocking the main thread.
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            self._wakeup.clear()
+            try:
+                records, cursor = self.spool.read_batch(self.max_batch)
+            except OSError as e:
+                logging.error(f"Error reading FABRIC spool: {e}")
+                self._stop_event.wait(backoff)
+                continue
+
+            if not records:
+                self._wakeup.wait(timeout=1.0)
+                continue
+
+            delivered = self._upload_batch(records)
+            if delivered:
+                self.spool.ack(cursor)
+                backoff = 1.0
+            else:
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
 
-        Parameters
-        ----------
-        data : FabricData
-            The data to be shared.
+    def _upload_batch(self, records: List[bytes]) -> bool:
         """
-        logging.info(f"_share_data_worker: {data}")
-        try:
-            json_dict = data.to_dict()
-        except Exception as e:
-            logging.error(f"Error converting to dict: {str(e)}")
-            return
+        Send a batch of spooled payloads to FABRIC.
 
-        if self.write_to_local_file:
-            self.write_dict_to_file(json_dict)
-            logging.info(f"FDS wrote to {self.filename_current}")
+        Parameters
+        ----------
+        records : List[bytes]
+            JSON encoded payloads.
 
-        if self.api_key is None or self.api_key == "":
-            logging.error("API key missing. Cannot share data to FABRIC.")
-            return
+        Returns
+        -------
+        bool
+            True if the batch is done with, i.e. accepted or, for a single
+            payload, rejected for good; False if it should be sent again.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        if len(records) == 1:
+            body = records[0]
+        else:
+            body = gzip.compress(b"[" + b",".join(records) + b"]", compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
 
         try:
-            request = requests.post(
+            request = get_http_client().post(
                 self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=json_dict,
+                headers=headers,
+                data=body,
                 timeout=10,
             )
-
-            if request.status_code == 201:
-                logging.debug(f"Data shared: {request.json()}")
-            else:
-                logging.error(
-                    f"Failed to share data: {request.status_code} - {request.text}"
-                )
         except Exception as e:
             logging.error(f"Error sharing data: {str(e)}")
+            return False
+
+        if 200 <= request.status_code < 300:
+            logging.debug(f"Data shared: {len(records)} payloads")
+            return True
+
+        logging.error(f"Failed to share data: {request.status_code} - {request.text}")
+        if request.status_code not in PAYLOAD_REJECTED_STATUSES:
+            return False
+        if len(records) > 1:
+            # Keep the batch and send it again one payload at a time
+            logging.warning("FABRIC rejected a batch, sending payloads one by one")
+            self.max_batch = 1
+            return False
+        # Drop a payload FABRIC rejects for good, as it would block the spool
+        return True
 
     def share_data(self, data: FabricData):
         """
         Share mapping data.
-        This function submits mapping data collected by a machine to a thread pool executor
-        to run in a separate thread.
+        This function appends mapping data collected by a machine to the
+        upload spool, and returns without waiting for the upload.
 
         Parameters
         ----------
@@ -294,4 +363,22 @@ class FabricDataSubmitter:
             A mapping data payload to submit.
         """
         logging.debug(f"share data: {data}")
-        self.executor.submit(self._share_data_worker, data)
+        try:
+            json_dict = data.to_dict()
+        except Exception as e:
+            logging.error(f"Error converting to dict: {str(e)}")
+            return
+
+        if self.recorder is not None:
+            self.recorder.record("fabric", json_dict)
+
+        if self.api_key is None or self.api_key == "":
+            logging.error("API key missing. Cannot share data to FABRIC.")
+            return
+
+        try:
+            self.spool.append(json.dumps(json_dict).encode("utf-8"))
+        except OSError as e:
+            logging.error(f"Error spooling data: {str(e)}")
+            return
+        self._wakeup.set()
@@ -0,0 +1,516 @@
+import base64
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+Resolution = Tuple[int, int]
+
+
+def fit_resolution(shape: Tuple[int, ...], resolution: Resolution) -> Resolution:
+    """
+    Fit an image into a resolution, keeping its aspect ratio.
+
+    Landscape images take the target width and portrait images the target
+    height, as the camera providers have always done.
+
+    Parameters
+    ----------
+    shape : Tuple[int, ...]
+        Shape of the image, (height, width, ...).
+    resolution : Resolution
+        Target (width, height).
+
+    Returns
+    -------
+    Resolution
+        The (width, height) to resize to.
+    """
+    height, width = shape[:2]
+    ratio = width / height
+    if width > height:
+        return resolution[0], int(resolution[0] / ratio)
+    return int(resolution[1] * ratio), resolution[1]
+
+
+class Frame:
+    """
+    One captured camera frame and the representations derived from it.
+
+    Resized images, JPEG bytes and base64 strings are computed on first use
+    and cached, so subscribers asking for the same representation of a frame
+    share one resize and one encode. The frame is immutable.
+    """
+
+    def __init__(self, image: NDArray, sequence: int, timestamp: float):
+        """
+        Initialize the frame.
+
+        Parameters
+        ----------
+        image : NDArray
+            The BGR image; it is made read-only.
+        sequence : int
+            Sequence number of the frame on its bus, starting at 1.
+        timestamp : float
+            Capture time in seconds since the epoch.
+        """
+        image.flags.writeable = False
+        self.image = image
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self._cache: Dict[Hashable, Any] = {}
+        # Reentrant, as encodings derive from the resized image
+        self._lock = threading.RLock()
+
+    def _derive(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        # One lock per frame: a second subscriber waits for the first
+        # encode instead of repeating it
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+
+    def resized(
+        self, resolution: Optional[Resolution] = None, keep_aspect: bool = True
+    ) -> NDArray:
+        """
+        Get the frame resized to a resolution.
+
+        Parameters
+        ----------
+        resolution : Resolution, optional
+            Target (width, height). The original image if None.
+        keep_aspect : bool
+            Fit the image into the resolution keeping its aspect ratio,
+            instead of stretching it.
+
+        Returns
+        -------
+        NDArray
+            The read-only resized BGR image.
+        """
+        if resolution is None:
+            return self.image
+
+        def compute():
+            size = (
+                fit_resolution(self.image.shape, resolution)
+                if keep_aspect
+                else tuple(resolution)
+            )
+            image = cv2.resize(self.image, size, interpolation=cv2.INTER_AREA)
+            image.flags.writeable = False
+            return image
+
+        return self._derive(("resized", tuple(resolution), keep_aspect), compute)
+
+    def jpeg(
+        self,
+        resolution: Optional[Resolution] = None,
+        quality: int = 70,
+        keep_aspect: bool = True,
+    ) -> bytes:
+        """
+        Get the frame as JPEG bytes.
+
+        Parameters
+        ----------
+        resolution : Resolution, optional
+            Target (width, height), see ``resized``.
+        quality : int
+            JPEG quality from 0 to 100.
+        keep_aspect : bool
+            See ``resized``.
+
+        Returns
+        -------
+        bytes
+            The encoded image.
+        """
+
+        def compute():
+            image = self.resized(resolution, keep_aspect)
+            _, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            return buffer.tobytes()
+
+        key = ("jpeg", resolution and tuple(resolution), quality, keep_aspect)
+        return self._derive(key, compute)
+
+    def base64(
+        self,
+        resolution: Optional[Resolution] = None,
+        quality: int = 70,
+        keep_aspect: bool = True,
+    ) -> str:
+        """
+        Get the frame as a base64 encoded JPEG, as sent to VLM services.
+
+        Parameters
+        ----------
+        resolution : Resolution, optional
+            Target (width, height), see ``resized``.
+        quality : int
+            JPEG quality from 0 to 100.
+        keep_aspect : bool
+            See ``resized``.
+
+        Returns
+        -------
+        str
+            The base64 string.
+        """
+        key = ("base64", resolution and tuple(resolution), quality, keep_aspect)
+        return self._derive(
+            key,
+            lambda: base64.b64encode(
+                self.jpeg(resolution, quality, keep_aspect)
+            ).decode("utf-8"),
+        )
+
+
+class FrameSubscription:
+    """
+    Delivers the frames of a bus to a callback on its own thread.
+
+    The callback always receives the newest frame; frames published while it
+    is still busy with an older one are dropped for this subscriber only.
+    """
+
+    def __init__(self, bus: "FrameBus", callback: Callable[[Frame], None]):
+        """
+        Start delivering frames.
+
+        Parameters
+        ----------
+        bus : FrameBus
+            The bus to subscribe to.
+        callback : Callable[[Frame], None]
+            Called with each delivered frame.
+        """
+        self.bus = bus
+        self.callback = callback
+        self.dropped = 0
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"frame-bus-{bus.name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        sequence = 0
+        while self._running:
+            frame = self.bus.wait(after=sequence, timeout=0.5)
+            if frame is None or not self._running:
+                continue
+            if sequence:
+                self.dropped += frame.sequence - sequence - 1
+            sequence = frame.sequence
+            try:
+                self.callback(frame)
+            except Exception as e:
+                logging.error(f"Error in frame bus {self.bus.name} subscriber: {e}")
+
+    def close(self):
+        """
+        Stop delivering frames.
+        """
+        self._running = False
+        self.bus._unsubscribe(self)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+
+class FrameBus:
+    """
+    Per-device bus that fans captured frames out to any number of consumers.
+
+    The capture loop of a device publishes each frame once. Consumers either
+    read ``latest`` when they poll, ``wait`` for a newer frame from their own
+    thread, or ``subscribe`` a callback. Derived representations are cached
+    on the ``Frame``, so each is computed once per frame.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the bus.
+
+        Parameters
+        ----------
+        name : str
+            Name of the device, e.g. "webcam:0".
+        """
+        self.name = name
+        self._latest: Optional[Frame] = None
+        self._condition = threading.Condition()
+        self._subscriptions: List[FrameSubscription] = []
+
+    def publish(self, image: NDArray, timestamp: Optional[float] = None) -> Frame:
+        """
+        Publish a captured frame and wake the consumers.
+
+        Parameters
+        ----------
+        image : NDArray
+            The BGR image. The bus takes ownership and makes it read-only.
+        timestamp : float, optional
+            Capture time; defaults to now.
+
+        Returns
+        -------
+        Frame
+            The published frame.
+        """
+        with self._condition:
+            sequence = self._latest.sequence + 1 if self._latest else 1
+            frame = Frame(image, sequence, timestamp or time.time())
+            self._latest = frame
+            self._condition.notify_all()
+        return frame
+
+    @property
+    def latest(self) -> Optional[Frame]:
+        """
+        Get the newest frame without waiting.
+
+        Returns
+        -------
+        Optional[Frame]
+            The newest frame, or None before the first one.
+        """
+        return self._latest
+
+    def wait(self, after: int = 0, timeout: Optional[float] = None) -> Optional[Frame]:
+        """
+        Wait for a frame newer than ``after`` and return the newest one.
+
+        Parameters
+        ----------
+        after : int
+            Sequence number of the last frame the consumer handled.
+        timeout : float, optional
+            Seconds to wait. Waits forever by default.
+
+        Returns
+        -------
+        Optional[Frame]
+            The newest frame, or None if none arrived in time.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._latest is not None and self._latest.sequence > after,
+                timeout=timeout,
+            ):
+                return None
+            return self._latest
+
+    def subscribe(self, callback: Callable[[Frame], None]) -> FrameSubscription:
+        """
+        Deliver frames to a callback on a dedicated thread.
+
+        Parameters
+        ----------
+        callback : Callable[[Frame], None]
+            Called with the newest frame; slow callbacks skip frames.
+
+        Returns
+        -------
+        FrameSubscription
+            The subscription; ``close`` it to stop the deliveries.
+        """
+        subscription = FrameSubscription(self, callback)
+        with self._condition:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: FrameSubscription):
+        with self._condition:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def close(self):
+        """
+        Close all subscriptions.
+        """
+        with self._condition:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.close()
+
+
+_buses: Dict[str, FrameBus] = {}
+_buses_lock = threading.Lock()
+
+
+def get_frame_bus(name: str) -> FrameBus:
+    """
+    Get the process-wide frame bus of a device, creating it on first use.
+
+    Parameters
+    ----------
+    name : str
+        Name of the device, e.g. "webcam:0" or "unitree_go2/front".
+
+    Returns
+    -------
+    FrameBus
+        The bus of the device.
+    """
+    with _buses_lock:
+        if name not in _buses:
+            _buses[name] = FrameBus(name)
+        return _buses[name]
+
+
+class WebcamCapture:
+    """
+    Captures a local webcam once and publishes its frames on a frame bus.
+
+    A webcam can usually be opened by only one ``cv2.VideoCapture``, so
+    inputs share the capture of an index through ``open_webcam`` instead of
+    opening their own, and hand it back with ``release_webcam``.
+    """
+
+    def __init__(self, index: int, resolution: Optional[Resolution] = None):
+        """
+        Open the webcam.
+
+        Parameters
+        ----------
+        index : int
+            The camera index.
+        resolution : Resolution, optional
+            Requested (width, height); the camera default if None.
+        """
+        self.index = index
+        self.bus = get_frame_bus(f"webcam:{index}")
+        self.cap = cv2.VideoCapture(index)
+        if resolution is not None and self.cap.isOpened():
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, resolution[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, resolution[1])
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+        # Inputs holding the capture through open_webcam
+        self.users = 0
+
+    @property
+    def is_opened(self) -> bool:
+        """
+        Check whether the webcam could be opened.
+
+        Returns
+        -------
+        bool
+            True if the capture device is open.
+        """
+        return bool(self.cap.isOpened())
+
+    def start(self):
+        """
+        Start the capture thread.
+        """
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(
+            target=self._capture, name=f"webcam-{self.index}", daemon=True
+        )
+        self._thread.start()
+
+    def _capture(self):
+        while self.running:
+            ret, image = self.cap.read()
+            if not ret or image is None:
+                time.sleep(0.1)
+                continue
+            self.bus.publish(np.asarray(image))
+
+    def stop(self):
+        """
+        Stop capturing and release the webcam.
+        """
+        self.running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self.cap.release()
+
+
+_webcams: Dict[int, WebcamCapture] = {}
+_webcams_lock = threading.Lock()
+
+
+def open_webcam(index: int, resolution: Optional[Resolution] = None) -> WebcamCapture:
+    """
+    Get the shared, running capture of a webcam, opening it on first use.
+
+    Parameters
+    ----------
+    index : int
+        The camera index.
+    resolution : Resolution, optional
+        Requested (width, height). Only the first caller opens the camera,
+        so later callers get its resolution.
+
+    Returns
+    -------
+    WebcamCapture
+        The capture; check ``is_opened`` before using its bus, and pass it
+        to ``release_webcam`` once done with it.
+    """
+    with _webcams_lock:
+        webcam = _webcams.get(index)
+        if webcam is None:
+            webcam = WebcamCapture(index, resolution)
+            if not webcam.is_opened:
+                logging.error(f"Could not open webcam {index}")
+                webcam.cap.release()
+                return webcam
+            _webcams[index] = webcam
+            webcam.start()
+        webcam.users += 1
+        return webcam
+
+
+def release_webcam(webcam: WebcamCapture) -> None:
+    """
+    Hand back a capture returned by ``open_webcam``.
+
+    The last user to release a webcam stops its capture thread and releases
+    the camera; the next ``open_webcam`` opens it again.
+
+    Parameters
+    ----------
+    webcam : WebcamCapture
+        The capture to release.
+    """
+    with _webcams_lock:
+        if _webcams.get(webcam.index) is not webcam:
+            return
+        webcam.users -= 1
+        if webcam.users > 0:
+            return
+        del _webcams[webcam.index]
+    webcam.stop()
+
+
+def webcam_is_open(index: int) -> bool:
+    """
+    Check whether a webcam is already captured through ``open_webcam``.
+
+    Parameters
+    ----------
+    index : int
+        The camera index.
+
+    Returns
+    -------
+    bool
+        True if the webcam is shared already.
+    """
+    return index in _webcams
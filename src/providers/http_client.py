@@ -0,0 +1,473 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, FrozenSet, Optional, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+# Methods that can be sent twice without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often to retry a request.
+
+    Connection errors, timeouts and the listed statuses are retried with
+    exponential backoff, but only for the listed methods, so a POST is not
+    sent twice unless its caller opts in.
+
+    Parameters
+    ----------
+    attempts : int
+        Total attempts, including the first one.
+    backoff : float
+        Seconds before the first retry; doubled for every further retry.
+    max_backoff : float
+        Upper bound of the delay between attempts.
+    statuses : FrozenSet[int]
+        Response statuses that are retried.
+    methods : FrozenSet[str]
+        HTTP methods that are retried.
+    """
+
+    attempts: int = 3
+    backoff: float = 0.25
+    max_backoff: float = 4.0
+    statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def attempts_for(self, method: str) -> int:
+        """
+        Get the number of attempts for a method.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+
+        Returns
+        -------
+        int
+            ``attempts`` for retried methods, 1 otherwise.
+        """
+        return max(1, self.attempts) if method.upper() in self.methods else 1
+
+    def delay(self, retry: int) -> float:
+        """
+        Get the delay before a retry.
+
+        Parameters
+        ----------
+        retry : int
+            The number of the retry, starting at 0.
+
+        Returns
+        -------
+        float
+            Seconds to wait.
+        """
+        return min(self.max_backoff, self.backoff * (2**retry))
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+@dataclass
+class HostStats:
+    """
+    Request metrics of one host.
+
+    Parameters
+    ----------
+    requests : int
+        Attempts sent, including retries.
+    errors : int
+        Attempts that failed or got a 5xx status.
+    retries : int
+        Attempts that were retries.
+    total_latency : float
+        Seconds spent in all attempts.
+    max_latency : float
+        Seconds of the slowest attempt.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        Get the mean seconds per attempt.
+
+        Returns
+        -------
+        float
+            The mean latency, 0 before the first request.
+        """
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+@dataclass
+class HTTPResponse:
+    """
+    A fully read response of an async request.
+
+    Parameters
+    ----------
+    status : int
+        The HTTP status.
+    content : bytes
+        The body.
+    headers : Dict[str, str]
+        The response headers.
+    """
+
+    status: int
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check for a status below 400.
+
+        Returns
+        -------
+        bool
+            True if the request succeeded.
+        """
+        return self.status < 400
+
+    @property
+    def text(self) -> str:
+        """
+        Get the body as text.
+
+        Returns
+        -------
+        str
+            The UTF-8 decoded body.
+        """
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Parse the body as JSON.
+
+        Returns
+        -------
+        Any
+            The parsed body.
+        """
+        return json.loads(self.content)
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc or url
+
+
+class HTTPClient:
+    """
+    Process-wide HTTP layer with keep-alive connection pools.
+
+    Providers, connectors and hooks send their requests through one shared
+    client instead of ``requests.post`` or a new ``aiohttp.ClientSession``
+    per call, so a connection and its TLS session are reused for every
+    request to the same host. That saves a TCP and TLS handshake per
+    request, which dominates request time on cellular links. Requests are
+    retried according to a ``RetryPolicy``, and latency and errors are
+    counted per host.
+
+    Blocking requests go through a pooled ``requests.Session``; coroutines
+    use an ``aiohttp.ClientSession`` of their event loop.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeout: float = 10.0,
+        retry: RetryPolicy = RetryPolicy(),
+    ):
+        """
+        Initialize the client; sessions are opened on first use.
+
+        Parameters
+        ----------
+        pool_size : int
+            Connections kept open per host.
+        timeout : float
+            Default request timeout in seconds.
+        retry : RetryPolicy
+            Default retry policy.
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retry = retry
+
+        self._session: Optional[requests.Session] = None
+        # Keyed by event loop, as aiohttp sessions are bound to their loop
+        self._async_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the shared blocking session.
+
+        Returns
+        -------
+        requests.Session
+            The session, with a connection pool per host.
+        """
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _record(self, url: str, latency: float, error: bool, retry: bool):
+        with self._lock:
+            stats = self._stats.setdefault(_host(url), HostStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.retries += int(retry)
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+
+    def stats(self) -> Dict[str, HostStats]:
+        """
+        Get the request metrics per host.
+
+        Returns
+        -------
+        Dict[str, HostStats]
+            A copy of the metrics, keyed by host and port.
+        """
+        with self._lock:
+            return {host: replace(stats) for host, stats in self._stats.items()}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a blocking request over the shared connection pool.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL.
+        retry : RetryPolicy, optional
+            Overrides the default retry policy.
+        **kwargs : Any
+            Arguments of ``requests.Session.request``, e.g. ``json`` or
+            ``headers``. ``timeout`` defaults to the client timeout.
+
+        Returns
+        -------
+        requests.Response
+            The response of the last attempt.
+
+        Raises
+        ------
+        requests.RequestException
+            If the last attempt failed.
+        """
+        policy = retry or self.retry
+        attempts = policy.attempts_for(method)
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(url, time.perf_counter() - start, True, attempt > 0)
+                if attempt + 1 >= attempts:
+                    raise
+                logging.warning(f"Retrying {method} {_host(url)} after: {e}")
+                time.sleep(policy.delay(attempt))
+                continue
+            except requests.RequestException:
+                self._record(url, time.perf_counter() - start, True, attempt > 0)
+                raise
+
+            self._record(
+                url,
+                time.perf_counter() - start,
+                response.status_code >= 500,
+                attempt > 0,
+            )
+            if response.status_code in policy.statuses and attempt + 1 < attempts:
+                response.close()
+                time.sleep(policy.delay(attempt))
+                continue
+            return response
+
+        raise AssertionError("unreachable")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a blocking GET request; see ``request``.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a blocking POST request; see ``request``.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a blocking PUT request; see ``request``.
+        """
+        return self.request("PUT", url, **kwargs)
+
+    def _async_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        retry: Optional[RetryPolicy] = None,
+        timeout: Union[float, aiohttp.ClientTimeout, None] = None,
+        **kwargs: Any,
+    ) -> HTTPResponse:
+        """
+        Send a request from a coroutine over the pool of its event loop.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL.
+        retry : RetryPolicy, optional
+            Overrides the default retry policy.
+        timeout : float or aiohttp.ClientTimeout, optional
+            Total timeout; defaults to the client timeout.
+        **kwargs : Any
+            Arguments of ``aiohttp.ClientSession.request``, e.g. ``json``,
+            ``params`` or ``headers``.
+
+        Returns
+        -------
+        HTTPResponse
+            The fully read response of the last attempt.
+
+        Raises
+        ------
+        aiohttp.ClientError
+            If the last attempt failed.
+        asyncio.TimeoutError
+            If the last attempt timed out.
+        """
+        policy = retry or self.retry
+        attempts = policy.attempts_for(method)
+        if not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                async with self._async_session().request(
+                    method, url, timeout=timeout, **kwargs
+                ) as response:
+                    result = HTTPResponse(
+                        status=response.status,
+                        content=await response.read(),
+                        headers=dict(response.headers),
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._record(url, time.perf_counter() - start, True, attempt > 0)
+                if attempt + 1 >= attempts:
+                    raise
+                logging.warning(f"Retrying {method} {_host(url)} after: {e!r}")
+                await asyncio.sleep(policy.delay(attempt))
+                continue
+
+            self._record(
+                url, time.perf_counter() - start, result.status >= 500, attempt > 0
+            )
+            if result.status in policy.statuses and attempt + 1 < attempts:
+                await asyncio.sleep(policy.delay(attempt))
+                continue
+            return result
+
+        raise AssertionError("unreachable")
+
+    async def get_async(self, url: str, **kwargs: Any) -> HTTPResponse:
+        """
+        Send a GET request from a coroutine; see ``request_async``.
+        """
+        return await self.request_async("GET", url, **kwargs)
+
+    async def post_async(self, url: str, **kwargs: Any) -> HTTPResponse:
+        """
+        Send a POST request from a coroutine; see ``request_async``.
+        """
+        return await self.request_async("POST", url, **kwargs)
+
+    async def aclose(self):
+        """
+        Close the async session of the running event loop.
+        """
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def close(self):
+        """
+        Close the blocking session and its connections.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+_http_client = HTTPClient()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Get the process-wide HTTP client.
+
+    Returns
+    -------
+    HTTPClient
+        The shared client.
+    """
+    return _http_client
@@ -1,9 +1,9 @@
 import threading
-import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from .clock import get_clock
 from .singleton import singleton
 
 
@@ -89,7 +89,7 @@ class IOProvider:
             The timestamp for the input.
         """
         with self._lock:
-            ts = timestamp if timestamp is not None else time.time()
+            ts = timestamp if timestamp is not None else get_clock().time()
             self._inputs[key] = Input(
                 input=value, timestamp=ts, tick=self._tick_counter
             )
@@ -0,0 +1,253 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@dataclass
+class PathScanResult:
+    """
+    Result of evaluating one lidar scan against the candidate paths.
+
+    Parameters
+    ----------
+    raw : NDArray
+        Oriented scan as an (N, 2) array of [angle_deg (0-360), distance_m].
+    points : NDArray
+        Relevant obstacle points as an (M, 4) array of
+        [x, y, angle_deg (-180 to +180), distance_m], sorted by angle.
+    valid_paths : List[int]
+        Indices of the candidate paths that are free of obstacles.
+    """
+
+    raw: NDArray
+    points: NDArray
+    valid_paths: List[int]
+
+
+class LidarPathEngine:
+    """
+    Vectorized collision engine for straight-line path planning on lidar scans.
+
+    All points of a scan are tested against all candidate path segments in a
+    single batched point-to-segment distance computation, instead of looping
+    over the points in Python.
+    """
+
+    DEGREES_TO_RADIANS = np.pi / 180.0
+
+    def __init__(
+        self,
+        paths: Sequence[NDArray],
+        half_width_robot: float,
+        relevant_distance_max: float,
+        relevant_distance_min: float,
+        sensor_mounting_angle: float,
+        angles_blanked: Optional[list] = None,
+        candidate_paths: Optional[Sequence[int]] = None,
+        retreat_path: Optional[int] = 9,
+    ):
+        """
+        Initialize the engine with the robot geometry and the candidate paths.
+
+        Parameters
+        ----------
+        paths : Sequence[NDArray]
+            Paths as (2, K) arrays of x and y coordinates. Only the first and
+            last point of each path are used, as a straight line segment.
+        half_width_robot : float
+            The half width of the robot in m
+        relevant_distance_max : float
+            Only consider barriers within this range, in m
+        relevant_distance_min : float
+            Only consider barriers above this range, in m
+        sensor_mounting_angle : float
+            The angle of the sensor zero relative to the way in which it's mounted
+        angles_blanked : Optional[list]
+            Regions of the scan to disregard, runs from -180 to +180 deg
+        candidate_paths : Optional[Sequence[int]]
+            Indices of the paths to evaluate. Defaults to all paths.
+        retreat_path : Optional[int]
+            Index of the backwards path, which only considers obstacles
+            behind the robot (negative y).
+        """
+        self.half_width_robot = half_width_robot
+        self.relevant_distance_max = relevant_distance_max
+        self.relevant_distance_min = relevant_distance_min
+        self.sensor_mounting_angle = sensor_mounting_angle
+
+        blanked = angles_blanked if angles_blanked is not None else []
+        self._blanked = np.asarray(blanked, dtype=np.float64).reshape(-1, 2)
+
+        if candidate_paths is None:
+            candidate_paths = range(len(paths))
+        self.candidate_paths = np.asarray(list(candidate_paths), dtype=np.int64)
+
+        # segment start/end points, one row per candidate path
+        starts = np.array(
+            [[paths[i][0][0], paths[i][1][0]] for i in self.candidate_paths]
+        )
+        ends = np.array(
+            [[paths[i][0][-1], paths[i][1][-1]] for i in self.candidate_paths]
+        )
+        self._starts = starts.reshape(-1, 2)
+        self._deltas = ends.reshape(-1, 2) - self._starts
+        self._length_sq = np.sum(self._deltas**2, axis=1)
+
+        self._retreat_rows = self.candidate_paths == retreat_path
+
+    def orient(self, data: NDArray) -> NDArray:
+        """
+        Rotate a scan so that angle zero is the robot zero.
+
+        Parameters
+        ----------
+        data : NDArray
+            The raw scan as an (N, 2) array of [sensor_angle_deg, distance_m].
+
+        Returns
+        -------
+        NDArray
+            An (N, 2) array of [angle_deg (0-360), distance_m].
+        """
+        data = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+
+        angles = data[:, 0] + self.sensor_mounting_angle
+        angles = np.where(angles >= 360.0, angles - 360.0, angles)
+        angles = np.where(angles < 0.0, angles + 360.0, angles)
+
+        return np.column_stack((angles, data[:, 1]))
+
+    def to_points(self, oriented: NDArray) -> NDArray:
+        """
+        Convert an oriented scan into relevant obstacle points.
+
+        Readings outside the relevant distance range and inside the blanked
+        angle regions are dropped.
+
+        Parameters
+        ----------
+        oriented : NDArray
+            An (N, 2) array of [angle_deg (0-360), distance_m].
+
+        Returns
+        -------
+        NDArray
+            An (M, 4) array of [x, y, angle_deg (-180 to +180), distance_m].
+        """
+        angles = oriented[:, 0]
+        distances = oriented[:, 1]
+
+        keep = (distances <= self.relevant_distance_max) & (
+            distances >= self.relevant_distance_min
+        )
+
+        # convert the angle from [0 to 360] to [-180 to +180] range
+        angles = angles[keep] - 180.0
+        distances = distances[keep]
+
+        if len(self._blanked):
+            # permanent robot reflections - disregard
+            blanked = (
+                (angles[:, None] >= self._blanked[:, 0])
+                & (angles[:, None] <= self._blanked[:, 1])
+            ).any(axis=1)
+            angles = angles[~blanked]
+            distances = distances[~blanked]
+
+        a_rad = (angles + 180.0) * self.DEGREES_TO_RADIANS
+
+        # x runs backwards to forwards, y runs left to right
+        x = -distances * np.sin(a_rad)
+        y = -distances * np.cos(a_rad)
+
+        return np.column_stack((x, y, angles, distances))
+
+    def blocked_paths(self, x: NDArray, y: NDArray) -> NDArray:
+        """
+        Determine which candidate paths collide with any of the points.
+
+        Parameters
+        ----------
+        x : NDArray
+            The x-coordinates of the obstacle points.
+        y : NDArray
+            The y-coordinates of the obstacle points.
+
+        Returns
+        -------
+        NDArray
+            A boolean array with one entry per candidate path, True if the
+            path passes within half_width_robot of an obstacle.
+        """
+        if len(x) == 0:
+            return np.zeros(len(self.candidate_paths), dtype=bool)
+
+        # (paths, points) offsets of every point from every segment start
+        px = x[None, :] - self._starts[:, 0:1]
+        py = y[None, :] - self._starts[:, 1:2]
+        dx = self._deltas[:, 0:1]
+        dy = self._deltas[:, 1:2]
+
+        # projection of each point onto each segment, clamped to the segment
+        length_sq = self._length_sq[:, None]
+        t = np.divide(
+            px * dx + py * dy,
+            length_sq,
+            out=np.zeros_like(px),
+            where=length_sq > 0,
+        )
+        np.clip(t, 0.0, 1.0, out=t)
+
+        dist_sq = (px - t * dx) ** 2 + (py - t * dy) ** 2
+        close = dist_sq < self.half_width_robot**2
+
+        # going back only cares about obstacles behind the robot
+        if self._retreat_rows.any():
+            close[self._retreat_rows] &= y[None, :] < 0
+
+        return close.any(axis=1)
+
+    def process(
+        self, data: NDArray, obstacles: Optional[NDArray] = None
+    ) -> PathScanResult:
+        """
+        Evaluate a scan, plus optional extra obstacles, against the paths.
+
+        Parameters
+        ----------
+        data : NDArray
+            The raw scan as an (N, 2) array of [sensor_angle_deg, distance_m].
+        obstacles : Optional[NDArray]
+            Additional obstacle points, such as from a depth camera, as a
+            (K, 4) array of [x, y, angle_deg, distance_m].
+
+        Returns
+        -------
+        PathScanResult
+            The oriented scan, the sorted obstacle points and the valid paths.
+        """
+        raw = self.orient(data)
+        points = self.to_points(raw)
+
+        if obstacles is not None and len(obstacles):
+            points = np.concatenate(
+                (points, np.asarray(obstacles, dtype=np.float64).reshape(-1, 4))
+            )
+
+        # sort data into strictly increasing angles to deal with sensor issues
+        # the sensor sometimes reports part of the previous scan and part of
+        # the next scan
+        points = points[points[:, 2].argsort()]
+
+        blocked = self.blocked_paths(points[:, 0], points[:, 1])
+        valid_paths = self.candidate_paths[~blocked].tolist()
+        logging.debug(f"LidarPathEngine blocked paths: {blocked}")
+
+        return PathScanResult(
+            raw=np.column_stack((np.round(raw[:, 0], 2), raw[:, 1])),
+            points=points,
+            valid_paths=valid_paths,
+        )
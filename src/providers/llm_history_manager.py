@@ -1,8 +1,19 @@
 import asyncio
+import contextvars
 import functools
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import openai
 
@@ -30,6 +41,62 @@ ACTION_MAP = {
 }
 
 
+class DeferredHistory:
+    """
+    Holds back the history updates of LLM calls until they are committed.
+
+    LLM calls made inside ``defer`` are sent the history as it would be,
+    but leave it unchanged; ``commit`` applies their updates, e.g. once a
+    speculative call is used, and dropping the object discards them.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty set of updates.
+        """
+        self._updates: List[Callable[[], Awaitable[None]]] = []
+
+    @contextmanager
+    def defer(self) -> Iterator["DeferredHistory"]:
+        """
+        Defer the history updates of LLM calls in the current context.
+
+        Yields
+        ------
+        DeferredHistory
+            This object.
+        """
+        token = _deferred_history.set(self)
+        try:
+            yield self
+        finally:
+            _deferred_history.reset(token)
+
+    def add(self, update: Callable[[], Awaitable[None]]):
+        """
+        Hold back a history update.
+
+        Parameters
+        ----------
+        update : Callable[[], Awaitable[None]]
+            Applies the update.
+        """
+        self._updates.append(update)
+
+    async def commit(self):
+        """
+        Apply the held back updates in call order.
+        """
+        updates, self._updates = self._updates, []
+        for update in updates:
+            await update()
+
+
+_deferred_history: contextvars.ContextVar[Optional[DeferredHistory]] = (
+    contextvars.ContextVar("deferred_history", default=None)
+)
+
+
 class LLMHistoryManager:
     """
     Manages the history of interactions for LLMs, including summarization.
@@ -288,6 +355,70 @@ class LLMHistoryManager:
         """
         return [{"role": msg.role, "content": msg.content} for msg in self.history]
 
+    async def record_response(self, response: Any, agent_name: str):
+        """
+        Add the actions of an LLM response to the history.
+
+        The user message of the call must be the last message. It is
+        removed if the call failed, and the history is summarized once it
+        grows beyond its configured length.
+
+        Parameters
+        ----------
+        response : Any
+            The LLM response, None if the call failed.
+        agent_name : str
+            Name of the agent in the action message.
+        """
+        if response is not None:
+
+            action_message = "Given that information, **** took these actions: " + (
+                " | ".join(
+                    ACTION_MAP[action.type.lower()].format(
+                        action.value if action.value else ""
+                    )
+                    for action in response.actions  # type: ignore
+                    if action.type.lower() in ACTION_MAP
+                )
+            )
+
+            action_message = action_message.replace("****", agent_name)
+
+            self.history.append(ChatMessage(role="assistant", content=action_message))
+
+            if (
+                self.config.history_length > 0
+                and len(self.history) > self.config.history_length
+            ):
+                await self.start_summary_task(self.history)
+        else:
+            if self.history and self.history[-1].role == "user":
+                logging.warning("LLM response failed, removing unpaired user message")
+                self.history.pop()
+
+        self.frame_index += 1
+
+    async def commit_response(
+        self, inputs: Optional[ChatMessage], response: Any, agent_name: str
+    ):
+        """
+        Add a deferred LLM call and its response to the history.
+
+        Parameters
+        ----------
+        inputs : ChatMessage, optional
+            The user message of the call, None without history.
+        response : Any
+            The LLM response, None if the call failed.
+        agent_name : str
+            Name of the agent in the action message.
+        """
+        if inputs is not None and response is not None:
+            self.history.append(inputs)
+            await self.record_response(response, agent_name)
+        else:
+            self.frame_index += 1
+
     @staticmethod
     def update_history() -> (
         Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]
@@ -307,9 +438,19 @@ class LLMHistoryManager:
                 if getattr(self, "_skip_state_management", False):
                     return await func(self, prompt, *args, **kwargs)
 
+                deferred = _deferred_history.get()
+
                 if self._config.history_length == 0:
                     response = await func(self, prompt, [], *args, **kwargs)
-                    self.history_manager.frame_index += 1
+                    if deferred is None:
+                        self.history_manager.frame_index += 1
+                    else:
+                        # Only the frame index advances without history
+                        deferred.add(
+                            functools.partial(
+                                self.history_manager.commit_response, None, None, ""
+                            )
+                        )
                     return response
 
                 self.agent_name = self._config.agent_name
@@ -331,6 +472,21 @@ class LLMHistoryManager:
                 inputs = ChatMessage(role="user", content=formatted_inputs)
 
                 logging.debug(f"Inputs: {inputs}")
+                if deferred is not None:
+                    messages = self.history_manager.get_messages() + [
+                        {"role": inputs.role, "content": inputs.content}
+                    ]
+                    response = await func(self, prompt, messages, *args, **kwargs)
+                    deferred.add(
+                        functools.partial(
+                            self.history_manager.commit_response,
+                            inputs,
+                            response,
+                            self.agent_name,
+                        )
+                    )
+                    return response
+
                 self.history_manager.history.append(inputs)
 
                 messages = self.history_manager.get_messages()
@@ -339,46 +495,7 @@ class LLMHistoryManager:
                 response = await func(self, prompt, messages, *args, **kwargs)
                 logging.debug(f"Response to parse:\n{response}")
 
-                if response is not None:
-
-                    action_message = (
-                        "Given that information, **** took these actions: "
-                        + (
-                            " | ".join(
-                                ACTION_MAP[action.type.lower()].format(
-                                    action.value if action.value else ""
-                                )
-                                for action in response.actions  # type: ignore
-                                if action.type.lower() in ACTION_MAP
-                            )
-                        )
-                    )
-
-                    action_message = action_message.replace("****", self.agent_name)
-
-                    self.history_manager.history.append(
-                        ChatMessage(role="assistant", content=action_message)
-                    )
-
-                    if (
-                        self.history_manager.config.history_length > 0
-                        and len(self.history_manager.history)
-                        > self.history_manager.config.history_length
-                    ):
-                        await self.history_manager.start_summary_task(
-                            self.history_manager.history
-                        )
-                else:
-                    if (
-                        self.history_manager.history
-                        and self.history_manager.history[-1].role == "user"
-                    ):
-                        logging.warning(
-                            "LLM response failed, removing unpaired user message"
-                        )
-                        self.history_manager.history.pop()
-
-                self.history_manager.frame_index += 1
+                await self.history_manager.record_response(response, self.agent_name)
 
                 return response
 
@@ -31,6 +31,7 @@ import sys
 import time
 from collections import namedtuple
 
+import numpy as np
 import serial
 
 # Protocol constants
@@ -116,6 +117,97 @@ def _process_express_scan(data, new_angle, trame):
     return new_scan, None, angle, distance
 
 
+def _decode_express_packets(packets):
+    """Decodes a (n, 84) array of express packets at once.
+
+    Vectorized counterpart of `ExpressPacket.from_string`.
+
+    Parameters
+    ----------
+    packets : numpy.ndarray
+        Raw packets, one uint8 row per packet.
+
+    Returns
+    -------
+    valid : numpy.ndarray
+        (n,) bool, False for packets with bad sync bits or checksum
+    start_angle : numpy.ndarray
+        (n,) start angle of each packet in degrees
+    distance : numpy.ndarray
+        (n, 32) distances in millimeters
+    angle : numpy.ndarray
+        (n, 32) angle compensation of each measurement in degrees
+    """
+    packets = packets.astype(np.int32)
+    sync = ((packets[:, 0] >> 4) == ExpressPacket.sync1) & (
+        (packets[:, 1] >> 4) == ExpressPacket.sync2
+    )
+    checksum = np.bitwise_xor.reduce(packets[:, 2:], axis=1)
+    valid = sync & (
+        checksum == (packets[:, 0] & 0b00001111) + ((packets[:, 1] & 0b00001111) << 4)
+    )
+
+    start_angle = (packets[:, 2] + ((packets[:, 3] & 0b01111111) << 8)) / 64
+
+    # 16 cabins of 5 bytes, each holding two measurements
+    cabins = packets[:, 4:84].reshape(len(packets), 16, 5)
+    first, second = cabins[..., 0], cabins[..., 2]
+    distance = np.stack(
+        (
+            (first >> 2) + (cabins[..., 1] << 6),
+            (second >> 2) + (cabins[..., 3] << 6),
+        ),
+        axis=-1,
+    )
+    angle = np.stack(
+        (
+            ((cabins[..., 4] & 0b00001111) + ((first & 0b00000001) << 4))
+            / 8
+            * np.where(first & 0b00000010, -1, 1),
+            ((cabins[..., 4] >> 4) + ((second & 0b00000001) << 4))
+            / 8
+            * np.where(second & 0b00000010, -1, 1),
+        ),
+        axis=-1,
+    )
+    return (
+        valid,
+        start_angle,
+        distance.reshape(len(packets), -1),
+        angle.reshape(len(packets), -1),
+    )
+
+
+def _process_express_packets(start_angle, new_angle, distance, angle):
+    """Vectorized counterpart of `_process_express_scan` for whole packets.
+
+    Parameters
+    ----------
+    start_angle : numpy.ndarray
+        (n,) start angle of each packet
+    new_angle : numpy.ndarray
+        (n,) start angle of the packet following each packet
+    distance : numpy.ndarray
+        (n, 32) distances of each packet
+    angle : numpy.ndarray
+        (n, 32) angle compensation of each packet
+
+    Returns
+    -------
+    tuple
+        Flat arrays (new_scan, angle, distance) of the n * 32 measurements.
+    """
+    trame = np.arange(1, distance.shape[1] + 1)
+    angle = (
+        start_angle[:, None]
+        + ((new_angle - start_angle) % 360)[:, None] / 32 * trame
+        - angle
+    ) % 360
+    new_scan = np.zeros(distance.shape, dtype=bool)
+    new_scan[:, 0] = new_angle < start_angle
+    return new_scan.ravel(), angle.ravel(), distance.ravel()
+
+
 class RPDriver(object):
     """Class for communicating with RPLidar rangefinder scanners."""
 
@@ -484,15 +576,89 @@ class RPDriver(object):
 
                 except ValueError as e:
                     self.logger.warning("Error while processing express scan: %s", e)
-                    self.express_trame = 32
-                    self.express_data = False
+                    self._restart_express()
+                    continue
 
+    def _restart_express(self):
+        """Restarts express scanning after corrupted data."""
+        self.express_trame = 32
+        self.express_data = False
+
+        self.stop()
+        time.sleep(0.1)
+        self.clean_input()
+        time.sleep(0.1)
+        self.start("express")
+
+    def iter_express_measures(self, max_buf_meas=3000):
+        """Iterate over express scan measurements in blocks. Everything
+        waiting on the serial port is read at once, and all complete packets
+        in it are decoded together with NumPy.
+
+        Parameters
+        ----------
+        max_buf_meas : int or False if you want unlimited buffer
+            Maximum number of bytes to be stored inside the buffer. Once
+            number exceeds this limit buffer will be emptied out.
+
+        Yields
+        ------
+        tuple
+            Flat arrays (new_scan, angle, distance) of the measurements of
+            the packets decoded from one read. For values description please
+            refer to `iter_measures` method's documentation.
+        """
+        self.start_motor()
+        if not self.scanning[0]:
+            self.start("express")
+
+        buffer = bytearray()
+        previous = None
+        while True:
+            dsize = self.scanning[1]
+
+            if max_buf_meas:
+                data_in_buf = self._serial.inWaiting()
+                if data_in_buf > max_buf_meas:
+                    self.logger.warning(
+                        "Too many bytes in the input buffer: %d/%d. "
+                        "Cleaning buffer...",
+                        data_in_buf,
+                        max_buf_meas,
+                    )
                     self.stop()
-                    time.sleep(0.1)
-                    self.clean_input()
-                    time.sleep(0.1)
                     self.start("express")
-                    continue
+                    buffer.clear()
+                    previous = None
+
+            buffer += self._serial.read(max(dsize, self._serial.inWaiting()))
+            count = len(buffer) // dsize
+            if count == 0:
+                continue
+            packets = np.frombuffer(bytes(buffer[: count * dsize]), dtype=np.uint8)
+            del buffer[: count * dsize]
+
+            valid, *decoded = _decode_express_packets(packets.reshape(count, dsize))
+            n_valid = count if valid.all() else int(np.argmin(valid))
+            decoded = [values[:n_valid] for values in decoded]
+            if previous is not None:
+                decoded = [np.concatenate(pair) for pair in zip(previous, decoded)]
+
+            start_angle, distance, angle = decoded
+            if len(start_angle) > 1:
+                # Each packet is resolved with the start angle of the next one
+                yield _process_express_packets(
+                    start_angle[:-1], start_angle[1:], distance[:-1], angle[:-1]
+                )
+            previous = [values[-1:] for values in decoded] if len(start_angle) else None
+
+            if n_valid < count:
+                self.logger.warning(
+                    "Error while processing express scan: corrupted packet"
+                )
+                self._restart_express()
+                buffer.clear()
+                previous = None
 
     def iter_scans(self, scan_type="normal", max_buf_meas=3000, min_len=5):
         """Iterate over scans. Note that consumer must be fast enough,
@@ -547,21 +713,44 @@ class RPDriver(object):
 
         Yields
         ------
-        list
-            List of the measurements. Each measurement is a tuple with following
-            format: (angle, distance). For values description please
-            refer to `iter_measures` method's documentation.
+        numpy.ndarray
+            (n, 2) float32 array of the measurements, with one (angle, distance)
+            row per measurement. For values description please refer to
+            `iter_measures` method's documentation.
         """
+        if scan_type == "express":
+            yield from self._iter_express_scans_local(
+                max_buf_meas, min_len, max_distance_mm
+            )
+            return
+
         scan_list = []
         iterator = self.iter_measures(scan_type, max_buf_meas)
         for new_scan, _quality, angle, distance in iterator:
             if new_scan:
                 if len(scan_list) > min_len:
-                    yield scan_list
+                    yield np.array(scan_list, dtype=np.float32)
                 scan_list = []
             if distance > 0 and distance < max_distance_mm:
                 scan_list.append((angle, distance))
 
+    def _iter_express_scans_local(self, max_buf_meas, min_len, max_distance_mm):
+        """Assembles the blocks of `iter_express_measures` into scans."""
+        pending = []
+        for new_scan, angle, distance in self.iter_express_measures(max_buf_meas):
+            points = np.column_stack((angle, distance)).astype(np.float32)
+            keep = (distance > 0) & (distance < max_distance_mm)
+
+            start = 0
+            for edge in np.flatnonzero(new_scan):
+                pending.append(points[start:edge][keep[start:edge]])
+                scan = np.concatenate(pending)
+                pending = []
+                if len(scan) > min_len:
+                    yield scan
+                start = edge
+            pending.append(points[start:][keep[start:]])
+
 
 class ExpressPacket(
     namedtuple("express_packet", "distance angle new_scan start_angle")
@@ -0,0 +1,214 @@
+import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+# Header layout: [latest sequence, (slot sequence, slot length) * capacity]
+_HEADER_FIELDS = 1
+_SLOT_FIELDS = 2
+
+
+class SharedScanRing:
+    """
+    Fixed-capacity ring of scans in shared memory.
+
+    A producer process writes each scan as an (n, columns) array into the
+    next slot and publishes its sequence number; consumers in other
+    processes wait on a condition and read the newest scan as a NumPy view
+    of the shared buffer, without pickling or copying. A scan stays valid
+    until ``capacity - 1`` newer scans have been written, which
+    ``is_current`` checks.
+
+    The ring pickles by name, so it can be passed to ``mp.Process`` and is
+    attached to the same shared memory in the child process.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4,
+        max_points: int = 8192,
+        columns: int = 2,
+        dtype: DTypeLike = np.float32,
+        context: Optional[str] = None,
+    ):
+        """
+        Create the ring and its shared memory.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of scans kept.
+        max_points : int
+            Maximum rows per scan; longer scans are truncated.
+        columns : int
+            Values per row, e.g. angle and distance.
+        dtype : DTypeLike
+            Type of the values.
+        context : str, optional
+            Start method of the processes sharing the ring, e.g. "spawn".
+            Defaults to the multiprocessing default.
+        """
+        self.capacity = capacity
+        self.max_points = max_points
+        self.columns = columns
+        self.dtype = np.dtype(dtype)
+
+        header_bytes = (_HEADER_FIELDS + _SLOT_FIELDS * capacity) * 8
+        data_bytes = capacity * max_points * columns * self.dtype.itemsize
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=header_bytes + data_bytes
+        )
+        self._owner = True
+        self._condition = mp.get_context(context).Condition()
+        self._map()
+        self._header[:] = 0
+
+    def _map(self):
+        header_len = _HEADER_FIELDS + _SLOT_FIELDS * self.capacity
+        self._header: NDArray[np.int64] = np.ndarray(
+            (header_len,), dtype=np.int64, buffer=self._shm.buf
+        )
+        self._slots = self._header[_HEADER_FIELDS:].reshape(self.capacity, _SLOT_FIELDS)
+        self._data: NDArray = np.ndarray(
+            (self.capacity, self.max_points, self.columns),
+            dtype=self.dtype,
+            buffer=self._shm.buf,
+            offset=header_len * 8,
+        )
+
+    def __getstate__(self):
+        """
+        Pickle the ring by the name of its shared memory.
+        """
+        return {
+            "name": self._shm.name,
+            "capacity": self.capacity,
+            "max_points": self.max_points,
+            "columns": self.columns,
+            "dtype": self.dtype.str,
+            "condition": self._condition,
+        }
+
+    def __setstate__(self, state):
+        """
+        Attach to the shared memory of a pickled ring.
+        """
+        self.capacity = state["capacity"]
+        self.max_points = state["max_points"]
+        self.columns = state["columns"]
+        self.dtype = np.dtype(state["dtype"])
+        self._condition = state["condition"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self._map()
+
+    @property
+    def sequence(self) -> int:
+        """
+        Get the sequence number of the newest scan.
+
+        Returns
+        -------
+        int
+            0 before the first write, then 1, 2, ...
+        """
+        return int(self._header[0])
+
+    def write(self, scan: NDArray) -> int:
+        """
+        Copy a scan into the next slot and wake the consumers.
+
+        Parameters
+        ----------
+        scan : NDArray
+            The (n, columns) scan.
+
+        Returns
+        -------
+        int
+            The sequence number of the scan.
+        """
+        scan = np.asarray(scan, dtype=self.dtype).reshape(-1, self.columns)
+        if len(scan) > self.max_points:
+            logging.warning(
+                f"Scan of {len(scan)} points truncated to {self.max_points}"
+            )
+            scan = scan[: self.max_points]
+
+        sequence = self.sequence + 1
+        slot = sequence % self.capacity
+        self._slots[slot, 0] = -1
+        self._data[slot, : len(scan)] = scan
+        self._slots[slot, 1] = len(scan)
+        with self._condition:
+            self._slots[slot, 0] = sequence
+            self._header[0] = sequence
+            self._condition.notify_all()
+        return sequence
+
+    def latest(
+        self, after: int = 0, timeout: Optional[float] = None
+    ) -> Optional[Tuple[int, NDArray]]:
+        """
+        Wait for a scan newer than ``after`` and return the newest one.
+
+        Parameters
+        ----------
+        after : int
+            Sequence number of the last scan the consumer read.
+        timeout : float, optional
+            Seconds to wait. Waits forever by default.
+
+        Returns
+        -------
+        Tuple[int, NDArray] or None
+            The sequence number and a read-only view of the newest scan, or
+            None if no newer scan arrived in time.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self.sequence > after, timeout=timeout
+            ):
+                return None
+            sequence = self.sequence
+
+        slot = sequence % self.capacity
+        view = self._data[slot, : int(self._slots[slot, 1])]
+        view.flags.writeable = False
+        return sequence, view
+
+    def is_current(self, sequence: int) -> bool:
+        """
+        Check that a scan returned by ``latest`` has not been overwritten.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the scan.
+
+        Returns
+        -------
+        bool
+            True if the view of the scan still holds its data.
+        """
+        return int(self._slots[sequence % self.capacity, 0]) == sequence
+
+    def close(self):
+        """
+        Detach from the shared memory; the creating process also unlinks it.
+        """
+        self._header = self._slots = self._data = None  # type: ignore
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            self._shm.close()
+        except BufferError:
+            # Scans handed out by latest() still map the memory; it is
+            # released together with the last of them
+            pass
@@ -0,0 +1,166 @@
+import base64
+import binascii
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+
+class SceneChangeGate:
+    """
+    Decides which camera frames are worth sending to a cloud VLM.
+
+    Each frame is reduced to a small grayscale thumbnail and compared with
+    the thumbnail of the last frame that was sent. Frames are skipped while
+    the scene stays the same and the robot is not moving, but one is always
+    sent once ``max_staleness`` seconds have passed, so the VLM description
+    never gets older than that.
+
+    Base64 JPEG frames are decoded at 1/8 scale by libjpeg itself, so the
+    check costs a fraction of a full decode.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 5.0,
+        max_staleness: float = 5.0,
+        motion_hint: Optional[Callable[[], bool]] = None,
+        thumbnail_size: Tuple[int, int] = (32, 24),
+    ):
+        """
+        Initialize the gate.
+
+        Parameters
+        ----------
+        threshold : float
+            Mean absolute difference of the thumbnails, in grayscale levels
+            from 0 to 255, from which the scene counts as changed. Frames
+            are never skipped if it is 0.
+        max_staleness : float
+            Seconds after which a frame is sent even if nothing changed.
+        motion_hint : Callable[[], bool], optional
+            Returns True while the robot moves, e.g. from odometry; every
+            frame is sent while it does.
+        thumbnail_size : Tuple[int, int]
+            (width, height) of the compared thumbnails.
+        """
+        self.threshold = threshold
+        self.max_staleness = max_staleness
+        self.motion_hint = motion_hint
+        self.thumbnail_size = thumbnail_size
+
+        self.sent = 0
+        self.skipped = 0
+
+        self._reference: Optional[NDArray[np.float32]] = None
+        self._last_sent = 0.0
+        self._lock = threading.Lock()
+
+    def _thumbnail(self, image: NDArray) -> NDArray[np.float32]:
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        thumbnail = cv2.resize(image, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        return thumbnail.astype(np.float32)
+
+    def _is_moving(self) -> bool:
+        if self.motion_hint is None:
+            return False
+        try:
+            return bool(self.motion_hint())
+        except Exception as e:
+            logging.error(f"Error reading motion hint: {e}")
+            return False
+
+    def should_send(self, image: NDArray, now: Optional[float] = None) -> bool:
+        """
+        Decide whether to send a frame, and remember it if so.
+
+        Parameters
+        ----------
+        image : NDArray
+            BGR or grayscale image of the frame.
+        now : float, optional
+            Current time in seconds; defaults to ``time.monotonic()``.
+
+        Returns
+        -------
+        bool
+            True if the frame should be sent.
+        """
+        now = time.monotonic() if now is None else now
+        thumbnail = self._thumbnail(image)
+
+        with self._lock:
+            reference = self._reference
+            send = (
+                reference is None
+                or self.threshold <= 0
+                or now - self._last_sent >= self.max_staleness
+                or reference.shape != thumbnail.shape
+                or self._is_moving()
+                or float(np.mean(np.abs(thumbnail - reference))) >= self.threshold
+            )
+            if not send:
+                self.skipped += 1
+                return False
+
+            self._reference = thumbnail
+            self._last_sent = now
+            self.sent += 1
+            return True
+
+    def should_send_base64(self, frame: str, now: Optional[float] = None) -> bool:
+        """
+        Decide whether to send a base64 encoded JPEG frame.
+
+        Parameters
+        ----------
+        frame : str
+            The base64 encoded JPEG, as produced by the video streams.
+        now : float, optional
+            Current time in seconds; defaults to ``time.monotonic()``.
+
+        Returns
+        -------
+        bool
+            True if the frame should be sent. Frames that cannot be decoded
+            are always sent, leaving the decision to the VLM service.
+        """
+        try:
+            data = np.frombuffer(base64.b64decode(frame), dtype=np.uint8)
+        except (binascii.Error, ValueError, TypeError) as e:
+            logging.error(f"Error decoding frame for scene change check: {e}")
+            return True
+
+        image = (
+            cv2.imdecode(data, cv2.IMREAD_REDUCED_GRAYSCALE_8) if data.size else None
+        )
+        if image is None:
+            return True
+        return self.should_send(image, now)
+
+    def wrap(self, callback: Callable[[str], Any]) -> Callable[[str], Any]:
+        """
+        Gate a frame callback of a video stream.
+
+        Parameters
+        ----------
+        callback : Callable[[str], Any]
+            Callback taking base64 encoded frames, e.g. a websocket send.
+
+        Returns
+        -------
+        Callable[[str], Any]
+            Callback that forwards only the frames worth sending.
+        """
+
+        def gated(frame: str) -> Any:
+            if self.should_send_base64(frame):
+                return callback(frame)
+            return None
+
+        return gated
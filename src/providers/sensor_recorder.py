@@ -0,0 +1,540 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+FILE_MAGIC = b"OM1REC\x00\x01"
+CHUNK_MAGIC = b"CHNK"
+
+# magic, compression, payload length, record count, first and last timestamp
+CHUNK_HEADER = struct.Struct("<4sBIIdd")
+# channel id, timestamp, body length
+RECORD_HEADER = struct.Struct("<HdI")
+META_LENGTH = struct.Struct("<I")
+
+# Records on channel 0 declare the channels of a file
+DEFINE_CHANNEL = 0
+
+COMPRESSIONS = {None: 0, "zlib": 1}
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encode a record value, keeping NumPy arrays in their binary form.
+
+    Parameters
+    ----------
+    value : Any
+        A NumPy array, or a JSON serializable value which may contain
+        NumPy arrays and scalars.
+
+    Returns
+    -------
+    bytes
+        The JSON description of the value, followed by the array data.
+    """
+    arrays: List[np.ndarray] = []
+
+    def walk(item: Any) -> Any:
+        if isinstance(item, np.ndarray):
+            arrays.append(np.ascontiguousarray(item))
+            return {"__ndarray__": len(arrays) - 1}
+        if isinstance(item, dict):
+            return {key: walk(v) for key, v in item.items()}
+        if isinstance(item, (list, tuple)):
+            return [walk(v) for v in item]
+        if isinstance(item, np.generic):
+            return item.item()
+        return item
+
+    meta = json.dumps(
+        {"v": walk(value), "a": [[a.dtype.str, a.shape] for a in arrays]}
+    ).encode("utf-8")
+    parts = [META_LENGTH.pack(len(meta)), meta]
+    parts.extend(a.tobytes() for a in arrays)
+    return b"".join(parts)
+
+
+def decode_value(body: memoryview) -> Any:
+    """
+    Decode a record value encoded by ``encode_value``.
+
+    Parameters
+    ----------
+    body : memoryview
+        The encoded value.
+
+    Returns
+    -------
+    Any
+        The value. Arrays are read-only views of ``body``.
+    """
+    (meta_length,) = META_LENGTH.unpack_from(body)
+    offset = META_LENGTH.size + meta_length
+    meta = json.loads(bytes(body[META_LENGTH.size : offset]))
+
+    arrays = []
+    for dtype_str, shape in meta["a"]:
+        dtype = np.dtype(dtype_str)
+        count = int(np.prod(shape, dtype=np.int64))
+        array = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+        arrays.append(array.reshape(shape))
+        offset += count * dtype.itemsize
+
+    def walk(item: Any) -> Any:
+        if isinstance(item, dict):
+            if len(item) == 1 and "__ndarray__" in item:
+                return arrays[item["__ndarray__"]]
+            return {key: walk(v) for key, v in item.items()}
+        if isinstance(item, list):
+            return [walk(v) for v in item]
+        return item
+
+    return walk(meta["v"])
+
+
+@dataclass
+class _Record:
+    channel: str
+    timestamp: float
+    body: bytes
+
+
+class SensorRecorder:
+    """
+    Records sensor channels into chunked binary files on a writer thread.
+
+    ``record`` only encodes the value and queues it, so sensor threads never
+    wait on the disk. The writer thread groups records into chunks, which are
+    optionally compressed, and starts a new file once the current one
+    reaches ``max_file_bytes`` or ``max_file_seconds``. Every file gets a
+    JSON index of its chunks with their time ranges and channels, so a
+    reader can seek without scanning the file. NumPy arrays are stored in
+    their binary form and read back as views of the chunk.
+
+    If the writer falls behind, records are dropped rather than blocking
+    the sensor thread.
+    """
+
+    def __init__(
+        self,
+        directory: str = "dump",
+        prefix: str = "sensors",
+        compression: Optional[str] = None,
+        chunk_bytes: int = 1024 * 1024,
+        chunk_seconds: float = 1.0,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        max_file_seconds: float = 600.0,
+        max_queue: int = 1024,
+    ):
+        """
+        Initialize the recorder; files are only created once data arrives.
+
+        Parameters
+        ----------
+        directory : str
+            Directory of the recordings; created if missing.
+        prefix : str
+            Prefix of the file names.
+        compression : str, optional
+            None, or "zlib" to compress the chunks.
+        chunk_bytes : int
+            Size from which a chunk is written.
+        chunk_seconds : float
+            Seconds after which a chunk is written even if not full.
+        max_file_bytes : int
+            Size from which a new file is started.
+        max_file_seconds : float
+            Seconds after which a new file is started.
+        max_queue : int
+            Records waiting for the writer thread, beyond which new records
+            are dropped.
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported recorder compression: {compression}")
+
+        self.directory = directory
+        self.prefix = prefix
+        self.compression = compression
+        self.chunk_bytes = chunk_bytes
+        self.chunk_seconds = chunk_seconds
+        self.max_file_bytes = max_file_bytes
+        self.max_file_seconds = max_file_seconds
+
+        self.recorded = 0
+        self.dropped = 0
+        self.filename_current: Optional[str] = None
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # Writer thread state
+        self._channel_ids: Dict[str, int] = {}
+        self._file: Optional[BinaryIO] = None
+        self._file_opened = 0.0
+        self._file_count = 0
+        self._file_channels: Set[str] = set()
+        self._index: Dict[str, Any] = {}
+        self._chunk: List[_Record] = []
+        self._chunk_size = 0
+        self._chunk_started = 0.0
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._thread = threading.Thread(
+                    target=self._run, name="sensor-recorder", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def record(self, channel: str, value: Any, timestamp: Optional[float] = None):
+        """
+        Record a value of a channel.
+
+        Parameters
+        ----------
+        channel : str
+            Name of the channel, e.g. "rplidar".
+        value : Any
+            A NumPy array, or a JSON serializable value which may contain
+            NumPy arrays and scalars. Arrays are copied.
+        timestamp : float, optional
+            Unix time of the value; defaults to now.
+        """
+        self._ensure_started()
+        timestamp = time.time() if timestamp is None else timestamp
+        try:
+            self._queue.put_nowait(_Record(channel, timestamp, encode_value(value)))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 100 == 1:
+                logging.warning(
+                    f"Sensor recorder is behind, dropped {self.dropped} records"
+                )
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Write everything recorded so far to disk.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the writer thread.
+
+        Returns
+        -------
+        bool
+            True if the data was written in time.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """
+        Write the remaining records and stop the writer thread.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the writer thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        thread.join(timeout=timeout)
+
+    def _run(self):
+        while True:
+            wait = self.chunk_seconds
+            if self._chunk:
+                wait = max(0.0, self._chunk_started + self.chunk_seconds - time.time())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                self._write_chunk()
+                continue
+
+            if item is None:
+                self._write_chunk()
+                self._close_file()
+                return
+            if isinstance(item, threading.Event):
+                self._write_chunk()
+                item.set()
+                continue
+
+            if not self._chunk:
+                self._chunk_started = time.time()
+            self._chunk.append(item)
+            self._chunk_size += RECORD_HEADER.size + len(item.body)
+            if self._chunk_size >= self.chunk_bytes:
+                self._write_chunk()
+
+    def _write_chunk(self):
+        if not self._chunk:
+            return
+        records, self._chunk, self._chunk_size = self._chunk, [], 0
+        try:
+            self._rotate_if_needed()
+            assert self._file is not None
+
+            parts = []
+            channels = set()
+            for record in records:
+                channel_id = self._channel_ids.setdefault(
+                    record.channel, len(self._channel_ids) + 1
+                )
+                if record.channel not in self._file_channels:
+                    self._file_channels.add(record.channel)
+                    definition = json.dumps(
+                        {"id": channel_id, "name": record.channel}
+                    ).encode("utf-8")
+                    parts.append(
+                        RECORD_HEADER.pack(DEFINE_CHANNEL, 0.0, len(definition))
+                    )
+                    parts.append(definition)
+                channels.add(record.channel)
+                parts.append(
+                    RECORD_HEADER.pack(channel_id, record.timestamp, len(record.body))
+                )
+                parts.append(record.body)
+
+            payload = b"".join(parts)
+            if self.compression == "zlib":
+                payload = zlib.compress(payload, 3)
+
+            start = min(r.timestamp for r in records)
+            end = max(r.timestamp for r in records)
+            offset = self._file.tell()
+            self._file.write(
+                CHUNK_HEADER.pack(
+                    CHUNK_MAGIC,
+                    COMPRESSIONS[self.compression],
+                    len(payload),
+                    len(records),
+                    start,
+                    end,
+                )
+            )
+            self._file.write(payload)
+            self._file.flush()
+
+            self.recorded += len(records)
+            self._index["channels"] = {
+                name: self._channel_ids[name] for name in sorted(self._file_channels)
+            }
+            self._index["chunks"].append(
+                {
+                    "offset": offset,
+                    "length": len(payload),
+                    "records": len(records),
+                    "start": start,
+                    "end": end,
+                    "channels": sorted(channels),
+                }
+            )
+            self._write_index()
+        except Exception as e:
+            logging.error(f"Error writing sensor recording: {e}")
+
+    def _rotate_if_needed(self):
+        if self._file is not None and (
+            self._file.tell() >= self.max_file_bytes
+            or time.time() - self._file_opened >= self.max_file_seconds
+        ):
+            self._close_file()
+
+        if self._file is None:
+            unix_ts = str(round(time.time(), 6)).replace(".", "_")
+            self._file_count += 1
+            self.filename_current = os.path.join(
+                self.directory,
+                f"{self.prefix}_{unix_ts}Z_{self._file_count:04d}.om1rec",
+            )
+            self._file = open(self.filename_current, "wb")
+            self._file.write(FILE_MAGIC)
+            self._file_opened = time.time()
+            self._file_channels = set()
+            self._index = {
+                "version": 1,
+                "compression": self.compression,
+                "channels": {},
+                "chunks": [],
+            }
+            logging.info(f"Recording sensors to {self.filename_current}")
+
+    def _write_index(self):
+        assert self.filename_current is not None
+        index_path = f"{self.filename_current}.idx"
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, index_path)
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _read_chunks(
+    f: BinaryIO, offsets: List[int], tail: int
+) -> Iterator[Tuple[Tuple[Any, ...], int]]:
+    # Chunks listed in the index, then any written after the index
+    for offset in offsets:
+        f.seek(offset)
+        yield CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size)), offset
+
+    offset = tail
+    while True:
+        f.seek(offset)
+        header = f.read(CHUNK_HEADER.size)
+        if len(header) < CHUNK_HEADER.size:
+            return
+        fields = CHUNK_HEADER.unpack(header)
+        yield fields, offset
+        offset += CHUNK_HEADER.size + fields[2]
+
+
+def read_recording(
+    path: str,
+    channels: Optional[Iterable[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Iterator[Tuple[str, float, Any]]:
+    """
+    Read the records of a recording in the order they were written.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .om1rec file.
+    channels : Iterable[str], optional
+        Only read these channels.
+    start : float, optional
+        Skip records before this Unix time.
+    end : float, optional
+        Skip records after this Unix time.
+
+    Yields
+    ------
+    Tuple[str, float, Any]
+        Channel, timestamp and value of each record. Arrays are read-only.
+    """
+    wanted = set(channels) if channels is not None else None
+
+    names: Dict[int, str] = {}
+    offsets: List[int] = []
+    tail = len(FILE_MAGIC)
+    try:
+        with open(f"{path}.idx", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        names = {channel_id: name for name, channel_id in index["channels"].items()}
+        for chunk in index["chunks"]:
+            tail = chunk["offset"] + CHUNK_HEADER.size + chunk["length"]
+            if (
+                (start is None or chunk["end"] >= start)
+                and (end is None or chunk["start"] <= end)
+                and (wanted is None or wanted & set(chunk["channels"]))
+            ):
+                offsets.append(chunk["offset"])
+    except (OSError, ValueError, KeyError):
+        # Without an index, e.g. after a crash, the chunks are scanned
+        names, offsets, tail = {}, [], len(FILE_MAGIC)
+
+    with open(path, "rb") as f:
+        if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"{path} is not a sensor recording")
+
+        for fields, offset in _read_chunks(f, offsets, tail):
+            magic, compression, length, _, _, _ = fields
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"Corrupt chunk in {path} at {offset}")
+            f.seek(offset + CHUNK_HEADER.size)
+            payload = f.read(length)
+            if len(payload) < length:
+                logging.warning(f"Skipping truncated chunk at the end of {path}")
+                return
+            if compression == COMPRESSIONS["zlib"]:
+                payload = zlib.decompress(payload)
+
+            view = memoryview(payload)
+            position = 0
+            while position < len(view):
+                channel_id, timestamp, body_length = RECORD_HEADER.unpack_from(
+                    view, position
+                )
+                position += RECORD_HEADER.size
+                body = view[position : position + body_length]
+                position += body_length
+
+                if channel_id == DEFINE_CHANNEL:
+                    definition = json.loads(bytes(body))
+                    names[definition["id"]] = definition["name"]
+                    continue
+
+                channel = names.get(channel_id, str(channel_id))
+                if wanted is not None and channel not in wanted:
+                    continue
+                if (start is not None and timestamp < start) or (
+                    end is not None and timestamp > end
+                ):
+                    continue
+                yield channel, timestamp, decode_value(body)
+
+
+_sensor_recorders: Dict[str, SensorRecorder] = {}
+_sensor_recorders_lock = threading.Lock()
+
+
+def get_sensor_recorder(directory: str = "dump", **kwargs: Any) -> SensorRecorder:
+    """
+    Get the recorder shared by all sensors recording into a directory.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the recordings.
+    **kwargs : Any
+        Arguments of ``SensorRecorder``, used when the recorder is created.
+
+    Returns
+    -------
+    SensorRecorder
+        The shared recorder.
+    """
+    key = os.path.abspath(directory)
+    with _sensor_recorders_lock:
+        recorder = _sensor_recorders.get(key)
+        if recorder is None:
+            recorder = SensorRecorder(directory, **kwargs)
+            _sensor_recorders[key] = recorder
+        return recorder
@@ -3,7 +3,7 @@ import multiprocessing as mp
 import threading
 import time
 from queue import Empty, Full
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import zenoh
 
@@ -99,6 +99,7 @@ class SimplePathsProvider:
 
         # LLM string
         self._lidar_string = ""
+        self._lidar_callbacks: List[Callable[[str], None]] = []
 
         # Path angles for movement options
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
@@ -159,7 +160,7 @@ class SimplePathsProvider:
         """
         while not self._stop_event.is_set():
             try:
-                paths = self.data_queue.get_nowait()
+                paths = self.data_queue.get(timeout=0.1)
 
                 self.turn_left = []
                 self.turn_right = []
@@ -178,11 +179,44 @@ class SimplePathsProvider:
 
                 self._valid_paths = paths
                 self._lidar_string = self._generate_movement_string(paths)
+                self._notify_lidar_callbacks()
 
             except Empty:
-                time.sleep(0.1)
                 continue
 
+    def register_lidar_callback(self, callback: Optional[Callable[[str], None]]):
+        """
+        Register a callback for new lidar strings.
+
+        The callback runs on the provider thread after every processed scan.
+
+        Parameters
+        ----------
+        callback : Optional[Callable[[str], None]]
+            The callback, called with the new lidar string.
+        """
+        if callback is not None:
+            # Copied on write, as the provider thread iterates over the list
+            self._lidar_callbacks = self._lidar_callbacks + [callback]
+
+    def unregister_lidar_callback(self, callback: Callable[[str], None]):
+        """
+        Unregister a callback registered with ``register_lidar_callback``.
+
+        Parameters
+        ----------
+        callback : Callable[[str], None]
+            The callback to remove.
+        """
+        self._lidar_callbacks = [c for c in self._lidar_callbacks if c != callback]
+
+    def _notify_lidar_callbacks(self):
+        for callback in self._lidar_callbacks:
+            try:
+                callback(self._lidar_string)
+            except Exception as e:
+                logging.error(f"Error in lidar callback: {e}")
+
     def _generate_movement_string(self, valid_paths: list) -> str:
         """
         Generate movement direction string based on valid paths.
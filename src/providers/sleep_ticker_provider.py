@@ -3,6 +3,7 @@ import logging
 import threading
 from typing import Optional
 
+from .clock import get_clock
 from .singleton import singleton
 
 
@@ -13,7 +14,8 @@ class SleepTickerProvider:
 
     This class provides a thread-safe way to manage sleep operations that can be
     skipped/cancelled. It uses a lock mechanism to ensure thread safety when
-    modifying the skip state.
+    modifying the skip state. Durations are measured by the runtime clock, see
+    providers.clock.
     """
 
     def __init__(self):
@@ -27,6 +29,9 @@ class SleepTickerProvider:
         self._skip_sleep: bool = False
         self._current_sleep_task: Optional[asyncio.Task] = None
 
+        self._input_event: Optional[asyncio.Event] = None
+        self._input_loop: Optional[asyncio.AbstractEventLoop] = None
+
     @property
     def skip_sleep(self) -> bool:
         """
@@ -55,6 +60,66 @@ class SleepTickerProvider:
             self._skip_sleep = value
             if value and self._current_sleep_task:
                 self._current_sleep_task.cancel()
+        if value:
+            self.notify()
+
+    def notify(self) -> None:
+        """
+        Signal that an input has new data.
+
+        Wakes a pending wait_for_input call. Safe to call from any thread.
+        """
+        with self._lock:
+            event = self._input_event
+            loop = self._input_loop
+        if event is None or loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    async def wait_for_input(self, timeout: float) -> bool:
+        """
+        Wait until an input signals new data or the timeout expires.
+
+        Notifications that arrive while no one is waiting are kept, so the next
+        call returns immediately.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time to wait in seconds.
+
+        Returns
+        -------
+        bool
+            True if woken by an input, False if the timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._input_event is None or self._input_loop is not loop:
+                self._input_event = asyncio.Event()
+                self._input_loop = loop
+            event = self._input_event
+
+        if self.skip_sleep:
+            event.clear()
+            return True
+
+        try:
+            await get_clock().wait_for(event.wait(), max(timeout, 0.0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
 
     async def sleep(self, duration: float) -> None:
         """
@@ -81,7 +146,9 @@ class SleepTickerProvider:
             return
 
         try:
-            self._current_sleep_task = asyncio.create_task(asyncio.sleep(duration))
+            self._current_sleep_task = asyncio.create_task(
+                get_clock().sleep_async(duration)
+            )
             await self._current_sleep_task
         except asyncio.CancelledError:
             logging.warning("Sleep operation was cancelled.")
@@ -5,8 +5,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-import requests
-
+from .http_client import get_http_client
 from .singleton import singleton
 
 
@@ -142,7 +141,7 @@ class TeleopsConversationProvider:
             return
 
         try:
-            request = requests.post(
+            request = get_http_client().post(
                 self.base_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=message.to_dict(),
@@ -7,6 +7,7 @@ from typing import Optional
 
 import requests
 
+from .http_client import get_http_client
 from .singleton import singleton
 
 
@@ -241,7 +242,7 @@ class TeleopsStatusProvider:
 
         try:
             api_key_id = self.api_key[9:25] if len(self.api_key) > 25 else self.api_key
-            request = requests.get(
+            request = get_http_client().get(
                 f"{self.base_url}/{api_key_id}",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 timeout=10,
@@ -272,7 +273,7 @@ class TeleopsStatusProvider:
             return
 
         try:
-            request = requests.post(
+            request = get_http_client().post(
                 self.base_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=status.to_dict(),
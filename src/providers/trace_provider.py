@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .io_provider import IOProvider
+from .singleton import singleton
+
+
+@dataclass
+class Span:
+    """
+    A timed stage of the runtime.
+
+    Parameters
+    ----------
+    name : str
+        The stage, e.g. "fuse", "llm" or "<Connector>.connect".
+    lane : str
+        The timeline the span is drawn on, e.g. "cortex" or "input:VLMVila".
+    start : float
+        Wall clock time the stage started, in seconds since the epoch.
+    duration : float
+        Seconds the stage took.
+    tick : int
+        The cortex tick that was current when the stage started.
+    args : Dict[str, Any]
+        Extra details shown with the span.
+    """
+
+    name: str
+    lane: str
+    start: float
+    duration: float
+    tick: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@singleton
+class TraceProvider:
+    """
+    Ring buffer of timed spans covering every stage of a tick.
+
+    Inputs, the fuser, the LLM, function call parsing and the action
+    connectors record spans here. The latest spans can be aggregated into
+    percentiles or exported as a Chrome trace, which chrome://tracing and
+    https://ui.perfetto.dev open directly.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        """
+        Initialize the TraceProvider.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of spans kept; the oldest span is dropped first.
+        """
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=capacity)
+        self._lanes: Dict[str, int] = {}
+        self.io_provider = IOProvider()
+        self.enabled = True
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of spans kept.
+
+        Returns
+        -------
+        int
+            The ring buffer size.
+        """
+        return self._spans.maxlen or 0
+
+    def record(
+        self,
+        name: str,
+        start: float,
+        duration: float,
+        lane: str = "cortex",
+        tick: Optional[int] = None,
+        **args: Any,
+    ) -> None:
+        """
+        Record a finished span.
+
+        Parameters
+        ----------
+        name : str
+            The stage name.
+        start : float
+            Wall clock start time, in seconds since the epoch.
+        duration : float
+            Seconds the stage took.
+        lane : str
+            The timeline to draw the span on.
+        tick : int, optional
+            The tick the span belongs to. Defaults to the current tick.
+        **args : Any
+            Extra details shown with the span.
+        """
+        if not self.enabled:
+            return
+        if tick is None:
+            tick = self.io_provider.tick_counter
+        span = Span(name, lane, start, duration, tick, args)
+        with self._lock:
+            self._lanes.setdefault(lane, len(self._lanes) + 1)
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, lane: str = "cortex", **args: Any) -> Iterator[None]:
+        """
+        Time the enclosed block as a span.
+
+        Works around awaits as well, so it can wrap async stages.
+
+        Parameters
+        ----------
+        name : str
+            The stage name.
+        lane : str
+            The timeline to draw the span on.
+        **args : Any
+            Extra details shown with the span.
+        """
+        if not self.enabled:
+            yield
+            return
+        tick = self.io_provider.tick_counter
+        start = time.time()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - started, lane, tick, **args)
+
+    def spans(self, tick: Optional[int] = None) -> List[Span]:
+        """
+        Get the buffered spans, oldest first.
+
+        Parameters
+        ----------
+        tick : int, optional
+            Only return the spans of this tick.
+
+        Returns
+        -------
+        List[Span]
+            The spans.
+        """
+        with self._lock:
+            spans = list(self._spans)
+        if tick is not None:
+            spans = [span for span in spans if span.tick == tick]
+        return spans
+
+    def clear(self) -> None:
+        """
+        Drop all buffered spans.
+        """
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate the buffered spans per stage.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            For each stage name, the span count and the mean, p50, p95, p99
+            and max duration in milliseconds.
+        """
+        durations: Dict[str, List[float]] = {}
+        for span in self.spans():
+            durations.setdefault(span.name, []).append(span.duration * 1000)
+
+        summary = {}
+        for name, values in sorted(durations.items()):
+            array = np.asarray(values)
+            p50, p95, p99 = np.percentile(array, [50, 95, 99])
+            summary[name] = {
+                "count": float(array.size),
+                "mean_ms": float(array.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "max_ms": float(array.max()),
+            }
+        return summary
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export the buffered spans in the Chrome trace event format.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A JSON-serializable trace with one complete event per span and
+            one named thread per lane.
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+            lanes = dict(self._lanes)
+
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": lane},
+            }
+            for lane, tid in lanes.items()
+        ]
+        for span in spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.lane.split(":", 1)[0],
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": lanes[span.lane],
+                    "args": {"tick": span.tick, **span.args},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Write the buffered spans to a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+        logging.info(f"Exported {len(self.spans())} trace spans to {path}")
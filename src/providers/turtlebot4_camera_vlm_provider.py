@@ -1,4 +1,3 @@
-import base64
 import logging
 import threading
 import time
@@ -12,6 +11,8 @@ from om1_vlm import VideoStream
 
 from zenoh_msgs import open_zenoh_session
 
+from .frame_bus import get_frame_bus
+from .scene_gate import SceneChangeGate
 from .singleton import singleton
 
 
@@ -68,6 +69,7 @@ class TurtleBot4CameraVideoStream(VideoStream):
             jpeg_quality=jpeg_quality,
         )
         self.session = None
+        self.frame_bus = get_frame_bus(f"turtlebot4/{URID}/oakd")
 
         try:
             self.session = open_zenoh_session()
@@ -102,6 +104,7 @@ class TurtleBot4CameraVideoStream(VideoStream):
             rgb = np.reshape(Xc, (250, 250, 3))
             with self.lock:
                 self.image = rgb
+            self.frame_bus.publish(rgb)
             if self.debug:
                 cv2.imwrite("turtlebot.jpg", rgb)
 
@@ -116,26 +119,22 @@ class TurtleBot4CameraVideoStream(VideoStream):
 
         frame_time = 1.0 / (self.fps or 30)
         last_frame_time = time.perf_counter()
+        last_sequence = 0
 
         while self.running:
             try:
-                with self.lock:
-                    image = self.image
+                frame = self.frame_bus.latest
 
-                if image is not None:
-                    resized_image = cv2.resize(
-                        image, self.resolution, interpolation=cv2.INTER_AREA
+                if frame is not None and frame.sequence != last_sequence:
+                    last_sequence = frame.sequence
+                    frame_data = frame.base64(
+                        self.resolution, self.encode_quality[1], keep_aspect=False
                     )
-                    _, buffer = cv2.imencode(".jpg", resized_image, self.encode_quality)
-                    frame_data = base64.b64encode(buffer.tobytes()).decode("utf-8")
 
                     if self.frame_callbacks:
                         for frame_callback in self.frame_callbacks:
                             frame_callback(frame_data)
 
-                    with self.lock:
-                        self.image = None
-
                 elapsed_time = time.perf_counter() - last_frame_time
                 if elapsed_time < frame_time:
                     time.sleep(frame_time - elapsed_time)
@@ -167,6 +166,7 @@ class TurtleBot4CameraVLMProvider:
         URID: str = "default",
         stream_url: Optional[str] = None,
         debug: bool = False,
+        scene_gate: Optional[SceneChangeGate] = None,
     ):
         """
         Initialize the VLM Provider.
@@ -187,14 +187,21 @@ class TurtleBot4CameraVLMProvider:
             The URL for the video stream. If not provided, defaults to None.
         debug : bool, optional
             Enable debug mode for writing images to local files. Default is False.
+        scene_gate : SceneChangeGate, optional
+            Skips frames of unchanged scenes before they are sent to the VLM
+            service; the video stream still gets every frame.
         """
         self.running: bool = False
         self.ws_client: ws.Client = ws.Client(url=ws_url)
         self.stream_ws_client: Optional[ws.Client] = (
             ws.Client(url=stream_url) if stream_url else None
         )
+        self.scene_gate = scene_gate
+        vlm_callback = self.ws_client.send_message
+        if scene_gate is not None:
+            vlm_callback = scene_gate.wrap(vlm_callback)
         self.video_stream: VideoStream = TurtleBot4CameraVideoStream(
-            self.ws_client.send_message,
+            vlm_callback,
             fps=fps,
             resolution=resolution,
             jpeg_quality=jpeg_quality,
@@ -4,15 +4,16 @@ import math
 import os
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 import zenoh
 from numpy.typing import NDArray
 
-from zenoh_msgs import LaserScan, open_zenoh_session, sensor_msgs
+from zenoh_msgs import LaserScan, deserialize_numpy, open_zenoh_session, sensor_msgs
 
-from .d435_provider import D435Provider
+from .d435_provider import D435Provider, path_obstacles
+from .lidar_path_engine import LidarPathEngine
 from .singleton import singleton
 
 
@@ -104,6 +105,7 @@ class TurtleBot4RPLidarProvider:
         self._raw_scan: Optional[NDArray] = None
         self._valid_paths: Optional[list] = None
         self._lidar_string: Optional[str] = None
+        self._lidar_callbacks: List[Callable[[str], None]] = []
 
         self.angles = None
         self.angles_final = None
@@ -126,10 +128,15 @@ class TurtleBot4RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
-        self.pp = []
-        for path in self.paths:
-            pairs = list(zip(path[0], path[1]))
-            self.pp.append(pairs)
+        self.path_engine = LidarPathEngine(
+            self.paths,
+            half_width_robot=self.half_width_robot,
+            relevant_distance_max=self.relevant_distance_max,
+            relevant_distance_min=self.relevant_distance_min,
+            sensor_mounting_angle=self.sensor_mounting_angle,
+            angles_blanked=self.angles_blanked,
+            candidate_paths=[4],
+        )
 
         self.turn_left: List[int] = []
         self.turn_right: List[int] = []
@@ -196,7 +203,7 @@ class TurtleBot4RPLidarProvider:
         data : zenoh.Sample
             The Zenoh sample containing the scan data.
         """
-        self.scans = sensor_msgs.LaserScan.deserialize(data.payload.to_bytes())
+        self.scans = deserialize_numpy(sensor_msgs.LaserScan, data.payload.to_bytes())
         logging.debug(f"Zenoh Laserscan data: {self.scans}")
 
         self._zenoh_processor(self.scans)
@@ -209,6 +216,39 @@ class TurtleBot4RPLidarProvider:
         self.running = True
         logging.info("TurtleBot4 RPLidar using Zenoh, provider started")
 
+    def register_lidar_callback(self, callback: Optional[Callable[[str], None]]):
+        """
+        Register a callback for new lidar strings.
+
+        The callback runs on the provider thread after every processed scan.
+
+        Parameters
+        ----------
+        callback : Optional[Callable[[str], None]]
+            The callback, called with the new lidar string.
+        """
+        if callback is not None:
+            # Copied on write, as the provider thread iterates over the list
+            self._lidar_callbacks = self._lidar_callbacks + [callback]
+
+    def unregister_lidar_callback(self, callback: Callable[[str], None]):
+        """
+        Unregister a callback registered with ``register_lidar_callback``.
+
+        Parameters
+        ----------
+        callback : Callable[[str], None]
+            The callback to remove.
+        """
+        self._lidar_callbacks = [c for c in self._lidar_callbacks if c != callback]
+
+    def _notify_lidar_callbacks(self):
+        for callback in self._lidar_callbacks:
+            try:
+                callback(self._lidar_string)
+            except Exception as e:
+                logging.error(f"Error in lidar callback: {e}")
+
     def _zenoh_processor(self, scan: Optional[LaserScan]):
         """
         Preprocess Zenoh LaserScan data.
@@ -224,6 +264,7 @@ class TurtleBot4RPLidarProvider:
             self._raw_scan = None
             self._lidar_string = "You might be surrounded by objects and cannot safely move in any direction. DO NOT MOVE."
             self._valid_paths = []
+            self._notify_lidar_callbacks()
         else:
             # logging.debug(f"_preprocess_zenoh: {scan}")
             # angle_min=-3.1241390705108643, angle_max=3.1415927410125732
@@ -239,10 +280,12 @@ class TurtleBot4RPLidarProvider:
 
             # angles now run from 360.0 to 0 degrees
             if self.angles_final is not None:
-                data = list(zip(self.angles_final, scan.ranges))
+                count = min(len(self.angles_final), len(scan.ranges))
+                array_ready = np.column_stack(
+                    (self.angles_final[:count], scan.ranges[:count])
+                )
             else:
-                data = []
-            array_ready = np.array(data)
+                array_ready = np.empty((0, 2))
             self._path_processor(array_ready)
 
     def _path_processor(self, data: NDArray):
@@ -258,76 +301,21 @@ class TurtleBot4RPLidarProvider:
             The raw data from the RPLidar, expected to be a 2D array
             with angles and distances.
         """
-        complexes = []
-        raw = []
-
-        for angle, distance in data:
-
-            d_m = distance
-
-            # first, correctly orient the sensor zero to the robot zero
-            angle = angle + self.sensor_mounting_angle
-            if angle >= 360.0:
-                angle = angle - 360.0
-            elif angle < 0.0:
-                angle = 360.0 + angle
-
-            raw.append([round(angle, 2), d_m])
-
-            # don't worry about distant objects
-            if d_m > self.relevant_distance_max:
-                continue
-
-            # don't worry about too close objects
-            if d_m < self.relevant_distance_min:
-                continue
-
-            # convert the angle from [0 to 360] to [-180 to +180] range
-            angle = angle - 180.0
-
-            for b in self.angles_blanked:
-                if angle >= b[0] and angle <= b[1]:
-                    # this is a permanent robot reflection
-                    # disregard
-                    continue
-
-            # Convert angle to radians for trigonometric calculations
-            # Note: angle is adjusted back to [0, 360] range
-            a_rad = (angle + 180.0) * self.DEGREES_TO_RADIANS
-
-            v1 = d_m * math.cos(a_rad)
-            v2 = d_m * math.sin(a_rad)
-
-            # convert to x and y
-            # x runs backwards to forwards, y runs left to right
-            x = -1 * v2
-            y = -1 * v1
-
-            # the final data ready to use for path planning
-            complexes.append([x, y, angle, d_m])
-
         # Append the D435 provider's obstacle data if available
-        if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
+        obstacles = None
+        obstacle = self.d435_provider.obstacle
+        if self.d435_provider.running and len(obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
+            obstacles = path_obstacles(obstacle)
 
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+        result = self.path_engine.process(data, obstacles)
 
         # save_timestamp = time.time()
         if self.write_to_local_file:
             try:
                 json_line = json.dumps(
                     {
-                        "frame": raw_array.tolist(),
+                        "frame": result.raw.tolist(),
                     }
                 )
                 self.write_str_to_file(json_line)
@@ -335,69 +323,14 @@ class TurtleBot4RPLidarProvider:
             except Exception as e:
                 logging.error(f"Error saving rplidar to file: {str(e)}")
 
-        # sort data into strictly increasing angles to deal with sensor issues
-        # the sensor sometimes reports part of the previous scan and part of the next scan
-        # so you end up with multiple slightly different values for some angles at the
-        # junction
-
-        """
-        Determine set of possible paths
-        """
-        possible_paths = np.array([4])
-
-        if array.ndim > 1:
-            # we have valid LIDAR returns
-
-            sorted_indices = array[:, 2].argsort()
-            array = array[sorted_indices]
-
-            X = array[:, 0]
-            Y = array[:, 1]
-            # A = array[:, 2]
-            D = array[:, 3]
-
-            # all the possible conflicting points
-            for x, y, _d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
-
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
-
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
-
-        logging.info(f"possible_paths TurtleBot4 RP Lidar: {possible_paths}")
+        ppl = result.valid_paths
+        logging.info(f"possible_paths TurtleBot4 RP Lidar: {ppl}")
 
         self.turn_left = []
         self.turn_right = []
         self.advance = []
         self.retreat = False
 
-        # convert to simple list
-        ppl = possible_paths.tolist()
-
         for p in ppl:
             if p < 3:
                 self.turn_left.append(p)
@@ -410,9 +343,10 @@ class TurtleBot4RPLidarProvider:
 
         return_string = self._generate_movement_string(ppl)
 
-        self._raw_scan = array
+        self._raw_scan = result.points
         self._lidar_string = return_string
         self._valid_paths = ppl
+        self._notify_lidar_callbacks()
 
         logging.debug(
             f"TurtleBot4 RPLidar Provider string: {self._lidar_string}\nValid paths: {self._valid_paths}"
@@ -527,54 +461,6 @@ class TurtleBot4RPLidarProvider:
             for angle in self.path_angles
         ]
 
-    def distance_point_to_line_segment(
-        self, px: float, py: float, x1: float, y1: float, x2: float, y2: float
-    ) -> float:
-        """
-        Calculate the distance from a point to a line segment.
-        This method computes the shortest distance from a point (px, py) to a line segment defined by two endpoints (x1, y1) and (x2, y2).
-        If the line segment has zero length, it returns the distance from the point to one of the endpoints.
-
-        Parameters
-        ----------
-        px : float
-            The x-coordinate of the point.
-        py : float
-            The y-coordinate of the point.
-        x1 : float
-            The x-coordinate of the first endpoint of the line segment.
-        y1 : float
-            The y-coordinate of the first endpoint of the line segment.
-        x2 : float
-            The x-coordinate of the second endpoint of the line segment.
-        y2 : float
-            The y-coordinate of the second endpoint of the line segment.
-
-        Returns
-        -------
-        float
-            The shortest distance from the point to the line segment.
-            If the line segment has zero length, it returns the distance to the closest endpoint.
-        """
-        dx = x2 - x1
-        dy = y2 - y1
-
-        # If the line segment has zero length, return distance to point
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        # Calculate the parameter t that represents the projection of the point onto the line
-        t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-
-        # Clamp t to [0, 1] to stay within the line segment
-        t = max(0, min(1, t))
-
-        # Find the closest point on the line segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-
-        return math.sqrt((px - closest_x) ** 2 + (py - closest_y) ** 2)
-
     def _generate_movement_string(self, valid_paths: list) -> str:
         """
         Generate movement direction string based on valid paths.
@@ -1,4 +1,3 @@
-import base64
 import logging
 import time
 from typing import Callable, List, Optional, Tuple
@@ -7,9 +6,10 @@ import cv2
 import numpy as np
 from mjpeg.client import MJPEGClient
 from om1_vlm import VideoStream
-
 from ubtech.ubtechapi import YanAPI
 
+from .frame_bus import get_frame_bus
+
 
 class UbtechCameraVideoStream(VideoStream):
     """
@@ -59,6 +59,7 @@ class UbtechCameraVideoStream(VideoStream):
         self.robot_ip = robot_ip
         self.url = f"http://{self.robot_ip}:8000/stream.mjpg"
         self.stream_client: Optional[MJPEGClient] = None
+        self.frame_bus = get_frame_bus(f"ubtech/{self.robot_ip}")
 
         YanAPI.yan_api_init(self.robot_ip)
 
@@ -92,18 +93,9 @@ class UbtechCameraVideoStream(VideoStream):
                     self.stream_client.enqueue_buffer(buf)
 
                     if frame is not None:
-                        height, width = frame.shape[:2]
-                        ratio = width / height
-                        new_width, new_height = (
-                            (self.resolution[0], int(self.resolution[0] / ratio))
-                            if width > height
-                            else (int(self.resolution[1] * ratio), self.resolution[1])
-                        )
-                        resized = cv2.resize(
-                            frame, (new_width, new_height), interpolation=cv2.INTER_AREA
+                        frame_data = self.frame_bus.publish(frame).base64(
+                            self.resolution, self.encode_quality[1]
                         )
-                        _, buffer = cv2.imencode(".jpg", resized, self.encode_quality)
-                        frame_data = base64.b64encode(buffer.tobytes()).decode("utf-8")
 
                         for cb in self.frame_callbacks:
                             cb(frame_data)
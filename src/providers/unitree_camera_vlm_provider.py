@@ -1,4 +1,3 @@
-import base64
 import logging
 import time
 from typing import Callable, List, Optional, Tuple
@@ -8,6 +7,8 @@ import numpy as np
 from om1_utils import ws
 from om1_vlm import VideoStream
 
+from .frame_bus import get_frame_bus
+from .scene_gate import SceneChangeGate
 from .singleton import singleton
 
 try:
@@ -61,6 +62,8 @@ class UnitreeCameraVideoStream(VideoStream):
         self.video_client = VideoClient()  # type: ignore
         self.video_client.Init()
 
+        self.frame_bus = get_frame_bus("unitree/front_camera")
+
     def on_video(self):
         """
         Main video capture and processing loop for Unitree cameras.
@@ -82,27 +85,10 @@ class UnitreeCameraVideoStream(VideoStream):
                     image = cv2.imdecode(image_data, cv2.IMREAD_COLOR)
 
                     if image is not None:
-                        # Calculate new dimensions maintaining aspect ratio
-                        height, width = image.shape[:2]
-                        ratio = width / height
-
-                        target_resolution = self.resolution or (640, 480)
-
-                        if width > height:
-                            new_width = target_resolution[0]
-                            new_height = int(target_resolution[0] / ratio)
-                        else:
-                            new_height = target_resolution[1]
-                            new_width = int(target_resolution[1] * ratio)
-
-                        # Resize image
-                        resized_image = cv2.resize(
-                            image, (new_width, new_height), interpolation=cv2.INTER_AREA
-                        )
-                        _, buffer = cv2.imencode(
-                            ".jpg", resized_image, self.encode_quality
+                        frame = self.frame_bus.publish(image)
+                        frame_data = frame.base64(
+                            self.resolution or (640, 480), self.encode_quality[1]
                         )
-                        frame_data = base64.b64encode(buffer.tobytes()).decode("utf-8")
 
                         if self.frame_callbacks:
                             for frame_callback in self.frame_callbacks:
@@ -141,6 +127,7 @@ class UnitreeCameraVLMProvider:
         resolution: Optional[Tuple[int, int]] = (640, 480),
         jpeg_quality: int = 70,
         stream_url: Optional[str] = None,
+        scene_gate: Optional[SceneChangeGate] = None,
     ):
         """
         Initialize the VLM Provider.
@@ -157,14 +144,21 @@ class UnitreeCameraVLMProvider:
             The JPEG quality for the video stream. Defaults to 70.
         stream_url : str, optional
             The URL for the video stream. If not provided, defaults to None.
+        scene_gate : SceneChangeGate, optional
+            Skips frames of unchanged scenes before they are sent to the VLM
+            service; the video stream still gets every frame.
         """
         self.running: bool = False
         self.ws_client: ws.Client = ws.Client(url=base_url)
         self.stream_ws_client: Optional[ws.Client] = (
             ws.Client(url=stream_url) if stream_url else None
         )
+        self.scene_gate = scene_gate
+        vlm_callback = self.ws_client.send_message
+        if scene_gate is not None:
+            vlm_callback = scene_gate.wrap(vlm_callback)
         self.video_stream: VideoStream = UnitreeCameraVideoStream(
-            self.ws_client.send_message,
+            vlm_callback,
             fps=fps,
             resolution=resolution,
             jpeg_quality=jpeg_quality,
@@ -3,8 +3,7 @@ import logging
 import threading
 from typing import Dict, List, Optional, Union
 
-import requests
-
+from .http_client import get_http_client
 from .io_provider import IOProvider
 from .singleton import singleton
 
@@ -84,7 +83,7 @@ class UnitreeG1LocationsProvider:
         if not self.base_url:
             return
         try:
-            resp = requests.get(self.base_url, timeout=self.timeout)
+            resp = get_http_client().get(self.base_url, timeout=self.timeout)
             if resp.status_code < 200 or resp.status_code >= 300:
                 logging.error(
                     f"Location list API returned {resp.status_code}: {resp.text}"
@@ -1,13 +1,11 @@
-import json
 import logging
 import math
 import multiprocessing as mp
-import os
 import threading
 import time
 from dataclasses import dataclass
-from queue import Empty, Full
-from typing import Dict, List, Optional, Union
+from queue import Empty
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -15,8 +13,11 @@ from numpy.typing import NDArray
 from providers.unitree_go2_odom_provider import UnitreeGo2OdomProvider
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
 
-from .d435_provider import D435Provider
+from .d435_provider import D435Provider, path_obstacles
+from .lidar_path_engine import LidarPathEngine
 from .rplidar_driver import RPDriver
+from .scan_ring import SharedScanRing
+from .sensor_recorder import SensorRecorder, get_sensor_recorder
 from .singleton import singleton
 
 
@@ -41,7 +42,7 @@ class RPLidarConfig:
 
 
 def rplidar_processor(
-    data_queue: mp.Queue,
+    scan_ring: SharedScanRing,
     control_queue: mp.Queue,
     serial_port: str,
     rplidar_config: RPLidarConfig,
@@ -53,8 +54,8 @@ def rplidar_processor(
 
     Parameters
     ----------
-    data_queue : mp.Queue
-        Queue for receiving RPLidar data.
+    scan_ring : SharedScanRing
+        Shared memory ring the scans are written to.
     control_queue : mp.Queue
         Queue for sending control commands.
     serial_port : str
@@ -103,14 +104,7 @@ def rplidar_processor(
                 except Empty:
                     pass
 
-                try:
-                    data_queue.put_nowait(scan_data)
-                except Full:
-                    try:
-                        data_queue.get_nowait()
-                        data_queue.put_nowait(scan_data)
-                    except (Empty, Full):
-                        pass
+                scan_ring.write(scan_data)
 
         except Exception as e:
             logging.error(f"Error in RPLidar processor: {e}")
@@ -190,6 +184,7 @@ class UnitreeGo2RPLidarProvider:
         self._raw_scan: Optional[NDArray] = None
         self._valid_paths: Optional[list] = None
         self._lidar_string: Optional[str] = None
+        self._lidar_callbacks: List[Callable[[str], None]] = []
 
         self.angles = None
         self.angles_final = None
@@ -207,13 +202,11 @@ class UnitreeGo2RPLidarProvider:
         if log_file:
             self.write_to_local_file = log_file
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Scans are recorded by a writer thread, off the scan path
+        self.recorder: Optional[SensorRecorder] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"RPSCAN Logging to {self.filename_current}")
+            self.recorder = get_sensor_recorder()
+            logging.info(f"RPSCAN Logging to {self.recorder.directory}")
 
         # Initialize paths for path planning
         # Define 9 straight line paths separated by 15 degrees
@@ -221,17 +214,22 @@ class UnitreeGo2RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
-        self.pp = []
-        for path in self.paths:
-            pairs = list(zip(path[0], path[1]))
-            self.pp.append(pairs)
+        self.path_engine = LidarPathEngine(
+            self.paths,
+            half_width_robot=self.half_width_robot,
+            relevant_distance_max=self.relevant_distance_max,
+            relevant_distance_min=self.relevant_distance_min,
+            sensor_mounting_angle=self.sensor_mounting_angle,
+            angles_blanked=self.angles_blanked,
+        )
 
         self.turn_left: List[int] = []
         self.turn_right: List[int] = []
         self.advance: List[int] = []
         self.retreat: bool = False
 
-        self.data_queue = mp.Queue(maxsize=5)
+        # Scans from the RPLidar process, created on start
+        self.scan_ring: Optional[SharedScanRing] = None
         self.control_queue = mp.Queue()
         self._rplidar_processor_thread: Optional[mp.Process] = None
 
@@ -240,42 +238,6 @@ class UnitreeGo2RPLidarProvider:
         # D435 Provider
         self.d435_provider = D435Provider()
 
-    def update_filename(self):
-        """
-        Update the filename for logging RPLidar data.
-        """
-        unix_ts = time.time()
-        logging.info(f"RPSCAN time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/lidar_{unix_ts}Z.jsonl"
-        return filename
-
-    def write_str_to_file(self, json_line: str):
-        """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
-
-        Parameters
-        ----------
-        json_line : str
-            The JSON string to write to the file.
-        """
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New rpscan file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
-
     def start(self):
         """
         Start the RPLidar provider.
@@ -287,10 +249,12 @@ class UnitreeGo2RPLidarProvider:
             not self._rplidar_processor_thread
             or not self._rplidar_processor_thread.is_alive()
         ):
+            if self.scan_ring is None:
+                self.scan_ring = SharedScanRing()
             self._rplidar_processor_thread = mp.Process(
                 target=rplidar_processor,
                 args=(
-                    self.data_queue,
+                    self.scan_ring,
                     self.control_queue,
                     self.serial_port,
                     self.rplidar_config,
@@ -323,71 +287,20 @@ class UnitreeGo2RPLidarProvider:
             The raw data from the RPLidar, expected to be a 2D array
             with angles and distances.
         """
-        complexes = []
-        raw = []
-
-        for angle, distance in data:
-            d_m = distance
-
-            # first, correctly orient the sensor zero to the robot zero
-            angle = angle + self.sensor_mounting_angle
-            if angle >= 360.0:
-                angle = angle - 360.0
-            elif angle < 0.0:
-                angle = 360.0 + angle
-
-            raw.append([round(angle, 2), d_m])
-
-            # don't worry about distant objects
-            if d_m > self.relevant_distance_max:
-                continue
-
-            # don't worry about too close objects
-            if d_m < self.relevant_distance_min:
-                continue
-
-            # convert the angle from [0 to 360] to [-180 to +180] range
-            angle = angle - 180.0
-
-            if any(b[0] <= angle <= b[1] for b in self.angles_blanked):
-                # this is a permanent robot reflection - disregard
-                continue
-
-            # Convert angle to radians for trigonometric calculations
-            # Note: angle is adjusted back to [0, 360] range
-            a_rad = (angle + 180.0) * self.DEGREES_TO_RADIANS
-
-            v1 = d_m * math.cos(a_rad)
-            v2 = d_m * math.sin(a_rad)
-
-            # convert to x and y
-            # x runs backwards to forwards, y runs left to right
-            x = -1 * v2
-            y = -1 * v1
-
-            # the final data ready to use for path planning
-            complexes.append([x, y, angle, d_m])
-
         # Append the D435 provider's obstacle data if available
-        if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
+        obstacles = None
+        obstacle = self.d435_provider.obstacle
+        if self.d435_provider.running and len(obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
+            obstacles = path_obstacles(obstacle)
 
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+        result = self.path_engine.process(data, obstacles)
 
         # save_timestamp = time.time()
-        if self.write_to_local_file:
+        if self.recorder is not None:
             try:
-                json_line = json.dumps(
+                self.recorder.record(
+                    "rplidar",
                     {
                         "odom_rockchip_ts": self.odom_rockchip_ts,
                         "odom_subscriber_ts": self.odom_subscriber_ts,
@@ -395,79 +308,20 @@ class UnitreeGo2RPLidarProvider:
                         "odom_y": self.odom_y,
                         "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
                         "odom_yaw_0_360": self.odom_yaw_0_360,
-                        "frame": raw_array.tolist(),
-                    }
+                        "frame": result.raw,
+                    },
                 )
-                self.write_str_to_file(json_line)
-                logging.debug(f"rplidar wrote to: {self.filename_current}")
             except Exception as e:
                 logging.error(f"Error saving rplidar to file: {str(e)}")
 
-        # sort data into strictly increasing angles to deal with sensor issues
-        # the sensor sometimes reports part of the previous scan and part of the next scan
-        # so you end up with multiple slightly different values for some angles at the
-        # junction
-
-        """
-        Determine set of possible paths
-        """
-        possible_paths = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
-
-        if array.ndim > 1:
-            # we have valid LIDAR returns
-
-            sorted_indices = array[:, 2].argsort()
-            array = array[sorted_indices]
-
-            # logging.debug(f"_process array: {array}")
-
-            X = array[:, 0]
-            Y = array[:, 1]
-            # A = array[:, 2]
-            D = array[:, 3]
-
-            # all the possible conflicting points
-            for x, y, _d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
-
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
-
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
-
-        logging.info(f"possible_paths RP Lidar: {possible_paths}")
+        ppl = result.valid_paths
+        logging.info(f"possible_paths RP Lidar: {ppl}")
 
         self.turn_left = []
         self.turn_right = []
         self.advance = []
         self.retreat = False
 
-        # convert to simple list
-        ppl = possible_paths.tolist()
-
         for p in ppl:
             if p < 3:
                 self.turn_left.append(p)
@@ -480,59 +334,92 @@ class UnitreeGo2RPLidarProvider:
 
         return_string = self._generate_movement_string(ppl)
 
-        self._raw_scan = array
+        self._raw_scan = result.points
         self._lidar_string = return_string
         self._valid_paths = ppl
+        self._notify_lidar_callbacks()
 
         logging.debug(
             f"RPLidar Provider string: {self._lidar_string}\nValid paths: {self._valid_paths}"
         )
 
-    def _serial_processor(self):
+    def register_lidar_callback(self, callback: Optional[Callable[[str], None]]):
         """
-        Serial data processing worker.
+        Register a callback for new lidar strings.
 
-        This method works for the serial RPLidar driver without Zenoh.
-        """
-        while self.running:
-            try:
-                scan = self.data_queue.get_nowait()
-                scan_array = np.array(scan)
-                logging.debug(f"_serial_processor: {scan_array.ndim}")
+        The callback runs on the provider thread after every processed scan.
 
-                # the driver sends angles in degrees between from 0 to 360
-                # warning - the driver may send two or more readings per angle,
-                # this can be confusing for the code
-                angles = scan_array[:, 0]
+        Parameters
+        ----------
+        callback : Optional[Callable[[str], None]]
+            The callback, called with the new lidar string.
+        """
+        if callback is not None:
+            # Copied on write, as the provider thread iterates over the list
+            self._lidar_callbacks = self._lidar_callbacks + [callback]
 
-                logging.debug(f"_serial_processor: {angles}")
+    def unregister_lidar_callback(self, callback: Callable[[str], None]):
+        """
+        Unregister a callback registered with ``register_lidar_callback``.
 
-                # distances are in millimeters
-                distances_m = scan_array[:, 1] / 1000
+        Parameters
+        ----------
+        callback : Callable[[str], None]
+            The callback to remove.
+        """
+        self._lidar_callbacks = [c for c in self._lidar_callbacks if c != callback]
 
-                data = list(zip(angles, distances_m))
+    def _notify_lidar_callbacks(self):
+        for callback in self._lidar_callbacks:
+            try:
+                callback(self._lidar_string)
+            except Exception as e:
+                logging.error(f"Error in lidar callback: {e}")
 
-                logging.debug(f"_serial_processor: {data}")
-                array_ready = np.array(data)
-                self._path_processor(array_ready)
+    def _serial_processor(self):
+        """
+        Serial data processing worker.
 
-                try:
-                    o = self.odom.position
-                    logging.debug(f"Odom data: {o}")
-                    if o:
-                        self.odom_x = o["odom_x"]
-                        self.odom_y = o["odom_y"]
-                        self.odom_rockchip_ts = o["odom_rockchip_ts"]
-                        self.odom_subscriber_ts = o["odom_subscriber_ts"]
-                        self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
-                        self.odom_yaw_0_360 = o["odom_yaw_0_360"]
-                except Exception as e:
-                    logging.error(f"Error parsing Odom: {e}")
-
-            except Empty:
+        This method works for the serial RPLidar driver without Zenoh.
+        """
+        sequence = 0
+        while self.running:
+            if self.scan_ring is None:
                 time.sleep(0.1)
                 continue
 
+            latest = self.scan_ring.latest(sequence, timeout=0.5)
+            if latest is None:
+                continue
+            sequence, scan = latest
+
+            # the driver sends angles in degrees between from 0 to 360
+            # warning - the driver may send two or more readings per angle,
+            # this can be confusing for the code
+            # distances are in millimeters
+            array_ready = np.empty(scan.shape, dtype=np.float64)
+            array_ready[:, 0] = scan[:, 0]
+            np.divide(scan[:, 1], 1000, out=array_ready[:, 1])
+
+            if not self.scan_ring.is_current(sequence):
+                logging.debug("RPLidar scan overwritten while reading, skipping")
+                continue
+
+            self._path_processor(array_ready)
+
+            try:
+                o = self.odom.position
+                logging.debug(f"Odom data: {o}")
+                if o:
+                    self.odom_x = o["odom_x"]
+                    self.odom_y = o["odom_y"]
+                    self.odom_rockchip_ts = o["odom_rockchip_ts"]
+                    self.odom_subscriber_ts = o["odom_subscriber_ts"]
+                    self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
+                    self.odom_yaw_0_360 = o["odom_yaw_0_360"]
+            except Exception as e:
+                logging.error(f"Error parsing Odom: {e}")
+
     def stop(self):
         """
         Stop the RPLidar provider.
@@ -549,6 +436,10 @@ class UnitreeGo2RPLidarProvider:
             logging.info("Stopping RPLidar serial processor thread")
             self._serial_processor_thread.join(timeout=5)
 
+        if self.scan_ring is not None:
+            self.scan_ring.close()
+            self.scan_ring = None
+
     @property
     def valid_paths(self) -> Optional[list]:
         """
@@ -651,54 +542,6 @@ class UnitreeGo2RPLidarProvider:
             for angle in self.path_angles
         ]
 
-    def distance_point_to_line_segment(
-        self, px: float, py: float, x1: float, y1: float, x2: float, y2: float
-    ) -> float:
-        """
-        Calculate the distance from a point to a line segment.
-        This method computes the shortest distance from a point (px, py) to a line segment defined by two endpoints (x1, y1) and (x2, y2).
-        If the line segment has zero length, it returns the distance from the point to one of the endpoints.
-
-        Parameters
-        ----------
-        px : float
-            The x-coordinate of the point.
-        py : float
-            The y-coordinate of the point.
-        x1 : float
-            The x-coordinate of the first endpoint of the line segment.
-        y1 : float
-            The y-coordinate of the first endpoint of the line segment.
-        x2 : float
-            The x-coordinate of the second endpoint of the line segment.
-        y2 : float
-            The y-coordinate of the second endpoint of the line segment.
-
-        Returns
-        -------
-        float
-            The shortest distance from the point to the line segment.
-            If the line segment has zero length, it returns the distance to the closest endpoint.
-        """
-        dx = x2 - x1
-        dy = y2 - y1
-
-        # If the line segment has zero length, return distance to point
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-
-        # Calculate the parameter t that represents the projection of the point onto the line
-        t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-
-        # Clamp t to [0, 1] to stay within the line segment
-        t = max(0, min(1, t))
-
-        # Find the closest point on the line segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-
-        return math.sqrt((px - closest_x) ** 2 + (py - closest_y) ** 2)
-
     def _generate_movement_string(self, valid_paths: list) -> str:
         """
         Generate movement direction string based on valid paths.
@@ -1,4 +1,3 @@
-import base64
 import glob
 import logging
 import subprocess
@@ -9,6 +8,8 @@ import cv2
 from om1_utils import ws
 from om1_vlm import VideoStream
 
+from .frame_bus import get_frame_bus
+from .scene_gate import SceneChangeGate
 from .singleton import singleton
 
 root_package_name = __name__.split(".")[0] if "." in __name__ else __name__
@@ -57,6 +58,8 @@ class UnitreeRealSenseDevVideoStream(VideoStream):
             jpeg_quality=jpeg_quality,
         )
 
+        self.frame_bus = get_frame_bus("unitree_realsense/rgb")
+
     def on_video(self):
         """
         Main video capture and processing loop.
@@ -138,8 +141,9 @@ class UnitreeRealSenseDevVideoStream(VideoStream):
 
                 # Convert frame to base64, and catch any encoding errors.
                 try:
-                    _, buffer = cv2.imencode(".jpg", frame, self.encode_quality)
-                    frame_data = base64.b64encode(buffer.tobytes()).decode("utf-8")
+                    frame_data = self.frame_bus.publish(frame).base64(
+                        quality=self.encode_quality[1]
+                    )
                 except Exception as e:
                     logger.exception("Error encoding frame: %s", e)
                     continue
@@ -268,6 +272,7 @@ class UnitreeRealSenseDevVLMProvider:
         resolution: Optional[Tuple[int, int]] = (640, 480),
         jpeg_quality: int = 70,
         stream_url: Optional[str] = None,
+        scene_gate: Optional[SceneChangeGate] = None,
     ):
         """
         Initialize the VLM Provider.
@@ -284,14 +289,21 @@ class UnitreeRealSenseDevVLMProvider:
             The JPEG quality for the video stream. Default is 70.
         stream_url : str, optional
             The URL for the video stream. If not provided, defaults to None.
+        scene_gate : SceneChangeGate, optional
+            Skips frames of unchanged scenes before they are sent to the VLM
+            service; the video stream still gets every frame.
         """
         self.running: bool = False
         self.ws_client: ws.Client = ws.Client(url=ws_url)
         self.stream_ws_client: Optional[ws.Client] = (
             ws.Client(url=stream_url) if stream_url else None
         )
+        self.scene_gate = scene_gate
+        vlm_callback = self.ws_client.send_message
+        if scene_gate is not None:
+            vlm_callback = scene_gate.wrap(vlm_callback)
         self.video_stream: VideoStream = UnitreeRealSenseDevVideoStream(
-            self.ws_client.send_message,
+            vlm_callback,
             fps=fps,
             resolution=resolution,
             jpeg_quality=jpeg_quality,
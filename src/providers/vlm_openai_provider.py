@@ -6,6 +6,7 @@ from om1_utils import ws
 from om1_vlm import VideoStream
 from openai import AsyncOpenAI
 
+from .scene_gate import SceneChangeGate
 from .singleton import singleton
 
 
@@ -26,6 +27,7 @@ class VLMOpenAIProvider:
         fps: int = 10,
         stream_url: Optional[str] = None,
         camera_index: int = 0,
+        scene_gate: Optional[SceneChangeGate] = None,
     ):
         """
         Initialize the VLM Provider.
@@ -42,6 +44,8 @@ class VLMOpenAIProvider:
             The URL for the video stream. If not provided, defaults to None.
         camera_index : int
             The camera index for the video stream device. Defaults to 0.
+        scene_gate : SceneChangeGate, optional
+            Skips frames of unchanged scenes. Every frame is sent if None.
         """
         self.running: bool = False
         self.api_client: AsyncOpenAI = AsyncOpenAI(api_key=api_key, base_url=base_url)
@@ -52,6 +56,7 @@ class VLMOpenAIProvider:
             frame_callback=self._process_frame, fps=fps, device_index=camera_index  # type: ignore
         )
         self.message_callback: Optional[Callable] = None
+        self.scene_gate = scene_gate
 
     async def _process_frame(self, frame: str):
         """
@@ -62,6 +67,9 @@ class VLMOpenAIProvider:
         frame : str
             The base64 encoded video frame to process.
         """
+        if self.scene_gate and not self.scene_gate.should_send_base64(frame):
+            return
+
         processing_start = time.perf_counter()
         try:
             response = await self.api_client.chat.completions.create(
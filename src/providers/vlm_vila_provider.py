@@ -4,6 +4,7 @@ from typing import Callable, Optional
 from om1_utils import ws
 from om1_vlm import VideoStream
 
+from .scene_gate import SceneChangeGate
 from .singleton import singleton
 
 
@@ -23,6 +24,7 @@ class VLMVilaProvider:
         fps: int = 30,
         stream_url: Optional[str] = None,
         camera_index: int = 0,
+        scene_gate: Optional[SceneChangeGate] = None,
     ):
         """
         Initialize the VLM Provider.
@@ -37,14 +39,21 @@ class VLMVilaProvider:
             The URL for the video stream. If not provided, defaults to None.
         camera_index : int
             The camera index for the video stream device. Defaults to 0.
+        scene_gate : SceneChangeGate, optional
+            Skips frames of unchanged scenes before they are sent to the VLM
+            service; the video stream still gets every frame.
         """
         self.running: bool = False
         self.ws_client: ws.Client = ws.Client(url=ws_url)
         self.stream_ws_client: Optional[ws.Client] = (
             ws.Client(url=stream_url) if stream_url else None
         )
+        self.scene_gate = scene_gate
+        vlm_callback = self.ws_client.send_message
+        if scene_gate is not None:
+            vlm_callback = scene_gate.wrap(vlm_callback)
         self.video_stream: VideoStream = VideoStream(
-            self.ws_client.send_message, fps=fps, device_index=camera_index
+            vlm_callback, fps=fps, device_index=camera_index
         )
 
     def register_frame_callback(self, video_callback: Optional[Callable]):
@@ -8,9 +8,21 @@ from typing import Optional, Tuple
 import dotenv
 import typer
 
-from runtime.config import load_mode_config
-from runtime.cortex import ModeCortexRuntime
+from runtime.lazy_import import lazy_attribute
 from runtime.logging import setup_logging
+from runtime.startup_profiler import enable_startup_profiling, mark_startup
+
+# Resolved on first use so --profile-startup can time the runtime imports.
+load_mode_config = lazy_attribute("runtime.config", "load_mode_config")
+ModeCortexRuntime = lazy_attribute("runtime.cortex", "ModeCortexRuntime")
+SessionRecorder = lazy_attribute("runtime.replay", "SessionRecorder")
+SessionReplay = lazy_attribute("runtime.replay", "SessionReplay")
+run_replay = lazy_attribute("runtime.replay", "run_replay")
+SimulatedClock = lazy_attribute("providers.clock", "SimulatedClock")
+set_clock = lazy_attribute("providers.clock", "set_clock")
+
+# Real seconds between jumps of the simulated clock to the next deadline
+SIMULATED_CLOCK_AUTOJUMP = 0.001
 
 app = typer.Typer()
 
@@ -73,6 +85,25 @@ def start(
     ),
     log_level: str = typer.Option("INFO", help="The logging level to use."),
     log_to_file: bool = typer.Option(False, help="Whether to log output to a file."),
+    profile_startup: bool = typer.Option(
+        False,
+        help="Report a per-module import-time tree and the time to the first cortex tick.",
+    ),
+    record: Optional[str] = typer.Option(
+        None,
+        help="Record the inputs and LLM responses of the session into this directory.",
+    ),
+    replay: Optional[str] = typer.Option(
+        None,
+        help="Replay a session recorded with --record instead of reading the inputs and LLM.",
+    ),
+    replay_speed: float = typer.Option(
+        1.0, help="Playback rate of --replay; 0 replays as fast as possible."
+    ),
+    simulated_time: bool = typer.Option(
+        False,
+        help="Run on a simulated clock that skips ahead to the next wake-up, for accelerated simulation.",
+    ),
 ) -> None:
     """
     Start the OM1 agent with a specific configuration.
@@ -90,18 +121,40 @@ def start(
         The logging level to use (default is "INFO").
     log_to_file : bool, optional
         Whether to log output to a file (default is False).
+    profile_startup : bool, optional
+        Log an import-time tree and the time to the first cortex tick (default is False).
+    record : str, optional
+        Directory to record the inputs and LLM responses of the session into.
+    replay : str, optional
+        Directory of a recorded session to replay; the runtime exits at its end.
+    replay_speed : float, optional
+        Playback rate of the replay, 0 for as fast as possible (default is 1.0).
+    simulated_time : bool, optional
+        Run on a simulated clock instead of real time (default is False).
     """
+    if profile_startup:
+        enable_startup_profiling()
+
     config_name, config_path = setup_config_file(config_name)
     setup_logging(config_name, log_level, log_to_file)
 
     try:
         mode_config = load_mode_config(config_name)
+        mark_startup("config_loaded")
+        if simulated_time:
+            set_clock(SimulatedClock(autojump=SIMULATED_CLOCK_AUTOJUMP))
+            logging.info("Running on a simulated clock")
+        session_recorder = SessionRecorder(record) if record else None
+        session_replay = SessionReplay(replay, speed=replay_speed) if replay else None
         runtime = ModeCortexRuntime(
             mode_config,
             config_name,
             hot_reload=hot_reload,
             check_interval=check_interval,
+            recorder=session_recorder,
+            replay=session_replay,
         )
+        mark_startup("runtime_created")
         logging.info(f"Starting OM1 with configuration: {config_name}")
         logging.info(f"Available modes: {list(mode_config.modes.keys())}")
         logging.info(f"Default mode: {mode_config.default_mode}")
@@ -111,7 +164,15 @@ def start(
                 f"Hot-reload enabled (check interval: {check_interval} seconds)"
             )
 
-        asyncio.run(runtime.run())
+        try:
+            if session_replay:
+                logging.info(f"Replaying session from {replay}")
+                asyncio.run(run_replay(runtime, session_replay))
+            else:
+                asyncio.run(runtime.run())
+        finally:
+            if session_recorder:
+                session_recorder.close()
 
     except FileNotFoundError:
         logging.error(f"Configuration file not found: {config_path}")
@@ -0,0 +1,15 @@
+import os
+
+
+def get_cache_dir() -> str:
+    """
+    Get the directory OM1 persists caches and spools in.
+
+    Returns
+    -------
+    str
+        The value of OM1_CACHE_DIR, or ~/.cache/om1.
+    """
+    return os.environ.get(
+        "OM1_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "om1")
+    )
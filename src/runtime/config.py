@@ -130,6 +130,14 @@ class RuntimeConfig:
         Optional action execution mode (e.g., "concurrent", "sequential", "dependencies"). Defaults to "concurrent".
     action_dependencies : Optional[Dict[str, List[str]]]
         Optional mapping of action dependencies.
+    event_driven_ticks : bool
+        Tick as soon as an input signals new data instead of at a fixed rate.
+    min_tick_interval : float
+        Minimum seconds between event-driven ticks.
+    max_tick_interval : Optional[float]
+        Maximum seconds between event-driven ticks. Defaults to 1 / hertz.
+    pipelined_ticks : bool
+        Query the LLM for the next tick while the current actions run.
     """
 
     version: str
@@ -152,6 +160,10 @@ class RuntimeConfig:
     unitree_ethernet: Optional[str] = None
     action_execution_mode: Optional[str] = None
     action_dependencies: Optional[Dict[str, List[str]]] = None
+    event_driven_ticks: bool = False
+    min_tick_interval: float = 0.1
+    max_tick_interval: Optional[float] = None
+    pipelined_ticks: bool = False
 
 
 def add_meta(
@@ -291,6 +303,14 @@ class ModeConfig:
         Execution mode for actions (e.g., "concurrent", "sequential", "dependencies"). Defaults to concurrent.
     action_dependencies : Optional[Dict[str, List[str]]], optional
         Dependencies between actions for execution order. Defaults to None.
+    event_driven_ticks : bool, optional
+        Tick as soon as an input signals new data instead of at a fixed rate. Defaults to False.
+    min_tick_interval : float, optional
+        Minimum seconds between event-driven ticks. Defaults to 0.1.
+    max_tick_interval : Optional[float], optional
+        Maximum seconds between event-driven ticks. Defaults to 1 / hertz.
+    pipelined_ticks : bool, optional
+        Query the LLM for the next tick while the current actions run. Defaults to False.
     _raw_inputs : List[Dict], optional
         Raw input configurations before loading. Defaults to empty list.
     _raw_llm : Optional[Dict], optional
@@ -327,6 +347,11 @@ class ModeConfig:
     action_execution_mode: Optional[str] = None
     action_dependencies: Optional[Dict[str, List[str]]] = None
 
+    event_driven_ticks: bool = False
+    min_tick_interval: float = 0.1
+    max_tick_interval: Optional[float] = None
+    pipelined_ticks: bool = False
+
     _raw_inputs: List[Dict] = field(default_factory=list)
     _raw_llm: Optional[Dict] = None
     _raw_simulators: List[Dict] = field(default_factory=list)
@@ -369,9 +394,15 @@ class ModeConfig:
             unitree_ethernet=global_config.unitree_ethernet,
             action_execution_mode=self.action_execution_mode,
             action_dependencies=self.action_dependencies,
+            event_driven_ticks=self.event_driven_ticks,
+            min_tick_interval=self.min_tick_interval,
+            max_tick_interval=self.max_tick_interval,
+            pipelined_ticks=self.pipelined_ticks,
         )
 
-    def load_components(self, system_config: "ModeSystemConfig"):
+    def load_components(
+        self, system_config: "ModeSystemConfig", load_inputs: bool = True
+    ):
         """
         Load the actual component instances for this mode.
 
@@ -382,9 +413,11 @@ class ModeConfig:
         ----------
         system_config : ModeSystemConfig
             The global system configuration containing shared settings
+        load_inputs : bool
+            Construct the inputs; a replay substitutes its own instead
         """
         logging.info(f"Loading components for mode: {self.name}")
-        _load_mode_components(self, system_config)
+        _load_mode_components(self, system_config, load_inputs)
         logging.info(f"Components loaded successfully for mode: {self.name}")
 
     async def execute_lifecycle_hooks(
@@ -452,6 +485,9 @@ class ModeSystemConfig:
         Global system prompt examples.
     global_cortex_llm : Optional[Dict]
         Global default LLM configuration if mode doesn't override.
+    loop_stall_threshold : Optional[float]
+        Seconds the event loop may be blocked before the stall is reported.
+        None or 0 disables the stall monitor. Defaults to 0.25.
     global_lifecycle_hooks : List[LifecycleHook], optional
         List of global lifecycle hooks executed for all modes. Defaults to empty list.
     modes : Dict[str, ModeConfig], optional
@@ -479,6 +515,9 @@ class ModeSystemConfig:
     # Default LLM settings if mode doesn't override
     global_cortex_llm: Optional[Dict] = None
 
+    # Event loop stall monitor
+    loop_stall_threshold: Optional[float] = 0.25
+
     # Global lifecycle hooks (executed for all modes)
     global_lifecycle_hooks: List[LifecycleHook] = field(default_factory=list)
     _raw_global_lifecycle_hooks: List[Dict] = field(default_factory=list)
@@ -595,6 +634,7 @@ def load_mode_config(
         system_governance=raw_config.get("system_governance", ""),
         system_prompt_examples=raw_config.get("system_prompt_examples", ""),
         global_cortex_llm=raw_config.get("cortex_llm"),
+        loop_stall_threshold=raw_config.get("loop_stall_threshold", 0.25),
         global_lifecycle_hooks=parse_lifecycle_hooks(
             raw_config.get("global_lifecycle_hooks", []), api_key=g_api_key
         ),
@@ -617,6 +657,10 @@ def load_mode_config(
             save_interactions=mode_data.get("save_interactions", False),
             action_execution_mode=mode_data.get("action_execution_mode"),
             action_dependencies=mode_data.get("action_dependencies"),
+            event_driven_ticks=mode_data.get("event_driven_ticks", False),
+            min_tick_interval=mode_data.get("min_tick_interval", 0.1),
+            max_tick_interval=mode_data.get("max_tick_interval"),
+            pipelined_ticks=mode_data.get("pipelined_ticks", False),
             _raw_inputs=mode_data.get("agent_inputs", []),
             _raw_llm=mode_data.get("cortex_llm"),
             _raw_simulators=mode_data.get("simulators", []),
@@ -643,7 +687,9 @@ def load_mode_config(
     return mode_system_config
 
 
-def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConfig):
+def _load_mode_components(
+    mode_config: ModeConfig, system_config: ModeSystemConfig, load_inputs: bool = True
+):
     """
     Load the actual component instances for a mode.
 
@@ -653,6 +699,8 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
         The mode configuration to load components for.
     system_config : ModeSystemConfig
         The global system configuration containing shared settings
+    load_inputs : bool
+        Construct the inputs; otherwise the mode has no inputs.
     """
     g_api_key = system_config.api_key
     g_ut_eth = system_config.unitree_ethernet
@@ -675,7 +723,7 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
                 ),
             }
         )
-        for inp in mode_config._raw_inputs
+        for inp in (mode_config._raw_inputs if load_inputs else [])
     ]
 
     # Load simulators
@@ -779,6 +827,10 @@ def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
                 "timeout_seconds": mode_config.timeout_seconds,
                 "remember_locations": mode_config.remember_locations,
                 "save_interactions": mode_config.save_interactions,
+                "event_driven_ticks": mode_config.event_driven_ticks,
+                "min_tick_interval": mode_config.min_tick_interval,
+                "max_tick_interval": mode_config.max_tick_interval,
+                "pipelined_ticks": mode_config.pipelined_ticks,
                 "agent_inputs": mode_config._raw_inputs,
                 "cortex_llm": mode_config._raw_llm,
                 "simulators": mode_config._raw_simulators,
@@ -815,6 +867,7 @@ def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
             "system_governance": config.system_governance,
             "system_prompt_examples": config.system_prompt_examples,
             "cortex_llm": config.global_cortex_llm,
+            "loop_stall_threshold": config.loop_stall_threshold,
             "global_lifecycle_hooks": config._raw_global_lifecycle_hooks,
             "modes": modes_dict,
             "transition_rules": transition_rules,
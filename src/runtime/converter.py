@@ -82,6 +82,7 @@ class ConfigConverter:
             "system_governance": raw_config.get("system_governance", ""),
             "system_prompt_examples": raw_config.get("system_prompt_examples", ""),
             "cortex_llm": raw_config.get("cortex_llm"),
+            "loop_stall_threshold": raw_config.get("loop_stall_threshold", 0.25),
         }
 
     @staticmethod
@@ -113,6 +114,10 @@ class ConfigConverter:
                 "action_execution_mode", "concurrent"
             ),
             "action_dependencies": raw_config.get("action_dependencies", {}),
+            "event_driven_ticks": raw_config.get("event_driven_ticks", False),
+            "min_tick_interval": raw_config.get("min_tick_interval", 0.1),
+            "max_tick_interval": raw_config.get("max_tick_interval"),
+            "pipelined_ticks": raw_config.get("pipelined_ticks", False),
         }
 
     @staticmethod
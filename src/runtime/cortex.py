@@ -1,26 +1,87 @@
 import asyncio
 import logging
 import os
-import time
-from typing import List, Optional, Union
+from typing import Awaitable, Callable, List, Optional, Union
 
 from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
 from inputs.orchestrator import InputOrchestrator
+from llm import LLM
+from llm.output_model import Action, CortexOutputModel
+from providers.clock import get_clock
 from providers.config_provider import ConfigProvider
+from providers.http_client import get_http_client
 from providers.io_provider import IOProvider
+from providers.llm_history_manager import DeferredHistory
 from providers.sleep_ticker_provider import SleepTickerProvider
+from providers.trace_provider import TraceProvider
 from runtime.config import (
     LifecycleHookType,
     ModeSystemConfig,
     RuntimeConfig,
     load_mode_config,
 )
+from runtime.loop_monitor import LoopStallMonitor
 from runtime.manager import ModeManager
+from runtime.replay import ReplayInput, SessionRecorder, SessionReplay
+from runtime.startup_profiler import mark_startup
 from simulators.orchestrator import SimulatorOrchestrator
 
 
+class Speculation:
+    """
+    LLM call of the next tick, started while the actions of a tick run.
+
+    The call leaves the LLM history unchanged until it is used, and actions
+    it streams are held back until then.
+    """
+
+    def __init__(self, prompt: str, llm: LLM):
+        """
+        Initialize the speculation; the call is started by the runtime.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt fused ahead of time.
+        llm : LLM
+            The cortex LLM.
+        """
+        self.prompt = prompt
+        self.llm = llm
+        self.task: Optional[asyncio.Task] = None
+        self.history = DeferredHistory()
+        self.streamed: List[Action] = []
+        self.dispatch: Optional[Callable[[Action], Awaitable[None]]] = None
+
+    async def ask(self) -> Optional[CortexOutputModel]:
+        """
+        Ask the LLM, deferring its history updates.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The LLM output.
+        """
+        with self.history.defer():
+            return await self.llm.ask(self.prompt)
+
+    async def on_action(self, action: Action):
+        """
+        Hold back a streamed action, or dispatch it once the call is used.
+
+        Parameters
+        ----------
+        action : Action
+            The streamed action.
+        """
+        if self.dispatch is None:
+            self.streamed.append(action)
+        else:
+            await self.dispatch(action)
+
+
 class ModeCortexRuntime:
     """
     Mode-aware cortex runtime that can dynamically switch between different
@@ -47,6 +108,8 @@ class ModeCortexRuntime:
         mode_config_name: str,
         hot_reload: bool = True,
         check_interval: float = 60,
+        recorder: Optional[SessionRecorder] = None,
+        replay: Optional[SessionReplay] = None,
     ):
         """
         Initialize the mode-aware cortex runtime.
@@ -61,13 +124,21 @@ class ModeCortexRuntime:
             Enable hot-reload of configuration files (default: True)
         check_interval : float, optional
             Interval in seconds to check for config file changes (default: 60)
+        recorder : SessionRecorder, optional
+            Records the inputs and LLM responses of the session
+        replay : SessionReplay, optional
+            Replays a recorded session in place of the inputs and LLM
         """
         self.mode_config = mode_config
         self.mode_config_name = mode_config_name
         self.mode_manager = ModeManager(mode_config)
         self.io_provider = IOProvider()
         self.sleep_ticker_provider = SleepTickerProvider()
+        self.trace_provider = TraceProvider()
         self.config_provider = ConfigProvider()
+        self.loop_monitor: Optional[LoopStallMonitor] = None
+        self.recorder = recorder
+        self.replay = replay
 
         # Hot-reload configuration
         self.hot_reload = hot_reload
@@ -108,6 +179,18 @@ class ModeCortexRuntime:
         # Flag to track if a reload is in progress
         self._is_reloading = False
 
+        # Set by stop to end run
+        self._stop_requested = False
+
+        # State of the event-driven tick scheduler
+        self._last_tick_time = 0.0
+        self._last_llm_prompt: Optional[str] = None
+        self._last_llm_time = 0.0
+
+        # Prompt and LLM call of the next tick, started while actions run
+        self._speculation: Optional[Speculation] = None
+        self._tick_called_llm = False
+
         # Event for handling mode transitions
         self._mode_transition_event = asyncio.Event()
         self._pending_mode_transition: Optional[str] = None
@@ -124,9 +207,21 @@ class ModeCortexRuntime:
         """
         mode_config = self.mode_config.modes[mode_name]
 
-        mode_config.load_components(self.mode_config)
+        # A replay does not start the providers and devices of the inputs
+        mode_config.load_components(self.mode_config, load_inputs=self.replay is None)
 
         self.current_config = mode_config.to_runtime_config(self.mode_config)
+        if self.replay:
+            self.current_config.agent_inputs = [
+                ReplayInput(inp["type"]) for inp in mode_config._raw_inputs
+            ]
+            self.current_config.cortex_llm = self.replay.wrap_llm(
+                self.current_config.cortex_llm
+            )
+        elif self.recorder:
+            self.current_config.cortex_llm = self.recorder.wrap_llm(
+                self.current_config.cortex_llm
+            )
 
         logging.info(f"Initializing mode: {mode_config.display_name}")
 
@@ -224,6 +319,7 @@ class ModeCortexRuntime:
         logging.debug("Stopping current orchestrators...")
 
         self.sleep_ticker_provider.skip_sleep = True
+        self._cancel_speculation()
 
         if self.background_orchestrator:
             self.background_orchestrator.stop()
@@ -324,7 +420,9 @@ class ModeCortexRuntime:
         self.sleep_ticker_provider.skip_sleep = False
 
         # Start input listener
-        self.input_orchestrator = InputOrchestrator(self.current_config.agent_inputs)
+        self.input_orchestrator = InputOrchestrator(
+            self.current_config.agent_inputs, recorder=self.recorder, replay=self.replay
+        )
         self.input_listener_task = asyncio.create_task(self.input_orchestrator.listen())
 
         # Start other orchestrators
@@ -351,6 +449,7 @@ class ModeCortexRuntime:
         Cleanup all running tasks gracefully.
         """
         tasks_to_cancel = []
+        self._cancel_speculation()
 
         if self.config_watcher_task and not self.config_watcher_task.done():
             tasks_to_cancel.append(self.config_watcher_task)
@@ -381,6 +480,13 @@ class ModeCortexRuntime:
         # Stop ConfigProvider
         self.config_provider.stop()
 
+        if self.loop_monitor:
+            self.loop_monitor.stop()
+
+        http_client = get_http_client()
+        await http_client.aclose()
+        http_client.close()
+
         logging.debug("Tasks cleaned up successfully")
 
     async def run(self) -> None:
@@ -390,6 +496,12 @@ class ModeCortexRuntime:
         try:
             self.mode_manager.set_event_loop(asyncio.get_event_loop())
 
+            if self.mode_config.loop_stall_threshold and self.loop_monitor is None:
+                self.loop_monitor = LoopStallMonitor(
+                    self.mode_config.loop_stall_threshold
+                )
+                self.loop_monitor.start()
+
             if not self._mode_initialized:
                 # Execute global startup hooks
                 startup_context = {
@@ -422,27 +534,11 @@ class ModeCortexRuntime:
                     self._check_config_changes()
                 )
 
-            while True:
+            while not self._stop_requested:
                 try:
-                    awaitables: List[Union[asyncio.Task, asyncio.Future]] = []
-                    if self.cortex_loop_task and not self.cortex_loop_task.done():
-                        awaitables.append(self.cortex_loop_task)
-                    if (
-                        self.mode_transition_task
-                        and not self.mode_transition_task.done()
-                    ):
-                        awaitables.append(self.mode_transition_task)
-                    if self.config_watcher_task and not self.config_watcher_task.done():
-                        awaitables.append(self.config_watcher_task)
-                    if self.input_listener_task and not self.input_listener_task.done():
-                        awaitables.append(self.input_listener_task)
-                    if self.simulator_task and not self.simulator_task.done():
-                        awaitables.append(self.simulator_task)
-                    if self.action_task and not self.action_task.done():
-                        awaitables.append(self.action_task)
-                    if self.background_task and not self.background_task.done():
-                        awaitables.append(self.background_task)
-
+                    awaitables = self._active_tasks()
+                    if not awaitables:
+                        break
                     await asyncio.gather(*awaitables)
 
                 except asyncio.CancelledError:
@@ -483,6 +579,34 @@ class ModeCortexRuntime:
 
             await self._cleanup_tasks()
 
+    def _active_tasks(self) -> List[Union[asyncio.Task, asyncio.Future]]:
+        """
+        Get the running tasks of the runtime.
+
+        Returns
+        -------
+        List[Union[asyncio.Task, asyncio.Future]]
+            The tasks that are not done.
+        """
+        tasks = [
+            self.cortex_loop_task,
+            self.mode_transition_task,
+            self.config_watcher_task,
+            self.input_listener_task,
+            self.simulator_task,
+            self.action_task,
+            self.background_task,
+        ]
+        return [task for task in tasks if task and not task.done()]
+
+    def stop(self) -> None:
+        """
+        Stop the runtime; run returns after executing the shutdown hooks.
+        """
+        self._stop_requested = True
+        for task in self._active_tasks():
+            task.cancel()
+
     async def _run_cortex_loop(self) -> None:
         """
         Execute the main cortex processing loop with mode awareness.
@@ -492,17 +616,29 @@ class ModeCortexRuntime:
 
         try:
             while True:
-                skip_status = self.sleep_ticker_provider.skip_sleep
-                sleep_duration = (
-                    1 / self.current_config.hertz if self.current_config else 1
-                )
-                if not skip_status and self.current_config:
-                    await self.sleep_ticker_provider.sleep(sleep_duration)
+                if self.current_config and self.current_config.event_driven_ticks:
+                    await self._wait_for_event_tick()
+                else:
+                    skip_status = self.sleep_ticker_provider.skip_sleep
+                    sleep_duration = (
+                        1 / self.current_config.hertz if self.current_config else 1
+                    )
+                    if not skip_status and self.current_config:
+                        await self.sleep_ticker_provider.sleep(sleep_duration)
 
                 # Helper to yield control to event loop
                 await asyncio.sleep(0)
 
-                await self._tick()
+                self._last_tick_time = get_clock().monotonic()
+                with self.trace_provider.span("tick"):
+                    await self._tick()
+                mark_startup("first_tick")
+                if (
+                    self.current_config
+                    and self.current_config.pipelined_ticks
+                    and self._tick_called_llm
+                ):
+                    self._start_speculation()
                 self.sleep_ticker_provider.skip_sleep = False
         except asyncio.CancelledError:
             logging.info(
@@ -515,10 +651,73 @@ class ModeCortexRuntime:
             )
             raise
 
+    def _max_tick_interval(self) -> float:
+        """
+        Get the longest time the event-driven loop may go without a tick.
+
+        Returns
+        -------
+        float
+            The configured max_tick_interval, or 1 / hertz.
+        """
+        if self.current_config is None:
+            return 1.0
+        if self.current_config.max_tick_interval is not None:
+            return self.current_config.max_tick_interval
+        return 1 / self.current_config.hertz
+
+    async def _wait_for_event_tick(self) -> None:
+        """
+        Wait until an input signals new data, bounded by the minimum tick
+        interval and the max-staleness heartbeat.
+        """
+        if self.current_config is None:
+            return
+
+        clock = get_clock()
+        elapsed = clock.monotonic() - self._last_tick_time
+        await self.sleep_ticker_provider.wait_for_input(
+            self._max_tick_interval() - elapsed
+        )
+
+        remaining = self.current_config.min_tick_interval - (
+            clock.monotonic() - self._last_tick_time
+        )
+        if remaining > 0:
+            await clock.sleep_async(remaining)
+
+    def _is_unchanged_prompt(self, prompt: str) -> bool:
+        """
+        Check whether an event-driven tick can skip the LLM call.
+
+        The prompt is unchanged if it matches the last prompt sent to the LLM
+        and the max-staleness heartbeat has not expired yet. This is the only
+        place an unchanged prompt skips the LLM; the response cache of the
+        LLM always answers.
+
+        Parameters
+        ----------
+        prompt : str
+            The fused prompt of the current tick.
+
+        Returns
+        -------
+        bool
+            True if the LLM call should be skipped.
+        """
+        if not self.current_config or not self.current_config.event_driven_ticks:
+            return False
+        return (
+            prompt == self._last_llm_prompt
+            and get_clock().monotonic() - self._last_llm_time
+            < self._max_tick_interval()
+        )
+
     async def _tick(self) -> None:
         """
         Execute a single tick of the mode-aware cortex processing cycle.
         """
+        self._tick_called_llm = False
         if not self.current_config or not self.fuser or not self.action_orchestrator:
             logging.warning("Cortex not properly initialized, skipping tick")
             return
@@ -532,7 +731,12 @@ class ModeCortexRuntime:
 
         finished_promises, _ = await self.action_orchestrator.flush_promises()
 
-        prompt = self.fuser.fuse(self.current_config.agent_inputs, finished_promises)
+        with self.trace_provider.span("fuse"):
+            prompt = self.fuser.fuse(
+                self.current_config.agent_inputs,
+                finished_promises,
+                keep_previous_inputs=self._speculation is not None,
+            )
         if prompt is None:
             logging.debug("No prompt to fuse")
             return
@@ -548,12 +752,24 @@ class ModeCortexRuntime:
             self._pending_mode_transition = new_mode
             self._pending_transition_reason = transition_reason
             self._mode_transition_event.set()
+            self._cancel_speculation()
             logging.info(
                 f"Scheduled mode transition to: {new_mode} (reason: {transition_reason})"
             )
             return
 
-        output = await self.current_config.cortex_llm.ask(prompt)
+        if self._is_unchanged_prompt(prompt):
+            logging.debug("Prompt unchanged, skipping LLM call")
+            self._cancel_speculation()
+            return
+
+        self._last_llm_prompt = prompt
+        self._last_llm_time = get_clock().monotonic()
+        self._tick_called_llm = True
+
+        dispatched: List[Action] = []
+        with self.trace_provider.span("llm"):
+            output = await self._ask_llm(prompt, dispatched)
         if output is None:
             logging.debug("No output from LLM")
             return
@@ -565,7 +781,188 @@ class ModeCortexRuntime:
         if self.simulator_orchestrator:
             await self.simulator_orchestrator.promise(output.actions)
 
-        await self.action_orchestrator.promise(output.actions)
+        if not dispatched:
+            await self.action_orchestrator.promise(output.actions)
+            return
+
+        dispatched_ids = {id(action) for action in dispatched}
+        remaining = [a for a in output.actions if id(a) not in dispatched_ids]
+        if remaining:
+            await self.action_orchestrator.extend_promise(remaining)
+
+    async def _ask_llm(
+        self, prompt: str, dispatched: List[Action]
+    ) -> Optional[CortexOutputModel]:
+        """
+        Ask the cortex LLM, dispatching streamed actions as they complete.
+
+        With concurrent action execution, every action a streaming LLM
+        completes before the response ends is promised right away, so e.g.
+        speech starts while later tool calls are still generated. The first
+        action starts the batch of the tick and later ones extend it. Sequential
+        and dependency execution need the whole action list and are only
+        promised by the caller.
+
+        Parameters
+        ----------
+        prompt : str
+            The fused prompt.
+        dispatched : List[Action]
+            Receives the actions that were already promised.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The complete LLM output.
+        """
+        if not self.current_config:
+            return None
+
+        async def dispatch(action: Action):
+            if self._is_reloading or not self.action_orchestrator:
+                return
+            dispatched.append(action)
+            if len(dispatched) == 1:
+                await self.action_orchestrator.promise([action])
+            else:
+                await self.action_orchestrator.extend_promise([action])
+
+        speculation = self._claim_speculation(prompt)
+        if speculation is not None:
+            logging.debug("Using the speculative LLM call of the previous tick")
+            return await self._use_speculation(speculation, dispatch)
+
+        llm = self.current_config.cortex_llm
+        if not self._streams_actions():
+            return await llm.ask(prompt)
+
+        llm.set_action_callback(dispatch)
+        try:
+            return await llm.ask(prompt)
+        finally:
+            llm.set_action_callback(None)
+
+    def _streams_actions(self) -> bool:
+        """
+        Check whether streamed actions are promised before the LLM returns.
+
+        Returns
+        -------
+        bool
+            True with concurrent action execution.
+        """
+        return bool(self.current_config) and (
+            self.current_config.action_execution_mode in (None, "concurrent")
+        )
+
+    def _start_speculation(self) -> None:
+        """
+        Fuse the next prompt and start its LLM call while actions run.
+
+        The call is used by the next tick if that tick fuses the same prompt,
+        i.e. no input changed in the meantime, and discarded otherwise. No
+        call is made if the inputs drained by the fuse hold a mode transition
+        input, which the next tick checks first, or if an event-driven tick
+        would skip the unchanged prompt.
+        """
+        self._cancel_speculation()
+        if (
+            not self.current_config
+            or not self.fuser
+            or self._is_reloading
+            or self._pending_mode_transition
+        ):
+            return
+
+        prompt = self.fuser.fuse(self.current_config.agent_inputs, [])
+        if prompt is None:
+            return
+
+        # The next tick reuses the drained inputs, with or without a call
+        speculation = Speculation(prompt, self.current_config.cortex_llm)
+        self._speculation = speculation
+        if (
+            self.io_provider.get_mode_transition_input() is not None
+            or self._is_unchanged_prompt(prompt)
+        ):
+            return
+
+        if self._streams_actions():
+            speculation.llm.set_action_callback(speculation.on_action)
+        speculation.task = asyncio.create_task(speculation.ask())
+
+    def _claim_speculation(self, prompt: str) -> Optional[Speculation]:
+        """
+        Take the speculative LLM call if it was made for this prompt.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt fused by the current tick.
+
+        Returns
+        -------
+        Speculation or None
+            The speculation, or None if no call was made or it was
+            discarded because the prompt changed.
+        """
+        speculation = self._speculation
+        if speculation is None or speculation.task is None:
+            self._speculation = None
+            return None
+
+        if speculation.prompt == prompt:
+            self._speculation = None
+            return speculation
+
+        logging.debug("Inputs changed, discarding the speculative LLM call")
+        self._cancel_speculation()
+        return None
+
+    async def _use_speculation(
+        self,
+        speculation: Speculation,
+        dispatch: Callable[[Action], Awaitable[None]],
+    ) -> Optional[CortexOutputModel]:
+        """
+        Wait for a claimed speculative call and commit its history.
+
+        Actions it streamed so far are dispatched right away, and later ones
+        as they arrive.
+
+        Parameters
+        ----------
+        speculation : Speculation
+            The claimed speculation.
+        dispatch : Callable[[Action], Awaitable[None]]
+            Promises a streamed action.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The LLM output.
+        """
+        if speculation.task is None:
+            return None
+        try:
+            while speculation.streamed:
+                await dispatch(speculation.streamed.pop(0))
+            speculation.dispatch = dispatch
+            output = await speculation.task
+        finally:
+            speculation.llm.set_action_callback(None)
+        await speculation.history.commit()
+        return output
+
+    def _cancel_speculation(self) -> None:
+        """
+        Cancel the speculative LLM call, if any, discarding its history.
+        """
+        speculation, self._speculation = self._speculation, None
+        if speculation is None or speculation.task is None:
+            return
+        speculation.task.cancel()
+        speculation.llm.set_action_callback(None)
 
     def get_mode_info(self) -> dict:
         """
@@ -681,8 +1078,8 @@ class ModeCortexRuntime:
                 current_mode = new_mode_config.default_mode
 
             self.mode_manager.state.current_mode = current_mode
-            self.mode_manager.state.mode_start_time = time.time()
-            self.mode_manager.state.last_transition_time = time.time()
+            self.mode_manager.state.mode_start_time = get_clock().time()
+            self.mode_manager.state.last_transition_time = get_clock().time()
             self.mode_manager.state.transition_history.append(
                 f"config_reload->{current_mode}:hot_reload"
             )
@@ -5,13 +5,26 @@ import os
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
-from providers.kokoro_tts_provider import KokoroTTSProvider
-from providers.riva_tts_provider import RivaTTSProvider
+from runtime.lazy_import import lazy_attribute
+
+if TYPE_CHECKING:
+    from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
+    from providers.kokoro_tts_provider import KokoroTTSProvider
+    from providers.riva_tts_provider import RivaTTSProvider
+else:
+    # The TTS stacks are only needed by message hooks; defer them so
+    # configs without one do not pay for the audio libraries at startup.
+    ElevenLabsTTSProvider = lazy_attribute(
+        "providers.elevenlabs_tts_provider", "ElevenLabsTTSProvider"
+    )
+    KokoroTTSProvider = lazy_attribute(
+        "providers.kokoro_tts_provider", "KokoroTTSProvider"
+    )
+    RivaTTSProvider = lazy_attribute("providers.riva_tts_provider", "RivaTTSProvider")
 
 
 class LifecycleHookType(Enum):
@@ -0,0 +1,179 @@
+import importlib
+import threading
+import types
+from typing import Any, Optional
+
+_import_lock = threading.RLock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Deferred proxy for a module.
+
+    The module is imported on first attribute access, so heavy optional
+    stacks (torch, ultralytics, deepface, web3, ...) are only loaded when a
+    plugin that needs them actually runs.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the proxy.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified module name, e.g. "torchvision.models.detection".
+        """
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Check whether the underlying module has been imported.
+
+        Returns
+        -------
+        bool
+            True once the module has been imported.
+        """
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Import the module if needed and return one of its attributes.
+        """
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        """
+        List the attributes of the underlying module.
+        """
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        """
+        Return a representation showing whether the module is loaded.
+        """
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+class LazyAttribute:
+    """
+    Deferred proxy for an attribute of a module, usually a class.
+
+    Calling the proxy or reading one of its attributes imports the module
+    and forwards to the real object. The proxy keeps module level names such
+    as ``YOLO`` or ``Web3`` in place, so they can still be patched in tests.
+    """
+
+    def __init__(self, module_name: str, attribute: str):
+        """
+        Initialize the proxy.
+
+        Parameters
+        ----------
+        module_name : str
+            The fully qualified module name.
+        attribute : str
+            The attribute to resolve from the module.
+        """
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target: Optional[Any] = None
+
+    def resolve(self) -> Any:
+        """
+        Import the module if needed and return the real attribute.
+
+        Returns
+        -------
+        Any
+            The attribute of the imported module.
+        """
+        if self._target is None:
+            with _import_lock:
+                if self._target is None:
+                    module = importlib.import_module(self._module_name)
+                    self._target = getattr(module, self._attribute)
+        return self._target
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Check whether the attribute has been resolved.
+
+        Returns
+        -------
+        bool
+            True once the module has been imported.
+        """
+        return self._target is not None
+
+    def __call__(self, *args, **kwargs):
+        """
+        Call the real attribute.
+        """
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Read an attribute of the real attribute.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """
+        Return a representation showing whether the attribute is resolved.
+        """
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy attribute '{self._module_name}.{self._attribute}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Get a deferred proxy for a module.
+
+    Parameters
+    ----------
+    name : str
+        The fully qualified module name.
+
+    Returns
+    -------
+    LazyModule
+        A proxy that imports the module on first attribute access.
+    """
+    return LazyModule(name)
+
+
+def lazy_attribute(module_name: str, attribute: str) -> LazyAttribute:
+    """
+    Get a deferred proxy for an attribute of a module.
+
+    Parameters
+    ----------
+    module_name : str
+        The fully qualified module name.
+    attribute : str
+        The attribute to resolve from the module.
+
+    Returns
+    -------
+    LazyAttribute
+        A proxy that imports the module when called or inspected.
+    """
+    return LazyAttribute(module_name, attribute)
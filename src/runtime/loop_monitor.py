@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import FrameType
+from typing import Dict, Optional, Tuple
+
+from providers.trace_provider import TraceProvider
+
+# Module prefixes of plugin code and the kind of plugin they hold
+_PLUGIN_KINDS = (
+    (re.compile(r"^inputs\.plugins\."), "input"),
+    (re.compile(r"^actions\.[^.]+\.connector\."), "action"),
+    (re.compile(r"^llm\.plugins\."), "llm"),
+    (re.compile(r"^backgrounds\.plugins\."), "background"),
+    (re.compile(r"^simulators\.plugins\."), "simulator"),
+)
+
+# The monitor of the running event loop, if any
+_monitor: Optional["LoopStallMonitor"] = None
+
+
+def get_loop_monitor() -> Optional["LoopStallMonitor"]:
+    """
+    Get the stall monitor of the running runtime.
+
+    Returns
+    -------
+    LoopStallMonitor or None
+        The started monitor, or None if stall detection is off.
+    """
+    return _monitor
+
+
+@dataclass
+class StallStats:
+    """
+    Stalls attributed to one plugin.
+
+    Parameters
+    ----------
+    count : int
+        Number of stalls.
+    total : float
+        Seconds the event loop was blocked in total.
+    max : float
+        Seconds of the longest stall.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+def attribute_frame(frame: Optional[FrameType]) -> Tuple[str, str]:
+    """
+    Name the plugin and the call site a stack is blocked in.
+
+    The culprit is the outermost plugin frame on the stack, so a provider or
+    library called by a plugin is charged to that plugin. The location is
+    the innermost frame, where the code is actually waiting.
+
+    Parameters
+    ----------
+    frame : FrameType, optional
+        The innermost frame of the blocked thread.
+
+    Returns
+    -------
+    Tuple[str, str]
+        The culprit, e.g. "input inputs.plugins.wallet_ethereum._poll", or
+        "unknown", and the location as "module.function:line".
+    """
+    if frame is None:
+        return "unknown", "unknown"
+
+    location = (
+        f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+        f":{frame.f_lineno}"
+    )
+
+    culprit = "unknown"
+    current: Optional[FrameType] = frame
+    while current is not None:
+        module = current.f_globals.get("__name__", "")
+        for pattern, kind in _PLUGIN_KINDS:
+            if pattern.match(module):
+                culprit = f"{kind} {module}.{current.f_code.co_name}"
+                break
+        current = current.f_back
+    return culprit, location
+
+
+class LoopStallMonitor:
+    """
+    Detects event loop stalls and attributes them to the blocking plugin.
+
+    A heartbeat coroutine measures how late the loop wakes it up. While the
+    heartbeat is overdue, a watchdog thread samples the stack of the loop
+    thread, so a synchronous call inside an async plugin can be named even
+    though the loop itself cannot run any code until it returns. Each stall
+    is logged as a warning, counted per plugin and recorded as a trace span.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: Optional[float] = None):
+        """
+        Initialize the monitor.
+
+        Parameters
+        ----------
+        threshold : float
+            Seconds the loop must be blocked before it counts as a stall.
+        interval : float, optional
+            Seconds between heartbeats and watchdog checks. Defaults to a
+            quarter of the threshold.
+        """
+        self.threshold = threshold
+        self.interval = interval or max(threshold / 4, 0.01)
+        self.stats: Dict[str, StallStats] = {}
+
+        self._lock = threading.Lock()
+        self._samples: Counter = Counter()
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._trace_provider = TraceProvider()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether the monitor is running.
+
+        Returns
+        -------
+        bool
+            True if the heartbeat is scheduled.
+        """
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def stall_count(self, module: str) -> int:
+        """
+        Count the stalls attributed to the plugins of a module.
+
+        Parameters
+        ----------
+        module : str
+            The plugin module, e.g. "inputs.plugins.wallet_ethereum".
+
+        Returns
+        -------
+        int
+            Number of stalls whose culprit is a function of the module.
+        """
+        prefix = f"{module}."
+        return sum(
+            stats.count
+            for culprit, stats in list(self.stats.items())
+            if culprit.split(" ", 1)[-1].startswith(prefix)
+        )
+
+    def start(self) -> None:
+        """
+        Start monitoring the running event loop.
+        """
+        global _monitor
+
+        if self.is_running:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-stall-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        _monitor = self
+        logging.info(f"Event loop stall monitor started ({self.threshold:.3f}s)")
+
+    def stop(self) -> None:
+        """
+        Stop monitoring.
+        """
+        global _monitor
+
+        if _monitor is self:
+            _monitor = None
+        self._stop_event.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            lag = now - expected
+            if lag >= self.threshold:
+                self._report(lag)
+            else:
+                with self._lock:
+                    self._samples.clear()
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            if time.monotonic() - self._last_beat < 2 * self.interval:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id or -1)
+            sample = attribute_frame(frame)
+            del frame
+            with self._lock:
+                self._samples[sample] += 1
+
+    def _report(self, lag: float) -> None:
+        with self._lock:
+            samples = self._samples
+            self._samples = Counter()
+
+        if samples:
+            (culprit, location), _ = samples.most_common(1)[0]
+        else:
+            culprit, location = "unknown", "unknown"
+
+        stats = self.stats.setdefault(culprit, StallStats())
+        stats.count += 1
+        stats.total += lag
+        stats.max = max(stats.max, lag)
+
+        logging.warning(
+            f"Event loop blocked for {lag * 1000:.0f} ms by {culprit} at {location}"
+        )
+        self._trace_provider.record(
+            "loop_stall",
+            start=time.time() - lag,
+            duration=lag,
+            lane="loop",
+            culprit=culprit,
+            location=location,
+        )
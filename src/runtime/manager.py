@@ -2,13 +2,13 @@ import asyncio
 import json
 import logging
 import os
-import time
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
 import json5
 import zenoh
 
+from providers.clock import get_clock
 from runtime.config import (
     LifecycleHookType,
     ModeConfig,
@@ -49,7 +49,7 @@ class ModeState:
 
     current_mode: str
     previous_mode: Optional[str] = None
-    mode_start_time: float = field(default_factory=time.time)
+    mode_start_time: float = field(default_factory=lambda: get_clock().time())
     transition_history: List[str] = field(default_factory=list)
     last_transition_time: float = 0.0
     user_context: Dict = field(default_factory=dict)
@@ -241,7 +241,7 @@ class ModeManager:
         Optional[str]
             The target mode if a transition should occur, None otherwise
         """
-        current_time = time.time()
+        current_time = get_clock().time()
         mode_duration = current_time - self.state.mode_start_time
 
         # Check if current mode has a timeout
@@ -368,7 +368,7 @@ class ModeManager:
         bool
             True if the transition can occur, False otherwise
         """
-        current_time = time.time()
+        current_time = get_clock().time()
 
         transition_key = f"{rule.from_mode}->{rule.to_mode}"
         if transition_key in self.transition_cooldowns:
@@ -544,7 +544,7 @@ class ModeManager:
                     return True
 
                 transition_key = f"{from_mode}->{target_mode}"
-                self.transition_cooldowns[transition_key] = time.time()
+                self.transition_cooldowns[transition_key] = get_clock().time()
 
                 from_config = self.config.modes.get(from_mode)
                 to_config = self.config.modes[target_mode]
@@ -553,7 +553,7 @@ class ModeManager:
                     "from_mode": from_mode,
                     "to_mode": target_mode,
                     "reason": reason,
-                    "timestamp": time.time(),
+                    "timestamp": get_clock().time(),
                     "transition_key": transition_key,
                 }
 
@@ -576,8 +576,8 @@ class ModeManager:
                 # Update state
                 self.state.previous_mode = from_mode
                 self.state.current_mode = target_mode
-                self.state.mode_start_time = time.time()
-                self.state.last_transition_time = time.time()
+                self.state.mode_start_time = get_clock().time()
+                self.state.last_transition_time = get_clock().time()
                 self.state.transition_history.append(
                     f"{from_mode}->{target_mode}:{reason}"
                 )
@@ -646,7 +646,7 @@ class ModeManager:
             Dictionary containing mode information
         """
         current_config = self.current_mode_config
-        current_time = time.time()
+        current_time = get_clock().time()
         mode_duration = current_time - self.state.mode_start_time
 
         return {
@@ -934,7 +934,7 @@ class ModeManager:
             state_data = {
                 "last_active_mode": self.state.current_mode,
                 "previous_mode": self.state.previous_mode,
-                "timestamp": time.time(),
+                "timestamp": get_clock().time(),
                 "transition_history": self.state.transition_history[-10:],
             }
 
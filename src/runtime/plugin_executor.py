@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import threading
+import typing as T
+
+from runtime.loop_monitor import get_loop_monitor
+
+R = T.TypeVar("R")
+
+# Stalls attributed to a plugin before it is reported as blocking
+BLOCKING_WARNING_STALLS = 3
+
+
+class PluginExecutor:
+    """
+    Runs the coroutines of one plugin on a dedicated worker thread.
+
+    The worker thread runs its own event loop, so a plugin that calls
+    blocking code from an async method only blocks its own thread. Every
+    plugin gets a separate executor, so one hung sensor or connector cannot
+    starve the others. Calls are awaited from the main loop with an optional
+    timeout, and cancelling the caller cancels the call on the worker loop.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the executor. The worker thread starts on the first call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the plugin, used for the worker thread name.
+        """
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._loop: T.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: T.Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether the worker thread is running.
+
+        Returns
+        -------
+        bool
+            True if the worker loop accepts calls.
+        """
+        return self._loop is not None and self._loop.is_running()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(
+                    target=run, name=f"plugin-{self.name}", daemon=True
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    async def run(
+        self, coro: T.Coroutine[T.Any, T.Any, R], timeout: T.Optional[float] = None
+    ) -> R:
+        """
+        Run a coroutine on the worker thread and wait for its result.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            The coroutine to run, e.g. ``sensor._poll()``.
+        timeout : float, optional
+            Seconds to wait before the call is cancelled.
+
+        Returns
+        -------
+        R
+            The result of the coroutine.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the call did not finish within the timeout.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker loop. Calls that are still running are abandoned.
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+            self._thread = None
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+
+
+class OffloadPolicy:
+    """
+    Decides whether a plugin runs on the event loop or on a PluginExecutor.
+
+    The ``blocking`` config option of the plugin takes precedence over the
+    ``blocking`` class attribute. True always offloads and False never does.
+    None keeps the plugin on the event loop, as an offloaded plugin cannot
+    share asyncio primitives with the main loop, and warns once the loop
+    stall monitor has attributed enough stalls to the plugin module. The
+    ``blocking_timeout`` config option bounds every call, offloaded or not.
+    """
+
+    def __init__(self, plugin: T.Any, kind: str):
+        """
+        Initialize the policy.
+
+        Parameters
+        ----------
+        plugin : Any
+            The sensor or action connector.
+        kind : str
+            "input" or "action", used in log messages.
+        """
+        self.plugin = plugin
+        self.kind = kind
+
+        config = getattr(plugin, "config", None)
+        declared = getattr(config, "blocking", None)
+        if declared is None:
+            declared = getattr(type(plugin), "blocking", None)
+        self.declared: T.Optional[bool] = declared
+        self.timeout: T.Optional[float] = getattr(config, "blocking_timeout", None)
+
+        self._warned = False
+        self._executor: T.Optional[PluginExecutor] = None
+
+    @property
+    def executor(self) -> PluginExecutor:
+        """
+        Get the executor of the plugin, creating it on first use.
+
+        Returns
+        -------
+        PluginExecutor
+            The executor dedicated to this plugin.
+        """
+        if self._executor is None:
+            self._executor = PluginExecutor(type(self.plugin).__name__)
+        return self._executor
+
+    def should_offload(self) -> bool:
+        """
+        Check whether the next call of the plugin should be offloaded.
+
+        Returns
+        -------
+        bool
+            True if the plugin should run on its executor.
+        """
+        if self.declared is not None:
+            return bool(self.declared)
+        self._warn_if_blocking()
+        return False
+
+    def _warn_if_blocking(self) -> None:
+        if self._warned:
+            return
+        monitor = get_loop_monitor()
+        if monitor is None:
+            return
+        stalls = monitor.stall_count(type(self.plugin).__module__)
+        if stalls >= BLOCKING_WARNING_STALLS:
+            self._warned = True
+            logging.warning(
+                f"{self.kind.capitalize()} {type(self.plugin).__name__} blocked the "
+                f'event loop {stalls} times; set "blocking": true in its config '
+                "to run it on a worker thread"
+            )
+
+    async def run(self, coro: T.Coroutine[T.Any, T.Any, R]) -> R:
+        """
+        Run a coroutine of the plugin, offloaded if the policy says so.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            The coroutine to run.
+
+        Returns
+        -------
+        R
+            The result of the coroutine.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the call did not finish within ``blocking_timeout``.
+        """
+        if self.should_offload():
+            return await self.executor.run(coro, self.timeout)
+        return await asyncio.wait_for(coro, self.timeout)
+
+    def shutdown(self) -> None:
+        """
+        Stop the executor of the plugin, if it was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,334 @@
+import ast
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from runtime.cache_dir import get_cache_dir
+
+CACHE_VERSION = 1
+
+
+@dataclass
+class PluginFile:
+    """
+    Top-level definitions of one plugin source file.
+
+    Parameters
+    ----------
+    mtime_ns : int
+        Modification time of the file when it was parsed.
+    size : int
+        Size of the file when it was parsed.
+    classes : Dict[str, List[str]]
+        Class names mapped to the source text of their base classes.
+    functions : List[str]
+        Names of the top-level functions, including async functions.
+    """
+
+    mtime_ns: int
+    size: int
+    classes: Dict[str, List[str]] = field(default_factory=dict)
+    functions: List[str] = field(default_factory=list)
+
+
+def parse_plugin_file(path: str, mtime_ns: int = 0, size: int = 0) -> PluginFile:
+    """
+    Collect the top-level classes and functions of a Python file using AST.
+
+    Parameters
+    ----------
+    path : str
+        Path to the Python file.
+    mtime_ns : int
+        Modification time to record for the file.
+    size : int
+        Size to record for the file.
+
+    Returns
+    -------
+    PluginFile
+        The definitions found in the file. Files that cannot be read or
+        parsed yield no definitions.
+    """
+    entry = PluginFile(mtime_ns=mtime_ns, size=size)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except Exception as e:
+        logging.warning(f"Could not read {os.path.basename(path)}: {e}")
+        return entry
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            entry.classes[node.name] = [ast.unparse(base) for base in node.bases]
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            entry.functions.append(node.name)
+
+    return entry
+
+
+class PluginIndex:
+    """
+    Persistent class to module index for a plugin directory.
+
+    The index is built once from the AST of every .py file in the directory,
+    keyed by file mtime and size, and cached on disk so later runs only
+    re-parse files that changed. Lookups are dictionary hits; the index is
+    refreshed when a lookup misses or the owning file has changed.
+    """
+
+    def __init__(self, directory: str, cache_dir: Optional[str] = None):
+        """
+        Initialize the index for a plugin directory.
+
+        Parameters
+        ----------
+        directory : str
+            The plugin directory to index.
+        cache_dir : Optional[str]
+            Directory for the on-disk cache. Defaults to OM1_CACHE_DIR or
+            ~/.cache/om1.
+        """
+        self.directory = directory
+        self.cache_dir = cache_dir if cache_dir is not None else get_cache_dir()
+
+        self._lock = threading.RLock()
+        self._files: Dict[str, PluginFile] = {}
+        self._classes: Dict[str, List[Tuple[str, List[str]]]] = {}
+        self._loaded = False
+
+    @property
+    def cache_path(self) -> str:
+        """
+        Get the path of the on-disk cache for this directory.
+
+        Returns
+        -------
+        str
+            The cache file path.
+        """
+        digest = hashlib.sha1(os.path.abspath(self.directory).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"plugin_index_{digest[:16]}.json")
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return
+            self._files = {
+                name: PluginFile(**entry) for name, entry in data["files"].items()
+            }
+        except Exception:
+            self._files = {}
+
+    def _save_cache(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            data = {
+                "version": CACHE_VERSION,
+                "directory": os.path.abspath(self.directory),
+                "files": {
+                    name: {
+                        "mtime_ns": entry.mtime_ns,
+                        "size": entry.size,
+                        "classes": entry.classes,
+                        "functions": entry.functions,
+                    }
+                    for name, entry in self._files.items()
+                },
+            }
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logging.debug(f"Could not write plugin index cache: {e}")
+
+    def _stat(self, filename: str) -> Tuple[int, int]:
+        try:
+            st = os.stat(os.path.join(self.directory, filename))
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return 0, 0
+
+    def _rebuild_lookup(self):
+        classes: Dict[str, List[Tuple[str, List[str]]]] = {}
+        for filename in sorted(self._files):
+            module_name = filename[:-3]
+            for class_name, bases in self._files[filename].classes.items():
+                classes.setdefault(class_name, []).append((module_name, bases))
+        self._classes = classes
+
+    def refresh(self):
+        """
+        Synchronize the index with the directory, re-parsing changed files only.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load_cache()
+                self._loaded = True
+
+            if not os.path.exists(self.directory):
+                self._files = {}
+                self._classes = {}
+                return
+
+            filenames = [f for f in os.listdir(self.directory) if f.endswith(".py")]
+
+            changed = False
+            files: Dict[str, PluginFile] = {}
+            for filename in filenames:
+                mtime_ns, size = self._stat(filename)
+                cached = self._files.get(filename)
+                if (
+                    cached is not None
+                    and mtime_ns
+                    and cached.mtime_ns == mtime_ns
+                    and cached.size == size
+                ):
+                    files[filename] = cached
+                    continue
+
+                files[filename] = parse_plugin_file(
+                    os.path.join(self.directory, filename), mtime_ns, size
+                )
+                changed = True
+
+            if changed or set(files) != set(self._files):
+                self._files = files
+                self._save_cache()
+            self._rebuild_lookup()
+
+    def _is_current(self, module_name: str) -> bool:
+        filename = f"{module_name}.py"
+        cached = self._files.get(filename)
+        if cached is None:
+            return False
+        mtime_ns, size = self._stat(filename)
+        return bool(mtime_ns) and (mtime_ns, size) == (cached.mtime_ns, cached.size)
+
+    def _lookup(
+        self, class_name: str, base: Optional[str], exclude: Tuple[str, ...]
+    ) -> Optional[str]:
+        for module_name, bases in self._classes.get(class_name, []):
+            if module_name in exclude:
+                continue
+            if base is None or any(base in b for b in bases):
+                return module_name
+        return None
+
+    def find_class(
+        self,
+        class_name: str,
+        base: Optional[str] = None,
+        exclude: Tuple[str, ...] = (),
+    ) -> Optional[str]:
+        """
+        Find which module file defines a top-level class.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name to search for.
+        base : Optional[str]
+            If given, only match classes with a base class whose source text
+            contains this string, e.g. "FuserInput".
+        exclude : Tuple[str, ...]
+            Module names to ignore, e.g. ("__init__",).
+
+        Returns
+        -------
+        str or None
+            The module name (without .py) that contains the class, or None
+            if not found.
+        """
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+
+            module_name = self._lookup(class_name, base, exclude)
+            if module_name is not None and self._is_current(module_name):
+                return module_name
+
+            self.refresh()
+            return self._lookup(class_name, base, exclude)
+
+    def has_function(self, module_name: str, function_name: str) -> bool:
+        """
+        Check whether a module file defines a top-level function.
+
+        Parameters
+        ----------
+        module_name : str
+            The module name (without .py).
+        function_name : str
+            The function name to search for.
+
+        Returns
+        -------
+        bool
+            True if the function is defined in the module.
+        """
+        with self._lock:
+            if not self._loaded or not self._is_current(module_name):
+                self.refresh()
+            entry = self._files.get(f"{module_name}.py")
+            return entry is not None and function_name in entry.functions
+
+
+_indexes: Dict[str, PluginIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_plugin_index(directory: str) -> PluginIndex:
+    """
+    Get the shared index for a plugin directory.
+
+    Parameters
+    ----------
+    directory : str
+        The plugin directory.
+
+    Returns
+    -------
+    PluginIndex
+        The process-wide index for the directory.
+    """
+    key = os.path.abspath(directory)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = PluginIndex(directory)
+            _indexes[key] = index
+        return index
+
+
+def find_plugin_module(
+    directory: str, class_name: str, base: Optional[str] = None
+) -> Optional[str]:
+    """
+    Find which plugin module in a directory defines a class.
+
+    Parameters
+    ----------
+    directory : str
+        The plugin directory.
+    class_name : str
+        The class name to search for.
+    base : Optional[str]
+        If given, only match classes with a base class containing this string.
+
+    Returns
+    -------
+    str or None
+        The module name (without .py) that contains the class, or None if
+        not found.
+    """
+    if not os.path.exists(directory):
+        return None
+    return get_plugin_index(directory).find_class(class_name, base)
@@ -0,0 +1,717 @@
+import asyncio
+import glob
+import logging
+import os
+import pickle
+import typing as T
+from collections import defaultdict, deque
+
+import numpy as np
+
+from inputs.base import SensorConfig
+from inputs.base.loop import FuserInput
+from llm import LLM
+from llm.output_model import CortexOutputModel
+from providers.clock import get_clock
+from providers.sensor_recorder import SensorRecorder, read_recording
+
+# Channel of the cortex LLM responses
+LLM_CHANNEL = "llm"
+
+# Events stored as they are; anything else is pickled
+NATIVE_EVENT_TYPES = (str, bytes, int, float, bool, np.ndarray)
+
+
+def input_channel(name: str) -> str:
+    """
+    Get the recording channel of an input.
+
+    Parameters
+    ----------
+    name : str
+        Name of the input, see ``InputOrchestrator``.
+
+    Returns
+    -------
+    str
+        The channel name.
+    """
+    return f"input:{name}"
+
+
+def text_channel(name: str) -> str:
+    """
+    Get the recording channel of the text an input hands to the fuser.
+
+    Parameters
+    ----------
+    name : str
+        Name of the input, see ``InputOrchestrator``.
+
+    Returns
+    -------
+    str
+        The channel name.
+    """
+    return f"text:{name}"
+
+
+def _encode_event(event: T.Any) -> T.Dict[str, T.Any]:
+    if isinstance(event, bytes):
+        return {"bytes": np.frombuffer(event, dtype=np.uint8)}
+    if isinstance(event, NATIVE_EVENT_TYPES):
+        return {"value": event}
+    return {"pickle": np.frombuffer(pickle.dumps(event), dtype=np.uint8)}
+
+
+def _decode_event(record: T.Dict[str, T.Any]) -> T.Any:
+    if "bytes" in record:
+        return record["bytes"].tobytes()
+    if "pickle" in record:
+        return pickle.loads(record["pickle"].tobytes())
+    value = record["value"]
+    # Arrays are read back as read-only views of the recording
+    return value.copy() if isinstance(value, np.ndarray) else value
+
+
+class SessionRecorder:
+    """
+    Records the inputs and LLM responses of a runtime session for replay.
+
+    Every raw event an input produces is recorded on the channel of the
+    input before it reaches ``raw_to_text``, and every text it hands to the
+    fuser on its text channel, together with every cortex LLM response, all
+    timestamped. Strings, bytes, numbers and NumPy arrays are
+    stored natively; other events, e.g. Zenoh messages or dataclasses, are
+    pickled, so recordings must only be replayed from trusted sources.
+    """
+
+    def __init__(self, directory: str, compression: T.Optional[str] = "zlib"):
+        """
+        Initialize the recorder; files are written on first use.
+
+        Parameters
+        ----------
+        directory : str
+            Directory of the session recording.
+        compression : str, optional
+            Chunk compression of the recording, see ``SensorRecorder``.
+        """
+        self.directory = directory
+        self.recorder = SensorRecorder(
+            directory, prefix="session", compression=compression
+        )
+        self._failed: T.Set[str] = set()
+
+    def record_event(
+        self, name: str, event: T.Any, timestamp: T.Optional[float] = None
+    ):
+        """
+        Record a raw event of an input.
+
+        Parameters
+        ----------
+        name : str
+            Name of the input.
+        event : Any
+            The raw event. None, i.e. a poll without data, is not recorded.
+        timestamp : float, optional
+            Unix time of the event; defaults to now.
+        """
+        if event is None:
+            return
+        self._record(input_channel(name), _encode_event(event), timestamp)
+
+    def record_text(self, name: str, text: str, timestamp: T.Optional[float] = None):
+        """
+        Record the text an input handed to the fuser.
+
+        Parameters
+        ----------
+        name : str
+            Name of the input.
+        text : str
+            The formatted buffer of the input.
+        timestamp : float, optional
+            Unix time of the read; defaults to now.
+        """
+        self._record(text_channel(name), {"value": text}, timestamp)
+
+    def _record(
+        self, channel: str, value: T.Dict[str, T.Any], timestamp: T.Optional[float]
+    ):
+        try:
+            self.recorder.record(
+                channel,
+                value,
+                timestamp=get_clock().time() if timestamp is None else timestamp,
+            )
+        except Exception as e:
+            if channel not in self._failed:
+                self._failed.add(channel)
+                logging.error(f"Cannot record {channel}: {e}")
+
+    def record_llm(
+        self,
+        prompt: str,
+        output: T.Optional[CortexOutputModel],
+        timestamp: T.Optional[float] = None,
+    ):
+        """
+        Record a response of the cortex LLM.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt of the call.
+        output : CortexOutputModel, optional
+            The response, None if the call failed.
+        timestamp : float, optional
+            Unix time of the response; defaults to now.
+        """
+        self.recorder.record(
+            LLM_CHANNEL,
+            {
+                "prompt": prompt,
+                "output": output.model_dump() if output is not None else None,
+            },
+            timestamp=get_clock().time() if timestamp is None else timestamp,
+        )
+
+    def wrap_llm(self, llm: LLM) -> LLM:
+        """
+        Wrap the cortex LLM to record its responses.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM.
+
+        Returns
+        -------
+        LLM
+            The recording wrapper.
+        """
+        return RecordingLLM(llm, self)
+
+    def close(self):
+        """
+        Write the rest of the recording to disk.
+        """
+        self.recorder.close()
+
+
+class _LLMWrapper(LLM):
+    """
+    Base of the session wrappers; forwards everything to the wrapped LLM.
+    """
+
+    def __init__(self, llm: LLM):
+        self._llm = llm
+        self._config = llm._config
+        self._available_actions = llm._available_actions
+        self.function_schemas = llm.function_schemas
+        self.io_provider = llm.io_provider
+        self._skip_state_management = llm._skip_state_management
+        self._action_callback = None
+
+    @property
+    def llm(self) -> LLM:
+        """
+        Get the wrapped LLM.
+
+        Returns
+        -------
+        LLM
+            The cortex LLM.
+        """
+        return self._llm
+
+    def __getattr__(self, name: str) -> T.Any:
+        """
+        Forward attributes of the wrapped LLM, e.g. its history manager.
+        """
+        if name == "_llm":
+            raise AttributeError(name)
+        return getattr(self._llm, name)
+
+
+class RecordingLLM(_LLMWrapper):
+    """
+    LLM wrapper that records every response of the wrapped LLM.
+    """
+
+    def __init__(self, llm: LLM, session: SessionRecorder):
+        """
+        Wrap an LLM.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM.
+        session : SessionRecorder
+            Receives the responses.
+        """
+        super().__init__(llm)
+        self.session = session
+
+    def set_action_callback(
+        self, callback: T.Optional[T.Callable[[T.Any], T.Awaitable[None]]]
+    ):
+        """
+        Set the streamed action callback on the wrapped LLM.
+
+        Parameters
+        ----------
+        callback : Callable[[Action], Awaitable[None]], optional
+            The callback, or None to stop early dispatch.
+        """
+        self._action_callback = callback
+        self._llm.set_action_callback(callback)
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> T.Optional[CortexOutputModel]:
+        """
+        Ask the wrapped LLM and record its response.
+
+        Parameters
+        ----------
+        prompt : str
+            Input text to send to the model
+        messages : List[Dict[str, str]]
+            List of message dictionaries to send to the model.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The response of the wrapped LLM.
+        """
+        output = await self._llm.ask(prompt, messages)
+        self.session.record_llm(prompt, output)
+        return output
+
+
+class SessionReplay:
+    """
+    Replays a recorded session into a runtime in place of its inputs and LLM.
+
+    The inputs of the runtime are not polled; the ``InputOrchestrator``
+    hands each of them its recorded raw events instead, so ``raw_to_text``
+    and everything after it run as in the recorded session. The cortex LLM
+    answers with the recorded responses.
+
+    ``ModeCortexRuntime`` does not construct the configured inputs during a
+    replay, so no input provider, device or network connection is started.
+    It substitutes a ``ReplayInput`` for each of them, which hands the fuser
+    the recorded text of the input. The actions, simulators and backgrounds
+    of the mode are still constructed and run as configured.
+
+    At a ``speed`` of 1 the events arrive at their recorded pace, measured
+    by the runtime clock, so a ``SimulatedClock`` replays a long session in
+    a fraction of its duration. Without a speed, events are replayed as
+    fast as possible, with the replay position as virtual time: they
+    are handed out strictly in recorded order, and inputs wait for the
+    cortex to consume each recorded LLM response before they get the
+    events recorded after it, so every replay interleaves inputs and ticks
+    the same way.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        speed: T.Optional[float] = 1.0,
+        llm_timeout: float = 10.0,
+    ):
+        """
+        Load a session recording.
+
+        Parameters
+        ----------
+        directory : str
+            Directory of the session recording.
+        speed : float, optional
+            Playback rate relative to the recording; None or 0 replays as
+            fast as possible.
+        llm_timeout : float
+            Seconds inputs wait for the cortex to ask for a recorded LLM
+            response when replaying as fast as possible, before skipping it.
+        """
+        self.directory = directory
+        self.speed = speed or None
+        self.llm_timeout = llm_timeout
+        self.mismatched_prompts = 0
+        self.delivered = 0
+
+        self.records: T.List[T.Tuple[float, str, T.Any]] = []
+        for path in sorted(glob.glob(os.path.join(directory, "session_*.om1rec"))):
+            for channel, timestamp, value in read_recording(path):
+                self.records.append((timestamp, channel, value))
+        # Stable, so records of the same timestamp keep their order
+        self.records.sort(key=lambda record: record[0])
+        if not self.records:
+            raise ValueError(f"No session recording found in {directory}")
+
+        self._pending: T.Dict[str, T.Deque[int]] = defaultdict(deque)
+        for i, (_, channel, _) in enumerate(self.records):
+            self._pending[channel].append(i)
+
+        self._position = 0
+        self._attached: T.Dict[str, int] = defaultdict(int)
+        self._attached[LLM_CHANNEL] = 1
+        self._changed = asyncio.Event()
+        self._started: T.Optional[float] = None
+        self._now = self.records[0][0]
+
+    @property
+    def start_time(self) -> float:
+        """
+        Get the time of the first record.
+
+        Returns
+        -------
+        float
+            Unix time of the start of the recorded session.
+        """
+        return self.records[0][0]
+
+    @property
+    def now(self) -> float:
+        """
+        Get the current time of the replayed session.
+
+        Returns
+        -------
+        float
+            Recorded Unix time of the replay position.
+        """
+        if self.speed is None or self._started is None:
+            return self._now
+        elapsed = get_clock().monotonic() - self._started
+        return self.start_time + elapsed * self.speed
+
+    @property
+    def done(self) -> bool:
+        """
+        Check whether every record the runtime consumes was replayed.
+
+        Returns
+        -------
+        bool
+            True once the replay started and no consumed channel has
+            records left.
+        """
+        return self._started is not None and not any(
+            pending
+            for channel, pending in self._pending.items()
+            if self._attached[channel] > 0
+        )
+
+    def channels(self) -> T.List[str]:
+        """
+        Get the channels of the recording.
+
+        Returns
+        -------
+        List[str]
+            The channel names.
+        """
+        return sorted({channel for _, channel, _ in self.records})
+
+    def attach(self, channels: T.Iterable[str]):
+        """
+        Declare that the runtime consumes channels.
+
+        Records of channels nobody consumes, e.g. inputs of another mode,
+        are skipped instead of holding up the replay.
+
+        Parameters
+        ----------
+        channels : Iterable[str]
+            The channels.
+        """
+        for channel in channels:
+            self._attached[channel] += 1
+        self._wake()
+
+    def detach(self, channels: T.Iterable[str]):
+        """
+        Declare that the runtime stopped consuming channels.
+
+        Parameters
+        ----------
+        channels : Iterable[str]
+            Channels passed to ``attach``.
+        """
+        for channel in channels:
+            self._attached[channel] -= 1
+        self._wake()
+
+    def _wake(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _skip_detached(self):
+        while self._position < len(self.records):
+            _, channel, _ = self.records[self._position]
+            if self._attached[channel] > 0:
+                return
+            self._pending[channel].popleft()
+            self._position += 1
+
+    async def next(self, channel: str) -> T.Optional[T.Tuple[float, T.Any]]:
+        """
+        Wait for the next record of a channel.
+
+        Parameters
+        ----------
+        channel : str
+            The channel.
+
+        Returns
+        -------
+        Tuple[float, Any] or None
+            Recorded time and value, or None at the end of the channel.
+        """
+        clock = get_clock()
+        if self._started is None:
+            self._started = clock.monotonic()
+        pending = self._pending[channel]
+
+        if self.speed is not None:
+            if not pending:
+                return None
+            index = pending.popleft()
+            timestamp, _, value = self.records[index]
+            due = self._started + (timestamp - self.start_time) / self.speed
+            if due > clock.monotonic():
+                await clock.sleep_async(due - clock.monotonic())
+            self.delivered += 1
+            return timestamp, value
+
+        while True:
+            self._skip_detached()
+            if not pending:
+                return None
+            if pending[0] == self._position:
+                break
+            changed = self._changed.wait()
+            if self.records[self._position][1] != LLM_CHANNEL:
+                await changed
+                continue
+            try:
+                await asyncio.wait_for(changed, self.llm_timeout)
+            except asyncio.TimeoutError:
+                if self.records[self._position][1] == LLM_CHANNEL:
+                    logging.warning(
+                        "Replay skipped an LLM response the runtime did not ask for"
+                    )
+                    self._pending[LLM_CHANNEL].popleft()
+                    self._position += 1
+
+        pending.popleft()
+        timestamp, _, value = self.records[self._position]
+        self._position += 1
+        self.delivered += 1
+        self._now = timestamp
+        self._wake()
+        return timestamp, value
+
+    async def events(self, name: str, text: bool = False) -> T.AsyncIterator[T.Any]:
+        """
+        Replay the raw events of an input.
+
+        Parameters
+        ----------
+        name : str
+            Name of the input.
+        text : bool
+            Replay the text the input handed to the fuser instead.
+
+        Yields
+        ------
+        Any
+            The recorded raw events, until the recording ends.
+        """
+        channel = text_channel(name) if text else input_channel(name)
+        while True:
+            record = await self.next(channel)
+            if record is None:
+                logging.info(f"Replay of input {name} finished")
+                return
+            yield _decode_event(record[1])
+
+    async def wait_done(self, poll_interval: float = 0.1):
+        """
+        Wait for the end of the recording.
+
+        Once only LLM responses are left, the wait also ends when the
+        runtime stops asking for them for ``llm_timeout`` seconds.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds between checks.
+        """
+        loop = asyncio.get_running_loop()
+        delivered, progress = self.delivered, loop.time()
+        while not self.done:
+            await asyncio.sleep(poll_interval)
+            if self.delivered != delivered:
+                delivered, progress = self.delivered, loop.time()
+            only_llm = not any(
+                pending
+                for channel, pending in self._pending.items()
+                if channel != LLM_CHANNEL
+            )
+            if only_llm and loop.time() - progress > self.llm_timeout:
+                logging.warning(
+                    f"Replay ended with {len(self._pending[LLM_CHANNEL])} "
+                    "LLM responses the runtime did not ask for"
+                )
+                return
+
+    def wrap_llm(self, llm: LLM) -> LLM:
+        """
+        Replace the cortex LLM with the recorded responses.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM; it is never asked.
+
+        Returns
+        -------
+        LLM
+            The replaying wrapper.
+        """
+        return ReplayLLM(llm, self)
+
+
+class ReplayInput(FuserInput[SensorConfig, str]):
+    """
+    Inert stand-in for a configured input during a replay.
+
+    It is never polled; the ``InputOrchestrator`` hands it the recorded text
+    of the input it replaces, which it passes on to the fuser unchanged.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the stand-in.
+
+        Parameters
+        ----------
+        name : str
+            Plugin class of the replaced input, e.g. "VLMOpenAI".
+        """
+        super().__init__(SensorConfig())
+        self.name = name
+        self.text: T.Optional[str] = None
+
+    async def raw_to_text(self, raw_input: T.Optional[str]):
+        """
+        Keep the latest recorded text.
+
+        Parameters
+        ----------
+        raw_input : str, optional
+            The recorded text.
+        """
+        if raw_input is not None:
+            self.text = raw_input
+
+    def formatted_latest_buffer(self) -> T.Optional[str]:
+        """
+        Hand the latest recorded text to the fuser once.
+
+        Returns
+        -------
+        str or None
+            The text, or None if none arrived since the last call.
+        """
+        text, self.text = self.text, None
+        return text
+
+
+class ReplayLLM(_LLMWrapper):
+    """
+    LLM wrapper that answers with the responses of a recorded session.
+    """
+
+    def __init__(self, llm: LLM, replay: SessionReplay):
+        """
+        Wrap an LLM.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM; it is never asked.
+        replay : SessionReplay
+            Provides the responses.
+        """
+        super().__init__(llm)
+        self.replay = replay
+
+    async def ask(
+        self, prompt: str, messages: T.List[T.Dict[str, str]] = []
+    ) -> T.Optional[CortexOutputModel]:
+        """
+        Answer with the next recorded response.
+
+        Responses are replayed in order. A prompt that differs from the
+        recorded one means the replay diverged from the session, which is
+        logged and counted in ``SessionReplay.mismatched_prompts``.
+
+        Parameters
+        ----------
+        prompt : str
+            Input text to send to the model
+        messages : List[Dict[str, str]]
+            List of message dictionaries to send to the model.
+
+        Returns
+        -------
+        CortexOutputModel or None
+            The recorded response, None after the last one.
+        """
+        record = await self.replay.next(LLM_CHANNEL)
+        if record is None:
+            logging.warning("Replay has no more LLM responses")
+            return None
+
+        _, value = record
+        if value["prompt"] != prompt:
+            self.replay.mismatched_prompts += 1
+            logging.warning("Replayed prompt differs from the recorded prompt")
+        if value["output"] is None:
+            return None
+        return CortexOutputModel.model_validate(value["output"])
+
+
+async def run_replay(runtime: T.Any, replay: SessionReplay, settle: float = 1.0):
+    """
+    Run a runtime until a replay ends.
+
+    Parameters
+    ----------
+    runtime : ModeCortexRuntime
+        A runtime created with the replay.
+    replay : SessionReplay
+        The replay.
+    settle : float
+        Seconds the runtime keeps running after the last record, so the
+        actions of the last response are executed.
+    """
+    run_task = asyncio.create_task(runtime.run())
+    done_task = asyncio.create_task(replay.wait_done())
+    await asyncio.wait({run_task, done_task}, return_when=asyncio.FIRST_COMPLETED)
+    if not run_task.done():
+        await asyncio.sleep(settle)
+        runtime.stop()
+    done_task.cancel()
+    await run_task
+    logging.info(
+        f"Replayed {replay.delivered} of {len(replay.records)} records, "
+        f"{replay.mismatched_prompts} prompts differed from the recording"
+    )
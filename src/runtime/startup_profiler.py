@@ -0,0 +1,332 @@
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ImportNode:
+    """
+    One module in the import-time tree.
+
+    Parameters
+    ----------
+    name : str
+        The fully qualified module name.
+    cumulative : float
+        Seconds spent executing the module, including nested imports.
+    children : List[ImportNode]
+        Modules imported while this module was executing.
+    """
+
+    name: str
+    cumulative: float = 0.0
+    children: List["ImportNode"] = field(default_factory=list)
+
+    @property
+    def self_time(self) -> float:
+        """
+        Get the seconds spent in this module, excluding nested imports.
+
+        Returns
+        -------
+        float
+            The self time in seconds.
+        """
+        return max(0.0, self.cumulative - sum(c.cumulative for c in self.children))
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """
+    Loader wrapper that times exec_module and restores the original loader.
+    """
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        """
+        Delegate module creation to the wrapped loader.
+        """
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """
+        Execute the module with the wrapped loader and record the time spent.
+        """
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler._measure(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str):
+        """
+        Forward everything else to the wrapped loader.
+        """
+        return getattr(self._loader, name)
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that wraps the loaders of the other finders.
+    """
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Find the spec with the remaining finders and wrap its loader.
+        """
+        if getattr(self._local, "busy", False):
+            return None
+
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+def _process_age() -> Optional[float]:
+    """
+    Get the seconds since the current process was started, on Linux.
+
+    Returns
+    -------
+    float or None
+        The process age, or None if it cannot be determined.
+    """
+    try:
+        with open("/proc/self/stat", "r") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        start_ticks = int(fields[19])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+
+
+class StartupProfiler:
+    """
+    Records an import-time tree and startup milestones for `om1 start`.
+
+    Imports are timed through a meta path finder, so only modules imported
+    after the profiler is started are measured. Milestones such as the first
+    cortex tick are recorded relative to the profiler start; the age of the
+    process at that point is reported separately.
+    """
+
+    def __init__(self):
+        """
+        Initialize the profiler.
+        """
+        self.root = ImportNode("<startup>")
+        self.marks: Dict[str, float] = {}
+
+        self._finder = _ImportTimingFinder(self)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_at = time.perf_counter()
+        self._process_age = _process_age()
+        self._running = False
+
+    def start(self):
+        """
+        Begin timing imports.
+        """
+        if self._running:
+            return
+        self._started_at = time.perf_counter()
+        self._process_age = _process_age()
+        sys.meta_path.insert(0, self._finder)
+        self._running = True
+
+    def stop(self):
+        """
+        Stop timing imports.
+        """
+        if not self._running:
+            return
+        try:
+            sys.meta_path.remove(self._finder)
+        except ValueError:
+            pass
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether imports are being timed.
+
+        Returns
+        -------
+        bool
+            True if the profiler is started.
+        """
+        return self._running
+
+    def _stack(self) -> List[ImportNode]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = [self.root]
+            self._local.stack = stack
+        return stack
+
+    @contextmanager
+    def _measure(self, name: str):
+        stack = self._stack()
+        node = ImportNode(name)
+        with self._lock:
+            stack[-1].children.append(node)
+        stack.append(node)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.cumulative = time.perf_counter() - start
+            stack.pop()
+
+    def mark(self, event: str) -> bool:
+        """
+        Record a startup milestone the first time it happens.
+
+        Parameters
+        ----------
+        event : str
+            The milestone name, e.g. "config_loaded" or "first_tick".
+
+        Returns
+        -------
+        bool
+            True if this call recorded the milestone.
+        """
+        with self._lock:
+            if event in self.marks:
+                return False
+            self.marks[event] = time.perf_counter() - self._started_at
+            return True
+
+    def import_time(self) -> float:
+        """
+        Get the total seconds spent in top-level imports.
+
+        Returns
+        -------
+        float
+            The sum of the cumulative time of the root's children.
+        """
+        return sum(child.cumulative for child in self.root.children)
+
+    def report(self, threshold_ms: float = 5.0, max_depth: int = 6) -> str:
+        """
+        Format the import-time tree and the startup milestones.
+
+        Parameters
+        ----------
+        threshold_ms : float
+            Modules with a cumulative time below this are left out.
+        max_depth : int
+            Maximum depth of the tree to print.
+
+        Returns
+        -------
+        str
+            A human readable report.
+        """
+        lines = ["Startup profile", "cumulative ms |    self ms | module"]
+
+        def walk(node: ImportNode, depth: int):
+            if depth > max_depth:
+                return
+            for child in sorted(node.children, key=lambda c: -c.cumulative):
+                if child.cumulative * 1000 < threshold_ms:
+                    continue
+                lines.append(
+                    f"{child.cumulative * 1000:13.1f} | {child.self_time * 1000:10.1f} | "
+                    f"{'  ' * depth}{child.name}"
+                )
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+
+        lines.append(f"imports total: {self.import_time() * 1000:.1f} ms")
+        for event, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"{event}: {elapsed * 1000:.1f} ms after profiler start")
+        if self._process_age is not None:
+            lines.append(
+                f"process age at profiler start: {self._process_age * 1000:.0f} ms"
+            )
+        return "\n".join(lines)
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def enable_startup_profiling() -> StartupProfiler:
+    """
+    Start the process-wide startup profiler.
+
+    Returns
+    -------
+    StartupProfiler
+        The running profiler.
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    _profiler.start()
+    return _profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """
+    Get the process-wide startup profiler.
+
+    Returns
+    -------
+    StartupProfiler or None
+        The profiler, or None if startup profiling is not enabled.
+    """
+    return _profiler
+
+
+def mark_startup(event: str):
+    """
+    Record a startup milestone, if startup profiling is enabled.
+
+    Reaching the "first_tick" milestone stops import timing and logs the
+    report.
+
+    Parameters
+    ----------
+    event : str
+        The milestone name.
+    """
+    profiler = _profiler
+    if profiler is None or not profiler.mark(event):
+        return
+    if event == "first_tick":
+        profiler.stop()
+        logging.info(profiler.report())
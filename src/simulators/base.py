@@ -1,10 +1,10 @@
 import threading
-import time
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from llm.output_model import Action
+from providers.clock import get_clock
 
 
 class SimulatorConfig(BaseModel):
@@ -63,6 +63,8 @@ class Simulator:
         """
         Sleep for the specified duration, but wake immediately if stop signal is received.
 
+        The duration is measured by the runtime clock, see providers.clock.
+
         Parameters
         ----------
         duration : float
@@ -73,11 +75,12 @@ class Simulator:
         bool
             True if sleep completed normally, False if interrupted by stop signal
         """
+        clock = get_clock()
         if self._stop_event is None:
-            time.sleep(duration)
+            clock.sleep(duration)
             return True
 
-        was_stopped = self._stop_event.wait(timeout=duration)
+        was_stopped = clock.wait(self._stop_event, duration)
 
         return not was_stopped
 
@@ -2,17 +2,18 @@ import asyncio
 import logging
 import os
 import threading
-import time
 from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional
 
 import uvicorn
 from fastapi import FastAPI, WebSocket
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from llm.output_model import Action
+from providers.clock import get_clock
 from providers.io_provider import Input, IOProvider
+from providers.trace_provider import TraceProvider
 from simulators.base import Simulator, SimulatorConfig
 
 
@@ -53,10 +54,11 @@ class WebSim(Simulator):
         super().__init__(config)
         self.messages: list[str] = []
         self.io_provider = IOProvider()
+        self.trace_provider = TraceProvider()
 
         self._initialized = False
         self._lock = threading.Lock()
-        self._last_tick = time.time()
+        self._last_tick = get_clock().time()
         self._tick_interval = 0.1  # 100ms tick rate
 
         self.state_dict = {}
@@ -473,6 +475,15 @@ class WebSim(Simulator):
             """
             )
 
+        @self.app.get("/trace")
+        async def get_trace():
+            # Chrome trace JSON; open it in chrome://tracing or ui.perfetto.dev
+            return JSONResponse(self.trace_provider.chrome_trace())
+
+        @self.app.get("/trace/summary")
+        async def get_trace_summary():
+            return JSONResponse(self.trace_provider.summary())
+
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
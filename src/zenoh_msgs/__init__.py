@@ -1,4 +1,4 @@
-from . import session
+from . import numpy_cdr, session
 from .idl import (
     IMU,
     Accel,
@@ -66,7 +66,14 @@ from .idl import (
     status_msgs,
     std_msgs,
 )
-from .session import create_zenoh_config, open_zenoh_session
+from .numpy_cdr import deserialize_numpy, serialize_numpy
+from .session import (
+    ZenohSessionLease,
+    ZenohSessionPool,
+    create_zenoh_config,
+    get_zenoh_session_pool,
+    open_zenoh_session,
+)
 
 __all__ = [
     # std_msgs
@@ -136,8 +143,15 @@ __all__ = [
     "Paths",
     # session
     "create_zenoh_config",
+    "get_zenoh_session_pool",
     "open_zenoh_session",
+    "ZenohSessionLease",
+    "ZenohSessionPool",
+    # numpy_cdr
+    "deserialize_numpy",
+    "serialize_numpy",
     # modules
+    "numpy_cdr",
     "session",
     # idl submodules
     "std_msgs",
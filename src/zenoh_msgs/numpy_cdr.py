@@ -0,0 +1,248 @@
+import struct
+import typing as T
+
+import numpy as np
+
+from .idl import sensor_msgs, std_msgs
+
+# CDR encapsulation header; bit 0 of the second byte selects little endian
+_ENCAPSULATION_LE = b"\x00\x01\x00\x00"
+_ENCAPSULATION_LEN = 4
+
+# Field kinds besides struct format characters of scalars
+_HEADER = "header"
+_STRING = "string"
+_FIELDS = "fields"
+
+
+class _Sequence(T.NamedTuple):
+    """
+    Sequence field decoded as a NumPy array of ``(count,) + shape``.
+    """
+
+    dtype: str
+    shape: T.Tuple[int, ...] = ()
+
+
+# Field layouts of the messages with bulky sequences, in IDL order
+_LAYOUTS: T.Dict[type, T.Tuple[T.Tuple[str, T.Any], ...]] = {
+    sensor_msgs.Image: (
+        ("header", _HEADER),
+        ("height", "I"),
+        ("width", "I"),
+        ("encoding", _STRING),
+        ("is_bigendian", "B"),
+        ("step", "I"),
+        ("data", _Sequence("u1")),
+    ),
+    sensor_msgs.PointCloud: (
+        ("header", _HEADER),
+        ("points", _Sequence("f4", (3,))),
+        ("channels", _FIELDS),
+    ),
+    sensor_msgs.PointCloud2: (
+        ("header", _HEADER),
+        ("height", "I"),
+        ("width", "I"),
+        ("fields", _FIELDS),
+        ("is_bigendian", "?"),
+        ("point_step", "I"),
+        ("row_step", "I"),
+        ("data", _Sequence("u1")),
+        ("is_dense", "?"),
+    ),
+    sensor_msgs.LaserScan: (
+        ("header", _HEADER),
+        ("angle_min", "f"),
+        ("angle_max", "f"),
+        ("angle_increment", "f"),
+        ("time_increment", "f"),
+        ("scan_time", "f"),
+        ("range_min", "f"),
+        ("range_max", "f"),
+        ("ranges", _Sequence("f4")),
+        ("intensities", _Sequence("f4")),
+    ),
+}
+
+M = T.TypeVar("M")
+
+
+class _Reader:
+    """
+    Sequential CDR reader over a payload buffer.
+    """
+
+    def __init__(self, payload: T.Union[bytes, bytearray, memoryview]):
+        self.buffer = memoryview(payload).cast("B")
+        if len(self.buffer) < _ENCAPSULATION_LEN:
+            raise ValueError("CDR payload is shorter than its header")
+        self.order = "<" if self.buffer[1] & 1 else ">"
+        self.position = _ENCAPSULATION_LEN
+
+    def align(self, size: int):
+        # Alignment is relative to the end of the encapsulation header
+        self.position += -(self.position - _ENCAPSULATION_LEN) % size
+
+    def scalar(self, code: str) -> T.Any:
+        size = struct.calcsize(code)
+        self.align(size)
+        (value,) = struct.unpack_from(self.order + code, self.buffer, self.position)
+        self.position += size
+        return value
+
+    def string(self) -> str:
+        length = self.scalar("I")
+        end = self.position + length
+        if length == 0 or end > len(self.buffer):
+            raise ValueError("Invalid CDR string length")
+        value = bytes(self.buffer[self.position : end - 1]).decode("utf-8")
+        self.position = end
+        return value
+
+    def sequence(self, field: _Sequence) -> np.ndarray:
+        count = self.scalar("I")
+        dtype = np.dtype(field.dtype).newbyteorder(self.order)
+        self.align(dtype.alignment)
+        items = count * int(np.prod(field.shape, dtype=np.int64))
+        array = np.frombuffer(
+            self.buffer, dtype=dtype, count=items, offset=self.position
+        )
+        self.position += array.nbytes
+        return array.reshape((count,) + field.shape)
+
+
+class _Writer:
+    """
+    Sequential little-endian CDR writer.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray(_ENCAPSULATION_LE)
+
+    def align(self, size: int):
+        self.buffer += bytes(-(len(self.buffer) - _ENCAPSULATION_LEN) % size)
+
+    def scalar(self, code: str, value: T.Any):
+        self.align(struct.calcsize(code))
+        self.buffer += struct.pack("<" + code, value)
+
+    def string(self, value: str):
+        encoded = value.encode("utf-8") + b"\x00"
+        self.scalar("I", len(encoded))
+        self.buffer += encoded
+
+    def sequence(self, field: _Sequence, value: T.Any):
+        dtype = np.dtype(field.dtype).newbyteorder("<")
+        array = np.ascontiguousarray(value, dtype=dtype).reshape((-1,) + field.shape)
+        self.scalar("I", len(array))
+        self.align(dtype.alignment)
+        self.buffer += array.data
+
+
+def _read_header(reader: _Reader) -> std_msgs.Header:
+    stamp = std_msgs.Time(sec=reader.scalar("i"), nanosec=reader.scalar("I"))
+    return std_msgs.Header(stamp=stamp, frame_id=reader.string())
+
+
+def _read_fields(reader: _Reader) -> T.List[sensor_msgs.PointField]:
+    return [
+        sensor_msgs.PointField(
+            name=reader.string(),
+            offset=reader.scalar("I"),
+            datatype=reader.scalar("B"),
+            count=reader.scalar("I"),
+        )
+        for _ in range(reader.scalar("I"))
+    ]
+
+
+def deserialize_numpy(message_type: T.Type[M], payload: T.Any) -> M:
+    """
+    Deserialize a message, decoding its bulky sequences as NumPy views.
+
+    The header and scalar fields are decoded into the usual objects, while
+    sequence fields such as ``Image.data``, ``PointCloud.points`` or
+    ``LaserScan.ranges`` become read-only arrays over the payload buffer
+    instead of Python lists built element by element. Supported types are
+    ``Image``, ``PointCloud``, ``PointCloud2`` and ``LaserScan``.
+
+    Parameters
+    ----------
+    message_type : Type[M]
+        The message class, e.g. ``sensor_msgs.PointCloud``.
+    payload : bytes-like
+        The CDR payload, e.g. ``sample.payload.to_bytes()``. The returned
+        arrays keep it alive.
+
+    Returns
+    -------
+    M
+        The message. ``PointCloud.points`` is an (n, 3) float32 array of x, y
+        and z; the other sequences are flat arrays.
+
+    Raises
+    ------
+    ValueError
+        If the payload is truncated or malformed.
+    """
+    layout = _LAYOUTS[message_type]
+    reader = _Reader(payload)
+    values: T.Dict[str, T.Any] = {}
+    try:
+        for name, kind in layout:
+            if kind == _HEADER:
+                values[name] = _read_header(reader)
+            elif kind == _STRING:
+                values[name] = reader.string()
+            elif kind == _FIELDS:
+                values[name] = _read_fields(reader)
+            elif isinstance(kind, _Sequence):
+                values[name] = reader.sequence(kind)
+            else:
+                values[name] = reader.scalar(kind)
+    except struct.error as e:
+        raise ValueError(f"Truncated {message_type.__name__} payload: {e}") from e
+    return message_type(**values)
+
+
+def serialize_numpy(message: T.Any) -> bytes:
+    """
+    Serialize a message whose bulky sequences may be NumPy arrays.
+
+    The counterpart of ``deserialize_numpy``: sequences are written with a
+    single buffer copy, and the result can be decoded by ``pycdr2``.
+
+    Parameters
+    ----------
+    message : Any
+        An ``Image``, ``PointCloud``, ``PointCloud2`` or ``LaserScan``.
+        Sequences may be arrays or lists of numbers.
+
+    Returns
+    -------
+    bytes
+        The little-endian CDR payload.
+    """
+    layout = _LAYOUTS[type(message)]
+    writer = _Writer()
+    for name, kind in layout:
+        value = getattr(message, name)
+        if kind == _HEADER:
+            writer.scalar("i", value.stamp.sec)
+            writer.scalar("I", value.stamp.nanosec)
+            writer.string(value.frame_id)
+        elif kind == _STRING:
+            writer.string(value)
+        elif kind == _FIELDS:
+            writer.scalar("I", len(value))
+            for field in value:
+                writer.string(field.name)
+                writer.scalar("I", field.offset)
+                writer.scalar("B", field.datatype)
+                writer.scalar("I", field.count)
+        elif isinstance(kind, _Sequence):
+            writer.sequence(kind, value)
+        else:
+            writer.scalar(kind, value)
+    return bytes(writer.buffer)
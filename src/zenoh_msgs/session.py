@@ -1,4 +1,7 @@
 import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import zenoh
 
@@ -27,9 +30,9 @@ def create_zenoh_config(network_discovery: bool = True) -> zenoh.Config:
     return config
 
 
-def open_zenoh_session() -> zenoh.Session:
+def _connect_zenoh_session() -> zenoh.Session:
     """
-    Open a Zenoh session with a local connection first, then fall back to network discovery.
+    Open a new Zenoh session with a local connection first, then fall back to network discovery.
 
     Returns
     -------
@@ -59,6 +62,451 @@ def open_zenoh_session() -> zenoh.Session:
         raise Exception("Failed to open Zenoh session") from e
 
 
+class _SubscriberFanout:
+    """
+    A single Zenoh subscriber that dispatches each sample to several callbacks.
+    """
+
+    def __init__(self, session: zenoh.Session, key_expr: str):
+        """
+        Declare the underlying subscriber.
+
+        Parameters
+        ----------
+        session : zenoh.Session
+            The shared Zenoh session.
+        key_expr : str
+            The key expression to subscribe to.
+        """
+        self.key_expr = key_expr
+        self.handlers: Tuple[Callable[[zenoh.Sample], Any], ...] = ()
+        self.subscriber = session.declare_subscriber(key_expr, self._dispatch)
+
+    def _dispatch(self, sample: zenoh.Sample):
+        """
+        Forward a sample to every registered callback.
+
+        Parameters
+        ----------
+        sample : zenoh.Sample
+            The received sample.
+        """
+        for handler in self.handlers:
+            try:
+                handler(sample)
+            except Exception as e:
+                logging.error(f"Error in Zenoh handler for {self.key_expr}: {e}")
+
+    def undeclare(self):
+        """
+        Undeclare the underlying subscriber.
+        """
+        self.handlers = ()
+        try:
+            self.subscriber.undeclare()
+        except Exception as e:
+            logging.warning(f"Error undeclaring subscriber {self.key_expr}: {e}")
+
+
+class ZenohSubscription:
+    """
+    Handle for one callback registered on a shared subscriber.
+    """
+
+    def __init__(
+        self,
+        pool: "ZenohSessionPool",
+        key_expr: str,
+        handler: Callable[[zenoh.Sample], Any],
+    ):
+        """
+        Initialize the subscription handle.
+
+        Parameters
+        ----------
+        pool : ZenohSessionPool
+            The pool owning the shared subscriber.
+        key_expr : str
+            The key expression subscribed to.
+        handler : Callable[[zenoh.Sample], Any]
+            The registered callback.
+        """
+        self._pool = pool
+        self.key_expr = key_expr
+        self.handler = handler
+        self._active = True
+
+    def undeclare(self):
+        """
+        Remove the callback; the shared subscriber is undeclared with its last callback.
+        """
+        if self._active:
+            self._active = False
+            self._pool._remove_handler(self.key_expr, self.handler)
+
+
+class ZenohPublisher:
+    """
+    Reference-counted handle for a publisher cached by topic.
+    """
+
+    def __init__(self, pool: "ZenohSessionPool", key: Tuple, publisher: Any):
+        """
+        Initialize the publisher handle.
+
+        Parameters
+        ----------
+        pool : ZenohSessionPool
+            The pool owning the cached publisher.
+        key : Tuple
+            The cache key of the publisher.
+        publisher : zenoh.Publisher
+            The cached Zenoh publisher.
+        """
+        self._pool = pool
+        self._key = key
+        self._publisher = publisher
+        self._active = True
+
+    def put(self, payload: Any, **kwargs):
+        """
+        Publish a payload on the topic.
+
+        Parameters
+        ----------
+        payload : Any
+            The payload to publish.
+        **kwargs
+            Additional arguments for zenoh.Publisher.put.
+        """
+        return self._publisher.put(payload, **kwargs)
+
+    def undeclare(self):
+        """
+        Release the publisher; it is undeclared when its last user releases it.
+        """
+        if self._active:
+            self._active = False
+            self._pool._release_publisher(self._key)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward any other attribute to the underlying publisher.
+        """
+        return getattr(self._publisher, name)
+
+
+class ZenohSessionLease:
+    """
+    A reference to the process-wide shared Zenoh session.
+
+    The lease behaves like a zenoh.Session. Subscribers on the same key
+    expression share one underlying subscriber and publishers are cached by
+    topic. Closing the lease releases everything it declared; the session
+    itself is closed once the last lease is closed.
+    """
+
+    def __init__(self, pool: "ZenohSessionPool", session: zenoh.Session):
+        """
+        Initialize the lease.
+
+        Parameters
+        ----------
+        pool : ZenohSessionPool
+            The pool that handed out the lease.
+        session : zenoh.Session
+            The shared Zenoh session.
+        """
+        self._pool = pool
+        self._session = session
+        self._declared: List[Any] = []
+        self._closed = False
+
+    def declare_subscriber(self, key_expr: Any, handler: Any = None, **kwargs) -> Any:
+        """
+        Declare a subscriber on the shared session.
+
+        Parameters
+        ----------
+        key_expr : Any
+            The key expression to subscribe to.
+        handler : Any
+            The callback for received samples. Channel handlers and extra
+            arguments bypass the fan-out and get a dedicated subscriber.
+        **kwargs
+            Additional arguments for zenoh.Session.declare_subscriber.
+
+        Returns
+        -------
+        Any
+            A ZenohSubscription, or a zenoh.Subscriber for non-callback handlers.
+        """
+        if handler is None:
+            subscriber = self._session.declare_subscriber(key_expr, **kwargs)
+        elif not callable(handler) or kwargs:
+            subscriber = self._session.declare_subscriber(key_expr, handler, **kwargs)
+        else:
+            subscriber = self._pool._add_handler(str(key_expr), handler)
+        self._declared.append(subscriber)
+        return subscriber
+
+    def declare_publisher(self, key_expr: Any, **kwargs) -> ZenohPublisher:
+        """
+        Get the cached publisher for a topic, declaring it on first use.
+
+        Parameters
+        ----------
+        key_expr : Any
+            The key expression to publish on.
+        **kwargs
+            Additional arguments for zenoh.Session.declare_publisher.
+
+        Returns
+        -------
+        ZenohPublisher
+            A handle to the shared publisher.
+        """
+        publisher = self._pool._acquire_publisher(str(key_expr), kwargs)
+        self._declared.append(publisher)
+        return publisher
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Whether this lease has been closed.
+
+        Returns
+        -------
+        bool
+            True if the lease has been closed.
+        """
+        return self._closed
+
+    def close(self):
+        """
+        Undeclare everything declared through this lease and release the session.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        for declared in self._declared:
+            try:
+                declared.undeclare()
+            except Exception as e:
+                logging.warning(f"Error undeclaring Zenoh entity: {e}")
+        self._declared.clear()
+
+        self._pool._release(self._session)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward any other attribute to the shared zenoh.Session.
+        """
+        return getattr(self._session, name)
+
+
+class ZenohSessionPool:
+    """
+    Process-wide registry that shares one reference-counted Zenoh session.
+    """
+
+    def __init__(self, connect: Optional[Callable[[], zenoh.Session]] = None):
+        """
+        Initialize the pool.
+
+        Parameters
+        ----------
+        connect : Optional[Callable[[], zenoh.Session]]
+            Function used to open the underlying session.
+        """
+        self._connect = connect
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._session: Optional[zenoh.Session] = None
+        self._refcount = 0
+        self._fanouts: Dict[str, _SubscriberFanout] = {}
+        self._publishers: Dict[Tuple, Tuple[Any, int]] = {}
+
+    def _reset_after_fork(self):
+        """
+        Forget the parent's session in a forked child process.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.RLock()
+            self._session = None
+            self._refcount = 0
+            self._fanouts = {}
+            self._publishers = {}
+
+    def acquire(self) -> ZenohSessionLease:
+        """
+        Get a lease on the shared session, opening it on first use.
+
+        Returns
+        -------
+        ZenohSessionLease
+            A lease on the shared Zenoh session.
+
+        Raises
+        ------
+        Exception
+            If unable to open a Zenoh session.
+        """
+        self._reset_after_fork()
+        with self._lock:
+            if self._session is None:
+                connect = self._connect or _connect_zenoh_session
+                self._session = connect()
+                self._refcount = 0
+            self._refcount += 1
+            logging.debug(f"Zenoh session pool: {self._refcount} active leases")
+            return ZenohSessionLease(self, self._session)
+
+    def _release(self, session: zenoh.Session):
+        with self._lock:
+            if session is not self._session:
+                return
+            self._refcount -= 1
+            if self._refcount > 0:
+                return
+
+            fanouts = list(self._fanouts.values())
+            self._fanouts.clear()
+            self._publishers.clear()
+            self._session = None
+
+        # Undeclaring waits for running callbacks, which may use the pool
+        for fanout in fanouts:
+            fanout.undeclare()
+        try:
+            session.close()
+            logging.info("Shared Zenoh session closed")
+        except Exception as e:
+            logging.warning(f"Error closing shared Zenoh session: {e}")
+
+    def _add_handler(
+        self, key_expr: str, handler: Callable[[zenoh.Sample], Any]
+    ) -> ZenohSubscription:
+        with self._lock:
+            fanout = self._fanouts.get(key_expr)
+            if fanout is None:
+                fanout = _SubscriberFanout(cast(zenoh.Session, self._session), key_expr)
+                self._fanouts[key_expr] = fanout
+            fanout.handlers = fanout.handlers + (handler,)
+        return ZenohSubscription(self, key_expr, handler)
+
+    def _remove_handler(self, key_expr: str, handler: Callable[[zenoh.Sample], Any]):
+        with self._lock:
+            fanout = self._fanouts.get(key_expr)
+            if fanout is None:
+                return
+            handlers = list(fanout.handlers)
+            if handler in handlers:
+                handlers.remove(handler)
+            fanout.handlers = tuple(handlers)
+            if handlers:
+                return
+            del self._fanouts[key_expr]
+        # Undeclaring waits for running callbacks, which may use the pool
+        fanout.undeclare()
+
+    def _acquire_publisher(
+        self, key_expr: str, kwargs: Dict[str, Any]
+    ) -> ZenohPublisher:
+        key = (key_expr, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        with self._lock:
+            cached = self._publishers.get(key)
+            if cached is None:
+                session = cast(zenoh.Session, self._session)
+                publisher = session.declare_publisher(key_expr, **kwargs)
+                refs = 0
+            else:
+                publisher, refs = cached
+            self._publishers[key] = (publisher, refs + 1)
+        return ZenohPublisher(self, key, publisher)
+
+    def _release_publisher(self, key: Tuple):
+        with self._lock:
+            cached = self._publishers.get(key)
+            if cached is None:
+                return
+            publisher, refs = cached
+            if refs > 1:
+                self._publishers[key] = (publisher, refs - 1)
+                return
+            del self._publishers[key]
+        try:
+            publisher.undeclare()
+        except Exception as e:
+            logging.warning(f"Error undeclaring publisher {key[0]}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the current usage of the shared session.
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of active leases, shared subscribers, registered
+            callbacks and cached publishers.
+        """
+        with self._lock:
+            return {
+                "leases": self._refcount,
+                "subscribers": len(self._fanouts),
+                "callbacks": sum(len(f.handlers) for f in self._fanouts.values()),
+                "publishers": len(self._publishers),
+            }
+
+
+_session_pool = ZenohSessionPool()
+
+
+def get_zenoh_session_pool() -> ZenohSessionPool:
+    """
+    Get the process-wide Zenoh session pool.
+
+    Returns
+    -------
+    ZenohSessionPool
+        The shared session pool.
+    """
+    return _session_pool
+
+
+def open_zenoh_session(shared: bool = True) -> zenoh.Session:
+    """
+    Open a Zenoh session with a local connection first, then fall back to network discovery.
+
+    By default this returns a lease on the process-wide shared session, so
+    every component reuses one connection. Subscribers on the same key
+    expression are deduplicated and publishers are cached by topic.
+
+    Parameters
+    ----------
+    shared : bool, optional
+        Whether to use the shared session (default is True). If False, a
+        dedicated session is opened.
+
+    Returns
+    -------
+    zenoh.Session
+        The opened Zenoh session.
+
+    Raises
+    ------
+    Exception
+        If unable to open a Zenoh session.
+    """
+    if not shared:
+        return _connect_zenoh_session()
+
+    # the lease exposes the zenoh.Session API used by the runtime
+    return cast(zenoh.Session, _session_pool.acquire())
+
+
 if __name__ == "__main__":
     session = open_zenoh_session()
     if session:
@@ -12,26 +12,16 @@ from actions.remember_location.connector.unitree_go2_location import (
     UnitreeGo2RememberLocationConnector,
 )
 from actions.remember_location.interface import RememberLocationInput
+from providers.http_client import HTTPResponse
 
 
-def create_aiohttp_mock(status=200, text="OK"):
-    """Create aiohttp ClientSession mock with proper async context managers."""
-    mock_response = Mock()
-    mock_response.status = status
-    mock_response.text = AsyncMock(return_value=text)
-
-    mock_post_cm = Mock()
-    mock_post_cm.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_post_cm.__aexit__ = AsyncMock(return_value=None)
-
-    mock_session = Mock()
-    mock_session.post = Mock(return_value=mock_post_cm)
-
-    mock_session_cm = Mock()
-    mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-
-    return mock_session_cm, mock_session
+def create_http_client_mock(status=200, text="OK"):
+    """Create a shared HTTP client mock answering POSTs with a fixed response."""
+    mock_client = Mock()
+    mock_client.post_async = AsyncMock(
+        return_value=HTTPResponse(status=status, content=text.encode())
+    )
+    return mock_client
 
 
 class TestUnitreeG1RememberLocationConfig:
@@ -77,12 +67,12 @@ class TestUnitreeG1RememberLocationConnector:
     @pytest.mark.asyncio
     async def test_connect_success(self, g1_connector):
         connector, mock_tts = g1_connector
-        mock_session_cm, mock_session = create_aiohttp_mock(status=200, text="saved")
+        mock_client = create_http_client_mock(status=200, text="saved")
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_g1_location.aiohttp.ClientSession",
-                return_value=mock_session_cm,
+                "actions.remember_location.connector.unitree_g1_location.get_http_client",
+                return_value=mock_client,
             ),
             patch(
                 "actions.remember_location.connector.unitree_g1_location.logging"
@@ -91,8 +81,8 @@ class TestUnitreeG1RememberLocationConnector:
             loc_input = RememberLocationInput(action="kitchen")
             await connector.connect(loc_input)
 
-            mock_session.post.assert_called_once()
-            call_kwargs = mock_session.post.call_args[1]
+            mock_client.post_async.assert_called_once()
+            call_kwargs = mock_client.post_async.call_args[1]
             assert call_kwargs["json"]["label"] == "kitchen"
             assert call_kwargs["json"]["map_name"] == "map"
             mock_logging.info.assert_called()
@@ -103,14 +93,12 @@ class TestUnitreeG1RememberLocationConnector:
     @pytest.mark.asyncio
     async def test_connect_api_error(self, g1_connector):
         connector, mock_tts = g1_connector
-        mock_session_cm, mock_session = create_aiohttp_mock(
-            status=500, text="Internal Server Error"
-        )
+        mock_client = create_http_client_mock(status=500, text="Internal Server Error")
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_g1_location.aiohttp.ClientSession",
-                return_value=mock_session_cm,
+                "actions.remember_location.connector.unitree_g1_location.get_http_client",
+                return_value=mock_client,
             ),
             patch(
                 "actions.remember_location.connector.unitree_g1_location.logging"
@@ -142,16 +130,15 @@ class TestUnitreeG1RememberLocationConnector:
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_g1_location.aiohttp.ClientSession"
-            ) as mock_cls,
+                "actions.remember_location.connector.unitree_g1_location.get_http_client"
+            ) as mock_get_client,
             patch(
                 "actions.remember_location.connector.unitree_g1_location.logging"
             ) as mock_logging,
         ):
-            mock_cm = Mock()
-            mock_cm.__aenter__ = AsyncMock(side_effect=asyncio.TimeoutError())
-            mock_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_cls.return_value = mock_cm
+            mock_get_client.return_value.post_async = AsyncMock(
+                side_effect=asyncio.TimeoutError()
+            )
 
             loc_input = RememberLocationInput(action="garden")
             await connector.connect(loc_input)
@@ -203,12 +190,12 @@ class TestUnitreeGo2RememberLocationConnector:
     @pytest.mark.asyncio
     async def test_connect_success(self, go2_connector):
         connector, mock_tts = go2_connector
-        mock_session_cm, mock_session = create_aiohttp_mock(status=200, text="saved")
+        mock_client = create_http_client_mock(status=200, text="saved")
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_go2_location.aiohttp.ClientSession",
-                return_value=mock_session_cm,
+                "actions.remember_location.connector.unitree_go2_location.get_http_client",
+                return_value=mock_client,
             ),
             patch(
                 "actions.remember_location.connector.unitree_go2_location.logging"
@@ -217,8 +204,8 @@ class TestUnitreeGo2RememberLocationConnector:
             loc_input = RememberLocationInput(action="charging_station")
             await connector.connect(loc_input)
 
-            mock_session.post.assert_called_once()
-            call_kwargs = mock_session.post.call_args[1]
+            mock_client.post_async.assert_called_once()
+            call_kwargs = mock_client.post_async.call_args[1]
             assert call_kwargs["json"]["label"] == "charging_station"
             mock_logging.info.assert_called()
             mock_tts.add_pending_message.assert_called_once_with(
@@ -228,14 +215,12 @@ class TestUnitreeGo2RememberLocationConnector:
     @pytest.mark.asyncio
     async def test_connect_api_error(self, go2_connector):
         connector, mock_tts = go2_connector
-        mock_session_cm, mock_session = create_aiohttp_mock(
-            status=404, text="Not Found"
-        )
+        mock_client = create_http_client_mock(status=404, text="Not Found")
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_go2_location.aiohttp.ClientSession",
-                return_value=mock_session_cm,
+                "actions.remember_location.connector.unitree_go2_location.get_http_client",
+                return_value=mock_client,
             ),
             patch(
                 "actions.remember_location.connector.unitree_go2_location.logging"
@@ -265,18 +250,15 @@ class TestUnitreeGo2RememberLocationConnector:
 
         with (
             patch(
-                "actions.remember_location.connector.unitree_go2_location.aiohttp.ClientSession"
-            ) as mock_cls,
+                "actions.remember_location.connector.unitree_go2_location.get_http_client"
+            ) as mock_get_client,
             patch(
                 "actions.remember_location.connector.unitree_go2_location.logging"
             ) as mock_logging,
         ):
-            mock_cm = Mock()
-            mock_cm.__aenter__ = AsyncMock(
+            mock_get_client.return_value.post_async = AsyncMock(
                 side_effect=ConnectionError("Connection refused")
             )
-            mock_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_cls.return_value = mock_cm
 
             loc_input = RememberLocationInput(action="unknown")
             await connector.connect(loc_input)
@@ -71,22 +71,28 @@ class TestSelfieConnectorHelpers:
     """Test helper methods."""
 
     def test_post_json_success(self, connector, mock_dependencies):
-        with patch("actions.selfie.connector.selfie.requests") as mock_requests:
+        with patch(
+            "actions.selfie.connector.selfie.get_http_client"
+        ) as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_response = Mock()
             mock_response.json.return_value = {"ok": True}
-            mock_requests.post.return_value = mock_response
+            mock_client.post.return_value = mock_response
 
             result = connector._post_json("/selfie", {"id": "wendy"})
             assert result == {"ok": True}
-            mock_requests.post.assert_called_once_with(
+            mock_client.post.assert_called_once_with(
                 "http://127.0.0.1:6793/selfie",
                 json={"id": "wendy"},
                 timeout=5.0,
             )
 
     def test_post_json_failure(self, connector, mock_dependencies):
-        with patch("actions.selfie.connector.selfie.requests") as mock_requests:
-            mock_requests.post.side_effect = Exception("Connection refused")
+        with patch(
+            "actions.selfie.connector.selfie.get_http_client"
+        ) as mock_get_client:
+            mock_client = mock_get_client.return_value
+            mock_client.post.side_effect = Exception("Connection refused")
             result = connector._post_json("/selfie", {"id": "test"})
             assert result is None
 
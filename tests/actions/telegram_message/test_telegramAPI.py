@@ -7,6 +7,7 @@ from actions.telegram.connector.telegramAPI import (
     TelegramAPIConnector,
 )
 from actions.telegram.interface import Telegram, TelegramInput
+from providers.http_client import HTTPResponse
 
 
 def test_telegram_input_default():
@@ -97,58 +98,43 @@ async def test_connect_without_credentials_returns_early():
         mock_error.assert_called_with("Telegram credentials not configured")
 
 
-@pytest.mark.asyncio
-async def test_connect_logs_message(connector_with_credentials):
-    """Test that connect logs the message being sent."""
+@pytest.fixture
+def mock_http_client():
     with patch(
-        "actions.telegram.connector.telegramAPI.aiohttp.ClientSession"
-    ) as mock_session:
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"result": {"message_id": 12345}})
-
-        mock_post = AsyncMock(return_value=mock_response)
-        mock_post.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
+        "actions.telegram.connector.telegramAPI.get_http_client"
+    ) as mock_get_client:
+        client = MagicMock()
+        client.post_async = AsyncMock(
+            return_value=HTTPResponse(
+                status=200, content=b'{"result": {"message_id": 12345}}'
+            )
+        )
+        mock_get_client.return_value = client
+        yield client
 
-        mock_session_instance = MagicMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
-        mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-        mock_session_instance.__aexit__ = AsyncMock(return_value=None)
 
-        mock_session.return_value = mock_session_instance
-
-        with patch("actions.telegram.connector.telegramAPI.logging.info") as mock_info:
-            input_obj = TelegramInput(action="Test notification")
-            await connector_with_credentials.connect(input_obj)
-            mock_info.assert_any_call("SendThisToTelegram: Test notification")
+@pytest.mark.asyncio
+async def test_connect_logs_message(connector_with_credentials, mock_http_client):
+    """Test that connect logs the message being sent."""
+    with patch("actions.telegram.connector.telegramAPI.logging.info") as mock_info:
+        input_obj = TelegramInput(action="Test notification")
+        await connector_with_credentials.connect(input_obj)
+        mock_info.assert_any_call("SendThisToTelegram: Test notification")
+        mock_info.assert_any_call(
+            "Telegram message sent successfully! Message ID: 12345"
+        )
 
 
 @pytest.mark.asyncio
-async def test_connect_uses_correct_api_url(connector_with_credentials):
+async def test_connect_uses_correct_api_url(
+    connector_with_credentials, mock_http_client
+):
     """Test that connect calls correct Telegram API URL."""
-    with patch(
-        "actions.telegram.connector.telegramAPI.aiohttp.ClientSession"
-    ) as mock_session:
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"result": {"message_id": 12345}})
-
-        mock_post = AsyncMock(return_value=mock_response)
-        mock_post.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
-
-        mock_session_instance = MagicMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
-        mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-        mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-
-        mock_session.return_value = mock_session_instance
-
-        input_obj = TelegramInput(action="Test")
-        await connector_with_credentials.connect(input_obj)
-
-        mock_session_instance.post.assert_called_once()
-        call_args = mock_session_instance.post.call_args
-        assert "api.telegram.org" in call_args[0][0]
-        assert "test-bot-token" in call_args[0][0]
+    input_obj = TelegramInput(action="Test")
+    await connector_with_credentials.connect(input_obj)
+
+    mock_http_client.post_async.assert_called_once()
+    call_args = mock_http_client.post_async.call_args
+    assert "api.telegram.org" in call_args[0][0]
+    assert "test-bot-token" in call_args[0][0]
+    assert call_args.kwargs["json"]["text"] == "Test"
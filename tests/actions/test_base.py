@@ -6,6 +6,7 @@ from typing import Optional
 import pytest
 
 from actions.base import ActionConfig, ActionConnector, AgentAction, Interface
+from providers.clock import SimulatedClock, set_clock
 
 
 @dataclass
@@ -137,6 +138,24 @@ def test_sleep_interrupted_by_stop_event(test_connector):
     assert test_connector.should_stop() is True
 
 
+def test_sleep_uses_runtime_clock(test_connector):
+    """Test that sleep waits for simulated time, not real time."""
+    clock = SimulatedClock(start=0.0, autojump=0.001)
+    previous = set_clock(clock)
+    test_connector.set_stop_event(threading.Event())
+    try:
+        start_time = time.time()
+        result = test_connector.sleep(3600.0)
+        duration = time.time() - start_time
+    finally:
+        set_clock(previous)
+        clock.close()
+
+    assert result is True
+    assert clock.time() == 3600.0
+    assert duration < 1.0
+
+
 def test_sleep_already_stopped(test_connector):
     """Test that sleep returns immediately when stop event is already set."""
     stop_event = threading.Event()
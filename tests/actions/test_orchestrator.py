@@ -1,5 +1,7 @@
 import asyncio
 import json
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List
@@ -257,6 +259,28 @@ class TestActionOrchestratorDependencies:
             "action_a"
         ) < MockConnector.execution_order.index("action_b")
 
+    @pytest.mark.asyncio
+    async def test_extend_promise_keeps_completion_state(
+        self, mock_runtime_config, create_agent_action
+    ):
+        """Test that extending a batch keeps the state of its earlier actions."""
+        action_a = create_agent_action("action_a", "action_a")
+        action_b = create_agent_action("action_b", "action_b")
+
+        mock_runtime_config.agent_actions = [action_a, action_b]
+        mock_runtime_config.action_execution_mode = "dependencies"
+        mock_runtime_config.action_dependencies = {"action_b": ["action_a"]}
+
+        orchestrator = ActionOrchestrator(mock_runtime_config)
+
+        await orchestrator.promise([Action(type="action_a", value="first")])
+        await orchestrator.extend_promise([Action(type="action_b", value="second")])
+        await orchestrator.flush_promises()
+
+        assert MockConnector.execution_order == ["action_a", "action_b"]
+        assert set(orchestrator._completed_actions) == {"action_a", "action_b"}
+        assert orchestrator._completed_actions["action_a"].is_set()
+
     @pytest.mark.asyncio
     async def test_multiple_dependencies(
         self, mock_runtime_config, create_agent_action
@@ -913,3 +937,61 @@ class TestLLMResultParser:
         await orchestrator.flush_promises()
 
         assert len(MockConnector.execution_order) == 1
+
+
+class BlockingConnector(ActionConnector[ActionConfig, MockInput]):
+    """
+    Connector that blocks the thread it is called on.
+    """
+
+    blocking = True
+
+    def __init__(self, config: ActionConfig):
+        super().__init__(config)
+        self.threads: List[str] = []
+
+    async def connect(self, output_interface: MockInput) -> None:
+        time.sleep(float(output_interface.action))
+        self.threads.append(threading.current_thread().name)
+
+
+class TestActionOrchestratorOffload:
+    """Test running blocking connectors on worker threads."""
+
+    def create_orchestrator(self, mock_runtime_config, config: ActionConfig):
+        connector = BlockingConnector(config)
+        mock_runtime_config.agent_actions = [
+            AgentAction(
+                name="block",
+                llm_label="block",
+                interface=MockInterface,
+                connector=connector,
+                exclude_from_prompt=False,
+            )
+        ]
+        return ActionOrchestrator(mock_runtime_config), connector
+
+    @pytest.mark.asyncio
+    async def test_blocking_connector_is_offloaded(self, mock_runtime_config):
+        orchestrator, connector = self.create_orchestrator(
+            mock_runtime_config, ActionConfig()
+        )
+
+        await orchestrator.promise([Action(type="block", value="0.01")])
+        await orchestrator.flush_promises()
+        orchestrator.stop()
+
+        assert connector.threads == ["plugin-BlockingConnector"]
+
+    @pytest.mark.asyncio
+    async def test_blocking_connector_timeout(self, mock_runtime_config, caplog):
+        orchestrator, connector = self.create_orchestrator(
+            mock_runtime_config, ActionConfig(blocking_timeout=0.05)
+        )
+
+        await orchestrator.promise([Action(type="block", value="0.5")])
+        await orchestrator.flush_promises()
+        orchestrator.stop()
+
+        assert connector.threads == []
+        assert "Action block timed out after 0.05s" in caplog.text
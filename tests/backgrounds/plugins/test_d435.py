@@ -1,7 +1,6 @@
 from unittest.mock import MagicMock, patch
 
-from backgrounds.base import BackgroundConfig
-from backgrounds.plugins.d435 import D435
+from backgrounds.plugins.d435 import D435, D435Config
 
 
 class TestD435:
@@ -13,12 +12,13 @@ class TestD435:
         mock_provider = MagicMock()
         mock_provider_class.return_value = mock_provider
 
-        config = BackgroundConfig()
+        config = D435Config()
         background = D435(config)
 
         assert background.config is config
         assert background.d435_provider == mock_provider
         mock_provider_class.assert_called_once()
+        mock_provider.set_voxel_size.assert_called_once_with(0.0)
         mock_provider.start.assert_called_once()
 
     @patch("backgrounds.plugins.d435.D435Provider")
@@ -27,7 +27,7 @@ class TestD435:
         mock_provider = MagicMock()
         mock_provider_class.return_value = mock_provider
 
-        config = BackgroundConfig()
+        config = D435Config()
         with caplog.at_level("INFO"):
             D435(config)
 
@@ -39,7 +39,7 @@ class TestD435:
         mock_provider = MagicMock()
         mock_provider_class.return_value = mock_provider
 
-        config = BackgroundConfig()
+        config = D435Config()
         background = D435(config)
 
         assert background.d435_provider is mock_provider
@@ -50,7 +50,7 @@ class TestD435:
         mock_provider = MagicMock()
         mock_provider_class.return_value = mock_provider
 
-        config = BackgroundConfig()
+        config = D435Config()
         background = D435(config)
 
         assert background.config is config
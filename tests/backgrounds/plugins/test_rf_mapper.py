@@ -99,7 +99,7 @@ class TestRFmapper:
         mock_rtk_class.assert_called_once()
         mock_odom_class.assert_called_once()
         mock_fds_class.assert_called_once_with(
-            api_key="test-key", write_to_local_file=True
+            api_key="test-key", write_to_local_file=True, max_batch=1
         )
 
     @patch("backgrounds.plugins.rf_mapper.threading.Thread")
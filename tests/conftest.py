@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def om1_cache_dir(tmp_path, monkeypatch):
+    """
+    Keep plugin indexes and spools of the tests out of the user's cache.
+    """
+    cache_dir = tmp_path / "om1_cache"
+    monkeypatch.setenv("OM1_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -94,3 +94,104 @@ def test_fuser_with_inputs_and_actions(mock_describe):
             io_provider.fuser_available_actions
             == "AVAILABLE ACTIONS:\naction description\n\naction description\n\n\n\nWhat will you do? Actions:"
         )
+
+
+class ChangingSensor(Sensor[SensorConfig, Any]):
+    def __init__(self, values):
+        super().__init__(SensorConfig())
+        self.values = list(values)
+
+    def formatted_latest_buffer(self):
+        return self.values.pop(0) if self.values else None
+
+
+@patch("fuser.describe_action")
+def test_fuser_caches_static_sections(mock_describe):
+    mock_describe.return_value = "action description"
+    config = create_mock_config(
+        agent_actions=[MockAction("action1"), MockAction("action2")]
+    )
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        first = fuser.fuse([MockSensor()], [])
+        for _ in range(5):
+            assert fuser.fuse([MockSensor()], []) == first
+
+    assert mock_describe.call_count == 2
+
+
+@patch("fuser.describe_action")
+def test_fuser_rebuilds_on_config_change(mock_describe):
+    mock_describe.return_value = "action description"
+    config = create_mock_config(agent_actions=[MockAction("action1")])
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        fuser.fuse([], [])
+
+        config.system_prompt_base = "new base"
+        config.agent_actions = [MockAction("action1"), MockAction("action2")]
+        result = fuser.fuse([], [])
+
+    assert "new base" in result
+    assert mock_describe.call_count == 3
+
+
+@patch("fuser.describe_action")
+def test_fuser_invalidate(mock_describe):
+    mock_describe.return_value = "action description"
+    config = create_mock_config(agent_actions=[MockAction("action1")])
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        fuser.fuse([], [])
+        fuser.invalidate()
+        fuser.fuse([], [])
+
+    assert mock_describe.call_count == 2
+
+
+def test_fuser_renders_changed_inputs():
+    config = create_mock_config()
+    sensor = ChangingSensor(["first input", "first input", "Universal Laws"])
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        first = fuser.fuse([sensor], [])
+        second = fuser.fuse([sensor], [])
+        third = fuser.fuse([sensor], [])
+        fourth = fuser.fuse([sensor], [])
+
+    assert first == second
+    assert "first input" in first and "LAWS:" in first
+    assert "Universal Laws" in third and "LAWS:" not in third
+    assert "first input" not in fourth and "LAWS:" in fourth
+
+
+def test_fuser_section_timings():
+    config = create_mock_config()
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        assert fuser.section_timings == {}
+        fuser.fuse([MockSensor()], [])
+
+    assert set(fuser.section_timings) == {"inputs", "static", "assemble", "total"}
+    assert all(value >= 0 for value in fuser.section_timings.values())
+    assert fuser.section_timings["total"] >= fuser.section_timings["inputs"]
+
+
+def test_fuser_keeps_previous_inputs():
+    config = create_mock_config()
+    camera = ChangingSensor(["camera frame", None, None])
+    speech = ChangingSensor([None, None, "hello"])
+
+    with patch("fuser.IOProvider", return_value=IOProvider()):
+        fuser = Fuser(config)
+        first = fuser.fuse([camera, speech], [])
+        second = fuser.fuse([camera, speech], [], keep_previous_inputs=True)
+        third = fuser.fuse([camera, speech], [], keep_previous_inputs=True)
+
+    assert second == first
+    assert "camera frame" in third and "hello" in third
@@ -1,27 +1,26 @@
 """Unit tests for nav2_hook module."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from aiohttp import ClientError, ClientTimeout
+from aiohttp import ClientError
 
 from hooks.nav2_hook import start_nav2_hook, stop_nav2_hook
+from providers.http_client import HTTPResponse
 
 
-def create_mock_response(status, json_data=None, json_error=None):
-    """Helper to create a mock aiohttp response."""
-    mock_resp = MagicMock()
-    mock_resp.status = status
+def create_mock_response(status, json_data=None, json_error=False):
+    """Helper to create a response of the shared HTTP client."""
+    content = b"<html>error</html>" if json_error else json.dumps(json_data).encode()
+    return HTTPResponse(status=status, content=content)
 
-    if json_error:
-        mock_resp.json = AsyncMock(side_effect=json_error)
-    else:
-        mock_resp.json = AsyncMock(return_value=json_data)
 
-    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-    mock_resp.__aexit__ = AsyncMock(return_value=None)
-
-    return mock_resp
+def create_mock_client(response=None, error=None):
+    """Helper to create a shared HTTP client mock."""
+    mock_client = MagicMock()
+    mock_client.post_async = AsyncMock(return_value=response, side_effect=error)
+    return mock_client
 
 
 @pytest.fixture
@@ -45,12 +44,9 @@ class TestStartNav2Hook:
 
         mock_response = create_mock_response(200, expected_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             result = await start_nav2_hook(context)
 
         assert result["status"] == "success"
@@ -68,15 +64,12 @@ class TestStartNav2Hook:
 
         mock_response = create_mock_response(200, expected_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             result = await start_nav2_hook(context)
 
-        call_args = mock_session.post.call_args
+        call_args = mock_client.post_async.call_args
         assert call_args[0][0] == "http://robot.local:8080/start/nav2"
         assert call_args[1]["json"]["map_name"] == "custom_map"
 
@@ -91,12 +84,9 @@ class TestStartNav2Hook:
 
         mock_response = create_mock_response(503, error_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             with pytest.raises(
                 Exception, match="Failed to start Nav2: Service unavailable"
             ):
@@ -107,14 +97,11 @@ class TestStartNav2Hook:
         """Test Nav2 start with HTTP error and no JSON response."""
         context = {}
 
-        mock_response = create_mock_response(500, json_error=Exception("No JSON"))
+        mock_response = create_mock_response(500, json_error=True)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             with pytest.raises(Exception, match="Failed to start Nav2: Unknown error"):
                 await start_nav2_hook(context)
 
@@ -123,12 +110,9 @@ class TestStartNav2Hook:
         """Test Nav2 start with client connection error."""
         context = {}
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(side_effect=ClientError("Connection refused"))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(error=ClientError("Connection refused"))
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             with pytest.raises(
                 Exception, match="Error calling Nav2 API: Connection refused"
             ):
@@ -142,18 +126,13 @@ class TestStartNav2Hook:
 
         mock_response = create_mock_response(200, expected_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             await start_nav2_hook(context)
 
-        call_args = mock_session.post.call_args
-        assert "timeout" in call_args[1]
-        timeout = call_args[1]["timeout"]
-        assert isinstance(timeout, ClientTimeout)
+        call_args = mock_client.post_async.call_args
+        assert call_args[1]["timeout"] == 5
 
 
 class TestStopNav2Hook:
@@ -167,12 +146,9 @@ class TestStopNav2Hook:
 
         mock_response = create_mock_response(200, expected_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             result = await stop_nav2_hook(context)
 
         assert result["status"] == "success"
@@ -187,15 +163,12 @@ class TestStopNav2Hook:
 
         mock_response = create_mock_response(200, expected_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             result = await stop_nav2_hook(context)
 
-        call_args = mock_session.post.call_args
+        call_args = mock_client.post_async.call_args
         assert call_args[0][0] == "http://custom.server:9000/stop/nav2"
 
         assert result["status"] == "success"
@@ -208,12 +181,9 @@ class TestStopNav2Hook:
 
         mock_response = create_mock_response(400, error_response)
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(mock_response)
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             with pytest.raises(Exception, match="Failed to stop Nav2: Failed to stop"):
                 await stop_nav2_hook(context)
 
@@ -222,12 +192,9 @@ class TestStopNav2Hook:
         """Test Nav2 stop with client connection error."""
         context = {}
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(side_effect=ClientError("Network error"))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_client = create_mock_client(error=ClientError("Network error"))
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("hooks.nav2_hook.get_http_client", return_value=mock_client):
             with pytest.raises(
                 Exception, match="Error calling Nav2 stop API: Network error"
             ):
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from inputs.base.bridge import LatestValue, ThreadBridge
+
+
+@pytest.mark.asyncio
+async def test_bridge_get_returns_queued_items_in_order():
+    bridge: ThreadBridge[str] = ThreadBridge()
+    bridge.put_nowait("a")
+    bridge.put_nowait("b")
+
+    assert bridge.qsize() == 2
+    assert await bridge.get() == "a"
+    assert bridge.get_nowait() == "b"
+    assert bridge.empty()
+
+
+def test_bridge_get_nowait_raises_when_empty():
+    with pytest.raises(asyncio.QueueEmpty):
+        ThreadBridge().get_nowait()
+
+
+def test_bridge_maxsize_drops_oldest():
+    bridge: ThreadBridge[int] = ThreadBridge(maxsize=2)
+    for i in range(3):
+        bridge.put_nowait(i)
+
+    assert bridge.get_nowait() == 1
+
+
+@pytest.mark.asyncio
+async def test_bridge_wakes_on_put_from_thread():
+    bridge: ThreadBridge[str] = ThreadBridge()
+    threading.Timer(0.05, bridge.put_nowait, ["speech"]).start()
+
+    start = time.monotonic()
+    assert await bridge.get(timeout=2.0) == "speech"
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_bridge_get_times_out():
+    bridge: ThreadBridge[str] = ThreadBridge()
+
+    assert await bridge.get(timeout=0.01) is None
+    bridge.put_nowait("late")
+    assert await bridge.get(timeout=0.01) == "late"
+
+
+@pytest.mark.asyncio
+async def test_latest_value_wait_newer():
+    slot: LatestValue[str] = LatestValue()
+
+    assert await slot.wait_newer(0, timeout=0.01) == (None, 0)
+
+    threading.Timer(0.05, slot.set, ["scan 1"]).start()
+    assert await slot.wait_newer(0, timeout=2.0) == ("scan 1", 1)
+
+    slot.set("scan 2")
+    slot.set("scan 3")
+    assert await slot.wait_newer(1) == ("scan 3", 3)
@@ -1,9 +1,9 @@
-import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from inputs.base import Message
+from inputs.base.bridge import ThreadBridge
 from inputs.plugins.google_asr import GoogleASRInput, GoogleASRSensorConfig
 
 
@@ -20,7 +20,7 @@ def test_initialization():
         sensor = GoogleASRInput(config=config)
 
         assert hasattr(sensor, "messages")
-        assert isinstance(sensor.message_buffer, asyncio.Queue)
+        assert isinstance(sensor.message_buffer, ThreadBridge)
         assert sensor.messages == []
 
 
@@ -38,8 +38,7 @@ async def test_poll_with_message():
         sensor = GoogleASRInput(config=config)
         sensor.message_buffer.put_nowait("Test speech")
 
-        with patch("asyncio.sleep", new=AsyncMock()):
-            result = await sensor._poll()
+        result = await sensor._poll()
 
         assert result == "Test speech"
 
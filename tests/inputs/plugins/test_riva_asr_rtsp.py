@@ -1,3 +1,4 @@
+import threading
 import time
 from unittest.mock import Mock, patch
 
@@ -200,7 +201,7 @@ async def test_poll_returns_none_if_buffer_empty(
 
 
 @pytest.mark.asyncio
-async def test_poll_has_delay(
+async def test_poll_wakes_on_message_from_thread(
     mock_io_provider,
     mock_asr_provider,
     mock_sleep_ticker_provider,
@@ -233,9 +234,11 @@ async def test_poll_has_delay(
     ):
         instance = RivaASRRTSPInput(config=config)
 
-    with patch("inputs.plugins.riva_asr_rtsp.asyncio.sleep") as mock_sleep:
-        await instance._poll()
-        mock_sleep.assert_called_once_with(0.01)
+    threading.Timer(0.05, instance.message_buffer.put_nowait, ["Hello world"]).start()
+
+    result = await instance._poll()
+
+    assert result == "Hello world"
 
 
 def test_handle_asr_message_processes_valid_json_with_asr_reply_longer_than_one_word(
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +13,7 @@ def test_initialization():
     """Test basic initialization."""
     with (
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4OdomProvider"),
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4CameraVLMProvider"),
     ):
         config = TurtleBot4CameraVLMCloudConfig()
@@ -25,6 +26,7 @@ def test_initialization_with_custom_config():
     """Test initialization with custom configuration."""
     with (
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4OdomProvider"),
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4CameraVLMProvider"),
     ):
         config = TurtleBot4CameraVLMCloudConfig(
@@ -46,10 +48,8 @@ async def test_poll():
     """Test _poll method."""
     with (
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4OdomProvider"),
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4CameraVLMProvider"),
-        patch(
-            "inputs.plugins.turtlebot4_camera_vlm_cloud.asyncio.sleep", new=AsyncMock()
-        ),
     ):
         config = TurtleBot4CameraVLMCloudConfig()
         sensor = TurtleBot4CameraVLMCloud(config=config)
@@ -62,6 +62,7 @@ def test_formatted_latest_buffer():
     """Test formatted_latest_buffer."""
     with (
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4OdomProvider"),
         patch("inputs.plugins.turtlebot4_camera_vlm_cloud.TurtleBot4CameraVLMProvider"),
     ):
         config = TurtleBot4CameraVLMCloudConfig()
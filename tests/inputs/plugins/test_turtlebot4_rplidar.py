@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -164,10 +164,8 @@ class TestTurtleBot4RPLidar:
             config = RPLidarConfig()
             sensor = TurtleBot4RPLidar(config=config)
 
-            with patch(
-                "inputs.plugins.turtlebot4_rplidar.asyncio.sleep", new=AsyncMock()
-            ):
-                result = await sensor._poll()
+            sensor.lidar_updates.set(mock_provider.lidar_string)
+            result = await sensor._poll()
 
             assert result == "Lidar scan data"
 
@@ -187,10 +185,8 @@ class TestTurtleBot4RPLidar:
             config = RPLidarConfig()
             sensor = TurtleBot4RPLidar(config=config)
 
-            with patch(
-                "inputs.plugins.turtlebot4_rplidar.asyncio.sleep", new=AsyncMock()
-            ):
-                result = await sensor._poll()
+            sensor.lidar_updates.set(mock_provider.lidar_string)
+            result = await sensor._poll()
 
             assert result is None
 
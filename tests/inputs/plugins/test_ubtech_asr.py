@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -26,7 +26,6 @@ async def test_poll():
         patch("inputs.plugins.ubtech_asr.IOProvider"),
         patch("inputs.plugins.ubtech_asr.UbtechASRProvider"),
         patch("inputs.plugins.ubtech_asr.SleepTickerProvider"),
-        patch("inputs.plugins.ubtech_asr.asyncio.sleep", new=AsyncMock()),
     ):
         config = UbtechASRSensorConfig()
         sensor = UbtechASRInput(config=config)
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -42,7 +42,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.ubtech_camera_vlm_input.IOProvider"),
         patch("inputs.plugins.ubtech_camera_vlm_input.UbtechVLMProvider"),
-        patch("inputs.plugins.ubtech_camera_vlm_input.asyncio.sleep", new=AsyncMock()),
     ):
         config = UbtechCameraVLMSensorConfig()
         sensor = UbtechCameraVLMInput(config=config)
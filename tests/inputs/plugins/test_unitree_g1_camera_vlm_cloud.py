@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -45,9 +45,6 @@ async def test_poll():
         patch(
             "inputs.plugins.unitree_g1_camera_vlm_cloud.UnitreeRealSenseDevVLMProvider"
         ),
-        patch(
-            "inputs.plugins.unitree_g1_camera_vlm_cloud.asyncio.sleep", new=AsyncMock()
-        ),
     ):
         config = UnitreeG1CameraVLMCloudConfig()
         sensor = UnitreeG1CameraVLMCloud(config=config)
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +13,7 @@ def test_initialization():
     """Test basic initialization."""
     with (
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeGo2OdomProvider"),
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeCameraVLMProvider"),
     ):
         config = UnitreeGo2CameraVLMCloudConfig()
@@ -25,6 +26,7 @@ def test_initialization_with_custom_config():
     """Test initialization with custom configuration."""
     with (
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeGo2OdomProvider"),
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeCameraVLMProvider"),
     ):
         config = UnitreeGo2CameraVLMCloudConfig(
@@ -44,11 +46,8 @@ async def test_poll():
     """Test _poll method."""
     with (
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeGo2OdomProvider"),
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeCameraVLMProvider"),
-        patch(
-            "inputs.plugins.unitree_go2_camera_vlm_cloud.asyncio.sleep",
-            new=AsyncMock(),
-        ),
     ):
         config = UnitreeGo2CameraVLMCloudConfig()
         sensor = UnitreeGo2CameraVLMCloud(config=config)
@@ -61,6 +60,7 @@ def test_formatted_latest_buffer():
     """Test formatted_latest_buffer."""
     with (
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.IOProvider"),
+        patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeGo2OdomProvider"),
         patch("inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeCameraVLMProvider"),
     ):
         config = UnitreeGo2CameraVLMCloudConfig()
@@ -76,3 +76,27 @@ def test_formatted_latest_buffer():
         assert isinstance(result, str)
         assert "I see a quadruped robot" in result
         assert len(sensor.messages) == 0
+
+
+def test_scene_gate_follows_odometry():
+    """Test that the scene gate sends every frame while the robot moves."""
+    with (
+        patch("inputs.plugins.unitree_go2_camera_vlm_cloud.IOProvider"),
+        patch(
+            "inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeGo2OdomProvider"
+        ) as mock_odom,
+        patch(
+            "inputs.plugins.unitree_go2_camera_vlm_cloud.UnitreeCameraVLMProvider"
+        ) as mock_provider,
+    ):
+        config = UnitreeGo2CameraVLMCloudConfig(
+            scene_change_threshold=8.0, max_staleness=2.0
+        )
+        UnitreeGo2CameraVLMCloud(config=config)
+
+        scene_gate = mock_provider.call_args.kwargs["scene_gate"]
+        assert scene_gate.threshold == 8.0
+        assert scene_gate.max_staleness == 2.0
+
+        mock_odom.return_value.moving = True
+        assert scene_gate.motion_hint() is True
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -26,13 +26,13 @@ async def test_poll():
         patch(
             "inputs.plugins.unitree_go2_rplidar.UnitreeGo2RPLidarProvider"
         ) as mock_rplidar,
-        patch("inputs.plugins.unitree_go2_rplidar.asyncio.sleep", new=AsyncMock()),
     ):
         mock_rplidar.return_value.lidar_string = (
             "Hello from RPLidar: objects and walls detected."
         )
         config = RPLidarConfig()
         sensor = UnitreeGo2RPLidar(config=config)
+        sensor.lidar_updates.set(mock_rplidar.return_value.lidar_string)
 
         result = await sensor._poll()
         assert result == "Hello from RPLidar: objects and walls detected."
@@ -63,3 +63,20 @@ def test_formatted_latest_buffer():
         assert "// START" in result
         assert "// END" in result
         assert len(sensor.messages) == 0
+
+
+def test_stop_listening_unregisters_callback():
+    """Test that the input unregisters its provider callback when stopped."""
+    with (
+        patch("inputs.plugins.unitree_go2_rplidar.IOProvider"),
+        patch(
+            "inputs.plugins.unitree_go2_rplidar.UnitreeGo2RPLidarProvider"
+        ) as mock_rplidar,
+    ):
+        sensor = UnitreeGo2RPLidar(config=RPLidarConfig())
+        sensor.stop_listening()
+
+        provider = mock_rplidar.return_value
+        provider.unregister_lidar_callback.assert_called_once_with(
+            provider.register_lidar_callback.call_args[0][0]
+        )
@@ -1,19 +1,17 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import numpy as np
 import pytest
-import torch
 
 from inputs.plugins.vlm_coco_local import Message, VLM_COCO_Local, VLM_COCO_LocalConfig
+from providers.detection_worker import Detections
 
 
 @pytest.fixture
-def mock_model():
-    with patch(
-        "inputs.plugins.vlm_coco_local.detection_model.fasterrcnn_mobilenet_v3_large_320_fpn"
-    ) as mock:
+def mock_detector():
+    with patch("inputs.plugins.vlm_coco_local.get_detection_worker") as mock:
         mock_instance = Mock()
-        mock_instance.eval = Mock()
+        mock_instance.names = {1: "cat", 2: "dog"}
         mock.return_value = mock_instance
         yield mock_instance
 
@@ -25,19 +23,19 @@ def mock_check_webcam():
 
 
 @pytest.fixture
-def mock_cv2_video_capture():
-    with patch("inputs.plugins.vlm_coco_local.cv2.VideoCapture") as mock:
+def mock_open_webcam():
+    with patch("inputs.plugins.vlm_coco_local.open_webcam") as mock:
         mock_instance = Mock()
-        # Simulate .read() returning a dummy frame
+        # Simulate the shared capture having published a dummy frame
         dummy_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        mock_instance.read.return_value = (True, dummy_frame)
-        mock_instance.get.side_effect = lambda x: {3: 640, 4: 480}[x]
+        mock_instance.bus.latest.image = dummy_frame
+        mock_instance.width, mock_instance.height = 640, 480
         mock.return_value = mock_instance
         yield mock_instance
 
 
 @pytest.fixture
-def vlm_coco_local(mock_model, mock_check_webcam, mock_cv2_video_capture):
+def vlm_coco_local(mock_detector, mock_check_webcam, mock_open_webcam):
     config = VLM_COCO_LocalConfig(camera_index=0)
     return VLM_COCO_Local(config=config)
 
@@ -56,21 +54,28 @@ async def test_raw_to_text_none(vlm_coco_local):
 
 
 @pytest.mark.asyncio
-async def test_raw_to_text_with_detection(vlm_coco_local, mock_model):
-    # Setup mock model output
-    dummy_detection = {
-        "labels": [1, 2],
-        "boxes": [torch.tensor([10, 10, 100, 100]), torch.tensor([200, 10, 300, 100])],
-        "scores": [torch.tensor(0.9), torch.tensor(0.8)],
-    }
-    vlm_coco_local.model = Mock(return_value=[dummy_detection])
-    vlm_coco_local.class_labels = ["__background__", "cat", "dog"]
+async def test_raw_to_text_with_detection(vlm_coco_local, mock_detector):
+    # Setup mock worker output, sorted by score
+    mock_detector.detect = AsyncMock(
+        return_value=Detections(
+            boxes=np.array(
+                [[10, 10, 100, 100], [200, 10, 300, 100], [500, 10, 600, 100]],
+                dtype=np.float32,
+            ),
+            scores=np.array([0.9, 0.8, 0.1], dtype=np.float32),
+            classes=np.array([1, 2, 1], dtype=np.int32),
+            inference=0.05,
+            latency=0.06,
+            batch_size=1,
+        )
+    )
     vlm_coco_local.cam_third = 213  # 640/3
 
     dummy_frame = np.zeros((480, 640, 3), dtype=np.uint8)
     result = await vlm_coco_local._raw_to_text(dummy_frame)
     assert isinstance(result, Message)
-    assert "You see a cat" in result.message
+    assert result.message == "You see a cat on your left. You also see a dog."
+    mock_detector.detect.assert_awaited_once_with(0, dummy_frame)
 
 
 @pytest.mark.asyncio
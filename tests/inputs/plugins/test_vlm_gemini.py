@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -24,7 +24,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.vlm_gemini.IOProvider"),
         patch("inputs.plugins.vlm_gemini.VLMGeminiProvider"),
-        patch("inputs.plugins.vlm_gemini.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLMGeminiConfig(api_key="test-api-key")
         sensor = VLMGemini(config=config)
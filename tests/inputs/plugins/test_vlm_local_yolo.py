@@ -1,18 +1,20 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from inputs.base import Message
 from inputs.plugins.vlm_local_yolo import VLM_Local_YOLO, VLM_Local_YOLOConfig
+from providers.detection_worker import Detections
 
 
 def test_initialization():
     """Test basic initialization."""
     with (
         patch("inputs.plugins.vlm_local_yolo.IOProvider"),
-        patch("inputs.plugins.vlm_local_yolo.YOLO"),
+        patch("inputs.plugins.vlm_local_yolo.get_detection_worker"),
         patch("inputs.plugins.vlm_local_yolo.check_webcam", return_value=(640, 480)),
-        patch("inputs.plugins.vlm_local_yolo.cv2.VideoCapture"),
+        patch("inputs.plugins.vlm_local_yolo.open_webcam"),
     ):
         config = VLM_Local_YOLOConfig()
         sensor = VLM_Local_YOLO(config=config)
@@ -23,14 +25,28 @@ def test_initialization():
 @pytest.mark.asyncio
 async def test_poll():
     """Test _poll method."""
-    mock_cap = MagicMock()
-    mock_cap.read.return_value = (True, MagicMock())  # (ret, frame)
+    mock_webcam = MagicMock()
+    mock_webcam.width, mock_webcam.height = 640, 480
+    mock_detector = MagicMock()
+    mock_detector.detect = AsyncMock(
+        return_value=Detections(
+            boxes=np.zeros((0, 4), dtype=np.float32),
+            scores=np.zeros(0, dtype=np.float32),
+            classes=np.zeros(0, dtype=np.int32),
+            inference=0.01,
+            latency=0.02,
+            batch_size=1,
+        )
+    )
 
     with (
         patch("inputs.plugins.vlm_local_yolo.IOProvider"),
-        patch("inputs.plugins.vlm_local_yolo.YOLO"),
+        patch(
+            "inputs.plugins.vlm_local_yolo.get_detection_worker",
+            return_value=mock_detector,
+        ),
         patch("inputs.plugins.vlm_local_yolo.check_webcam", return_value=(640, 480)),
-        patch("inputs.plugins.vlm_local_yolo.cv2.VideoCapture", return_value=mock_cap),
+        patch("inputs.plugins.vlm_local_yolo.open_webcam", return_value=mock_webcam),
         patch("inputs.plugins.vlm_local_yolo.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLM_Local_YOLOConfig()
@@ -40,13 +56,51 @@ async def test_poll():
         assert result == []
 
 
+@pytest.mark.asyncio
+async def test_poll_converts_worker_detections():
+    """Test that _poll turns the arrays of the worker into detections."""
+    mock_webcam = MagicMock()
+    mock_webcam.width, mock_webcam.height = 640, 480
+    mock_detector = MagicMock()
+    mock_detector.names = {0: "person"}
+    mock_detector.detect = AsyncMock(
+        return_value=Detections(
+            boxes=np.array([[10.4, 20.6, 100.5, 200.0]], dtype=np.float32),
+            scores=np.array([0.87654], dtype=np.float32),
+            classes=np.array([0], dtype=np.int32),
+            inference=0.01,
+            latency=0.02,
+            batch_size=1,
+        )
+    )
+
+    with (
+        patch("inputs.plugins.vlm_local_yolo.IOProvider"),
+        patch(
+            "inputs.plugins.vlm_local_yolo.get_detection_worker",
+            return_value=mock_detector,
+        ),
+        patch("inputs.plugins.vlm_local_yolo.check_webcam", return_value=(640, 480)),
+        patch("inputs.plugins.vlm_local_yolo.open_webcam", return_value=mock_webcam),
+        patch("inputs.plugins.vlm_local_yolo.asyncio.sleep", new=AsyncMock()),
+    ):
+        sensor = VLM_Local_YOLO(config=VLM_Local_YOLOConfig())
+
+        result = await sensor._poll()
+
+        mock_detector.detect.assert_awaited_once_with(0, mock_webcam.bus.latest.image)
+        assert result == [
+            {"class": "person", "confidence": 0.8765, "bbox": [10, 21, 100, 200]}
+        ]
+
+
 def test_formatted_latest_buffer():
     """Test formatted_latest_buffer."""
     with (
         patch("inputs.plugins.vlm_local_yolo.IOProvider"),
-        patch("inputs.plugins.vlm_local_yolo.YOLO"),
+        patch("inputs.plugins.vlm_local_yolo.get_detection_worker"),
         patch("inputs.plugins.vlm_local_yolo.check_webcam", return_value=(640, 480)),
-        patch("inputs.plugins.vlm_local_yolo.cv2.VideoCapture"),
+        patch("inputs.plugins.vlm_local_yolo.open_webcam"),
     ):
         config = VLM_Local_YOLOConfig()
         sensor = VLM_Local_YOLO(config=config)
@@ -67,3 +121,41 @@ def test_formatted_latest_buffer():
         assert "// START" in result
         assert "// END" in result
         assert len(sensor.messages) == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_records_detections_when_logging():
+    """Test that log_file records the detection arrays of each frame."""
+    mock_webcam = MagicMock()
+    mock_webcam.width, mock_webcam.height = 640, 480
+    mock_detector = MagicMock()
+    mock_detector.names = {0: "person"}
+    detections = Detections(
+        boxes=np.array([[10.0, 20.0, 100.0, 200.0]], dtype=np.float32),
+        scores=np.array([0.9], dtype=np.float32),
+        classes=np.array([0], dtype=np.int32),
+        inference=0.01,
+        latency=0.02,
+        batch_size=1,
+    )
+    mock_detector.detect = AsyncMock(return_value=detections)
+
+    with (
+        patch("inputs.plugins.vlm_local_yolo.IOProvider"),
+        patch(
+            "inputs.plugins.vlm_local_yolo.get_detection_worker",
+            return_value=mock_detector,
+        ),
+        patch("inputs.plugins.vlm_local_yolo.check_webcam", return_value=(640, 480)),
+        patch("inputs.plugins.vlm_local_yolo.open_webcam", return_value=mock_webcam),
+        patch("inputs.plugins.vlm_local_yolo.asyncio.sleep", new=AsyncMock()),
+        patch("inputs.plugins.vlm_local_yolo.get_sensor_recorder") as mock_recorder,
+    ):
+        sensor = VLM_Local_YOLO(config=VLM_Local_YOLOConfig(log_file=True))
+
+        await sensor._poll()
+
+        channel, value = mock_recorder.return_value.record.call_args.args
+        assert channel == "yolo"
+        assert value["boxes"] is detections.boxes
+        assert value["labels"] == ["person"]
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -24,7 +24,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.vlm_openai.IOProvider"),
         patch("inputs.plugins.vlm_openai.VLMOpenAIProvider"),
-        patch("inputs.plugins.vlm_openai.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLMOpenAIConfig(api_key="test-api-key")
         sensor = VLMOpenAI(config=config)
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -24,7 +24,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.vlm_openai_rtsp.IOProvider"),
         patch("inputs.plugins.vlm_openai_rtsp.VLMOpenAIRTSPProvider"),
-        patch("inputs.plugins.vlm_openai_rtsp.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLMOpenAIRTSPConfig(api_key="test-api-key")
         sensor = VLMOpenAIRTSP(config=config)
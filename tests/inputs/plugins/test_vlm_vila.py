@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -44,7 +44,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.vlm_vila.IOProvider"),
         patch("inputs.plugins.vlm_vila.VLMVilaProvider"),
-        patch("inputs.plugins.vlm_vila.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLMVilaConfig()
         sensor = VLMVila(config=config)
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -42,7 +42,6 @@ async def test_poll():
     with (
         patch("inputs.plugins.vlm_vila_zenoh.IOProvider"),
         patch("inputs.plugins.vlm_vila_zenoh.VLMVilaZenohProvider"),
-        patch("inputs.plugins.vlm_vila_zenoh.asyncio.sleep", new=AsyncMock()),
     ):
         config = VLMVilaZenohConfig()
         sensor = VLMVilaZenoh(config=config)
@@ -1,3 +1,4 @@
+import importlib.util
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -5,6 +6,12 @@ import pytest
 
 from inputs.plugins.wallet_coinbase import Message, WalletCoinbase, WalletCoinbaseConfig
 
+# Cdp and Wallet are imported on first use, so they can only be patched when
+# the cdp package is installed
+requires_cdp = pytest.mark.skipif(
+    importlib.util.find_spec("cdp") is None, reason="cdp is not installed"
+)
+
 
 def test_initialization_with_missing_wallet_id():
     """Missing COINBASE_WALLET_ID should fall back to a safe zero state."""
@@ -16,6 +23,7 @@ def test_initialization_with_missing_wallet_id():
         assert wallet.asset_id == "eth"
 
 
+@requires_cdp
 def test_initialization_with_wallet_fetch_failure():
     """Wallet.fetch failure should be handled gracefully."""
     env = {
@@ -37,6 +45,7 @@ def test_initialization_with_wallet_fetch_failure():
         assert wallet.balance_previous == 0.0
 
 
+@requires_cdp
 def test_initialization_with_successful_wallet_fetch_default_asset():
     """Successful initialization should read balance using default asset_id 'eth'."""
     mock_wallet = MagicMock()
@@ -66,6 +75,7 @@ def test_initialization_with_successful_wallet_fetch_default_asset():
         mock_wallet.balance.assert_called_with("eth")
 
 
+@requires_cdp
 def test_initialization_with_custom_asset_id():
     """Custom asset_id should be respected during initialization."""
     mock_wallet = MagicMock()
@@ -95,6 +105,7 @@ def test_initialization_with_custom_asset_id():
         mock_wallet.balance.assert_called_with("btc")
 
 
+@requires_cdp
 def test_initialization_without_api_keys_does_not_call_configure():
     """
     If API key/secret are missing, Cdp.configure should not be called.
@@ -124,6 +135,7 @@ def test_initialization_without_api_keys_does_not_call_configure():
         mock_configure.assert_not_called()
 
 
+@requires_cdp
 @pytest.mark.asyncio
 async def test_poll_with_wallet_refresh_failure_returns_zero_delta():
     """_poll should return zero delta if Wallet.fetch fails."""
@@ -150,6 +162,7 @@ async def test_poll_with_wallet_refresh_failure_returns_zero_delta():
         assert result == [0.0, 0.0]
 
 
+@requires_cdp
 @pytest.mark.asyncio
 async def test_poll_with_successful_wallet_refresh_calculates_delta():
     """_poll should update balance and compute correct delta on success."""
@@ -247,6 +260,7 @@ def test_formatted_latest_buffer_with_multiple_transactions():
     assert len(wallet.messages) == 0
 
 
+@requires_cdp
 def test_formatted_latest_buffer_with_custom_asset_symbol():
     """Custom asset should appear in upper-case in formatted output."""
     config = WalletCoinbaseConfig(asset_id="btc")
@@ -12,7 +12,7 @@ def test_initialization():
         patch("inputs.plugins.webcam_to_face_emotion.IOProvider"),
         patch("inputs.plugins.webcam_to_face_emotion.cv2.CascadeClassifier"),
         patch("inputs.plugins.webcam_to_face_emotion.check_webcam", return_value=True),
-        patch("inputs.plugins.webcam_to_face_emotion.cv2.VideoCapture"),
+        patch("inputs.plugins.webcam_to_face_emotion.open_webcam"),
     ):
         config = SensorConfig()
         sensor = FaceEmotionCapture(config=config)
@@ -23,16 +23,16 @@ def test_initialization():
 @pytest.mark.asyncio
 async def test_poll():
     """Test _poll method."""
-    mock_cap = MagicMock()
-    mock_cap.read.return_value = (True, "mock_frame")  # (ret, frame)
+    mock_webcam = MagicMock()
+    mock_webcam.bus.latest.image = "mock_frame"
 
     with (
         patch("inputs.plugins.webcam_to_face_emotion.IOProvider"),
         patch("inputs.plugins.webcam_to_face_emotion.cv2.CascadeClassifier"),
         patch("inputs.plugins.webcam_to_face_emotion.check_webcam", return_value=True),
         patch(
-            "inputs.plugins.webcam_to_face_emotion.cv2.VideoCapture",
-            return_value=mock_cap,
+            "inputs.plugins.webcam_to_face_emotion.open_webcam",
+            return_value=mock_webcam,
         ),
         patch("inputs.plugins.webcam_to_face_emotion.asyncio.sleep", new=AsyncMock()),
     ):
@@ -43,13 +43,35 @@ async def test_poll():
         assert result == "mock_frame"
 
 
+def test_stop_listening_releases_the_webcam():
+    """Test that stop_listening hands back the shared webcam."""
+    mock_webcam = MagicMock()
+
+    with (
+        patch("inputs.plugins.webcam_to_face_emotion.IOProvider"),
+        patch("inputs.plugins.webcam_to_face_emotion.cv2.CascadeClassifier"),
+        patch("inputs.plugins.webcam_to_face_emotion.check_webcam", return_value=True),
+        patch(
+            "inputs.plugins.webcam_to_face_emotion.open_webcam",
+            return_value=mock_webcam,
+        ),
+        patch("inputs.plugins.webcam_to_face_emotion.release_webcam") as release,
+    ):
+        sensor = FaceEmotionCapture(config=SensorConfig())
+        sensor.stop_listening()
+        sensor.stop_listening()
+
+        release.assert_called_once_with(mock_webcam)
+        assert sensor.webcam is None
+
+
 def test_formatted_latest_buffer():
     """Test formatted_latest_buffer."""
     with (
         patch("inputs.plugins.webcam_to_face_emotion.IOProvider"),
         patch("inputs.plugins.webcam_to_face_emotion.cv2.CascadeClassifier"),
         patch("inputs.plugins.webcam_to_face_emotion.check_webcam", return_value=True),
-        patch("inputs.plugins.webcam_to_face_emotion.cv2.VideoCapture"),
+        patch("inputs.plugins.webcam_to_face_emotion.open_webcam"),
     ):
         config = SensorConfig()
         sensor = FaceEmotionCapture(config=config)
@@ -1,11 +1,14 @@
 import asyncio
-from unittest.mock import AsyncMock
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from inputs.orchestrator import InputOrchestrator
+from inputs.plugins.wallet_ethereum import WalletEthereum
 
 
 class MockInput(FuserInput[SensorConfig, str]):
@@ -75,3 +78,126 @@ async def test_input_exception_handling():
 
     await asyncio.wait_for(orchestrator.listen(), timeout=5.0)
     assert normal_input.raw_to_text.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_listen_to_input_notifies_ticker():
+    """Test that new input events wake the event-driven tick scheduler."""
+    mock_input = MockInput()
+    orchestrator = InputOrchestrator([mock_input])
+    orchestrator.sleep_ticker_provider = Mock()
+
+    await orchestrator._listen_to_input(mock_input)
+
+    assert orchestrator.sleep_ticker_provider.notify.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_listen_to_input_without_trigger_tick():
+    """Test that inputs configured with trigger_tick false do not wake ticks."""
+    mock_input = MockInput()
+    mock_input.config = SensorConfig(trigger_tick=False)
+    orchestrator = InputOrchestrator([mock_input])
+    orchestrator.sleep_ticker_provider = Mock()
+
+    await orchestrator._listen_to_input(mock_input)
+
+    orchestrator.sleep_ticker_provider.notify.assert_not_called()
+
+
+class BlockingPollInput(FuserInput[SensorConfig, str]):
+    blocking = True
+
+    def __init__(self, config: SensorConfig = SensorConfig()):
+        super().__init__(config)
+        self.threads = []
+
+    async def _poll(self):
+        time.sleep(0.05)
+        self.threads.append(threading.current_thread().name)
+        if len(self.threads) > 3:
+            raise ValueError("Polled enough")
+        return str(len(self.threads))
+
+    async def raw_to_text(self, raw_input):
+        pass
+
+    def formatted_latest_buffer(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_blocking_poll_is_offloaded():
+    """Test that inputs declared blocking are polled on their own thread."""
+    blocking_input = BlockingPollInput()
+    blocking_input.raw_to_text = AsyncMock()
+    orchestrator = InputOrchestrator([blocking_input])
+
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(
+            orchestrator._listen_to_input(blocking_input), timeout=5.0
+        )
+    orchestrator.shutdown()
+
+    assert blocking_input.threads[0] == "plugin-BlockingPollInput"
+    assert blocking_input.raw_to_text.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_blocking_poll_runs_inline_when_disabled():
+    """Test that blocking: false in the config keeps polling on the loop."""
+    blocking_input = BlockingPollInput(SensorConfig(blocking=False))
+    orchestrator = InputOrchestrator([blocking_input])
+
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(
+            orchestrator._listen_to_input(blocking_input), timeout=5.0
+        )
+
+    assert blocking_input.threads[0] == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_wallet_ethereum_is_polled_on_its_executor():
+    """Test that the Web3 calls of the Ethereum wallet stay off the loop."""
+    threads = []
+    web3 = MagicMock()
+    web3.eth.get_balance.side_effect = lambda address: threads.append(
+        threading.current_thread().name
+    )
+    web3.from_wei.return_value = 1.0
+
+    with (
+        patch("inputs.plugins.wallet_ethereum.Web3", return_value=web3),
+        patch("inputs.plugins.wallet_ethereum.IOProvider"),
+    ):
+        wallet = WalletEthereum(config=SensorConfig())
+    wallet.POLL_INTERVAL = 0
+    orchestrator = InputOrchestrator([wallet])
+
+    events = orchestrator._events(wallet)
+    try:
+        assert await asyncio.wait_for(events.__anext__(), timeout=5.0) == [1.0, 1.0]
+    finally:
+        await events.aclose()
+        orchestrator.shutdown()
+
+    assert threads == ["plugin-WalletEthereum"]
+
+
+@pytest.mark.asyncio
+async def test_inputs_are_released_when_listening_stops():
+    """Test that inputs are told to release their providers after listening."""
+    inputs = [MockInput(), MockInput()]
+    for input in inputs:
+        input.stop_listening = Mock()
+    orchestrator = InputOrchestrator(inputs)
+
+    task = asyncio.create_task(orchestrator.listen())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    for input in inputs:
+        input.stop_listening.assert_called_once()
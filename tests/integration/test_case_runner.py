@@ -15,6 +15,7 @@ from PIL import Image
 from llm.output_model import Action, CortexOutputModel
 from runtime.config import ModeConfig, ModeSystemConfig
 from runtime.cortex import ModeCortexRuntime
+from runtime.replay import SessionReplay, run_replay
 from tests.integration.mock_inputs.data_providers.mock_image_provider import (
     get_image_provider,
     load_test_images,
@@ -358,12 +359,23 @@ async def run_test_case(config: Dict[str, Any]) -> Dict[str, Any]:
     if has_lidar_inputs:
         await load_test_lidar_data(config)
 
+    # Replay a session recorded with --record instead of running a single tick
+    replay = None
+    if "session" in inputs:
+        session_path = Path(inputs["session"])
+        if not session_path.is_absolute():
+            session_path = TEST_CASES_DIR / session_path
+        replay = SessionReplay(str(session_path), speed=None)
+        logging.info(f"Replaying {len(replay.records)} recorded session records")
+
     # No need to modify config - the input_registry will handle mapping
     # the real input types to their mock equivalents
 
     # Build a ModeSystemConfig and initialize the runtime
     mode_system_config = build_mode_system_config_from_test_case(config)
-    cortex = ModeCortexRuntime(mode_system_config, "test_config", hot_reload=False)
+    cortex = ModeCortexRuntime(
+        mode_system_config, "test_config", hot_reload=False, replay=replay
+    )
     await cortex._initialize_mode("default")
 
     assert cortex.current_config is not None
@@ -420,16 +432,23 @@ async def run_test_case(config: Dict[str, Any]) -> Dict[str, Any]:
     cortex.current_config.cortex_llm.ask = mock_llm_ask
 
     # Initialize inputs manually for testing
-    # This step is needed because we're not starting the full runtime
-    await initialize_mock_inputs(cortex.current_config.agent_inputs)
+    # This step is needed because we're not starting the full runtime.
+    # A replay substitutes inputs that only hand out the recorded text.
+    if not replay:
+        await initialize_mock_inputs(cortex.current_config.agent_inputs)
 
     # Set cortex runtime reference for MockRPLidar cleanup
     for input_obj in cortex.current_config.agent_inputs:
         if hasattr(input_obj, "set_cortex_runtime"):
             input_obj.set_cortex_runtime(cortex)  # type: ignore
 
-    # Run a single tick of the cortex loop
-    await cortex._tick()
+    if replay:
+        # Run the whole session; the mode is already initialized
+        cortex._mode_initialized = True
+        await run_replay(cortex, replay)
+    else:
+        # Run a single tick of the cortex loop
+        await cortex._tick()
 
     # Clean up inputs after test completion
     await cleanup_mock_inputs(cortex.current_config.agent_inputs)
@@ -160,3 +160,50 @@ async def test_ask_empty_choices(llm):
         result = await llm.ask("test prompt")
         mock_create.assert_called_once()
         assert result is None
+
+
+def _tool_call_chunk(index, name=None, arguments=None):
+    tool_call = MagicMock()
+    tool_call.index = index
+    tool_call.function.name = name
+    tool_call.function.arguments = arguments
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.tool_calls = [tool_call]
+    return chunk
+
+
+@pytest.mark.asyncio
+async def test_ask_streaming_dispatches_actions_early(config):
+    config.stream = True
+    llm = OpenAILLM(config, available_actions=None)
+    dispatched = []
+    chunks = [
+        _tool_call_chunk(0, "speak", '{"text": '),
+        _tool_call_chunk(0, None, '"hello"}'),
+        _tool_call_chunk(1, "move", '{"action": "wag tail"}'),
+    ]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+            # The speak action is dispatched before the move call arrives
+            if chunk is chunks[1]:
+                assert [a.type for a in dispatched] == ["speak"]
+
+    async def callback(action):
+        dispatched.append(action)
+
+    llm.set_action_callback(callback)
+    with patch.object(
+        llm._client.chat.completions, "create", new_callable=AsyncMock
+    ) as mock_create:
+        mock_create.return_value = stream()
+        result = await llm.ask("test prompt")
+
+    assert mock_create.call_args.kwargs["stream"] is True
+    assert result.actions == [
+        Action(type="speak", value="hello"),
+        Action(type="move", value="wag tail"),
+    ]
+    assert dispatched == result.actions
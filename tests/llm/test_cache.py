@@ -0,0 +1,132 @@
+import types
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from llm import LLM, LLMConfig, load_llm
+from llm.cache import (
+    CachedLLM,
+    ResponseCache,
+    ResponseCacheConfig,
+    normalize_prompt,
+    prompt_key,
+)
+
+
+class DummyOutputModel(BaseModel):
+    test_field: str
+
+
+class MockLLM(LLM[DummyOutputModel]):
+    async def ask(self, prompt: str, messages=None) -> DummyOutputModel:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def inner_llm():
+    llm = MockLLM(
+        LLMConfig(base_url="test_url", api_key="test_key", model="test_model"),
+        available_actions=None,
+    )
+    llm.ask = AsyncMock(return_value=DummyOutputModel(test_field="move"))
+    return llm
+
+
+def test_normalize_prompt():
+    assert normalize_prompt("  look\n\n around \t now ") == "look around now"
+
+
+def test_prompt_key():
+    assert prompt_key("look  around", []) == prompt_key("look\naround", None)
+    assert prompt_key("look around", []) != prompt_key("look left", [])
+    assert prompt_key("look around", []) != prompt_key(
+        "look around", [{"role": "user", "content": "hi"}]
+    )
+
+
+def test_response_cache_ttl_expiry():
+    cache = ResponseCache(ttl=1.0)
+
+    with patch("llm.cache.time.monotonic", return_value=100.0):
+        cache.put("a", 1)
+    with patch("llm.cache.time.monotonic", return_value=100.5):
+        assert cache.get("a") == 1
+    with patch("llm.cache.time.monotonic", return_value=101.5):
+        assert cache.get("a") is None
+
+    assert len(cache) == 0
+    assert cache.stats.evictions == 1
+
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_hit(inner_llm):
+    llm = CachedLLM(inner_llm, ResponseCacheConfig())
+
+    first = await llm.ask("look around")
+    second = await llm.ask("look   around ")
+
+    assert first == second
+    assert first is not second
+    inner_llm.ask.assert_awaited_once()
+    assert llm.stats.hits == 1
+    assert llm.stats.misses == 1
+    assert llm.stats.hit_rate == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_does_not_cache_none(inner_llm):
+    inner_llm.ask.return_value = None
+    llm = CachedLLM(inner_llm, ResponseCacheConfig())
+
+    assert await llm.ask("look around") is None
+    assert await llm.ask("look around") is None
+
+    assert inner_llm.ask.await_count == 2
+    assert len(llm.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_llm_history_is_part_of_key(inner_llm):
+    history_manager = types.SimpleNamespace(get_messages=lambda: list(history))
+    history = []
+    inner_llm._config.history_length = 5
+    inner_llm.history_manager = history_manager
+    llm = CachedLLM(inner_llm, ResponseCacheConfig())
+
+    await llm.ask("look around")
+    history.append({"role": "assistant", "content": "moved"})
+    await llm.ask("look around")
+
+    assert inner_llm.ask.await_count == 2
+    assert llm.history_manager is history_manager
+
+
+def test_load_llm_with_response_cache():
+    with (
+        patch("llm.find_module_with_class") as mock_find_module,
+        patch("llm.importlib.import_module") as mock_import,
+    ):
+        mock_find_module.return_value = "mock_llm"
+        mock_module = types.ModuleType("mock_llm")
+        setattr(mock_module, "MockLLM", MockLLM)
+        mock_import.return_value = mock_module
+
+        result = load_llm({"type": "MockLLM", "config": {"response_cache": {"ttl": 5}}})
+
+    assert isinstance(result, CachedLLM)
+    assert isinstance(result.llm, MockLLM)
+    assert result.cache.ttl == 5
@@ -0,0 +1,37 @@
+from llm.output_model import Action
+from llm.streaming import ToolCallAccumulator
+
+
+def test_call_completes_when_arguments_close():
+    accumulator = ToolCallAccumulator()
+
+    assert accumulator.add(0, "speak", '{"te') == []
+    assert accumulator.add(0, None, 'xt": "hi"') == []
+    assert accumulator.add(0, None, "}") == [Action(type="speak", value="hi")]
+    assert accumulator.finish() == []
+
+
+def test_call_completes_when_next_call_starts():
+    accumulator = ToolCallAccumulator()
+    accumulator.add(0, "wave")
+
+    completed = accumulator.add(1, "speak", '{"te')
+
+    assert completed == [Action(type="wave", value="")]
+
+
+def test_finish_completes_open_calls():
+    accumulator = ToolCallAccumulator()
+    accumulator.add(0, "speak", '{"text": "hi"}')
+    accumulator.add(1, "wave")
+
+    assert accumulator.finish() == [Action(type="wave", value="")]
+    assert [a.type for a in accumulator.actions] == ["speak", "wave"]
+
+
+def test_call_without_name_is_dropped():
+    accumulator = ToolCallAccumulator()
+    accumulator.add(0, None, "{}")
+
+    assert accumulator.finish() == []
+    assert accumulator.actions == []
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from providers.clock import RealClock, SimulatedClock, get_clock, set_clock
+from providers.sleep_ticker_provider import SleepTickerProvider
+
+
+@pytest.fixture
+def clock():
+    clock = SimulatedClock(start=1000.0)
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+    clock.close()
+
+
+def wait_for_sleepers(clock, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while clock.pending < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_default_clock_is_real():
+    assert isinstance(get_clock(), RealClock)
+    assert abs(get_clock().time() - time.time()) < 1.0
+
+
+def test_advance_wakes_threads_in_deadline_order(clock):
+    woken = []
+
+    def sleeper(duration):
+        clock.sleep(duration)
+        woken.append((duration, clock.time()))
+
+    threads = [threading.Thread(target=sleeper, args=(d,)) for d in (2.0, 1.0)]
+    for thread in threads:
+        thread.start()
+    wait_for_sleepers(clock, 2)
+
+    assert clock.advance(0.5) == 0
+    assert clock.advance(1.0) == 1
+    threads[1].join(timeout=2)
+    assert clock.advance(10.0) == 1
+    threads[0].join(timeout=2)
+
+    assert woken == [(1.0, 1001.5), (2.0, 1011.5)]
+    assert clock.time() == 1011.5
+
+
+def test_wait_returns_early_on_event(clock):
+    stop = threading.Event()
+    results = []
+    thread = threading.Thread(target=lambda: results.append(clock.wait(stop, 60)))
+    thread.start()
+    wait_for_sleepers(clock, 1)
+
+    stop.set()
+    thread.join(timeout=2)
+
+    assert results == [True]
+    assert clock.pending == 0
+    assert clock.time() == 1000.0
+
+
+@pytest.mark.asyncio
+async def test_run_for_steps_coroutines_deterministically(clock):
+    ticks = []
+
+    async def ticker():
+        while True:
+            await clock.sleep_async(1.0)
+            ticks.append(clock.time())
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await clock.run_for(5.0)
+    task.cancel()
+
+    assert ticks == [1001.0, 1002.0, 1003.0, 1004.0, 1005.0]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_times_out_on_simulated_time(clock):
+    event = asyncio.Event()
+    waiter = asyncio.create_task(clock.wait_for(event.wait(), 30.0))
+    await asyncio.sleep(0)
+    await clock.run_for(29.0)
+    assert not waiter.done()
+
+    await clock.run_for(1.0)
+    with pytest.raises(asyncio.TimeoutError):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_autojump_runs_hours_in_real_milliseconds():
+    clock = SimulatedClock(start=0.0, autojump=0.001)
+    try:
+        start = time.monotonic()
+        for _ in range(60):
+            await clock.sleep_async(60.0)
+        assert clock.time() == 3600.0
+        assert time.monotonic() - start < 2.0
+    finally:
+        clock.close()
+
+
+@pytest.mark.asyncio
+async def test_sleep_ticker_uses_the_clock(clock):
+    sleep_ticker = SleepTickerProvider()
+    sleep_ticker._skip_sleep = False
+    sleep = asyncio.create_task(sleep_ticker.sleep(5.0))
+    woke = asyncio.create_task(sleep_ticker.wait_for_input(2.0))
+    await asyncio.sleep(0)
+
+    await clock.run_for(2.0)
+    assert await woke is False
+    assert not sleep.done()
+
+    await clock.run_for(3.0)
+    await asyncio.wait_for(sleep, timeout=1)
@@ -1,8 +1,11 @@
 import math
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from providers.d435_provider import D435Provider
+from providers.d435_provider import OBSTACLE_DTYPE, D435Provider, path_obstacles
+from zenoh_msgs import Point32, sensor_msgs, std_msgs
 
 
 @pytest.fixture
@@ -123,3 +126,46 @@ def test_calculate_angle_and_distance_arbitrary_point(d435_provider):
 
     assert math.isclose(angle, expected_angle, abs_tol=1e-10)
     assert math.isclose(distance, expected_distance, abs_tol=1e-10)
+
+
+def test_obstacle_callback_decodes_point_cloud(d435_provider):
+    """
+    Test that obstacles are computed from a serialized PointCloud.
+    """
+    d435_provider.voxel_size = 0.0
+    header = std_msgs.Header(stamp=std_msgs.Time(sec=0, nanosec=0), frame_id="d435")
+    cloud = sensor_msgs.PointCloud(
+        header=header,
+        points=[Point32(x=3.0, y=4.0, z=0.5), Point32(x=1.0, y=0.0, z=0.25)],
+        channels=[],
+    )
+    sample = MagicMock()
+    sample.payload.to_bytes.return_value = cloud.serialize()
+
+    d435_provider.obstacle_callback(sample)
+
+    obstacle = d435_provider.obstacle
+    assert obstacle.dtype == OBSTACLE_DTYPE
+    assert not obstacle.flags.writeable
+    assert d435_provider.obstacle_timestamp > 0
+    np.testing.assert_allclose(obstacle["distance"], [5.0, 1.0])
+    np.testing.assert_allclose(obstacle["angle"], [math.degrees(math.atan2(4, 3)), 0])
+    np.testing.assert_allclose(obstacle["z"], [0.5, 0.25])
+    np.testing.assert_allclose(
+        path_obstacles(obstacle), [[3.0, 4.0, 53.130102, 5.0], [1.0, 0.0, 0.0, 1.0]]
+    )
+
+
+def test_obstacle_voxel_downsample(d435_provider):
+    """
+    Test that points sharing a voxel are reduced to the first of them.
+    """
+    d435_provider.set_voxel_size(0.1)
+    xyz = np.array(
+        [[0.51, 0.02, 0.1], [0.55, 0.08, 0.12], [1.0, -0.5, 0.1], [0.58, 0.01, 0.15]],
+        dtype=np.float32,
+    )
+
+    d435_provider._update_obstacle(xyz)
+
+    np.testing.assert_allclose(d435_provider.obstacle["x"], [0.51, 1.0], rtol=1e-6)
@@ -0,0 +1,152 @@
+import asyncio
+import functools
+import time
+
+import numpy as np
+import pytest
+
+from providers.detection_worker import Detections, DetectionWorker
+
+
+class FakeDetector:
+    """Finds one box over the whole image, classed by its brightness."""
+
+    names = {0: "dark", 1: "bright"}
+
+    def __init__(self, fail_on_height: int = -1):
+        self.fail_on_height = fail_on_height
+
+    def __call__(self, images):
+        if any(image.shape[0] == self.fail_on_height for image in images):
+            raise ValueError("bad frame")
+        return [
+            (
+                [[0, 0, image.shape[1], image.shape[0]]],
+                [image.mean() / 255.0],
+                [int(image.mean() > 127)],
+            )
+            for image in images
+        ]
+
+
+def failing_loader():
+    raise FileNotFoundError("weights.pt")
+
+
+@pytest.fixture
+def worker():
+    worker = DetectionWorker(
+        FakeDetector, threads=1, max_batch=4, batch_window=0.2, context="fork"
+    )
+    worker.start()
+    assert worker.wait_ready(timeout=10)
+    yield worker
+    worker.stop()
+
+
+def frame(height: int, value: int) -> np.ndarray:
+    return np.full((height, 8, 3), value, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("context", ["fork", "spawn"])
+def test_detects_frame_from_shared_memory(context):
+    worker = DetectionWorker(FakeDetector, threads=1, context=context)
+    worker.start()
+    try:
+        detections = worker.submit(0, frame(4, 255)).result(timeout=30)
+    finally:
+        worker.stop()
+
+    assert isinstance(detections, Detections)
+    assert worker.names == FakeDetector.names
+    np.testing.assert_array_equal(detections.boxes, [[0, 0, 8, 4]])
+    assert detections.boxes.dtype == np.float32
+    np.testing.assert_allclose(detections.scores, [1.0])
+    np.testing.assert_array_equal(detections.classes, [1])
+    assert detections.batch_size == 1
+    assert 0 <= detections.inference <= detections.latency
+
+
+def test_batches_frames_of_several_cameras(worker):
+    futures = [worker.submit(camera, frame(4 + camera, 0)) for camera in range(3)]
+
+    results = [future.result(timeout=10) for future in futures]
+
+    assert [r.batch_size for r in results] == [3, 3, 3]
+    assert [r.boxes[0, 3] for r in results] == [4, 5, 6]
+    np.testing.assert_array_equal(np.concatenate([r.classes for r in results]), 0)
+
+
+def test_one_frame_in_flight_per_stream(worker):
+    first = worker.submit("front", frame(4, 0))
+    with pytest.raises(RuntimeError):
+        worker.submit("front", frame(4, 0))
+
+    first.result(timeout=10)
+    # A larger frame gets a larger shared slot
+    larger = worker.submit("front", frame(64, 255)).result(timeout=10)
+    np.testing.assert_array_equal(larger.boxes, [[0, 0, 8, 64]])
+
+
+def test_cancelled_frame_keeps_its_slot_until_answered(worker):
+    first = worker.submit("front", frame(4, 0))
+    assert first.cancel()
+
+    # The worker may still be reading the slot of the cancelled frame
+    with pytest.raises(RuntimeError):
+        worker.submit("front", frame(4, 255))
+
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            second = worker.submit("front", frame(4, 255))
+            break
+        except RuntimeError:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    np.testing.assert_array_equal(second.result(timeout=10).classes, [1])
+
+
+def test_detect_awaits_without_blocking(worker):
+    async def detect_while_ticking():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        detections = await worker.detect(0, frame(4, 255))
+        ticker.cancel()
+        return detections, ticks
+
+    detections, ticks = asyncio.run(detect_while_ticking())
+
+    np.testing.assert_array_equal(detections.classes, [1])
+    assert ticks > 1
+
+
+def test_detector_errors_fail_the_frame():
+    worker = DetectionWorker(
+        functools.partial(FakeDetector, fail_on_height=2), threads=1, context="fork"
+    )
+    worker.start()
+    try:
+        with pytest.raises(RuntimeError, match="bad frame"):
+            worker.submit(0, frame(2, 0)).result(timeout=10)
+        assert worker.submit(0, frame(4, 0)).result(timeout=10).batch_size == 1
+    finally:
+        worker.stop()
+
+
+def test_loader_errors_stop_the_worker():
+    worker = DetectionWorker(failing_loader, threads=1, context="fork")
+    worker.start()
+    future = worker.submit(0, frame(4, 0))
+
+    with pytest.raises(RuntimeError, match="weights.pt"):
+        future.result(timeout=10)
+    assert not worker.running
+    worker.stop()
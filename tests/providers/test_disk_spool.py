@@ -0,0 +1,71 @@
+import json
+import os
+
+from providers.disk_spool import DiskSpool
+
+
+def record(i: int) -> bytes:
+    return json.dumps({"i": i}).encode()
+
+
+def indices(records) -> list:
+    return [json.loads(r)["i"] for r in records]
+
+
+def test_reads_batches_across_segments(tmp_path):
+    spool = DiskSpool(str(tmp_path), max_segment_bytes=30)
+    for i in range(6):
+        spool.append(record(i))
+
+    batch, cursor = spool.read_batch(4)
+    assert indices(batch) == [0, 1, 2, 3]
+    # Not acknowledged yet, so read again
+    assert indices(spool.read_batch(4)[0]) == [0, 1, 2, 3]
+
+    spool.ack(cursor)
+    batch, cursor = spool.read_batch(4)
+    assert indices(batch) == [4, 5]
+    spool.ack(cursor)
+
+    assert spool.read_batch(4)[0] == []
+    assert spool.pending_bytes == 0
+    segments = [name for name in os.listdir(tmp_path) if name.endswith(".jsonl")]
+    assert len(segments) == 1
+
+
+def test_resumes_from_cursor_after_restart(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    for i in range(3):
+        spool.append(record(i))
+    spool.ack(spool.read_batch(1)[1])
+    spool.close()
+
+    restarted = DiskSpool(str(tmp_path))
+    restarted.append(record(3))
+
+    assert indices(restarted.read_batch(10)[0]) == [1, 2, 3]
+
+
+def test_skips_record_torn_by_crash(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append(record(0))
+    spool.close()
+    with open(tmp_path / "000000000000.jsonl", "ab") as f:
+        f.write(b'{"i": 1')
+
+    restarted = DiskSpool(str(tmp_path))
+    restarted.append(record(2))
+
+    assert indices(restarted.read_batch(10)[0]) == [0, 2]
+
+
+def test_drops_oldest_segments_when_full(tmp_path):
+    spool = DiskSpool(str(tmp_path), max_segment_bytes=20, max_bytes=60)
+    for i in range(10):
+        spool.append(record(i))
+
+    assert spool.dropped_bytes > 0
+    assert spool.pending_bytes <= 60
+    batch = spool.read_batch(10)[0]
+    assert indices(batch)[-1] == 9
+    assert indices(batch) == sorted(indices(batch))
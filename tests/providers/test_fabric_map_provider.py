@@ -1,5 +1,5 @@
-import os
-import tempfile
+import gzip
+import json
 import time
 from unittest.mock import MagicMock, patch
 
@@ -11,20 +11,23 @@ from providers.fabric_map_provider import (
     RFData,
     RFDataRaw,
 )
+from providers.sensor_recorder import SensorRecorder, read_recording
 
 
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton instances between tests."""
+def reset_singleton(tmp_path, monkeypatch):
+    """Reset singleton instances between tests, spooling to a temporary dir."""
+    monkeypatch.setenv("OM1_CACHE_DIR", str(tmp_path))
     FabricDataSubmitter.reset()  # type: ignore
     yield
+    FabricDataSubmitter().stop()
     FabricDataSubmitter.reset()  # type: ignore
 
 
 @pytest.fixture
-def mock_requests():
-    with patch("providers.fabric_map_provider.requests") as mock_req:
-        yield mock_req
+def mock_http_client():
+    with patch("providers.fabric_map_provider.get_http_client") as mock_get_client:
+        yield mock_get_client.return_value
 
 
 def test_rf_data_to_dict():
@@ -83,11 +86,11 @@ def test_fabric_url():
     assert "test.endpoint" in provider.base_url
 
 
-def test_share_data(mock_requests):
+def test_share_data(mock_http_client):
     """Test sharing fabric data with an API key."""
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_requests.post.return_value = mock_response
+    mock_http_client.post.return_value = mock_response
 
     provider = FabricDataSubmitter(api_key="test_key")
 
@@ -119,10 +122,10 @@ def test_share_data(mock_requests):
     provider.share_data(fabric_data)
     time.sleep(0.1)
 
-    mock_requests.post.assert_called_once()
+    mock_http_client.post.assert_called_once()
 
 
-def test_share_data_no_api_key(mock_requests):
+def test_share_data_no_api_key(mock_http_client):
     """Test sharing fabric data without an API key."""
     provider = FabricDataSubmitter()
 
@@ -153,14 +156,14 @@ def test_share_data_no_api_key(mock_requests):
 
     provider.share_data(fabric_data)
     time.sleep(0.1)
-    mock_requests.post.assert_not_called()
+    mock_http_client.post.assert_not_called()
 
 
-def test_share_data_with_rf_data(mock_requests):
+def test_share_data_with_rf_data(mock_http_client):
     """Test sharing fabric data including RF data."""
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_requests.post.return_value = mock_response
+    mock_http_client.post.return_value = mock_response
 
     provider = FabricDataSubmitter(api_key="test_key")
 
@@ -201,47 +204,147 @@ def test_share_data_with_rf_data(mock_requests):
     provider.share_data(fabric_data)
     time.sleep(0.1)
 
-    mock_requests.post.assert_called_once()
+    mock_http_client.post.assert_called_once()
 
 
-def test_write_to_local_file(mock_requests):
-    """Test writing fabric data to a local file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+def test_write_to_local_file(mock_http_client, tmp_path):
+    """Test recording fabric data to a local file."""
+    mock_http_client.post.return_value = MagicMock(status_code=201)
+    recorder = SensorRecorder(str(tmp_path / "dump"))
+    with patch(
+        "providers.fabric_map_provider.get_sensor_recorder", return_value=recorder
+    ):
         provider = FabricDataSubmitter(api_key="test_key", write_to_local_file=True)
 
-        provider.filename_base = os.path.join(tmpdir, "fabric")
-        provider.filename_current = provider.update_filename()
-
-        fabric_data = FabricData(
-            machine_id="test_machine",
-            payload_idx=1,
-            gps_unix_ts=1234567890.0,
-            gps_lat=37.7749,
-            gps_lon=-122.4194,
-            gps_alt=10.0,
-            gps_qua=2,
-            rtk_unix_ts=0.0,
-            rtk_lat=0.0,
-            rtk_lon=0.0,
-            rtk_alt=0.0,
-            rtk_qua=0,
-            mag=0.0,
-            unix_ts=1234567890.0,
-            odom_x=0.0,
-            odom_y=0.0,
-            odom_rockchip_ts=0.0,
-            odom_subscriber_ts=0.0,
-            odom_yaw_0_360=0.0,
-            odom_yaw_m180_p180=0.0,
-            rf_data=[],
-            rf_data_raw=[],
-        )
+    provider.share_data(make_fabric_data(1))
+    recorder.close()
+
+    records = list(read_recording(recorder.filename_current))
+    assert [(channel, value["payload_idx"]) for channel, _, value in records] == [
+        ("fabric", 1)
+    ]
+
+
+def make_fabric_data(payload_idx: int) -> FabricData:
+    return FabricData(
+        machine_id="test_machine",
+        payload_idx=payload_idx,
+        gps_unix_ts=1234567890.0,
+        gps_lat=37.7749,
+        gps_lon=-122.4194,
+        gps_alt=10.0,
+        gps_qua=2,
+        rtk_unix_ts=0.0,
+        rtk_lat=0.0,
+        rtk_lon=0.0,
+        rtk_alt=0.0,
+        rtk_qua=0,
+        mag=0.0,
+        unix_ts=1234567890.0,
+        odom_x=0.0,
+        odom_y=0.0,
+        odom_rockchip_ts=0.0,
+        odom_subscriber_ts=0.0,
+        odom_yaw_0_360=0.0,
+        odom_yaw_m180_p180=0.0,
+        rf_data=[],
+        rf_data_raw=[],
+    )
+
+
+def uploaded_indices(post) -> list:
+    indices = []
+    for call in post.call_args_list:
+        assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+        batch = json.loads(gzip.decompress(call.kwargs["data"]))
+        indices.extend(payload["payload_idx"] for payload in batch)
+    return indices
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_spooled_payloads_upload_in_gzipped_batches(mock_http_client):
+    """Test that payloads spooled while offline are sent as one batch."""
+    mock_http_client.post.return_value = MagicMock(status_code=201)
+    provider = FabricDataSubmitter(api_key="test_key", max_batch=8)
+    provider.stop()
+
+    for i in range(5):
+        provider.share_data(make_fabric_data(i))
+    provider.start()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_requests.post.return_value = mock_response
+    wait_for(lambda: provider.spool.pending_bytes == 0)
+    assert uploaded_indices(mock_http_client.post) == [0, 1, 2, 3, 4]
+    assert mock_http_client.post.call_count == 1
 
-        provider.share_data(fabric_data)
-        time.sleep(0.1)
 
-        assert os.path.exists(provider.filename_current)
+def test_spool_survives_outage_and_restart(mock_http_client):
+    """Test that payloads are kept while FABRIC is unreachable."""
+    mock_http_client.post.side_effect = ConnectionError("offline")
+    provider = FabricDataSubmitter(api_key="test_key", max_batch=8)
+    provider.share_data(make_fabric_data(0))
+    provider.share_data(make_fabric_data(1))
+    wait_for(lambda: mock_http_client.post.call_count >= 1)
+    provider.stop()
+    FabricDataSubmitter.reset()  # type: ignore
+
+    mock_http_client.post.reset_mock(side_effect=True)
+    mock_http_client.post.return_value = MagicMock(status_code=201)
+    restarted = FabricDataSubmitter(api_key="test_key", max_batch=8)
+
+    wait_for(lambda: restarted.spool.pending_bytes == 0)
+    assert uploaded_indices(mock_http_client.post) == [0, 1]
+
+
+def test_payloads_are_sent_one_by_one_by_default(mock_http_client):
+    """Test that each payload is sent as an uncompressed JSON object."""
+    mock_http_client.post.return_value = MagicMock(status_code=201)
+    provider = FabricDataSubmitter(api_key="test_key")
+    provider.share_data(make_fabric_data(0))
+    provider.share_data(make_fabric_data(1))
+
+    wait_for(lambda: provider.spool.pending_bytes == 0)
+    sent = [call.kwargs for call in mock_http_client.post.call_args_list]
+    assert [json.loads(kwargs["data"])["payload_idx"] for kwargs in sent] == [0, 1]
+    assert all("Content-Encoding" not in kwargs["headers"] for kwargs in sent)
+
+
+def test_rejected_batch_falls_back_to_single_payloads(mock_http_client):
+    """Test that a batch FABRIC rejects is kept and sent payload by payload."""
+
+    def post(url, headers, data, timeout):
+        if "Content-Encoding" in headers:
+            return MagicMock(status_code=413)
+        return MagicMock(status_code=201)
+
+    mock_http_client.post.side_effect = post
+    provider = FabricDataSubmitter(api_key="test_key", max_batch=8)
+    provider.stop()
+    for i in range(3):
+        provider.share_data(make_fabric_data(i))
+    provider.start()
+
+    wait_for(lambda: provider.spool.pending_bytes == 0)
+    singles = [
+        json.loads(call.kwargs["data"])["payload_idx"]
+        for call in mock_http_client.post.call_args_list
+        if "Content-Encoding" not in call.kwargs["headers"]
+    ]
+    assert singles == [0, 1, 2]
+    assert provider.max_batch == 1
+
+
+def test_unauthorized_payloads_stay_in_the_spool(mock_http_client):
+    """Test that a payload is not dropped on a non-payload client error."""
+    mock_http_client.post.return_value = MagicMock(status_code=401)
+    provider = FabricDataSubmitter(api_key="test_key")
+    provider.share_data(make_fabric_data(0))
+
+    wait_for(lambda: mock_http_client.post.call_count >= 1)
+    provider.stop()
+    assert provider.spool.read_batch(8)[0]
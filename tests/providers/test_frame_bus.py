@@ -0,0 +1,136 @@
+import base64
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from providers import frame_bus
+from providers.frame_bus import FrameBus, fit_resolution, open_webcam, release_webcam
+
+
+@pytest.fixture
+def bus():
+    bus = FrameBus("test")
+    yield bus
+    bus.close()
+
+
+def make_image(width=800, height=600):
+    return np.full((height, width, 3), 128, dtype=np.uint8)
+
+
+def test_fit_resolution_keeps_aspect_ratio():
+    assert fit_resolution((600, 800, 3), (640, 480)) == (640, 480)
+    assert fit_resolution((1200, 1600, 3), (640, 480)) == (640, 480)
+    assert fit_resolution((800, 600, 3), (640, 480)) == (360, 480)
+
+
+def test_frame_encodes_once_per_representation(bus):
+    frame = bus.publish(make_image())
+
+    with patch.object(frame_bus.cv2, "imencode", wraps=cv2.imencode) as imencode:
+        first = frame.base64((640, 480), 70)
+        second = frame.base64((640, 480), 70)
+        jpeg = frame.jpeg((640, 480), 70)
+        frame.jpeg((320, 240), 70)
+
+    assert first is second
+    assert base64.b64decode(first) == jpeg
+    assert imencode.call_count == 2
+    decoded = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == (480, 640, 3)
+    assert frame.resized((640, 360), keep_aspect=False).shape == (360, 640, 3)
+    assert not frame.image.flags.writeable
+
+
+def test_latest_and_wait(bus):
+    assert bus.latest is None
+    assert bus.wait(timeout=0) is None
+
+    bus.publish(make_image())
+    frame = bus.publish(make_image())
+
+    assert bus.latest is frame
+    assert frame.sequence == 2
+    assert bus.wait(after=1, timeout=0) is frame
+    assert bus.wait(after=2, timeout=0) is None
+
+    threading.Timer(0.05, bus.publish, [make_image()]).start()
+    assert bus.wait(after=2, timeout=2.0).sequence == 3
+
+
+def test_slow_subscriber_drops_frames(bus):
+    received = []
+    done = threading.Event()
+
+    def slow(frame):
+        received.append(frame.sequence)
+        time.sleep(0.1)
+        if frame.sequence == 10:
+            done.set()
+
+    subscription = bus.subscribe(slow)
+    for _ in range(10):
+        bus.publish(make_image(8, 6))
+        time.sleep(0.01)
+
+    assert done.wait(2.0)
+    subscription.close()
+
+    assert received[-1] == 10
+    assert len(received) < 10
+    assert subscription.dropped == 10 - len(received)
+
+
+def mock_capture():
+    capture = MagicMock()
+    capture.isOpened.return_value = True
+    capture.read.return_value = (True, make_image(8, 6))
+    capture.get.side_effect = lambda prop: {
+        cv2.CAP_PROP_FRAME_WIDTH: 8,
+        cv2.CAP_PROP_FRAME_HEIGHT: 6,
+    }[prop]
+    return capture
+
+
+def test_webcam_is_opened_once():
+    capture = mock_capture()
+
+    with patch.object(frame_bus.cv2, "VideoCapture", return_value=capture) as opener:
+        first = open_webcam(7, (8, 6))
+        second = open_webcam(7)
+
+    try:
+        assert first is second
+        opener.assert_called_once_with(7)
+        assert frame_bus.webcam_is_open(7)
+        assert (first.width, first.height) == (8, 6)
+        assert first.bus.wait(timeout=2.0) is not None
+    finally:
+        release_webcam(first)
+        release_webcam(second)
+    assert not frame_bus.webcam_is_open(7)
+
+
+def test_webcam_is_released_by_its_last_user():
+    capture = mock_capture()
+
+    with patch.object(frame_bus.cv2, "VideoCapture", return_value=capture):
+        first = open_webcam(7)
+        second = open_webcam(7)
+
+    release_webcam(first)
+    assert first.running
+    capture.release.assert_not_called()
+
+    release_webcam(second)
+    assert not first.running
+    capture.release.assert_called_once()
+    assert not frame_bus.webcam_is_open(7)
+
+    # Releasing again does not touch a capture opened later
+    release_webcam(second)
+    capture.release.assert_called_once()
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import pytest
+import requests
+
+from providers.http_client import HTTPClient, RetryPolicy
+
+FAST_RETRY = RetryPolicy(attempts=3, backoff=0.0)
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers with a queued status, echoing the request body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.methods.append(self.command)
+            status = server.statuses.pop(0) if server.statuses else 200
+        payload = json.dumps({"path": self.path, "body": body.decode()}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = set()
+    server.methods = []
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HTTPClient(pool_size=2, timeout=5.0, retry=FAST_RETRY)
+    yield client
+    client.close()
+
+
+def url(server, path="/status"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_reuses_connections(server, client):
+    for i in range(5):
+        response = client.post(url(server), json={"i": i})
+        assert response.json()["body"] == json.dumps({"i": i})
+
+    assert len(server.connections) == 1
+    stats = client.stats()[f"127.0.0.1:{server.server_address[1]}"]
+    assert (stats.requests, stats.errors, stats.retries) == (5, 0, 0)
+    assert 0 < stats.mean_latency <= stats.max_latency
+
+
+def test_retries_idempotent_requests_only(server, client):
+    server.statuses = [503, 502]
+    assert client.get(url(server)).status_code == 200
+    assert server.methods == ["GET"] * 3
+
+    server.statuses = [503]
+    assert client.post(url(server)).status_code == 503
+
+    stats = client.stats()[f"127.0.0.1:{server.server_address[1]}"]
+    assert (stats.requests, stats.errors, stats.retries) == (4, 3, 2)
+
+
+def test_connection_errors_raise_after_retries(client):
+    with pytest.raises(requests.ConnectionError):
+        client.get("http://127.0.0.1:1/status")
+
+    assert client.stats()["127.0.0.1:1"].requests == 3
+
+
+def test_async_requests_share_a_session(server, client):
+    async def send():
+        try:
+            server.statuses = [429]
+            responses = await asyncio.gather(
+                *(client.get_async(url(server, f"/{i}")) for i in range(3))
+            )
+            posted = await client.post_async(url(server), json={"a": 1}, timeout=2)
+            return responses, posted
+        finally:
+            await client.aclose()
+
+    responses, posted = asyncio.run(send())
+
+    assert [r.status for r in responses] == [200, 200, 200]
+    assert sorted(r.json()["path"] for r in responses) == ["/0", "/1", "/2"]
+    assert posted.ok and posted.json()["body"] == '{"a": 1}'
+    assert len(server.connections) <= 2
+    assert client.stats()[f"127.0.0.1:{server.server_address[1]}"].retries == 1
+
+
+def test_async_connection_errors_raise(client):
+    async def send():
+        try:
+            return await client.get_async("http://127.0.0.1:1/status")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(aiohttp.ClientError):
+        asyncio.run(send())
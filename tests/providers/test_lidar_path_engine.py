@@ -0,0 +1,148 @@
+import math
+
+import numpy as np
+import pytest
+
+from providers.lidar_path_engine import LidarPathEngine
+
+PATH_ANGLES = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
+
+
+def make_paths(length: float = 1.0):
+    paths = []
+    for angle in PATH_ANGLES:
+        rad = math.radians(angle)
+        paths.append(
+            np.array(
+                [
+                    np.linspace(0.0, length * math.sin(rad), 30),
+                    np.linspace(0.0, length * math.cos(rad), 30),
+                ]
+            )
+        )
+    return paths
+
+
+def make_engine(**kwargs):
+    params = dict(
+        half_width_robot=0.20,
+        relevant_distance_max=1.1,
+        relevant_distance_min=0.08,
+        sensor_mounting_angle=180.0,
+    )
+    params.update(kwargs)
+    return LidarPathEngine(make_paths(), **params)
+
+
+def scalar_distance(px, py, x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    if dx == 0 and dy == 0:
+        return math.hypot(px - x1, py - y1)
+    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+    t = max(0, min(1, t))
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+def test_empty_scan_keeps_all_paths():
+    engine = make_engine()
+    result = engine.process(np.empty((0, 2)))
+
+    assert result.valid_paths == list(range(10))
+    assert result.points.shape == (0, 4)
+    assert result.raw.shape == (0, 2)
+
+
+def test_orient_wraps_angles():
+    engine = make_engine(sensor_mounting_angle=180.0)
+    oriented = engine.orient(np.array([[0.0, 0.5], [190.0, 0.5], [359.0, 0.5]]))
+
+    np.testing.assert_allclose(oriented[:, 0], [180.0, 10.0, 179.0])
+    np.testing.assert_allclose(oriented[:, 1], [0.5, 0.5, 0.5])
+
+
+def test_distance_filter():
+    engine = make_engine()
+    oriented = engine.orient(
+        np.array([[0.0, 0.05], [10.0, 0.5], [20.0, 2.0], [30.0, np.nan]])
+    )
+    points = engine.to_points(oriented)
+
+    assert len(points) == 1
+    assert points[0, 3] == pytest.approx(0.5)
+
+
+def test_blanked_angles_are_masked():
+    engine = make_engine(angles_blanked=[[-170.0, -150.0]])
+    result = engine.process(
+        np.array([[0.0, 0.5], [190.0, 0.5], [200.0, 0.5], [215.0, 0.5]])
+    )
+
+    assert len(result.points) == 2
+    assert -170.0 not in result.points[:, 2]
+    assert -160.0 not in result.points[:, 2]
+
+
+def test_obstacle_straight_ahead_blocks_forward_paths():
+    engine = make_engine()
+    # sensor 0 deg with a 180 deg mounting angle is straight ahead
+    result = engine.process(np.array([[0.0, 0.5]]))
+
+    assert result.points[0, 1] == pytest.approx(0.5)
+    assert 4 not in result.valid_paths
+    assert 9 in result.valid_paths
+    assert 0 in result.valid_paths
+
+
+def test_retreat_only_checks_points_behind():
+    engine = make_engine()
+    behind = engine.process(np.array([[180.0, 0.5]]))
+    ahead = engine.process(np.array([[0.0, 0.15]]))
+
+    assert 9 not in behind.valid_paths
+    assert 9 in ahead.valid_paths
+
+
+def test_obstacles_are_merged_and_sorted():
+    engine = make_engine()
+    obstacles = np.array([[0.0, 0.5, 0.0, 0.5], [0.0, 0.6, -90.0, 0.6]])
+    result = engine.process(np.array([[90.0, 0.5]]), obstacles)
+
+    assert len(result.points) == 3
+    assert np.all(np.diff(result.points[:, 2]) >= 0)
+    assert 4 not in result.valid_paths
+
+
+def test_candidate_paths_subset():
+    engine = make_engine(candidate_paths=[4])
+
+    assert engine.process(np.empty((0, 2))).valid_paths == [4]
+    assert engine.process(np.array([[0.0, 0.5]])).valid_paths == []
+
+
+def test_matches_scalar_reference():
+    rng = np.random.default_rng(0)
+    engine = make_engine()
+    paths = make_paths()
+
+    angles = rng.uniform(-180.0, 180.0, 500)
+    distances = rng.uniform(0.1, 1.0, 500)
+    x = distances * np.cos(np.radians(angles))
+    y = distances * np.sin(np.radians(angles))
+
+    blocked = engine.blocked_paths(x, y)
+
+    for i, path in enumerate(paths):
+        expected = False
+        for px, py in zip(x, y):
+            if i == 9 and py >= 0:
+                continue
+            if (
+                scalar_distance(
+                    px, py, path[0][0], path[1][0], path[0][-1], path[1][-1]
+                )
+                < 0.20
+            ):
+                expected = True
+                break
+        assert blocked[i] == expected
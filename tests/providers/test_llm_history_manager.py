@@ -5,7 +5,11 @@ from unittest.mock import AsyncMock, MagicMock
 import openai
 import pytest
 
-from providers.llm_history_manager import ChatMessage, LLMHistoryManager
+from providers.llm_history_manager import (
+    ChatMessage,
+    DeferredHistory,
+    LLMHistoryManager,
+)
 
 
 @dataclass
@@ -582,3 +586,58 @@ async def test_multiple_summarization_failures_prevent_unbounded_growth():
 
     # Final check: history should be at or below history_length
     assert len(history_manager.history) <= config.history_length
+
+
+@pytest.mark.asyncio
+async def test_deferred_history_is_applied_on_commit():
+    """Test that calls inside defer leave the history unchanged until commit."""
+    config = MagicMock()
+    config.model = "gpt-4o"
+    config.history_length = 10
+    config.agent_name = "TestBot"
+
+    history_manager = LLMHistoryManager(config, AsyncMock())
+    history_manager.history.append(ChatMessage(role="user", content="Earlier"))
+    history_manager.history.append(ChatMessage(role="assistant", content="Reply"))
+    sent = []
+
+    class MockLLMProvider:
+        def __init__(self):
+            self._config = config
+            self._skip_state_management = False
+            self.history_manager = history_manager
+            self.io_provider = history_manager.io_provider
+
+        @LLMHistoryManager.update_history()
+        async def process(self, prompt: str, messages: list):
+            sent.append(messages)
+            response = MagicMock()
+            response.actions = [MockAction(type="speak", value="Hello")]
+            return response
+
+    provider = MockLLMProvider()
+    provider.io_provider.add_input("audio", "Deferred input", 1234.0)
+
+    deferred = DeferredHistory()
+    with deferred.defer():
+        await provider.process("test prompt")
+    discarded = DeferredHistory()
+    with discarded.defer():
+        await provider.process("test prompt")
+
+    assert len(sent[0]) == 3
+    assert "Deferred input" in sent[0][-1]["content"]
+    assert len(history_manager.history) == 2
+    assert history_manager.frame_index == 0
+
+    await deferred.commit()
+
+    assert [message.role for message in history_manager.history] == [
+        "user",
+        "assistant",
+        "user",
+        "assistant",
+    ]
+    assert "Deferred input" in history_manager.history[2].content
+    assert "Hello" in history_manager.history[3].content
+    assert history_manager.frame_index == 1
@@ -1,6 +1,15 @@
+import itertools
 from unittest.mock import MagicMock, patch
 
-from providers.rplidar_driver import RPDriver
+import numpy as np
+import pytest
+
+from providers.rplidar_driver import (
+    ExpressPacket,
+    RPDriver,
+    RPLidarException,
+    _decode_express_packets,
+)
 
 
 def test_rplidar_driver_initialization():
@@ -88,3 +97,134 @@ def test_rplidar_driver_stop():
         assert driver.scanning[0] is False
         mock_serial_instance.write.assert_called()
         mock_serial_instance.flushInput.assert_called()
+
+
+class FakeSerial:
+    """Serial port replaying a byte stream in chunks of at most `chunk` bytes."""
+
+    def __init__(self, data, chunk=200):
+        self.data = bytearray(data)
+        self.chunk = chunk
+
+    def inWaiting(self):
+        return min(len(self.data), self.chunk)
+
+    def read(self, size):
+        chunk = bytes(self.data[:size])
+        del self.data[:size]
+        return chunk
+
+    def write(self, data):
+        pass
+
+    def setDTR(self, value):
+        pass
+
+    def flushInput(self):
+        self.data.clear()
+
+
+def encode_express_packet(start_angle, distances, offsets):
+    """Encode 32 (distance, angle offset in 1/8 degree) pairs as a packet."""
+    packet = bytearray(84)
+    angle_q6 = int(start_angle * 64)
+    packet[2] = angle_q6 & 0xFF
+    packet[3] = angle_q6 >> 8
+    for cabin in range(16):
+        base = 4 + cabin * 5
+        for half in range(2):
+            distance = int(distances[cabin * 2 + half])
+            offset = int(offsets[cabin * 2 + half])
+            magnitude = abs(offset)
+            packet[base + half * 2] = (
+                ((distance & 0x3F) << 2) | ((offset < 0) << 1) | (magnitude >> 4)
+            )
+            packet[base + half * 2 + 1] = distance >> 6
+            packet[base + 4] |= (magnitude & 0x0F) << (half * 4)
+    checksum = 0
+    for byte in packet[2:]:
+        checksum ^= byte
+    packet[0] = 0xA0 | (checksum & 0x0F)
+    packet[1] = 0x50 | (checksum >> 4)
+    return bytes(packet)
+
+
+def express_stream(packets=120, seed=0):
+    rng = np.random.default_rng(seed)
+    stream = b""
+    for i in range(packets):
+        stream += encode_express_packet(
+            (i * 11.25 + 3.0) % 360,
+            rng.integers(0, 3000, 32),
+            rng.integers(-31, 32, 32),
+        )
+    return stream
+
+
+def make_driver(data):
+    with patch("providers.rplidar_driver.serial.Serial", return_value=FakeSerial(data)):
+        driver = RPDriver(port="/dev/ttyUSB0")
+    driver.scanning = [True, 84, "express"]
+    return driver
+
+
+def test_decode_express_packets_matches_scalar_parser():
+    stream = express_stream(packets=8)
+    packets = np.frombuffer(stream, dtype=np.uint8).reshape(8, 84)
+
+    valid, start_angle, distance, angle = _decode_express_packets(packets)
+
+    assert valid.all()
+    for i in range(8):
+        packet = ExpressPacket.from_string(stream[i * 84 : (i + 1) * 84])
+        assert start_angle[i] == packet.start_angle
+        np.testing.assert_array_equal(distance[i], packet.distance)
+        np.testing.assert_array_equal(angle[i], packet.angle)
+
+    corrupted = packets.copy()
+    corrupted[3, 10] ^= 0xFF
+    valid = _decode_express_packets(corrupted)[0]
+    assert list(valid) == [True, True, True, False, True, True, True, True]
+
+
+def test_express_scans_match_per_measurement_path():
+    stream = express_stream()
+
+    fast = make_driver(stream).iter_scans_local("express", max_buf_meas=False)
+    fast_scans = list(itertools.islice(fast, 3))
+
+    reference = make_driver(stream)
+    slow_scans = []
+    scan_list = []
+    for new_scan, _, angle, distance in reference.iter_measures("express", False):
+        if new_scan:
+            if len(scan_list) > 5:
+                slow_scans.append(scan_list)
+            scan_list = []
+            if len(slow_scans) == 3:
+                break
+        if 0 < distance < 2000:
+            scan_list.append((angle, distance))
+
+    for fast_scan, slow_scan in zip(fast_scans, slow_scans):
+        assert fast_scan.dtype == np.float32
+        np.testing.assert_allclose(fast_scan, slow_scan, atol=1e-3)
+
+
+def test_express_corrupted_packet_restarts_scan():
+    stream = bytearray(express_stream(packets=4))
+    stream[2 * 84 + 10] ^= 0xFF
+    driver = make_driver(bytes(stream))
+
+    with patch.object(
+        driver, "_restart_express", side_effect=RPLidarException("restarted")
+    ) as restart:
+        blocks = driver.iter_express_measures(max_buf_meas=False)
+        new_scan, angle, distance = next(blocks)
+        restart.assert_not_called()
+
+        with pytest.raises(RPLidarException, match="restarted"):
+            next(blocks)
+
+    # Only the first packet is resolved; the second needs the corrupted one
+    assert len(new_scan) == len(angle) == len(distance) == 32
@@ -0,0 +1,76 @@
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from providers.scan_ring import SharedScanRing
+
+
+def write_scans(ring: SharedScanRing, count: int):
+    for i in range(count):
+        ring.write(np.full((10 + i, 2), i, dtype=np.float32))
+
+
+@pytest.fixture
+def ring():
+    ring = SharedScanRing(capacity=3, max_points=16)
+    yield ring
+    ring.close()
+
+
+def test_latest_returns_newest_scan(ring):
+    assert ring.latest(timeout=0) is None
+
+    ring.write(np.array([[1.0, 100.0], [2.0, 200.0]]))
+    sequence, scan = ring.latest()
+
+    assert sequence == 1
+    assert scan.dtype == np.float32
+    np.testing.assert_array_equal(scan, [[1.0, 100.0], [2.0, 200.0]])
+    assert not scan.flags.writeable
+    assert ring.latest(after=1, timeout=0) is None
+
+
+def test_latest_skips_to_newest(ring):
+    write_scans(ring, 5)
+
+    sequence, scan = ring.latest(after=1)
+
+    assert sequence == 5
+    assert scan.shape == (14, 2)
+    assert np.all(scan == 4)
+
+
+def test_is_current_detects_overwrite(ring):
+    ring.write(np.zeros((4, 2)))
+    sequence, _ = ring.latest()
+    assert ring.is_current(sequence)
+
+    write_scans(ring, ring.capacity)
+
+    assert not ring.is_current(sequence)
+
+
+def test_long_scan_is_truncated(ring):
+    ring.write(np.ones((20, 2)))
+
+    _, scan = ring.latest()
+
+    assert len(scan) == ring.max_points
+
+
+@pytest.mark.parametrize("context", ["fork", "spawn"])
+def test_scans_from_another_process(context):
+    ring = SharedScanRing(capacity=3, max_points=16, context=context)
+    process = mp.get_context(context).Process(target=write_scans, args=(ring, 2))
+    process.start()
+
+    latest = ring.latest(after=1, timeout=10)
+    process.join(timeout=10)
+
+    assert latest is not None
+    sequence, scan = latest
+    assert sequence == 2
+    assert scan.shape == (11, 2)
+    assert np.all(scan == 1)
+    ring.close()
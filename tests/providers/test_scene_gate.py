@@ -0,0 +1,80 @@
+import base64
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from providers.scene_gate import SceneChangeGate
+
+
+def make_scene(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (6, 8, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (640, 480), interpolation=cv2.INTER_NEAREST)
+
+
+def encode(image: np.ndarray) -> str:
+    _, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 70])
+    return base64.b64encode(buffer.tobytes()).decode("utf-8")
+
+
+@pytest.fixture
+def scene():
+    return make_scene(0)
+
+
+def test_skips_unchanged_scene(scene):
+    gate = SceneChangeGate(threshold=5.0, max_staleness=10.0)
+
+    assert gate.should_send(scene, now=0.0)
+    assert not gate.should_send(scene.copy(), now=1.0)
+    assert gate.should_send(make_scene(1), now=2.0)
+    assert (gate.sent, gate.skipped) == (2, 1)
+
+
+def test_small_noise_is_not_a_scene_change(scene):
+    gate = SceneChangeGate(threshold=5.0, max_staleness=10.0)
+    noise = np.random.default_rng(2).integers(-3, 4, scene.shape)
+    noisy = np.clip(scene.astype(int) + noise, 0, 255).astype(np.uint8)
+
+    assert gate.should_send(scene, now=0.0)
+    assert not gate.should_send(noisy, now=1.0)
+
+
+def test_max_staleness_forces_send(scene):
+    gate = SceneChangeGate(threshold=5.0, max_staleness=3.0)
+
+    assert gate.should_send(scene, now=0.0)
+    assert not gate.should_send(scene, now=2.9)
+    assert gate.should_send(scene, now=3.0)
+    assert not gate.should_send(scene, now=4.0)
+
+
+def test_motion_hint_and_zero_threshold_send_every_frame(scene):
+    moving = MagicMock(return_value=True)
+    gate = SceneChangeGate(threshold=5.0, max_staleness=10.0, motion_hint=moving)
+    assert gate.should_send(scene, now=0.0)
+    assert gate.should_send(scene, now=0.1)
+
+    moving.side_effect = RuntimeError("odometry gone")
+    assert not gate.should_send(scene, now=0.2)
+
+    ungated = SceneChangeGate(threshold=0.0)
+    assert ungated.should_send(scene, now=0.0)
+    assert ungated.should_send(scene, now=0.1)
+
+
+def test_wrap_forwards_changed_base64_frames(scene):
+    callback = MagicMock()
+    gated = SceneChangeGate(threshold=5.0, max_staleness=10.0).wrap(callback)
+    frames = [encode(scene), encode(scene), encode(make_scene(1)), "not a jpeg"]
+
+    for frame in frames:
+        gated(frame)
+
+    assert [c.args[0] for c in callback.call_args_list] == [
+        frames[0],
+        frames[2],
+        frames[3],
+    ]
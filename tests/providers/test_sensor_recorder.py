@@ -0,0 +1,101 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from providers.sensor_recorder import (
+    SensorRecorder,
+    decode_value,
+    encode_value,
+    get_sensor_recorder,
+    read_recording,
+)
+
+
+def recordings(directory) -> list:
+    return sorted(glob.glob(os.path.join(str(directory), "*.om1rec")))
+
+
+def read_all(directory, **kwargs) -> list:
+    return [
+        record
+        for path in recordings(directory)
+        for record in read_recording(path, **kwargs)
+    ]
+
+
+def test_encodes_arrays_natively():
+    frame = np.arange(12, dtype=np.float32).reshape(6, 2)
+    value = {"frame": frame, "odom_x": np.float64(1.5), "labels": ["cup", "dog"]}
+
+    decoded = decode_value(memoryview(encode_value(value)))
+
+    np.testing.assert_array_equal(decoded["frame"], frame)
+    assert decoded["frame"].dtype == np.float32
+    assert decoded["odom_x"] == 1.5
+    assert decoded["labels"] == ["cup", "dog"]
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_records_channels_with_timestamps(tmp_path, compression):
+    recorder = SensorRecorder(str(tmp_path), compression=compression)
+    for i in range(3):
+        recorder.record("rplidar", {"frame": np.full((4, 2), i)}, timestamp=10.0 + i)
+        recorder.record("yolo", {"frame": i}, timestamp=10.5 + i)
+    recorder.close()
+
+    records = read_all(tmp_path)
+    assert [(c, t) for c, t, _ in records] == [
+        ("rplidar", 10.0),
+        ("yolo", 10.5),
+        ("rplidar", 11.0),
+        ("yolo", 11.5),
+        ("rplidar", 12.0),
+        ("yolo", 12.5),
+    ]
+    np.testing.assert_array_equal(records[4][2]["frame"], np.full((4, 2), 2))
+    assert recorder.recorded == 6
+
+
+def test_rotates_files_and_filters_with_index(tmp_path):
+    recorder = SensorRecorder(str(tmp_path), chunk_bytes=1, max_file_bytes=200)
+    for i in range(10):
+        recorder.record("rplidar", np.zeros(16, dtype=np.float32), timestamp=float(i))
+        recorder.record("odom", {"x": i}, timestamp=i + 0.5)
+    recorder.close()
+
+    assert len(recordings(tmp_path)) > 1
+    assert all(os.path.exists(f"{path}.idx") for path in recordings(tmp_path))
+    odom = read_all(tmp_path, channels=["odom"], start=3.0, end=6.0)
+    assert [value["x"] for _, _, value in odom] == [3, 4, 5]
+
+
+def test_reads_recording_without_index(tmp_path):
+    recorder = SensorRecorder(str(tmp_path))
+    recorder.record("fabric", {"payload_idx": 1}, timestamp=1.0)
+    recorder.flush()
+    recorder.record("fabric", {"payload_idx": 2}, timestamp=2.0)
+    recorder.close()
+
+    path = recordings(tmp_path)[0]
+    os.remove(f"{path}.idx")
+    assert [v["payload_idx"] for _, _, v in read_recording(path)] == [1, 2]
+
+
+def test_drops_records_when_writer_is_behind(tmp_path):
+    recorder = SensorRecorder(str(tmp_path), max_queue=1)
+    recorder._ensure_started = lambda: None
+
+    recorder.record("rplidar", [1])
+    recorder.record("rplidar", [2])
+
+    assert recorder.dropped == 1
+
+
+def test_recorder_is_shared_per_directory(tmp_path):
+    recorder = get_sensor_recorder(str(tmp_path))
+
+    assert get_sensor_recorder(os.path.join(str(tmp_path), ".")) is recorder
+    assert get_sensor_recorder(str(tmp_path / "other")) is not recorder
+    assert not recordings(tmp_path)
@@ -184,3 +184,56 @@ async def test_skip_sleep_thread_safety(sleep_ticker):
         t.join()
 
     assert isinstance(sleep_ticker.skip_sleep, bool)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_times_out(sleep_ticker):
+    start_time = time.time()
+    woke = await sleep_ticker.wait_for_input(0.05)
+
+    assert woke is False
+    assert time.time() - start_time >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_wait_for_input(sleep_ticker):
+    async def notify():
+        await asyncio.sleep(0.05)
+        sleep_ticker.notify()
+
+    start_time = time.time()
+    asyncio.create_task(notify())
+    woke = await sleep_ticker.wait_for_input(2.0)
+
+    assert woke is True
+    assert time.time() - start_time < 1.0
+
+
+@pytest.mark.asyncio
+async def test_notify_before_wait_is_kept(sleep_ticker):
+    await sleep_ticker.wait_for_input(0)
+    sleep_ticker.notify()
+
+    assert await sleep_ticker.wait_for_input(2.0) is True
+    assert await sleep_ticker.wait_for_input(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_notify_from_thread(sleep_ticker):
+    await sleep_ticker.wait_for_input(0)
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, lambda: loop.run_in_executor(None, sleep_ticker.notify))
+
+    assert await sleep_ticker.wait_for_input(2.0) is True
+
+
+@pytest.mark.asyncio
+async def test_skip_sleep_wakes_wait_for_input(sleep_ticker):
+    await sleep_ticker.wait_for_input(0)
+
+    async def skip():
+        await asyncio.sleep(0.05)
+        sleep_ticker.skip_sleep = True
+
+    asyncio.create_task(skip())
+    assert await sleep_ticker.wait_for_input(2.0) is True
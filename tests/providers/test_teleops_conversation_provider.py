@@ -69,8 +69,8 @@ def test_singleton_pattern():
     assert provider1 is provider2
 
 
-@patch("providers.teleops_conversation_provider.requests.post")
-def test_store_user_message(mock_post):
+@patch("providers.teleops_conversation_provider.get_http_client")
+def test_store_user_message(mock_get_client):
     """Test storing a user message with an API key."""
     provider = TeleopsConversationProvider(api_key="test_key")
 
@@ -84,8 +84,8 @@ def test_store_user_message(mock_post):
         assert message.message_type == MessageType.USER
 
 
-@patch("providers.teleops_conversation_provider.requests.post")
-def test_store_robot_message(mock_post):
+@patch("providers.teleops_conversation_provider.get_http_client")
+def test_store_robot_message(mock_get_client):
     """Test storing a robot message with an API key."""
     provider = TeleopsConversationProvider(api_key="test_key")
 
@@ -245,11 +245,9 @@ def test_teleops_status_from_dict():
 @pytest.fixture
 def mock_teleops_dependencies():
     """Mock dependencies for TeleopsStatusProvider."""
-    with (
-        patch("providers.teleops_status_provider.requests.get") as mock_get,
-        patch("providers.teleops_status_provider.requests.post") as mock_post,
-    ):
-        yield mock_get, mock_post
+    with patch("providers.teleops_status_provider.get_http_client") as mock_get_client:
+        mock_client = mock_get_client.return_value
+        yield mock_client.get, mock_client.post
 
 
 def test_teleops_status_provider_initialization(mock_teleops_dependencies):
@@ -0,0 +1,77 @@
+import json
+import time
+
+import pytest
+
+from providers.trace_provider import TraceProvider
+
+
+@pytest.fixture
+def trace_provider():
+    TraceProvider.reset()  # type: ignore
+    provider = TraceProvider(capacity=8)
+    yield provider
+    TraceProvider.reset()  # type: ignore
+
+
+def test_span_records_duration_and_tick(trace_provider):
+    trace_provider.io_provider._tick_counter = 3
+
+    with trace_provider.span("fuse", calls=2):
+        time.sleep(0.01)
+
+    (span,) = trace_provider.spans()
+    assert span.name == "fuse"
+    assert span.lane == "cortex"
+    assert span.tick == 3
+    assert span.duration >= 0.01
+    assert span.args == {"calls": 2}
+    trace_provider.io_provider._tick_counter = 0
+
+
+def test_ring_buffer_drops_oldest(trace_provider):
+    for i in range(10):
+        trace_provider.record(f"stage{i}", start=float(i), duration=0.001)
+
+    names = [span.name for span in trace_provider.spans()]
+    assert trace_provider.capacity == 8
+    assert names == [f"stage{i}" for i in range(2, 10)]
+
+
+def test_summary_percentiles(trace_provider):
+    for duration in (0.001, 0.002, 0.003, 0.004):
+        trace_provider.record("llm", start=0.0, duration=duration)
+
+    summary = trace_provider.summary()["llm"]
+    assert summary["count"] == 4
+    assert summary["p50_ms"] == pytest.approx(2.5)
+    assert summary["max_ms"] == pytest.approx(4.0)
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
+
+
+def test_chrome_trace_export(trace_provider, tmp_path):
+    trace_provider.record("tick", start=1.0, duration=0.5, tick=1)
+    trace_provider.record("poll", start=1.1, duration=0.1, lane="input:Camera", tick=1)
+
+    path = tmp_path / "trace.json"
+    trace_provider.export_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+
+    lanes = {e["args"]["name"]: e["tid"] for e in events if e["ph"] == "M"}
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert set(lanes) == {"cortex", "input:Camera"}
+    assert spans["tick"]["ts"] == pytest.approx(1e6)
+    assert spans["tick"]["dur"] == pytest.approx(5e5)
+    assert spans["poll"]["tid"] == lanes["input:Camera"]
+    assert spans["poll"]["cat"] == "input"
+    assert spans["poll"]["args"]["tick"] == 1
+
+
+def test_disabled_provider_records_nothing(trace_provider):
+    trace_provider.enabled = False
+
+    with trace_provider.span("fuse"):
+        pass
+    trace_provider.record("llm", start=0.0, duration=0.1)
+
+    assert trace_provider.spans() == []
@@ -130,7 +130,6 @@ class TestTurtleBot4RPLidarProvider:
         provider = TurtleBot4RPLidarProvider()
 
         assert len(provider.paths) == len(provider.path_angles)
-        assert len(provider.pp) == len(provider.paths)
 
     def test_angles_blanked_default(self, mock_rplidar_dependencies):
         """Test that angles_blanked defaults to empty list."""
@@ -254,7 +253,7 @@ class TestTurtleBot4RPLidarProvider:
         mock_scan = MagicMock()
 
         with patch(
-            "providers.turtlebot4_rplidar_provider.sensor_msgs.LaserScan.deserialize"
+            "providers.turtlebot4_rplidar_provider.deserialize_numpy"
         ) as mock_deserialize:
             mock_deserialize.return_value = mock_scan
 
@@ -292,6 +291,10 @@ class TestTurtleBot4RPLidarProvider:
             mock_path_processor.assert_called_once()
             assert provider.angles is not None
             assert provider.angles_final is not None
+            data = mock_path_processor.call_args[0][0]
+            assert data.shape == (63, 2)
+            assert data[0, 0] == provider.angles_final[0]
+            assert (data[:, 1] == 1.0).all()
 
     def test_d435_provider_initialization(self, mock_rplidar_dependencies):
         """Test D435 provider is initialized."""
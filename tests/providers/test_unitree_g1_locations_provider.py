@@ -27,7 +27,9 @@ def mock_dependencies():
     """Mock dependencies for UnitreeG1LocationsProvider."""
     with (
         patch("providers.unitree_g1_locations_provider.IOProvider") as mock_io,
-        patch("providers.unitree_g1_locations_provider.requests") as mock_requests,
+        patch(
+            "providers.unitree_g1_locations_provider.get_http_client"
+        ) as mock_get_client,
     ):
 
         mock_io_instance = MagicMock()
@@ -36,7 +38,7 @@ def mock_dependencies():
         yield {
             "io": mock_io,
             "io_instance": mock_io_instance,
-            "requests": mock_requests,
+            "http_client": mock_get_client.return_value,
         }
 
 
@@ -119,7 +121,7 @@ def test_fetch_success(mock_dependencies):
         "location1": {"name": "Location 1", "pose": {"x": 1.0, "y": 2.0}},
         "location2": {"name": "Location 2", "pose": {"x": 3.0, "y": 4.0}},
     }
-    mock_dependencies["requests"].get.return_value = mock_response
+    mock_dependencies["http_client"].get.return_value = mock_response
 
     provider._fetch()
 
@@ -141,7 +143,7 @@ def test_fetch_with_nested_message(mock_dependencies):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"message": json.dumps(locations_data)}
-    mock_dependencies["requests"].get.return_value = mock_response
+    mock_dependencies["http_client"].get.return_value = mock_response
 
     provider._fetch()
 
@@ -156,7 +158,7 @@ def test_fetch_http_error(mock_dependencies):
     mock_response = MagicMock()
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    mock_dependencies["requests"].get.return_value = mock_response
+    mock_dependencies["http_client"].get.return_value = mock_response
 
     # Should not raise exception, just log error
     provider._fetch()
@@ -168,7 +170,7 @@ def test_fetch_request_exception(mock_dependencies):
     """Test fetch with request exception."""
     provider = UnitreeG1LocationsProvider()
 
-    mock_dependencies["requests"].get.side_effect = requests.RequestException(
+    mock_dependencies["http_client"].get.side_effect = requests.RequestException(
         "Connection error"
     )
 
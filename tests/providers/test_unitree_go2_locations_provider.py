@@ -26,7 +26,9 @@ def mock_dependencies():
     """Mock dependencies for UnitreeGo2LocationsProvider."""
     with (
         patch("providers.unitree_go2_locations_provider.IOProvider") as mock_io,
-        patch("providers.unitree_go2_locations_provider.requests") as mock_requests,
+        patch(
+            "providers.unitree_go2_locations_provider.get_http_client"
+        ) as mock_get_client,
     ):
 
         mock_io_instance = MagicMock()
@@ -35,7 +37,7 @@ def mock_dependencies():
         yield {
             "io": mock_io,
             "io_instance": mock_io_instance,
-            "requests": mock_requests,
+            "http_client": mock_get_client.return_value,
         }
 
 
@@ -3,6 +3,8 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from providers.d435_provider import OBSTACLE_DTYPE
+from providers.scan_ring import SharedScanRing
 from providers.unitree_go2_rplidar_provider import (
     RPLidarConfig,
     UnitreeGo2RPLidarProvider,
@@ -213,12 +215,85 @@ def test_path_processor_no_blanking_when_empty(mock_rplidar_dependencies):
     assert len(provider._raw_scan) == 3
 
 
+def test_path_processor_fuses_d435_obstacles(mock_rplidar_dependencies):
+    """Test that D435 obstacles are appended to the scan in one block."""
+    mocks = mock_rplidar_dependencies
+    obstacle = np.zeros(60, dtype=OBSTACLE_DTYPE)
+    obstacle["y"] = 0.5
+    obstacle["angle"] = 90.0
+    obstacle["distance"] = 0.5
+    mocks["d435_instance"].running = True
+    mocks["d435_instance"].obstacle = obstacle
+
+    provider = UnitreeGo2RPLidarProvider(angles_blanked=[])
+
+    provider._path_processor(np.array([[0.0, 0.5]]))
+
+    assert provider._raw_scan is not None
+    assert len(provider._raw_scan) == 61
+
+
 def test_log_file_initialization(mock_rplidar_dependencies):
     """Test log file initialization."""
-    with patch("providers.unitree_go2_rplidar_provider.time.time") as mock_time:
-        mock_time.return_value = 1234567890.123456
+    assert UnitreeGo2RPLidarProvider().recorder is None
+    UnitreeGo2RPLidarProvider.reset()  # type: ignore
+
+    with patch(
+        "providers.unitree_go2_rplidar_provider.get_sensor_recorder"
+    ) as mock_get_recorder:
         provider = UnitreeGo2RPLidarProvider(log_file=True)
 
         assert provider.write_to_local_file is True
-        assert provider.filename_current == "dump/lidar_1234567890_123456Z.jsonl"
-        mock_time.assert_called()
+        assert provider.recorder is mock_get_recorder.return_value
+
+
+def test_log_file_records_scans(mock_rplidar_dependencies):
+    """Test that processed scans are recorded as NumPy arrays with odometry."""
+    with patch(
+        "providers.unitree_go2_rplidar_provider.get_sensor_recorder"
+    ) as mock_get_recorder:
+        provider = UnitreeGo2RPLidarProvider(log_file=True, angles_blanked=[])
+    provider.odom_x = 1.5
+
+    provider._path_processor(np.array([[0.0, 0.5]]))
+
+    channel, value = mock_get_recorder.return_value.record.call_args.args
+    assert channel == "rplidar"
+    assert value["odom_x"] == 1.5
+    assert isinstance(value["frame"], np.ndarray)
+    assert value["frame"].shape == (1, 2)
+
+
+def test_serial_processor_reads_scan_ring(mock_rplidar_dependencies):
+    """Test that scans from the shared memory ring reach the path processor."""
+    provider = UnitreeGo2RPLidarProvider()
+    provider.scan_ring = SharedScanRing(capacity=2, max_points=8)
+    processed = []
+
+    def capture(data):
+        processed.append(data.copy())
+        provider.running = False
+
+    provider._path_processor = capture
+    provider.scan_ring.write(np.array([[90.0, 1500.0], [180.0, 250.0]]))
+    provider.running = True
+
+    provider._serial_processor()
+
+    np.testing.assert_allclose(processed[0], [[90.0, 1.5], [180.0, 0.25]])
+    provider.scan_ring.close()
+
+
+def test_unregistered_lidar_callback_is_not_called(mock_rplidar_dependencies):
+    """Test that callbacks of stopped inputs stop receiving lidar strings."""
+    provider = UnitreeGo2RPLidarProvider()
+    kept, removed = [], []
+    provider.register_lidar_callback(kept.append)
+    provider.register_lidar_callback(removed.append)
+
+    provider.unregister_lidar_callback(removed.append)
+    provider._lidar_string = "clear ahead"
+    provider._notify_lidar_callbacks()
+
+    assert kept == ["clear ahead"]
+    assert removed == []
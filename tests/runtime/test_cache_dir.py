@@ -0,0 +1,14 @@
+import os
+from unittest.mock import patch
+
+from runtime.cache_dir import get_cache_dir
+
+
+def test_cache_dir_defaults_to_user_cache():
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_cache_dir() == os.path.join(os.path.expanduser("~"), ".cache", "om1")
+
+
+def test_cache_dir_from_environment(tmp_path):
+    with patch.dict(os.environ, {"OM1_CACHE_DIR": str(tmp_path)}):
+        assert get_cache_dir() == str(tmp_path)
@@ -170,6 +170,10 @@ class TestModeConfig:
         assert config.timeout_seconds is None
         assert config.remember_locations is False
         assert config.save_interactions is False
+        assert config.event_driven_ticks is False
+        assert config.min_tick_interval == 0.1
+        assert config.max_tick_interval is None
+        assert config.pipelined_ticks is False
         assert len(config.agent_inputs) == 0
         assert config.cortex_llm is None
         assert len(config.simulators) == 0
@@ -197,6 +201,23 @@ class TestModeConfig:
         assert runtime_config.URID == "test_urid"
         assert runtime_config.unitree_ethernet == "eth0"
 
+    def test_to_runtime_config_event_driven_ticks(
+        self, sample_mode_config, sample_system_config, mock_llm
+    ):
+        """Test that the tick scheduler settings reach the RuntimeConfig."""
+        sample_mode_config.cortex_llm = mock_llm
+        sample_mode_config.event_driven_ticks = True
+        sample_mode_config.min_tick_interval = 0.05
+        sample_mode_config.max_tick_interval = 2.0
+        sample_mode_config.pipelined_ticks = True
+
+        runtime_config = sample_mode_config.to_runtime_config(sample_system_config)
+
+        assert runtime_config.event_driven_ticks is True
+        assert runtime_config.min_tick_interval == 0.05
+        assert runtime_config.max_tick_interval == 2.0
+        assert runtime_config.pipelined_ticks is True
+
     def test_to_runtime_config_no_llm(self, sample_mode_config, sample_system_config):
         """Test conversion to RuntimeConfig fails when no LLM is configured."""
         sample_system_config.modes = {"test_mode": sample_mode_config}
@@ -211,7 +232,7 @@ class TestModeConfig:
         """Test load_components calls _load_mode_components."""
         sample_mode_config.load_components(sample_system_config)
         mock_load_components.assert_called_once_with(
-            sample_mode_config, sample_system_config
+            sample_mode_config, sample_system_config, True
         )
 
 
@@ -306,6 +327,27 @@ class TestLoadModeComponents:
         assert sample_mode_config.backgrounds[0] == mock_background
         assert sample_mode_config.cortex_llm == mock_llm
 
+    @patch("runtime.config.load_input")
+    @patch("runtime.config.load_llm")
+    def test_load_mode_components_without_inputs(
+        self,
+        mock_load_llm,
+        mock_load_input,
+        sample_mode_config,
+        sample_system_config,
+        mock_llm,
+    ):
+        """Test that inputs are not constructed when a replay replaces them."""
+        mock_load_llm.return_value = mock_llm
+        sample_mode_config._raw_inputs = [{"type": "test_input", "config": {}}]
+        sample_mode_config._raw_llm = {"type": "test_llm", "config": {}}
+
+        _load_mode_components(sample_mode_config, sample_system_config, False)
+
+        mock_load_input.assert_not_called()
+        assert sample_mode_config.agent_inputs == []
+        assert sample_mode_config.cortex_llm == mock_llm
+
     @patch("runtime.config.load_llm")
     def test_load_mode_components_with_global_llm(
         self,
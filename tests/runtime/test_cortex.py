@@ -1,12 +1,16 @@
 import asyncio
 import os
 import tempfile
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from llm.output_model import Action, CortexOutputModel
+from providers.clock import get_clock
 from runtime.config import ModeConfig, ModeSystemConfig
 from runtime.cortex import ModeCortexRuntime
+from runtime.replay import ReplayInput
 
 
 @pytest.fixture
@@ -40,6 +44,7 @@ def mock_system_config(mock_mode_config):
     config = Mock(spec=ModeSystemConfig)
     config.name = "test_system"
     config.default_mode = "default"
+    config.loop_stall_threshold = None
     config.modes = {
         "default": mock_mode_config,
         "advanced": mock_mode_config,
@@ -161,7 +166,7 @@ class TestModeCortexRuntime:
             await runtime._initialize_mode("test_mode")
 
             mock_mode_config.load_components.assert_called_once_with(
-                runtime.mode_config
+                runtime.mode_config, load_inputs=True
             )
             mock_mode_config.to_runtime_config.assert_called_once_with(
                 runtime.mode_config
@@ -328,6 +333,56 @@ class TestModeCortexRuntime:
             mock_task2.cancel.assert_called_once()
             mock_gather.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_initialize_mode_wraps_llm_for_replay(
+        self, cortex_runtime, mock_mode_config
+    ):
+        """Test that a replay replaces the cortex LLM and inputs of the mode."""
+        runtime, mocks = cortex_runtime
+        runtime.replay = Mock()
+        runtime.mode_config.modes = {"test_mode": mock_mode_config}
+        mock_mode_config._raw_inputs = [{"type": "VLMOpenAI", "config": {}}]
+        runtime_config = mock_mode_config.to_runtime_config.return_value
+        cortex_llm = runtime_config.cortex_llm
+
+        with (
+            patch("runtime.cortex.Fuser"),
+            patch("runtime.cortex.ActionOrchestrator"),
+            patch("runtime.cortex.SimulatorOrchestrator"),
+            patch("runtime.cortex.BackgroundOrchestrator"),
+        ):
+            await runtime._initialize_mode("test_mode")
+
+        runtime.replay.wrap_llm.assert_called_once_with(cortex_llm)
+        assert runtime_config.cortex_llm == runtime.replay.wrap_llm.return_value
+        mock_mode_config.load_components.assert_called_once_with(
+            runtime.mode_config, load_inputs=False
+        )
+        assert [type(i) for i in runtime_config.agent_inputs] == [ReplayInput]
+        assert runtime_config.agent_inputs[0].name == "VLMOpenAI"
+
+    @pytest.mark.asyncio
+    async def test_stop_ends_run(self, cortex_runtime):
+        """Test that stop cancels the tasks and makes run return."""
+        runtime, mocks = cortex_runtime
+        runtime.hot_reload = False
+        runtime._mode_initialized = True
+        runtime.mode_config.execute_global_lifecycle_hooks = AsyncMock()
+        runtime.mode_config.modes["default"].execute_lifecycle_hooks = AsyncMock()
+        runtime._cleanup_tasks = AsyncMock()
+
+        async def start_orchestrators():
+            runtime.cortex_loop_task = asyncio.create_task(asyncio.sleep(3600))
+
+        runtime._start_orchestrators = start_orchestrators
+        run_task = asyncio.create_task(runtime.run())
+        await asyncio.sleep(0.01)
+        runtime.stop()
+
+        await asyncio.wait_for(run_task, timeout=2)
+        assert runtime.cortex_loop_task.cancelled()
+        runtime._cleanup_tasks.assert_called_once()
+
 
 class TestModeCortexRuntimeHotReload:
     """Test cases for hot reload functionality in ModeCortexRuntime."""
@@ -805,3 +860,322 @@ class TestHotReloadMultiToSingle:
 
             assert len(new_single_config.modes) == 1
             assert "single_mode" in new_single_config.modes
+
+
+class TestEventDrivenTicks:
+    """Test cases for the event-driven tick scheduler."""
+
+    @pytest.fixture
+    def event_runtime(self, cortex_runtime):
+        runtime, mocks = cortex_runtime
+        config = Mock()
+        config.hertz = 1.0
+        config.event_driven_ticks = True
+        config.min_tick_interval = 0.0
+        config.max_tick_interval = 5.0
+        config.cortex_llm = Mock()
+        config.cortex_llm.ask = AsyncMock(return_value=Mock(actions=[]))
+        runtime.current_config = config
+        runtime.fuser = Mock()
+        runtime.fuser.fuse = Mock(return_value="same prompt")
+        runtime.action_orchestrator = Mock()
+        runtime.action_orchestrator.flush_promises = AsyncMock(return_value=([], None))
+        runtime.action_orchestrator.promise = AsyncMock()
+        runtime.simulator_orchestrator = None
+        runtime.mode_manager.process_tick = AsyncMock(return_value=None)
+        mocks["io_provider"].mode_transition_input.return_value.__enter__ = Mock()
+        mocks["io_provider"].mode_transition_input.return_value.__exit__ = Mock(
+            return_value=False
+        )
+        return runtime, config
+
+    def test_max_tick_interval_defaults_to_hertz(self, event_runtime):
+        runtime, config = event_runtime
+        config.max_tick_interval = None
+        config.hertz = 4.0
+
+        assert runtime._max_tick_interval() == 0.25
+
+    @pytest.mark.asyncio
+    async def test_unchanged_prompt_skips_llm(self, event_runtime):
+        runtime, config = event_runtime
+
+        await runtime._tick()
+        await runtime._tick()
+
+        config.cortex_llm.ask.assert_called_once_with("same prompt")
+
+    @pytest.mark.asyncio
+    async def test_changed_prompt_calls_llm(self, event_runtime):
+        runtime, config = event_runtime
+
+        await runtime._tick()
+        runtime.fuser.fuse.return_value = "new prompt"
+        await runtime._tick()
+
+        assert config.cortex_llm.ask.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_calls_llm_on_unchanged_prompt(self, event_runtime):
+        runtime, config = event_runtime
+        config.max_tick_interval = 0.01
+
+        await runtime._tick()
+        await asyncio.sleep(0.02)
+        await runtime._tick()
+
+        assert config.cortex_llm.ask.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fixed_rate_never_skips(self, event_runtime):
+        runtime, config = event_runtime
+        config.event_driven_ticks = False
+
+        await runtime._tick()
+        await runtime._tick()
+
+        assert config.cortex_llm.ask.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_tick_uses_remaining_staleness(self, event_runtime):
+        runtime, config = event_runtime
+        runtime.sleep_ticker_provider.wait_for_input = AsyncMock(return_value=True)
+
+        with patch("providers.clock.time.monotonic", return_value=100.0):
+            runtime._last_tick_time = 98.0
+            await runtime._wait_for_event_tick()
+
+        runtime.sleep_ticker_provider.wait_for_input.assert_called_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_tick_enforces_min_interval(self, event_runtime):
+        runtime, config = event_runtime
+        config.min_tick_interval = 0.05
+        runtime.sleep_ticker_provider.wait_for_input = AsyncMock(return_value=True)
+        runtime._last_tick_time = time.monotonic()
+
+        start = time.monotonic()
+        await runtime._wait_for_event_tick()
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestStreamedActionDispatch:
+    """Test cases for dispatching actions of a streamed LLM response."""
+
+    @pytest.fixture
+    def stream_runtime(self, cortex_runtime):
+        runtime, mocks = cortex_runtime
+        config = Mock()
+        config.event_driven_ticks = False
+        config.action_execution_mode = "concurrent"
+        runtime.current_config = config
+        runtime.fuser = Mock()
+        runtime.fuser.fuse = Mock(return_value="prompt")
+        runtime.action_orchestrator = Mock()
+        runtime.action_orchestrator.flush_promises = AsyncMock(return_value=([], None))
+        runtime.action_orchestrator.promise = AsyncMock()
+        runtime.action_orchestrator.extend_promise = AsyncMock()
+        runtime.simulator_orchestrator = None
+        runtime.mode_manager.process_tick = AsyncMock(return_value=None)
+        mocks["io_provider"].mode_transition_input.return_value.__enter__ = Mock()
+        mocks["io_provider"].mode_transition_input.return_value.__exit__ = Mock(
+            return_value=False
+        )
+
+        speak = Action(type="speak", value="hello")
+        move = Action(type="move", value="wag tail")
+        callbacks = []
+
+        async def ask(prompt):
+            await callbacks[-1](speak)
+            return CortexOutputModel(actions=[speak, move])
+
+        config.cortex_llm = Mock()
+        config.cortex_llm.set_action_callback = Mock(side_effect=callbacks.append)
+        config.cortex_llm.ask = AsyncMock(side_effect=ask)
+        return runtime, config, speak, move
+
+    @pytest.mark.asyncio
+    async def test_streamed_actions_are_promised_once(self, stream_runtime):
+        runtime, config, speak, move = stream_runtime
+
+        await runtime._tick()
+
+        runtime.action_orchestrator.promise.assert_called_once_with([speak])
+        runtime.action_orchestrator.extend_promise.assert_called_once_with([move])
+        assert config.cortex_llm.set_action_callback.call_args_list[-1].args == (None,)
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_is_not_streamed(self, stream_runtime):
+        runtime, config, speak, move = stream_runtime
+        config.action_execution_mode = "sequential"
+        config.cortex_llm.ask = AsyncMock(
+            return_value=CortexOutputModel(actions=[speak, move])
+        )
+
+        await runtime._tick()
+
+        config.cortex_llm.set_action_callback.assert_not_called()
+        runtime.action_orchestrator.promise.assert_called_once_with([speak, move])
+
+
+class TestPipelinedTicks:
+    """Test cases for the speculative next-tick LLM call."""
+
+    @pytest.fixture
+    def pipelined_runtime(self, cortex_runtime):
+        runtime, mocks = cortex_runtime
+        config = Mock()
+        config.event_driven_ticks = False
+        config.pipelined_ticks = True
+        config.action_execution_mode = "sequential"
+        config.cortex_llm = Mock()
+        config.cortex_llm.ask = AsyncMock(return_value=CortexOutputModel(actions=[]))
+        runtime.current_config = config
+        runtime.fuser = Mock()
+        runtime.fuser.fuse = Mock(return_value="prompt")
+        runtime.action_orchestrator = Mock()
+        runtime.action_orchestrator.flush_promises = AsyncMock(return_value=([], None))
+        runtime.action_orchestrator.promise = AsyncMock()
+        runtime.action_orchestrator.extend_promise = AsyncMock()
+        runtime.simulator_orchestrator = None
+        runtime.mode_manager.process_tick = AsyncMock(return_value=None)
+        mocks["io_provider"].mode_transition_input.return_value.__enter__ = Mock()
+        mocks["io_provider"].mode_transition_input.return_value.__exit__ = Mock(
+            return_value=False
+        )
+        mocks["io_provider"].get_mode_transition_input.return_value = None
+        return runtime, config
+
+    @pytest.mark.asyncio
+    async def test_speculative_call_is_used_for_same_prompt(self, pipelined_runtime):
+        runtime, config = pipelined_runtime
+
+        runtime._start_speculation()
+        await runtime._tick()
+
+        config.cortex_llm.ask.assert_called_once_with("prompt")
+        assert runtime.fuser.fuse.call_args.kwargs["keep_previous_inputs"] is True
+        assert runtime._speculation is None
+        runtime.action_orchestrator.promise.assert_called_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_speculative_call_is_discarded_when_inputs_change(
+        self, pipelined_runtime
+    ):
+        runtime, config = pipelined_runtime
+
+        async def ask(prompt):
+            if prompt == "prompt":
+                await asyncio.sleep(10)
+            return CortexOutputModel(actions=[])
+
+        config.cortex_llm.ask = AsyncMock(side_effect=ask)
+
+        runtime._start_speculation()
+        task = runtime._speculation.task
+        runtime.fuser.fuse.return_value = "new prompt"
+        await runtime._tick()
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        config.cortex_llm.ask.assert_called_with("new prompt")
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_with_pending_mode_transition(self, pipelined_runtime):
+        runtime, config = pipelined_runtime
+        runtime._pending_mode_transition = "other_mode"
+
+        runtime._start_speculation()
+
+        assert runtime._speculation is None
+        runtime.fuser.fuse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_speculation(self, pipelined_runtime):
+        runtime, config = pipelined_runtime
+
+        runtime._start_speculation()
+        task = runtime._speculation.task
+        await runtime._stop_current_orchestrators()
+        await asyncio.sleep(0)
+
+        assert runtime._speculation is None
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_no_speculative_call_with_drained_transition_input(
+        self, pipelined_runtime
+    ):
+        runtime, config = pipelined_runtime
+        runtime.io_provider.get_mode_transition_input.return_value = "go to sleep"
+
+        runtime._start_speculation()
+
+        config.cortex_llm.ask.assert_not_called()
+        assert runtime._speculation.task is None
+        await runtime._tick()
+        assert runtime.fuser.fuse.call_args.kwargs["keep_previous_inputs"] is True
+        config.cortex_llm.ask.assert_called_once_with("prompt")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_prompt_cancels_speculation(self, pipelined_runtime):
+        runtime, config = pipelined_runtime
+        config.event_driven_ticks = True
+        config.max_tick_interval = 60.0
+
+        async def ask(prompt):
+            await asyncio.sleep(10)
+
+        config.cortex_llm.ask = AsyncMock(side_effect=ask)
+        runtime._last_llm_prompt = "other prompt"
+        runtime._last_llm_time = get_clock().monotonic()
+        runtime._start_speculation()
+        task = runtime._speculation.task
+        await asyncio.sleep(0)
+        runtime._last_llm_prompt = "prompt"
+
+        await runtime._tick()
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert runtime._speculation is None
+        assert runtime._tick_called_llm is False
+
+        runtime._start_speculation()
+        assert runtime._speculation.task is None
+        config.cortex_llm.ask.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_streamed_speculative_actions_are_dispatched_on_claim(
+        self, pipelined_runtime
+    ):
+        runtime, config = pipelined_runtime
+        config.action_execution_mode = "concurrent"
+        speak = Action(type="speak", value="hi")
+        move = Action(type="move", value="sit")
+        callbacks = []
+        config.cortex_llm.set_action_callback = Mock(side_effect=callbacks.append)
+        release = asyncio.Event()
+
+        async def ask(prompt):
+            await callbacks[0](speak)
+            await release.wait()
+            await callbacks[0](move)
+            return CortexOutputModel(actions=[speak, move])
+
+        config.cortex_llm.ask = AsyncMock(side_effect=ask)
+        runtime._start_speculation()
+        await asyncio.sleep(0)
+        runtime.action_orchestrator.promise.assert_not_called()
+
+        tick = asyncio.create_task(runtime._tick())
+        await asyncio.sleep(0)
+        runtime.action_orchestrator.promise.assert_called_once_with([speak])
+        release.set()
+        await tick
+
+        runtime.action_orchestrator.promise.assert_called_once_with([speak])
+        runtime.action_orchestrator.extend_promise.assert_called_once_with([move])
+        assert callbacks[-1] is None
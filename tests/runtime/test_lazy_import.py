@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+
+from runtime.lazy_import import LazyAttribute, LazyModule, lazy_attribute, lazy_import
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    (tmp_path / "om1_lazy_fake.py").write_text(
+        "class Model:\n"
+        "    loaded = True\n"
+        "\n"
+        "    def __init__(self, name):\n"
+        "        self.name = name\n"
+        "\n"
+        "VALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "om1_lazy_fake"
+    sys.modules.pop("om1_lazy_fake", None)
+
+
+def test_lazy_module_imports_on_first_access(fake_module):
+    module = lazy_import(fake_module)
+
+    assert isinstance(module, LazyModule)
+    assert not module.is_loaded
+    assert fake_module not in sys.modules
+
+    assert module.VALUE == 42
+    assert module.is_loaded
+    assert fake_module in sys.modules
+
+
+def test_lazy_attribute_call(fake_module):
+    Model = lazy_attribute(fake_module, "Model")
+
+    assert isinstance(Model, LazyAttribute)
+    assert fake_module not in sys.modules
+
+    instance = Model("yolo")
+
+    assert instance.name == "yolo"
+    assert Model.is_loaded
+    assert Model.resolve() is sys.modules[fake_module].Model
+
+
+def test_lazy_attribute_getattr(fake_module):
+    Model = lazy_attribute(fake_module, "Model")
+
+    assert Model.loaded is True
+
+
+def test_missing_module_fails_on_use():
+    module = lazy_import("om1_missing_module")
+    Missing = lazy_attribute("om1_missing_module", "Missing")
+
+    with pytest.raises(ModuleNotFoundError):
+        module.anything
+    with pytest.raises(ModuleNotFoundError):
+        Missing()
+
+
+def test_repr_does_not_import(fake_module):
+    assert "not loaded" in repr(lazy_import(fake_module))
+    assert "not loaded" in repr(lazy_attribute(fake_module, "Model"))
+    assert fake_module not in sys.modules
+
+
+def test_hook_tts_providers_are_deferred():
+    import runtime.hook
+
+    assert isinstance(runtime.hook.ElevenLabsTTSProvider, LazyAttribute)
+    assert isinstance(runtime.hook.KokoroTTSProvider, LazyAttribute)
+    assert isinstance(runtime.hook.RivaTTSProvider, LazyAttribute)
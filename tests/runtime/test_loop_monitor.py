@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import sys
+import time
+
+import pytest
+
+from providers.trace_provider import TraceProvider
+from runtime.loop_monitor import LoopStallMonitor, attribute_frame
+
+FAKE_PLUGIN = """
+import sys
+import time
+
+
+def current_frame():
+    return sys._getframe()
+
+
+async def _poll(duration):
+    time.sleep(duration)
+"""
+
+
+@pytest.fixture
+def fake_plugin():
+    namespace = {"__name__": "inputs.plugins.fake_input"}
+    exec(compile(FAKE_PLUGIN, "fake_input.py", "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture
+def monitor():
+    TraceProvider.reset()  # type: ignore
+    monitor = LoopStallMonitor(threshold=0.05)
+    yield monitor
+    TraceProvider.reset()  # type: ignore
+
+
+def test_attribute_frame_names_plugin(fake_plugin):
+    culprit, location = attribute_frame(fake_plugin["current_frame"]())
+
+    assert culprit == "input inputs.plugins.fake_input.current_frame"
+    assert location.startswith("inputs.plugins.fake_input.current_frame:")
+
+
+def test_attribute_frame_without_plugin():
+    culprit, location = attribute_frame(sys._getframe())
+
+    assert culprit == "unknown"
+    assert "test_attribute_frame_without_plugin" in location
+    assert attribute_frame(None) == ("unknown", "unknown")
+
+
+@pytest.mark.asyncio
+async def test_stall_is_attributed_to_blocking_plugin(monitor, fake_plugin, caplog):
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    with caplog.at_level(logging.WARNING):
+        await fake_plugin["_poll"](0.3)
+        await asyncio.sleep(0.05)
+    monitor.stop()
+
+    culprit = "input inputs.plugins.fake_input._poll"
+    assert monitor.stats[culprit].count == 1
+    assert monitor.stats[culprit].max >= 0.2
+    assert culprit in caplog.text
+    (span,) = TraceProvider().spans()
+    assert span.name == "loop_stall"
+    assert span.args["culprit"] == culprit
+
+
+@pytest.mark.asyncio
+async def test_no_stall_on_idle_loop(monitor):
+    monitor.start()
+    assert monitor.is_running
+
+    await asyncio.sleep(0.2)
+
+    assert monitor.stats == {}
+    monitor.stop()
+    await asyncio.sleep(0)
+    assert not monitor.is_running
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_watchdog(monitor):
+    monitor.start()
+    monitor.stop()
+    time.sleep(monitor.interval * 3)
+
+    assert not monitor._watchdog.is_alive()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from runtime import loop_monitor, plugin_executor
+from runtime.loop_monitor import LoopStallMonitor, StallStats
+from runtime.plugin_executor import (
+    BLOCKING_WARNING_STALLS,
+    OffloadPolicy,
+    PluginExecutor,
+)
+
+
+class FakePlugin:
+    blocking = None
+
+    def __init__(self, **config):
+        self.config = SimpleNamespace(**config)
+
+
+class BlockingPlugin(FakePlugin):
+    blocking = True
+
+
+async def current_thread_name():
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+@pytest.fixture
+def executor():
+    executor = PluginExecutor("FakePlugin")
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_on_worker_thread(executor):
+    assert not executor.is_running
+
+    assert await executor.run(current_thread_name()) == "plugin-FakePlugin"
+    assert executor.is_running
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_does_not_block_loop(executor):
+    async def blocking_poll():
+        time.sleep(0.2)
+        return "event"
+
+    beats = 0
+
+    async def heartbeat():
+        nonlocal beats
+        while True:
+            await asyncio.sleep(0.01)
+            beats += 1
+
+    task = asyncio.create_task(heartbeat())
+    assert await executor.run(blocking_poll()) == "event"
+    task.cancel()
+
+    assert beats >= 5
+
+
+@pytest.mark.asyncio
+async def test_executor_timeout_cancels_call(executor):
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.run(hang(), timeout=0.05)
+
+    assert await asyncio.to_thread(cancelled.wait, 1.0)
+
+
+def test_policy_config_overrides_class_attribute():
+    assert OffloadPolicy(BlockingPlugin(), "input").should_offload()
+    assert not OffloadPolicy(BlockingPlugin(blocking=False), "input").should_offload()
+    assert OffloadPolicy(FakePlugin(blocking=True), "action").should_offload()
+    assert OffloadPolicy(FakePlugin(blocking_timeout=2.0), "action").timeout == 2.0
+
+
+def test_policy_warns_after_stalls_without_offloading(caplog):
+    monitor = LoopStallMonitor()
+    policy = OffloadPolicy(FakePlugin(), "input")
+    culprit = f"input {FakePlugin.__module__}._poll"
+
+    with patch.object(plugin_executor, "get_loop_monitor", return_value=None):
+        assert not policy.should_offload()
+
+    with (
+        patch.object(plugin_executor, "get_loop_monitor", return_value=monitor),
+        caplog.at_level(logging.WARNING),
+    ):
+        monitor.stats[culprit] = StallStats(count=BLOCKING_WARNING_STALLS - 1)
+        assert not policy.should_offload()
+        assert "blocked the event loop" not in caplog.text
+
+        monitor.stats[culprit].count += 1
+        assert not policy.should_offload()
+        assert not policy.should_offload()
+
+    assert caplog.text.count('set "blocking": true') == 1
+
+
+@pytest.mark.asyncio
+async def test_policy_timeout_applies_on_the_event_loop():
+    policy = OffloadPolicy(FakePlugin(blocking_timeout=0.05), "input")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await policy.run(asyncio.sleep(10))
+    assert policy._executor is None
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_is_registered_while_running():
+    monitor = LoopStallMonitor(threshold=1.0)
+
+    monitor.start()
+    assert loop_monitor.get_loop_monitor() is monitor
+
+    monitor.stop()
+    assert loop_monitor.get_loop_monitor() is None
@@ -0,0 +1,139 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from runtime.plugin_index import (
+    PluginIndex,
+    find_plugin_module,
+    get_plugin_index,
+    parse_plugin_file,
+)
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    (directory / "__init__.py").write_text("")
+    (directory / "alpha.py").write_text(
+        "class AlphaInput(FuserInput[Config, str]):\n"
+        "    pass\n"
+        "\n"
+        "class AlphaConfig(SensorConfig):\n"
+        "    pass\n"
+        "\n"
+        "async def start(context):\n"
+        "    pass\n"
+    )
+    (directory / "beta.py").write_text("class BetaLLM(LLM[R]):\n    pass\n")
+    return directory
+
+
+@pytest.fixture
+def index(plugins_dir, tmp_path):
+    return PluginIndex(str(plugins_dir), cache_dir=str(tmp_path / "cache"))
+
+
+def test_parse_plugin_file(plugins_dir):
+    entry = parse_plugin_file(str(plugins_dir / "alpha.py"))
+
+    assert entry.classes["AlphaInput"] == ["FuserInput[Config, str]"]
+    assert entry.classes["AlphaConfig"] == ["SensorConfig"]
+    assert entry.functions == ["start"]
+
+
+def test_parse_plugin_file_syntax_error(tmp_path):
+    broken = tmp_path / "broken.py"
+    broken.write_text("class BrokenClass\n    pass\n")
+
+    entry = parse_plugin_file(str(broken))
+
+    assert entry.classes == {}
+
+
+def test_find_class(index):
+    assert index.find_class("AlphaInput") == "alpha"
+    assert index.find_class("BetaLLM") == "beta"
+    assert index.find_class("Missing") is None
+
+
+def test_find_class_with_base(index):
+    assert index.find_class("AlphaInput", base="FuserInput") == "alpha"
+    assert index.find_class("AlphaConfig", base="FuserInput") is None
+    assert index.find_class("BetaLLM", base="LLM") == "beta"
+
+
+def test_find_class_exclude(plugins_dir, index):
+    (plugins_dir / "__init__.py").write_text("class Hidden:\n    pass\n")
+
+    assert index.find_class("Hidden") == "__init__"
+    assert index.find_class("Hidden", exclude=("__init__",)) is None
+
+
+def test_has_function(index):
+    assert index.has_function("alpha", "start") is True
+    assert index.has_function("alpha", "stop") is False
+    assert index.has_function("missing", "start") is False
+
+
+def test_new_file_is_picked_up(plugins_dir, index):
+    assert index.find_class("GammaInput") is None
+
+    (plugins_dir / "gamma.py").write_text("class GammaInput(FuserInput):\n    pass\n")
+
+    assert index.find_class("GammaInput") == "gamma"
+
+
+def test_changed_file_is_reparsed(plugins_dir, index):
+    assert index.find_class("BetaLLM") == "beta"
+
+    beta = plugins_dir / "beta.py"
+    beta.write_text("class RenamedLLM(LLM):\n    pass\n")
+    stat = beta.stat()
+    os.utime(beta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert index.find_class("BetaLLM") is None
+    assert index.find_class("RenamedLLM") == "beta"
+
+
+def test_hits_do_not_reparse(index):
+    index.find_class("AlphaInput")
+
+    with patch("runtime.plugin_index.parse_plugin_file") as mock_parse:
+        for _ in range(10):
+            assert index.find_class("AlphaInput") == "alpha"
+            assert index.find_class("BetaLLM") == "beta"
+
+    mock_parse.assert_not_called()
+
+
+def test_cache_is_persisted(plugins_dir, tmp_path, index):
+    index.find_class("AlphaInput")
+    assert os.path.exists(index.cache_path)
+
+    reloaded = PluginIndex(str(plugins_dir), cache_dir=str(tmp_path / "cache"))
+    with patch("runtime.plugin_index.parse_plugin_file") as mock_parse:
+        assert reloaded.find_class("AlphaInput") == "alpha"
+
+    mock_parse.assert_not_called()
+
+
+def test_corrupt_cache_is_ignored(plugins_dir, tmp_path, index):
+    os.makedirs(index.cache_dir, exist_ok=True)
+    with open(index.cache_path, "w") as f:
+        f.write("not json")
+
+    assert index.find_class("AlphaInput") == "alpha"
+
+
+def test_missing_directory(tmp_path):
+    missing = str(tmp_path / "missing")
+
+    assert find_plugin_module(missing, "AlphaInput") is None
+
+
+def test_get_plugin_index_is_shared(plugins_dir):
+    assert get_plugin_index(str(plugins_dir)) is get_plugin_index(
+        str(plugins_dir / ".." / "plugins")
+    )
@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from inputs.base import SensorConfig
+from inputs.base.loop import FuserInput
+from inputs.orchestrator import InputOrchestrator
+from llm import LLM, LLMConfig
+from llm.output_model import Action, CortexOutputModel
+from runtime.replay import (
+    ReplayInput,
+    ReplayLLM,
+    SessionRecorder,
+    SessionReplay,
+    run_replay,
+)
+
+
+class ScriptedInput(FuserInput[SensorConfig, object]):
+    def __init__(self, events=(), log=None):
+        super().__init__(SensorConfig())
+        self.events = list(events)
+        self.received = []
+        self.log = log if log is not None else []
+
+    async def _poll(self):
+        if not self.events:
+            await asyncio.sleep(3600)
+        return self.events.pop(0)
+
+    async def raw_to_text(self, raw_input):
+        if raw_input is not None:
+            self.received.append(raw_input)
+            self.log.append(("input", raw_input))
+
+    def formatted_latest_buffer(self):
+        if not self.received:
+            return None
+        return f"INPUT: {self.received[-1]}"
+
+
+class ScriptedLLM(LLM[CortexOutputModel]):
+    def __init__(self, responses):
+        super().__init__(LLMConfig())
+        self.responses = list(responses)
+
+    async def ask(self, prompt, messages=[]):
+        return self.responses.pop(0)
+
+
+def output(value: str) -> CortexOutputModel:
+    return CortexOutputModel(actions=[Action(type="speak", value=value)])
+
+
+@pytest.mark.asyncio
+async def test_records_and_replays_input_events(tmp_path):
+    events = ["hello", (1, "tuple"), np.arange(4, dtype=np.float32), b"raw", None]
+    recorded_input = ScriptedInput(events)
+    recorder = SessionRecorder(str(tmp_path))
+    orchestrator = InputOrchestrator([recorded_input], recorder=recorder)
+    task = asyncio.create_task(orchestrator.listen())
+    while len(recorded_input.received) < 4:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    llm = recorder.wrap_llm(ScriptedLLM([output("hi")]))
+    assert await llm.ask("prompt") == output("hi")
+    recorder.close()
+
+    replay = SessionReplay(str(tmp_path), speed=None)
+    assert replay.channels() == ["input:ScriptedInput", "llm"]
+    replayed_input = ScriptedInput()
+    await asyncio.wait_for(
+        InputOrchestrator([replayed_input], replay=replay).listen(), timeout=5
+    )
+
+    received = replayed_input.received
+    assert received[:2] == ["hello", (1, "tuple")]
+    np.testing.assert_array_equal(received[2], np.arange(4, dtype=np.float32))
+    assert received[3] == b"raw"
+    assert await replay.wrap_llm(ScriptedLLM([])).ask("prompt") == output("hi")
+    assert replay.done and replay.mismatched_prompts == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_inputs_hand_out_the_recorded_text(tmp_path):
+    recorded_input = ScriptedInput(["hello", "world"])
+    recorder = SessionRecorder(str(tmp_path))
+    orchestrator = InputOrchestrator([recorded_input], recorder=recorder)
+    task = asyncio.create_task(orchestrator.listen())
+    while len(recorded_input.received) < 2:
+        await asyncio.sleep(0.01)
+    assert recorded_input.formatted_latest_buffer() == "INPUT: world"
+    task.cancel()
+    recorder.close()
+
+    replay = SessionReplay(str(tmp_path), speed=None)
+    assert "text:ScriptedInput" in replay.channels()
+    stand_in = ReplayInput("ScriptedInput")
+    await asyncio.wait_for(
+        InputOrchestrator([stand_in], replay=replay).listen(), timeout=5
+    )
+
+    assert stand_in.formatted_latest_buffer() == "INPUT: world"
+    assert stand_in.formatted_latest_buffer() is None
+
+
+def record_session(directory):
+    recorder = SessionRecorder(str(directory))
+    recorder.record_event("ScriptedInput", "before", timestamp=100.0)
+    recorder.record_llm("prompt", output("answer"), timestamp=100.5)
+    recorder.record_event("ScriptedInput", "after", timestamp=101.0)
+    recorder.record_event("OtherInput", "ignored", timestamp=101.5)
+    recorder.close()
+
+
+@pytest.mark.asyncio
+async def test_fast_replay_waits_for_llm_responses(tmp_path):
+    record_session(tmp_path)
+    replay = SessionReplay(str(tmp_path), speed=None)
+    log = []
+    replayed_input = ScriptedInput(log=log)
+    listen = asyncio.create_task(
+        InputOrchestrator([replayed_input], replay=replay).listen()
+    )
+    await asyncio.sleep(0.1)
+    assert log == [("input", "before")]
+    assert replay.now == 100.0
+
+    log.append(("llm", await replay.wrap_llm(ScriptedLLM([])).ask("other prompt")))
+    await asyncio.wait_for(listen, timeout=5)
+
+    assert log == [("input", "before"), ("llm", output("answer")), ("input", "after")]
+    assert replay.mismatched_prompts == 1
+    assert replay.done
+
+
+@pytest.mark.asyncio
+async def test_fast_replay_skips_llm_responses_not_asked_for(tmp_path):
+    record_session(tmp_path)
+    replay = SessionReplay(str(tmp_path), speed=None, llm_timeout=0.05)
+    replayed_input = ScriptedInput()
+
+    await asyncio.wait_for(
+        InputOrchestrator([replayed_input], replay=replay).listen(), timeout=5
+    )
+
+    assert replayed_input.received == ["before", "after"]
+    assert await ReplayLLM(ScriptedLLM([]), replay).ask("prompt") is None
+
+
+@pytest.mark.asyncio
+async def test_replays_at_recorded_pace(tmp_path):
+    record_session(tmp_path)
+    replay = SessionReplay(str(tmp_path), speed=10.0)
+    replayed_input = ScriptedInput()
+
+    start = time.monotonic()
+    await asyncio.wait_for(
+        InputOrchestrator([replayed_input], replay=replay).listen(), timeout=5
+    )
+
+    assert replayed_input.received == ["before", "after"]
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_run_replay_stops_runtime_at_the_end(tmp_path):
+    record_session(tmp_path)
+    replay = SessionReplay(str(tmp_path), speed=None, llm_timeout=0.05)
+    stopped = asyncio.Event()
+
+    class Runtime:
+        async def run(self):
+            replayed_input = ScriptedInput()
+            await InputOrchestrator([replayed_input], replay=replay).listen()
+            await stopped.wait()
+
+        def stop(self):
+            stopped.set()
+
+    await asyncio.wait_for(run_replay(Runtime(), replay, settle=0), timeout=5)
+
+    assert stopped.is_set()
+    assert replay.delivered == 2
+
+
+def test_replay_requires_a_recording(tmp_path):
+    with pytest.raises(ValueError):
+        SessionReplay(str(tmp_path))
@@ -0,0 +1,106 @@
+import logging
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from runtime import startup_profiler
+from runtime.startup_profiler import ImportNode, StartupProfiler, mark_startup
+
+
+@pytest.fixture
+def fake_modules(tmp_path, monkeypatch):
+    (tmp_path / "om1_profile_outer.py").write_text(
+        "import time\nimport om1_profile_inner\ntime.sleep(0.01)\n"
+    )
+    (tmp_path / "om1_profile_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop("om1_profile_outer", None)
+    sys.modules.pop("om1_profile_inner", None)
+
+
+@pytest.fixture
+def profiler():
+    profiler = StartupProfiler()
+    yield profiler
+    profiler.stop()
+
+
+def test_import_node_self_time():
+    node = ImportNode("outer", 0.03, [ImportNode("inner", 0.02)])
+
+    assert node.self_time == pytest.approx(0.01)
+
+
+def test_import_tree(fake_modules, profiler):
+    profiler.start()
+    import om1_profile_outer  # noqa: F401
+
+    profiler.stop()
+
+    outer = next(n for n in profiler.root.children if n.name == "om1_profile_outer")
+    inner = next(n for n in outer.children if n.name == "om1_profile_inner")
+
+    assert inner.cumulative >= 0.02
+    assert outer.cumulative >= inner.cumulative + 0.01
+    assert outer.self_time >= 0.01
+
+
+def test_loader_is_restored(fake_modules, profiler):
+    profiler.start()
+    import om1_profile_inner
+
+    profiler.stop()
+
+    assert type(om1_profile_inner.__loader__).__name__ != "_TimedLoader"
+    assert om1_profile_inner.__spec__.loader is om1_profile_inner.__loader__
+
+
+def test_stop_removes_finder(profiler):
+    profiler.start()
+    assert profiler.is_running
+    assert profiler._finder in sys.meta_path
+
+    profiler.stop()
+    assert not profiler.is_running
+    assert profiler._finder not in sys.meta_path
+
+
+def test_mark_is_recorded_once(profiler):
+    assert profiler.mark("config_loaded") is True
+    first = profiler.marks["config_loaded"]
+
+    assert profiler.mark("config_loaded") is False
+    assert profiler.marks["config_loaded"] == first
+
+
+def test_report(fake_modules, profiler):
+    profiler.start()
+    import om1_profile_outer  # noqa: F401
+
+    profiler.mark("first_tick")
+    profiler.stop()
+
+    report = profiler.report(threshold_ms=1.0)
+
+    assert "om1_profile_outer" in report
+    assert "  om1_profile_inner" in report
+    assert "first_tick" in report
+
+
+def test_mark_startup_disabled_is_noop():
+    with patch.object(startup_profiler, "_profiler", None):
+        mark_startup("first_tick")
+
+
+def test_mark_startup_first_tick_logs_report(profiler, caplog):
+    profiler.start()
+
+    with patch.object(startup_profiler, "_profiler", profiler):
+        with caplog.at_level(logging.INFO):
+            mark_startup("first_tick")
+            mark_startup("first_tick")
+
+    assert not profiler.is_running
+    assert caplog.text.count("Startup profile") == 1
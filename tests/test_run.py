@@ -96,12 +96,22 @@ def test_start_with_multi_mode_config():
             check_interval=60,
             log_level="INFO",
             log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=False,
         )
 
         mock_setup_logging.assert_called_once_with("test_config", "INFO", False)
         mock_load_mode_config.assert_called_once_with("test_config")
         mock_runtime_class.assert_called_once_with(
-            mock_mode_config, "test_config", hot_reload=True, check_interval=60
+            mock_mode_config,
+            "test_config",
+            hot_reload=True,
+            check_interval=60,
+            recorder=None,
+            replay=None,
         )
         mock_asyncio_run.assert_called_once()
 
@@ -124,6 +134,11 @@ def test_start_with_file_not_found():
                 check_interval=60,
                 log_level="INFO",
                 log_to_file=False,
+                profile_startup=False,
+                record=None,
+                replay=None,
+                replay_speed=1.0,
+                simulated_time=False,
             )
 
 
@@ -145,6 +160,11 @@ def test_start_with_generic_exception():
                 check_interval=60,
                 log_level="INFO",
                 log_to_file=False,
+                profile_startup=False,
+                record=None,
+                replay=None,
+                replay_speed=1.0,
+                simulated_time=False,
             )
 
 
@@ -174,10 +194,20 @@ def test_start_with_hot_reload_disabled():
             check_interval=60,
             log_level="INFO",
             log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=False,
         )
 
         mock_runtime_class.assert_called_once_with(
-            mock_mode_config, "test_config", hot_reload=False, check_interval=60
+            mock_mode_config,
+            "test_config",
+            hot_reload=False,
+            check_interval=60,
+            recorder=None,
+            replay=None,
         )
 
 
@@ -207,10 +237,20 @@ def test_start_with_custom_check_interval():
             check_interval=120,
             log_level="INFO",
             log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=False,
         )
 
         mock_runtime_class.assert_called_once_with(
-            mock_mode_config, "test_config", hot_reload=True, check_interval=120
+            mock_mode_config,
+            "test_config",
+            hot_reload=True,
+            check_interval=120,
+            recorder=None,
+            replay=None,
         )
 
 
@@ -237,6 +277,11 @@ def test_start_with_custom_log_level():
             check_interval=60,
             log_level="DEBUG",
             log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=False,
         )
 
         mock_setup_logging.assert_called_once_with("test_config", "DEBUG", False)
@@ -265,11 +310,99 @@ def test_start_with_log_to_file():
             check_interval=60,
             log_level="INFO",
             log_to_file=True,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=False,
         )
 
         mock_setup_logging.assert_called_once_with("test_config", "INFO", True)
 
 
+def test_start_with_replay():
+    """Test starting a replay of a recorded session."""
+    with (
+        patch("run.setup_logging"),
+        patch("run.setup_config_file") as mock_setup_config,
+        patch("run.load_mode_config") as mock_load_mode_config,
+        patch("run.ModeCortexRuntime") as mock_runtime_class,
+        patch("run.SessionReplay") as mock_replay_class,
+        patch("run.run_replay", new=MagicMock()) as mock_run_replay,
+        patch("asyncio.run") as mock_asyncio_run,
+    ):
+
+        mock_setup_config.return_value = ("test_config", "/path/to/test_config.json5")
+
+        mock_mode_config = MagicMock()
+        mock_mode_config.modes = {"test": MagicMock()}
+        mock_mode_config.default_mode = "test"
+        mock_load_mode_config.return_value = mock_mode_config
+
+        start(
+            config_name="test_config",
+            hot_reload=False,
+            check_interval=60,
+            log_level="INFO",
+            log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay="/path/to/session",
+            replay_speed=0,
+            simulated_time=False,
+        )
+
+        mock_replay_class.assert_called_once_with("/path/to/session", speed=0)
+        mock_runtime_class.assert_called_once_with(
+            mock_mode_config,
+            "test_config",
+            hot_reload=False,
+            check_interval=60,
+            recorder=None,
+            replay=mock_replay_class.return_value,
+        )
+        mock_run_replay.assert_called_once_with(
+            mock_runtime_class.return_value, mock_replay_class.return_value
+        )
+        mock_asyncio_run.assert_called_once_with(mock_run_replay.return_value)
+
+
+def test_start_with_simulated_time():
+    """Test starting on a simulated clock."""
+    with (
+        patch("run.setup_logging"),
+        patch("run.setup_config_file") as mock_setup_config,
+        patch("run.load_mode_config") as mock_load_mode_config,
+        patch("run.ModeCortexRuntime"),
+        patch("run.SimulatedClock") as mock_clock_class,
+        patch("run.set_clock", new=MagicMock()) as mock_set_clock,
+        patch("asyncio.run"),
+    ):
+
+        mock_setup_config.return_value = ("test_config", "/path/to/test_config.json5")
+
+        mock_mode_config = MagicMock()
+        mock_mode_config.modes = {"test": MagicMock()}
+        mock_mode_config.default_mode = "test"
+        mock_load_mode_config.return_value = mock_mode_config
+
+        start(
+            config_name="test_config",
+            hot_reload=False,
+            check_interval=60,
+            log_level="INFO",
+            log_to_file=False,
+            profile_startup=False,
+            record=None,
+            replay=None,
+            replay_speed=1.0,
+            simulated_time=True,
+        )
+
+        mock_clock_class.assert_called_once_with(autojump=0.001)
+        mock_set_clock.assert_called_once_with(mock_clock_class.return_value)
+
+
 def test_start_without_config_name_uses_default():
     """Test that start without config_name calls setup_config_file with None."""
     with (
@@ -287,6 +420,11 @@ def test_start_without_config_name_uses_default():
                 check_interval=60,
                 log_level="INFO",
                 log_to_file=False,
+                profile_startup=False,
+                record=None,
+                replay=None,
+                replay_speed=1.0,
+                simulated_time=False,
             )
 
         mock_setup_config.assert_called_once_with(None)
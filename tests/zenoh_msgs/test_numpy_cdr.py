@@ -0,0 +1,112 @@
+import struct
+
+import numpy as np
+import pytest
+
+from zenoh_msgs import (
+    Point32,
+    deserialize_numpy,
+    sensor_msgs,
+    serialize_numpy,
+    std_msgs,
+)
+
+HEADER = std_msgs.Header(stamp=std_msgs.Time(sec=12, nanosec=34), frame_id="base")
+FIELDS = [
+    sensor_msgs.PointField(name="x", offset=0, datatype=7, count=1),
+    sensor_msgs.PointField(name="y", offset=4, datatype=7, count=1),
+]
+
+
+def make_messages():
+    return [
+        sensor_msgs.Image(
+            header=HEADER,
+            height=2,
+            width=3,
+            encoding="rgb8",
+            is_bigendian=0,
+            step=9,
+            data=list(range(18)),
+        ),
+        sensor_msgs.PointCloud(
+            header=HEADER,
+            points=[Point32(x=1.0, y=2.0, z=3.0), Point32(x=-1.0, y=0.5, z=0.0)],
+            channels=FIELDS,
+        ),
+        sensor_msgs.PointCloud2(
+            header=HEADER,
+            height=1,
+            width=2,
+            fields=FIELDS,
+            is_bigendian=False,
+            point_step=8,
+            row_step=16,
+            data=list(range(16)),
+            is_dense=True,
+        ),
+        sensor_msgs.LaserScan(
+            header=HEADER,
+            angle_min=-3.0,
+            angle_max=3.0,
+            angle_increment=0.5,
+            time_increment=0.0,
+            scan_time=0.125,
+            range_min=0.25,
+            range_max=12.0,
+            ranges=[1.5, 2.5, 3.5],
+            intensities=[],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("message", make_messages(), ids=lambda m: type(m).__name__)
+def test_round_trip_matches_pycdr2(message):
+    payload = message.serialize()
+
+    decoded = deserialize_numpy(type(message), payload)
+
+    assert decoded.header == HEADER
+    assert serialize_numpy(decoded) == payload
+    assert type(message).deserialize(serialize_numpy(decoded)) == message
+
+
+def test_sequences_are_views_of_the_payload():
+    payload = bytearray(make_messages()[0].serialize())
+
+    image = deserialize_numpy(sensor_msgs.Image, payload)
+
+    assert image.data.dtype == np.uint8
+    assert np.shares_memory(image.data, np.frombuffer(payload, dtype=np.uint8))
+    assert image.encoding == "rgb8"
+    assert image.step == 9
+
+
+def test_point_cloud_points_are_xyz_rows():
+    cloud = deserialize_numpy(sensor_msgs.PointCloud, make_messages()[1].serialize())
+
+    np.testing.assert_array_equal(cloud.points, [[1.0, 2.0, 3.0], [-1.0, 0.5, 0.0]])
+    assert cloud.channels == FIELDS
+
+
+def test_big_endian_payload():
+    payload = (
+        b"\x00\x00\x00\x00"
+        + struct.pack(">iII", 12, 34, 5)
+        + b"base\x00\x00\x00\x00"
+        + struct.pack(">7f", -3.0, 3.0, 0.5, 0.0, 0.125, 0.25, 12.0)
+        + struct.pack(">I3fI", 3, 1.5, 2.5, 3.5, 0)
+    )
+
+    decoded = deserialize_numpy(sensor_msgs.LaserScan, payload)
+
+    assert decoded.header == HEADER
+    assert decoded.range_max == 12.0
+    np.testing.assert_array_equal(decoded.ranges, [1.5, 2.5, 3.5])
+
+
+def test_truncated_payload_raises():
+    payload = make_messages()[3].serialize()
+
+    with pytest.raises(ValueError):
+        deserialize_numpy(sensor_msgs.LaserScan, payload[:-8])
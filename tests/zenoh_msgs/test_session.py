@@ -1,9 +1,15 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 import zenoh
 
-from zenoh_msgs.session import create_zenoh_config, open_zenoh_session
+from zenoh_msgs.session import (
+    ZenohSessionLease,
+    ZenohSessionPool,
+    create_zenoh_config,
+    open_zenoh_session,
+)
 
 
 class TestCreateZenohConfig:
@@ -22,7 +28,7 @@ class TestOpenZenohSession:
         mock_session = MagicMock()
         mock_zenoh_open.return_value = mock_session
 
-        session = open_zenoh_session()
+        session = open_zenoh_session(shared=False)
 
         mock_zenoh_open.assert_called_once()
         assert session is mock_session
@@ -35,7 +41,7 @@ class TestOpenZenohSession:
             mock_session_fallback,
         ]
 
-        session = open_zenoh_session()
+        session = open_zenoh_session(shared=False)
 
         assert mock_zenoh_open.call_count == 2
         assert session is mock_session_fallback
@@ -48,8 +54,196 @@ class TestOpenZenohSession:
         ]
 
         with pytest.raises(Exception, match="Failed to open Zenoh session"):
-            open_zenoh_session()
+            open_zenoh_session(shared=False)
 
         assert mock_zenoh_open.call_count == 2
         expected_calls_to_zenoh_open = mock_zenoh_open.call_args_list
         mock_zenoh_open.assert_has_calls(expected_calls_to_zenoh_open)
+
+
+@pytest.fixture
+def pool():
+    session = MagicMock()
+    session.declare_subscriber.side_effect = lambda key, handler: MagicMock(
+        key=key, handler=handler
+    )
+    session.declare_publisher.side_effect = lambda key, **kwargs: MagicMock(key=key)
+    connect = MagicMock(return_value=session)
+    return ZenohSessionPool(connect=connect), session, connect
+
+
+class TestZenohSessionPool:
+    def test_shared_session_is_opened_once(self, pool):
+        zenoh_pool, session, connect = pool
+
+        lease1 = zenoh_pool.acquire()
+        lease2 = zenoh_pool.acquire()
+
+        assert isinstance(lease1, ZenohSessionLease)
+        connect.assert_called_once()
+        assert zenoh_pool.stats()["leases"] == 2
+
+        lease1.close()
+        session.close.assert_not_called()
+
+        lease2.close()
+        session.close.assert_called_once()
+        assert zenoh_pool.stats()["leases"] == 0
+
+    def test_close_is_idempotent(self, pool):
+        zenoh_pool, session, _ = pool
+
+        lease1 = zenoh_pool.acquire()
+        lease2 = zenoh_pool.acquire()
+        lease1.close()
+        lease1.close()
+
+        session.close.assert_not_called()
+        lease2.close()
+        session.close.assert_called_once()
+
+    def test_reopens_after_last_lease_closed(self, pool):
+        zenoh_pool, _, connect = pool
+
+        zenoh_pool.acquire().close()
+        zenoh_pool.acquire()
+
+        assert connect.call_count == 2
+
+    def test_subscribers_are_fanned_out(self, pool):
+        zenoh_pool, session, _ = pool
+        handler1 = MagicMock()
+        handler2 = MagicMock()
+
+        lease1 = zenoh_pool.acquire()
+        lease2 = zenoh_pool.acquire()
+        lease1.declare_subscriber("robot/odom", handler1)
+        lease2.declare_subscriber("robot/odom", handler2)
+
+        session.declare_subscriber.assert_called_once()
+        dispatch = session.declare_subscriber.call_args[0][1]
+
+        sample = MagicMock()
+        dispatch(sample)
+
+        handler1.assert_called_once_with(sample)
+        handler2.assert_called_once_with(sample)
+        assert zenoh_pool.stats()["callbacks"] == 2
+
+    def test_failing_handler_does_not_block_others(self, pool):
+        zenoh_pool, session, _ = pool
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        handler = MagicMock()
+
+        lease = zenoh_pool.acquire()
+        lease.declare_subscriber("robot/odom", failing)
+        lease.declare_subscriber("robot/odom", handler)
+        session.declare_subscriber.call_args[0][1](MagicMock())
+
+        handler.assert_called_once()
+
+    def test_undeclare_last_handler_undeclares_subscriber(self, pool):
+        zenoh_pool, session, _ = pool
+
+        lease = zenoh_pool.acquire()
+        sub1 = lease.declare_subscriber("robot/odom", MagicMock())
+        sub2 = lease.declare_subscriber("robot/odom", MagicMock())
+        underlying = zenoh_pool._fanouts["robot/odom"].subscriber
+
+        sub1.undeclare()
+        assert zenoh_pool.stats()["subscribers"] == 1
+        underlying.undeclare.assert_not_called()
+
+        sub2.undeclare()
+        assert zenoh_pool.stats()["subscribers"] == 0
+        underlying.undeclare.assert_called_once()
+
+    def test_subscribers_are_undeclared_outside_the_pool_lock(self, pool):
+        zenoh_pool, _, _ = pool
+        lock_free = []
+
+        def undeclare():
+            # A dispatch callback on another thread subscribing through the pool
+            def use_pool():
+                acquired = zenoh_pool._lock.acquire(timeout=1.0)
+                if acquired:
+                    zenoh_pool._lock.release()
+                lock_free.append(acquired)
+
+            thread = threading.Thread(target=use_pool)
+            thread.start()
+            thread.join()
+
+        lease = zenoh_pool.acquire()
+        subscription = lease.declare_subscriber("robot/odom", MagicMock())
+        lease.declare_subscriber("robot/cmd", MagicMock())
+        for fanout in zenoh_pool._fanouts.values():
+            fanout.subscriber.undeclare.side_effect = undeclare
+
+        subscription.undeclare()
+        lease.close()
+
+        assert lock_free == [True, True]
+
+    def test_closing_lease_removes_its_handlers(self, pool):
+        zenoh_pool, session, _ = pool
+        handler1 = MagicMock()
+        handler2 = MagicMock()
+
+        lease1 = zenoh_pool.acquire()
+        lease2 = zenoh_pool.acquire()
+        lease1.declare_subscriber("robot/odom", handler1)
+        lease2.declare_subscriber("robot/odom", handler2)
+        lease1.close()
+
+        session.declare_subscriber.call_args[0][1](MagicMock())
+
+        handler1.assert_not_called()
+        handler2.assert_called_once()
+
+    def test_publishers_are_cached_by_topic(self, pool):
+        zenoh_pool, session, _ = pool
+
+        lease1 = zenoh_pool.acquire()
+        lease2 = zenoh_pool.acquire()
+        pub1 = lease1.declare_publisher("om/status")
+        pub2 = lease2.declare_publisher("om/status")
+        lease1.declare_publisher("om/other")
+
+        assert session.declare_publisher.call_count == 2
+
+        pub1.put(b"data")
+        pub2.put(b"more")
+        underlying = pub1._publisher
+        assert underlying is pub2._publisher
+        assert underlying.put.call_count == 2
+
+        pub1.undeclare()
+        underlying.undeclare.assert_not_called()
+        pub2.undeclare()
+        underlying.undeclare.assert_called_once()
+
+    def test_other_attributes_are_forwarded(self, pool):
+        zenoh_pool, session, _ = pool
+
+        lease = zenoh_pool.acquire()
+        lease.put("om/topic", b"payload")
+
+        session.put.assert_called_once_with("om/topic", b"payload")
+
+    def test_open_zenoh_session_returns_shared_lease(self):
+        session = MagicMock()
+        connect = MagicMock(return_value=session)
+        with patch.dict(
+            open_zenoh_session.__globals__,
+            {"_session_pool": ZenohSessionPool(connect=connect)},
+        ):
+            session1 = open_zenoh_session()
+            session2 = open_zenoh_session()
+
+            connect.assert_called_once()
+            assert isinstance(session1, ZenohSessionLease)
+
+            session1.close()
+            session2.close()
+            session.close.assert_called_once()